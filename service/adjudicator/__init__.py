@@ -10,7 +10,7 @@ from .serializers import (
 )
 
 
-__all__ = ["adjudicate"]
+__all__ = ["adjudicate", "adjudicate_many"]
 
 
 def adjudicate(variant: Dict[str, Any], game_state: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -20,6 +20,19 @@ def adjudicate(variant: Dict[str, Any], game_state: Dict[str, Any]) -> List[Dict
     return [_serialize_game_state(s) for s in new_states]
 
 
+def adjudicate_many(
+    variant: Dict[str, Any], game_states: List[Dict[str, Any]]
+) -> List[List[Dict[str, Any]]]:
+    """`adjudicate` over several game states of one variant, which is
+    deserialized once and shared by the whole batch."""
+    parsed_variant = _deserialize_variant(variant)
+    states = [_deserialize_game_state(s, parsed_variant) for s in game_states]
+    return [
+        [_serialize_game_state(s) for s in new_states]
+        for new_states in _Engine().adjudicate_many(states)
+    ]
+
+
 for _name in ("engine", "serializers", "domain"):
     globals().pop(_name, None)
 del _name
@@ -0,0 +1,341 @@
+"""Database-free benchmark harness for the adjudicator.
+
+The integration fixtures (`integration/fixtures/*.json`) record every
+phase of a finished game: the orders each nation submitted and the
+position after resolution. `replay_fixture` rebuilds the canonical game
+state before each of those phases by replaying the orders through the
+engine, and `benchmark_fixture` then times the two calls a resolution
+makes per phase -- `Engine.adjudicate` on the submitted orders and
+`get_options` on the position being played -- over several repetitions.
+
+A report carries latency percentiles per phase and per game, the peak
+traced memory of one full replay, and how many options each phase
+offered. Option counts are deterministic, so a change there is a change
+in behaviour rather than noise; `compare_to_baseline` flags it alongside
+latency and memory that moved past a tolerance.
+
+The fixtures name their variant but carry no map. `bundled_variant`
+assembles the canonical variant dict from the files the database is
+seeded from: `variant/data/<id>.json` for provinces, nations and the
+starting position, and the adjacency backfill migrations for the graph.
+Nothing here opens a database connection; the migration modules only
+import `django.db.migrations`.
+
+    python manage.py benchmark_adjudicator
+
+runs the default fixture set and compares it to a baseline recorded
+with `--save-baseline` on the same machine (see
+`integration/management/commands/benchmark_adjudicator.py`); no baseline
+is committed, since timings do not carry across machines. Pull request
+CI records one from the base commit on its runner and fails the build on
+a regression.
+
+Public symbols: `DEFAULT_FIXTURES`, `BUNDLED_VARIANTS`, `bundled_variant`, `replay_fixture`,
+`benchmark_fixture`, `compare_to_baseline`, and `median_ms`. Everything
+else is module-private.
+"""
+import copy
+import importlib
+import json
+import math
+import re
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .domain import Variant
+from .engine import Engine
+from .options import get_options
+from .serializers import deserialize_game_state, deserialize_variant, serialize_game_state
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = SERVICE_DIR / "integration" / "fixtures"
+VARIANT_DATA_DIR = SERVICE_DIR / "variant" / "data"
+
+DEFAULT_FIXTURES = (
+    "02_classical_solo_35p.json",
+    "09_classical_solo_110p.json",
+    "10_classical_solo_convoyheavy_65p.json",
+    "03_hundred_solo_40p.json",
+)
+
+_ADJACENCY_MIGRATIONS = (
+    "province.migrations.0016_backfill_adjacencies_classical_ivg_hundred",
+    "province.migrations.0017_backfill_adjacencies_youngstown_vietnam_canton",
+)
+_HUNDRED_PROGRESSION_MIGRATION = "variant.migrations.0015_correct_hundred_phase_progression"
+_HUNDRED_MODIFIERS_MIGRATION = "variant.migrations.0017_hundred_allow_non_home_builds"
+
+# Solo thresholds as seeded by variant migrations 0005 to 0008.
+_SOLO_SUPPLY_CENTERS = {
+    "classical": 18,
+    "italy-vs-germany": 18,
+    "hundred": 9,
+    "youngstown-redux": 28,
+    "vietnam-war": 13,
+    "canton": 19,
+}
+
+BUNDLED_VARIANTS = tuple(_SOLO_SUPPLY_CENTERS)
+
+_PERCENTILES = (50, 90, 99)
+
+
+def _standard_phase_progression() -> Dict[str, Any]:
+    # Mirrors variant.models.default_phase_progression, which cannot be
+    # imported without an app registry.
+    return {
+        "seasons": ["Spring", "Fall"],
+        "transitions": [
+            {"from": {"season": "Spring", "type": "Movement"}, "to": {"season": "Spring", "type": "Retreat", "yearDelta": 0}},
+            {"from": {"season": "Spring", "type": "Retreat"}, "to": {"season": "Fall", "type": "Movement", "yearDelta": 0}},
+            {"from": {"season": "Fall", "type": "Movement"}, "to": {"season": "Fall", "type": "Retreat", "yearDelta": 0}},
+            {"from": {"season": "Fall", "type": "Retreat"}, "to": {"season": "Fall", "type": "Adjustment", "yearDelta": 0}},
+            {"from": {"season": "Fall", "type": "Adjustment"}, "to": {"season": "Spring", "type": "Movement", "yearDelta": 1}},
+        ],
+    }
+
+
+def _slug(name: str) -> str:
+    # The ASCII subset of django.utils.text.slugify, which is how nation
+    # and variant ids were derived from their names.
+    value = re.sub(r"[^\w\s-]", "", name.lower())
+    return re.sub(r"[-\s]+", "-", value).strip("-_")
+
+
+def bundled_variant(variant_id: str) -> Dict[str, Any]:
+    """Canonical variant dict for a variant the database is seeded with,
+    built without the database. Only the variants whose adjacencies the
+    backfill migrations carry (`BUNDLED_VARIANTS`) are supported;
+    anything else raises KeyError."""
+    if variant_id not in _SOLO_SUPPLY_CENTERS:
+        raise KeyError(variant_id)
+    adjacencies: Dict[str, List[Dict[str, str]]] = {}
+    for module in _ADJACENCY_MIGRATIONS:
+        adjacencies.update(importlib.import_module(module).ADJACENCIES.get(variant_id, {}))
+    data = json.loads((VARIANT_DATA_DIR / f"{variant_id}.json").read_text())
+
+    homes = {sc["province"]: _slug(sc["nation"]) for sc in data["initial_supply_centers"]}
+    provinces, named_coasts = [], []
+    for province in data["provinces"]:
+        if province["type"] == "named_coast":
+            named_coasts.append(
+                {
+                    "id": province["id"],
+                    "name": province["name"],
+                    "parentProvince": province["parent"],
+                    "adjacencies": adjacencies.get(province["id"], []),
+                }
+            )
+            continue
+        canonical = {
+            "id": province["id"],
+            "name": province["name"],
+            "type": province["type"],
+            "supplyCenter": province["supply_center"],
+            "adjacencies": adjacencies.get(province["id"], []),
+        }
+        if province["id"] in homes:
+            canonical["homeNation"] = homes[province["id"]]
+        provinces.append(canonical)
+
+    phase_progression = _standard_phase_progression()
+    adjudication_modifiers: List[str] = []
+    if variant_id == "hundred":
+        phase_progression = importlib.import_module(
+            _HUNDRED_PROGRESSION_MIGRATION
+        ).CORRECTED_HUNDRED_PHASE_PROGRESSION
+        adjudication_modifiers = [importlib.import_module(_HUNDRED_MODIFIERS_MIGRATION).BUILD_ANYWHERE_MODIFIER]
+
+    return {
+        "schemaVersion": 1,
+        "id": variant_id,
+        "name": data["name"],
+        "description": data["description"],
+        "author": data["author"],
+        "victoryConditions": [
+            {"type": "supply-center-majority", "supplyCenters": _SOLO_SUPPLY_CENTERS[variant_id]}
+        ],
+        "adjudicationModifiers": adjudication_modifiers,
+        "phaseProgression": phase_progression,
+        "nations": [{"id": _slug(n["name"]), "name": n["name"], "color": n["color"]} for n in data["nations"]],
+        "provinces": provinces,
+        "namedCoasts": named_coasts,
+        "initialState": {
+            "phase": dict(data["initial_phase"]),
+            "units": [
+                {"nation": _slug(u["nation"]), "type": u["type"], "location": u["province"]}
+                for u in data["initial_units"]
+            ],
+            "supplyCenters": [
+                {"nation": _slug(sc["nation"]), "province": sc["province"]}
+                for sc in data["initial_supply_centers"]
+            ],
+        },
+    }
+
+
+def _fixture_order(order: Dict[str, Any], phase_type: str) -> Dict[str, Any]:
+    """Translate a fixture's `selected` list into a canonical order, the
+    way `phase.utils._canonical_order` translates an Order row."""
+    source, order_type, *rest = order["selected"]
+    canonical = {
+        "nation": _slug(order["nation"]),
+        "source": source,
+        "orderType": order_type,
+        "target": None,
+        "aux": None,
+        "unitType": None,
+        "viaConvoy": False,
+    }
+    if order_type in ("Move", "MoveViaConvoy"):
+        canonical["target"] = rest[-1]
+        if order_type == "MoveViaConvoy":
+            canonical["orderType"] = "Move"
+            canonical["viaConvoy"] = True
+        elif phase_type == "Retreat":
+            canonical["orderType"] = "Retreat"
+    elif order_type in ("Support", "Convoy"):
+        canonical["aux"], canonical["target"] = rest
+    elif order_type == "Build":
+        canonical["unitType"] = rest[0]
+        if len(rest) > 1:
+            canonical["source"] = rest[1]
+    return canonical
+
+
+def replay_fixture(fixture_name: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """The fixture's canonical variant and the canonical game state before
+    each of its phases, orders filled in. Raises ValueError when the
+    replay drifts from the phase sequence the fixture recorded."""
+    fixture = json.loads((FIXTURES_DIR / fixture_name).read_text())
+    canonical_variant = bundled_variant(_slug(fixture["variant"]))
+    variant = deserialize_variant(canonical_variant)
+    engine = Engine()
+
+    initial = canonical_variant["initialState"]
+    state: Dict[str, Any] = {
+        "phase": dict(initial["phase"]),
+        "units": [{**unit, "dislodged": False, "dislodgedFrom": None} for unit in initial["units"]],
+        "supplyCenters": [dict(sc) for sc in initial["supplyCenters"]],
+        "orders": [],
+        "resolutions": None,
+        "skipped": False,
+        "outcome": None,
+        "contestedProvinces": [],
+    }
+    states = []
+    for phase in fixture["phases"]:
+        recorded = (phase["season"], phase["year"], phase["type"])
+        replayed = (state["phase"]["season"], state["phase"]["year"], state["phase"]["type"])
+        if replayed != recorded:
+            raise ValueError(f"{fixture_name} phase {phase['ordinal']}: replay reached {replayed}, fixture has {recorded}")
+        state["orders"] = [_fixture_order(order, phase["type"]) for order in phase["orders"]]
+        states.append(copy.deepcopy(state))
+        resolved = engine.adjudicate(deserialize_game_state(state, variant))
+        if len(resolved) < 2:
+            break
+        state = serialize_game_state(resolved[1])
+    return canonical_variant, states
+
+
+def _percentiles(samples: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        f"p{p}": round(ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)], 3) for p in _PERCENTILES
+    }
+
+
+def _timed(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+MEDIAN_ITERATIONS = 20
+
+
+def median_ms(fn: Callable[[], Any], before_each: Optional[Callable[[], Any]] = None) -> float:
+    """Median wall time of `MEDIAN_ITERATIONS` calls to `fn`, in
+    milliseconds; `before_each` runs untimed ahead of every call. The
+    timing helper of the test_benchmarks modules."""
+    samples = []
+    for _ in range(MEDIAN_ITERATIONS):
+        if before_each is not None:
+            before_each()
+        _, elapsed = _timed(fn)
+        samples.append(elapsed)
+    return statistics.median(samples)
+
+
+def benchmark_fixture(fixture_name: str, repeat: int = 5) -> Dict[str, Any]:
+    """Replay `fixture_name` `repeat` times (after one warm-up pass) and
+    report, in milliseconds, percentiles of per-phase adjudication and
+    option-enumeration latency and of whole-game latency, the peak traced
+    memory of one replay in KiB, and option counts."""
+    canonical_variant, states = replay_fixture(fixture_name)
+    variant: Variant = deserialize_variant(canonical_variant)
+    engine = Engine()
+
+    def replay_once(adjudicate_ms: List[float], options_ms: List[float]) -> List[int]:
+        counts = []
+        for game_state in states:
+            parsed = deserialize_game_state(game_state, variant)
+            _, elapsed = _timed(lambda: engine.adjudicate(parsed))
+            adjudicate_ms.append(elapsed)
+            options, elapsed = _timed(lambda: get_options(parsed))
+            options_ms.append(elapsed)
+            counts.append(len(options))
+        return counts
+
+    counts = replay_once([], [])
+
+    adjudicate_ms: List[float] = []
+    options_ms: List[float] = []
+    game_ms: List[float] = []
+    for _ in range(max(repeat, 1)):
+        _, elapsed = _timed(lambda: replay_once(adjudicate_ms, options_ms))
+        game_ms.append(elapsed)
+
+    tracemalloc.start()
+    try:
+        replay_once([], [])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "fixture": fixture_name,
+        "variant": canonical_variant["id"],
+        "phases": len(states),
+        "repeat": max(repeat, 1),
+        "adjudicate_ms": _percentiles(adjudicate_ms),
+        "options_ms": _percentiles(options_ms),
+        "game_ms": _percentiles(game_ms),
+        "peak_kib": round(peak / 1024),
+        "options": {"total": sum(counts), "max_per_phase": max(counts, default=0)},
+    }
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Regressions of `report` against the `baseline` report for the same
+    fixture, one message each. The whole-game median and peak memory
+    regress when they exceed the baseline by more than `tolerance` (0.25
+    allows 25%); option and phase counts regress on any difference.
+    Per-phase percentiles are reported but not compared: they are
+    sub-millisecond and swing with runner load."""
+    fixture = report["fixture"]
+    problems = []
+    for key in ("phases", "options"):
+        if report[key] != baseline[key]:
+            problems.append(f"{fixture}: {key} changed from {baseline[key]} to {report[key]}")
+    limits = [
+        ("game_ms.p50", report["game_ms"]["p50"], baseline["game_ms"]["p50"]),
+        ("peak_kib", report["peak_kib"], baseline["peak_kib"]),
+    ]
+    for name, value, reference in limits:
+        if value > reference * (1 + tolerance):
+            problems.append(f"{fixture}: {name} {value} exceeds baseline {reference} by more than {tolerance:.0%}")
+    return problems
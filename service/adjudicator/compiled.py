@@ -0,0 +1,100 @@
+"""Process-wide cache of compiled variants.
+
+A variant's graph is immutable between edits, but every `start` and
+`resolve` used to rebuild it from the database, re-run JSON-schema and
+adjacency-symmetry validation, and re-derive the lookup tables the engine
+consults. This module keeps one compiled copy per variant per process.
+
+An entry is keyed by variant id plus the model's `updated_at`. Both
+variant write paths (`update_variant_from_dvar`, `apply_safe_replacement`)
+save the Variant row, so a stale entry in another worker process misses
+on the timestamp and is recompiled on its next lookup; the writing process
+also drops its entry eagerly via `invalidate_compiled_variant`.
+
+The cached `Variant` is shared by every adjudication in the process.
+Nothing in the engine mutates it — states are rebuilt around it, never
+through it — and callers must keep it that way.
+
+Public symbols: `CompiledVariant`, `compile_variant`,
+`get_compiled_variant`, `invalidate_compiled_variant`, and
+`clear_compiled_variants`. Everything else is module-private.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+from .domain import Variant, VariantIndex
+from .serializers import deserialize_variant
+
+
+@dataclass(frozen=True)
+class CompiledVariant:
+    """A deserialized Variant together with its precomputed lookup tables
+    (interned ids, army/fleet reachability bitsets, parent and coast maps,
+    and each nation's civil-disorder distances from its home centers).
+
+    `updated_at` is the model timestamp the entry was compiled from; it is
+    compared on every lookup and never interpreted otherwise."""
+
+    variant: Variant
+    updated_at: Any
+    index: VariantIndex
+
+    @property
+    def parent_by_location(self) -> Dict[str, str]:
+        return self.index.parent_by_location
+
+    @property
+    def coasts_by_parent(self) -> Dict[str, Tuple[str, ...]]:
+        return self.index.coasts_by_parent
+
+    def home_distances(self, nation: str) -> Dict[str, int]:
+        return self.variant.home_distances(nation)
+
+
+_CACHE: Dict[str, CompiledVariant] = {}
+_LOCK = threading.Lock()
+
+
+def compile_variant(canonical_variant: Dict[str, Any], updated_at: Any = None) -> CompiledVariant:
+    """Validate and deserialize a canonical variant dict and build its
+    lookup tables eagerly, so the first adjudication against the result
+    pays nothing extra."""
+    variant = deserialize_variant(canonical_variant)
+    for nation in variant.nations:
+        variant.home_distances(nation.id)
+    return CompiledVariant(variant=variant, updated_at=updated_at, index=variant.index)
+
+
+def get_compiled_variant(
+    variant_id: str,
+    updated_at: Any,
+    load_canonical: Callable[[], Dict[str, Any]],
+) -> CompiledVariant:
+    """Return the compiled variant for `(variant_id, updated_at)`,
+    compiling it from `load_canonical()` on a miss.
+
+    `load_canonical` is only called on a miss, which is what keeps the
+    database round-trips of `variant_to_canonical_dict` off the warm
+    path. Compilation runs outside the lock; two threads racing on the
+    same cold entry both compile and the last one wins, which is harmless
+    because the results are equal."""
+    entry = _CACHE.get(variant_id)
+    if entry is not None and entry.updated_at == updated_at:
+        return entry
+    compiled = compile_variant(load_canonical(), updated_at)
+    with _LOCK:
+        _CACHE[variant_id] = compiled
+    return compiled
+
+
+def invalidate_compiled_variant(variant_id: str) -> None:
+    with _LOCK:
+        _CACHE.pop(variant_id, None)
+
+
+def clear_compiled_variants() -> None:
+    with _LOCK:
+        _CACHE.clear()
@@ -7,18 +7,179 @@ disrupted at resolution time if any fleet in the path is dislodged.
 This module answers the static question; C3 will integrate the dynamic
 question into the Decision graph.
 
-Public symbols: `convoy_path_exists`, `convoy_path_through_fleet`,
-`is_convoy_redundant`, and `fleet_reaches_coast`. Everything else is
-module-private.
+Reachability questions are answered by a `ConvoyOracle`, which each
+StateView holds (see `StateView.convoys()`): the connected components
+of the fleet-occupied sea subgraph are computed once per fleet set and
+every later query against that set is a component lookup. The shortest-
+chain questions behind `is_convoy_redundant` still run a BFS.
+
+Public symbols: `ConvoyOracle`, `convoy_path_exists`,
+`convoy_path_through_fleet`, `is_convoy_redundant`, and
+`fleet_reaches_coast`. Everything else is module-private.
 """
 from __future__ import annotations
 
-from typing import Collection, Optional, Set
+from typing import Collection, Dict, Iterable, Optional, Set
 
-from .domain import Unit
+from .domain import Unit, VariantIndex
 from .types import StateView
 
 
+class ConvoyOracle:
+    """Memoized sea-province reachability over one variant graph.
+
+    A convoy chain is a walk through sea provinces that each hold a
+    convoying fleet, so every reachability question in this module
+    reduces to "which seas in the fleet set can be reached from these
+    seas". The oracle answers it with bitsets from `Variant.index`: for
+    each fleet set (a bitset of sea parents) it records the component of
+    every sea it has explored, and a closure is the union of the
+    components of its seeds.
+
+    On a symmetric sea graph -- every variant that passed
+    `deserialize_variant`'s adjacency validation -- one BFS yields a
+    whole connected component, and every sea in it shares the result.
+    Otherwise each sea keeps its own forward reach, which is still exact.
+
+    Answers depend only on the variant graph and the fleet set, never on
+    the rest of the state, so one oracle is shared by every StateView of
+    an adjudication and by every options call on it."""
+
+    def __init__(self, index: VariantIndex):
+        self._index = index
+        self._components: Dict[int, Dict[int, int]] = {}
+        self._symmetric = _sea_graph_is_symmetric(index)
+
+    def sea_mask(self, locations: Iterable[str]) -> int:
+        """Bitset of the sea parents of `locations`. Locations that are
+        not in a sea province, or not in the variant, contribute nothing."""
+        index = self._index
+        mask = 0
+        for loc in locations:
+            i = index.index_of.get(loc)
+            if i is not None:
+                mask |= 1 << index.parent[i]
+        return mask & index.sea
+
+    def coast_seas(self, location: str) -> int:
+        """Bitset form of `_sea_neighbours`: the convoy entry/exit seas of
+        `location`'s province."""
+        i = self._index.index_of.get(location)
+        return self._index.sea_neighbours[i] if i is not None else 0
+
+    def closure(self, start: int, allowed: int) -> int:
+        """Every sea province reachable from `start ∩ allowed` moving only
+        through `allowed` sea provinces."""
+        seeds = start & allowed
+        reached = 0
+        while seeds:
+            low = seeds & -seeds
+            component = self._component(low.bit_length() - 1, allowed)
+            reached |= component
+            seeds &= ~component
+        return reached
+
+    def landings(self, seas: int) -> int:
+        """Coastal provinces touching any of `seas`."""
+        landings = self._index.landings
+        out = 0
+        while seas:
+            low = seas & -seas
+            out |= landings[low.bit_length() - 1]
+            seas ^= low
+        return out & self._index.coastal
+
+    def army_targets(self, source_parent: int, allowed: int) -> int:
+        """Provinces an army at `source_parent` could be convoyed to
+        through `allowed`. Empty unless the source is coastal; never
+        contains the source itself (`convoy_path_exists` rejects
+        same-province convoys)."""
+        index = self._index
+        if not index.coastal >> source_parent & 1:
+            return 0
+        reach = self.closure(index.sea_neighbours[source_parent], allowed)
+        return self.landings(reach) & ~(1 << source_parent)
+
+    def path_exists(
+        self,
+        army_source: str,
+        army_target: str,
+        convoying_fleet_locations: Collection[str],
+    ) -> bool:
+        if army_source == army_target:
+            return False
+        start = self.coast_seas(army_source)
+        end = self.coast_seas(army_target)
+        if not convoying_fleet_locations:
+            return bool(start & end)
+        allowed = self.sea_mask(convoying_fleet_locations)
+        return bool(self.closure(start, allowed) & end)
+
+    def path_through_fleet(
+        self,
+        army_source: str,
+        army_target: str,
+        fleet_location: str,
+        convoying_fleet_locations: Collection[str],
+    ) -> bool:
+        if army_source == army_target:
+            return False
+        fleet = self.sea_mask((fleet_location,))
+        allowed = self.sea_mask(convoying_fleet_locations)
+        if not fleet & allowed:
+            return False
+        return bool(self.closure(self.coast_seas(army_source), allowed) & fleet) and bool(
+            self.closure(fleet, allowed) & self.coast_seas(army_target)
+        )
+
+    def fleet_reaches(self, fleet_location: str, coast_location: str) -> bool:
+        fleet = self.sea_mask((fleet_location,))
+        if not fleet:
+            return False
+        return bool(self.closure(fleet, self._index.sea) & self.coast_seas(coast_location))
+
+    def _component(self, sea: int, allowed: int) -> int:
+        components = self._components.setdefault(allowed, {})
+        component = components.get(sea)
+        if component is not None:
+            return component
+        sea_reach = self._index.sea_reach
+        component = 0
+        frontier = 1 << sea
+        while frontier:
+            component |= frontier
+            step = 0
+            while frontier:
+                low = frontier & -frontier
+                step |= sea_reach[low.bit_length() - 1]
+                frontier ^= low
+            frontier = step & allowed & ~component
+        if self._symmetric:
+            members = component
+            while members:
+                low = members & -members
+                components[low.bit_length() - 1] = component
+                members ^= low
+        else:
+            components[sea] = component
+        return component
+
+
+def _sea_graph_is_symmetric(index: VariantIndex) -> bool:
+    seas = index.sea
+    while seas:
+        low = seas & -seas
+        s = low.bit_length() - 1
+        targets = index.sea_reach[s] & index.sea
+        while targets:
+            t_low = targets & -targets
+            if not index.sea_reach[t_low.bit_length() - 1] & low:
+                return False
+            targets ^= t_low
+        seas ^= low
+    return True
+
+
 def convoy_path_exists(
     state: StateView,
     army_source: str,
@@ -44,44 +205,11 @@ def convoy_path_exists(
     endpoints; C2/C3 will layer the 'at least one matched convoy fleet'
     requirement on top.
 
-    Implementation: BFS over the variant's adjacency graph, restricted
-    to sea provinces in the convoying set (plus the two endpoints'
-    sea-passable neighbours as entry/exit). Cost: O(V + E) over the
-    sea sub-graph. Memoization is not done here — callers that need
-    repeated queries are expected to wrap calls or maintain their own
-    cache (C3 will do this inside the Decision graph)."""
-    if army_source == army_target:
-        return False
-    variant = state.variant()
-    start_set = _sea_neighbours(state, army_source)
-    end_set = _sea_neighbours(state, army_target)
-    if not convoying_fleet_locations:
-        return bool(start_set & end_set)
-    allowed_interior: Set[str] = {
-        variant.parent_of(loc) for loc in convoying_fleet_locations
-    }
-    visited: Set[str] = set()
-    frontier: Set[str] = start_set & allowed_interior
-    while frontier:
-        next_frontier: Set[str] = set()
-        for node in frontier:
-            if node in visited:
-                continue
-            visited.add(node)
-            if node in end_set:
-                return True
-            for adjacency in variant.adjacencies_of(node):
-                if not adjacency.allows(Unit.FLEET):
-                    continue
-                neighbour = variant.parent_of(adjacency.to)
-                if not state.province(neighbour).is_sea():
-                    continue
-                if neighbour in visited:
-                    continue
-                if neighbour in allowed_interior:
-                    next_frontier.add(neighbour)
-        frontier = next_frontier
-    return False
+    Answered by the state's `ConvoyOracle`: a component lookup over
+    the sea provinces holding the convoying fleets."""
+    return state.convoys().path_exists(
+        army_source, army_target, convoying_fleet_locations
+    )
 
 
 def convoy_path_through_fleet(
@@ -102,61 +230,11 @@ def convoy_path_through_fleet(
     own location). A chain A→B through F exists iff F is reachable from
     `army_source` and `army_target` is reachable from F, both restricted
     to the given on-board fleet set."""
-    if army_source == army_target:
-        return False
-    variant = state.variant()
-    fleet_parent = variant.parent_of(fleet_location)
-    if not state.province(fleet_parent).is_sea():
-        return False
-    allowed_interior: Set[str] = {
-        variant.parent_of(loc) for loc in convoying_fleet_locations
-    }
-    if fleet_parent not in allowed_interior:
-        return False
-    return _sea_chain_connects(
-        state, _sea_neighbours(state, army_source), {fleet_parent}, allowed_interior
-    ) and _sea_chain_connects(
-        state, {fleet_parent}, _sea_neighbours(state, army_target), allowed_interior
+    return state.convoys().path_through_fleet(
+        army_source, army_target, fleet_location, convoying_fleet_locations
     )
 
 
-def _sea_chain_connects(
-    state: StateView,
-    start_set: Set[str],
-    end_set: Set[str],
-    allowed_interior: Set[str],
-) -> bool:
-    """BFS over fleet-passable sea adjacency: True iff some node in
-    `end_set` is reachable from `start_set`, with every visited node
-    constrained to `allowed_interior`. Only nodes in `allowed_interior`
-    are ever checked against `end_set`, matching `convoy_path_exists` —
-    the first and last sea province in a convoy chain must each hold a
-    convoying fleet."""
-    visited: Set[str] = set()
-    frontier: Set[str] = start_set & allowed_interior
-    variant = state.variant()
-    while frontier:
-        next_frontier: Set[str] = set()
-        for node in frontier:
-            if node in visited:
-                continue
-            visited.add(node)
-            if node in end_set:
-                return True
-            for adjacency in variant.adjacencies_of(node):
-                if not adjacency.allows(Unit.FLEET):
-                    continue
-                neighbour = variant.parent_of(adjacency.to)
-                if neighbour in visited:
-                    continue
-                if not state.province(neighbour).is_sea():
-                    continue
-                if neighbour in allowed_interior:
-                    next_frontier.add(neighbour)
-        frontier = next_frontier
-    return False
-
-
 def is_convoy_redundant(
     state: StateView,
     fleet_location: str,
@@ -293,32 +371,7 @@ def fleet_reaches_coast(
     The fleet's own province counts as a starting node only when it is
     a sea province (named coasts and coastal fleet locations cannot
     convoy)."""
-    variant = state.variant()
-    fleet_parent = variant.parent_of(fleet_location)
-    if not state.province(fleet_parent).is_sea():
-        return False
-    if fleet_parent in _sea_neighbours(state, coast_location):
-        return True
-    visited: Set[str] = {fleet_parent}
-    frontier: Set[str] = {fleet_parent}
-    target_neighbours = _sea_neighbours(state, coast_location)
-    while frontier:
-        next_frontier: Set[str] = set()
-        for sea in frontier:
-            for adjacency in variant.adjacencies_of(sea):
-                if not adjacency.allows(Unit.FLEET):
-                    continue
-                neighbour = variant.parent_of(adjacency.to)
-                if neighbour in visited:
-                    continue
-                if not state.province(neighbour).is_sea():
-                    continue
-                if neighbour in target_neighbours:
-                    return True
-                visited.add(neighbour)
-                next_frontier.add(neighbour)
-        frontier = next_frontier
-    return False
+    return state.convoys().fleet_reaches(fleet_location, coast_location)
 
 
 def _sea_neighbours(state: StateView, location: str) -> Set[str]:
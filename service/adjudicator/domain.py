@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import ClassVar, Dict, List, Optional, Tuple, Union
+from typing import ClassVar, Dict, Iterable, List, Optional, Tuple, Union
 
 
 class Pass:
@@ -116,6 +116,218 @@ VictoryCondition = Union[
 ]
 
 
+@dataclass(frozen=True)
+class VariantIndex:
+    """
+    Integer-indexed form of a Variant's graph.
+
+    Every province, named coast and adjacency target is interned to a
+    small int (its position in `ids`). Army and fleet reachability are
+    stored per location as int bitsets — bit `j` of `army_reach[i]` is set
+    iff an army at `ids[i]` can move to `ids[j]` — and the parent and
+    named-coast tables are precomputed. The Variant's string API
+    (`parent_of`, `coasts_of`, `can_move`, `can_support_to`,
+    `has_fleet_access`, `is_sea`, `is_coastal`) is a facade over these
+    tables, so legality checks and option generation get O(1) lookups
+    without handling ints themselves; code that wants to work on
+    whole neighbourhoods at once can use the bitsets directly.
+
+    The index is built once per Variant instance on first use; a Variant
+    held by the compiled-variant cache carries its index across
+    adjudications.
+    """
+    ids: Tuple[str, ...]
+    index_of: Dict[str, int]
+    parent: Tuple[int, ...]
+    coasts: Tuple[Tuple[int, ...], ...]
+    army_reach: Tuple[int, ...]
+    fleet_reach: Tuple[int, ...]
+    fleet_access: int
+    sea: int
+    parent_by_location: Dict[str, str]
+    coasts_by_parent: Dict[str, Tuple[str, ...]]
+    # Derived neighbourhood tables, all bitsets over `ids`:
+    #   locations          every province and named coast
+    #   coastal            land provinces with fleet access (convoy endpoints)
+    #   multi_coast        parents that have named coasts
+    #   army/fleet_parent_reach[i]  parents of the locations reachable from i
+    #   sea_reach[i]       sea provinces a fleet at i can move to
+    #   sea_neighbours[i]  sea provinces touching i's parent or its coasts
+    #   landings[s]        provinces whose sea_neighbours include sea s
+    locations: int
+    coastal: int
+    multi_coast: int
+    army_parent_reach: Tuple[int, ...]
+    fleet_parent_reach: Tuple[int, ...]
+    sea_reach: Tuple[int, ...]
+    sea_neighbours: Tuple[int, ...]
+    landings: Tuple[int, ...]
+
+    @classmethod
+    def build(cls, variant: "Variant") -> "VariantIndex":
+        ids: List[str] = []
+        index_of: Dict[str, int] = {}
+
+        def intern(location_id: str) -> int:
+            i = index_of.get(location_id)
+            if i is None:
+                i = index_of[location_id] = len(ids)
+                ids.append(location_id)
+            return i
+
+        for province_id in variant.provinces:
+            intern(province_id)
+        for named in variant.named_coasts.values():
+            intern(named.id)
+            intern(named.parent_province)
+        for location_id in list(ids):
+            for adjacency in variant.adjacencies_of(location_id):
+                intern(adjacency.to)
+
+        parent = list(range(len(ids)))
+        coasts: List[List[int]] = [[] for _ in ids]
+        for named in variant.named_coasts.values():
+            parent_index = index_of[named.parent_province]
+            parent[index_of[named.id]] = parent_index
+            coasts[parent_index].append(index_of[named.id])
+
+        army_reach = [0] * len(ids)
+        fleet_reach = [0] * len(ids)
+        for location_id in ids:
+            i = index_of[location_id]
+            # `can_move` honours the first adjacency listed for a target,
+            # so a later duplicate edge never widens the pass type.
+            seen = 0
+            for adjacency in variant.adjacencies_of(location_id):
+                bit = 1 << index_of[adjacency.to]
+                if seen & bit:
+                    continue
+                seen |= bit
+                if adjacency.allows(Unit.ARMY):
+                    army_reach[i] |= bit
+                if adjacency.allows(Unit.FLEET):
+                    fleet_reach[i] |= bit
+
+        fleet_access = 0
+        sea = 0
+        for province in variant.provinces.values():
+            i = index_of[province.id]
+            if province.type == ProvinceType.SEA:
+                sea |= 1 << i
+            if (
+                province.type == ProvinceType.SEA
+                or coasts[i]
+                or any(adjacency.allows(Unit.FLEET) for adjacency in province.adjacencies)
+            ):
+                fleet_access |= 1 << i
+
+        def parents_of(mask: int) -> int:
+            out = 0
+            while mask:
+                low = mask & -mask
+                out |= 1 << parent[low.bit_length() - 1]
+                mask ^= low
+            return out
+
+        army_parent_reach = [parents_of(m) for m in army_reach]
+        fleet_parent_reach = [parents_of(m) for m in fleet_reach]
+        sea_reach = [m & sea for m in fleet_parent_reach]
+
+        sea_neighbours = [0] * len(ids)
+        for i in range(len(ids)):
+            p = parent[i]
+            mask = sea_reach[p]
+            for c in coasts[p]:
+                mask |= sea_reach[c]
+            sea_neighbours[i] = mask
+
+        landings = [0] * len(ids)
+        locations = 0
+        coastal = 0
+        multi_coast = 0
+        for province_id, province in variant.provinces.items():
+            i = index_of[province_id]
+            locations |= 1 << i
+            if coasts[i]:
+                multi_coast |= 1 << i
+            if province.type != ProvinceType.SEA and fleet_access >> i & 1:
+                coastal |= 1 << i
+            mask = sea_neighbours[i]
+            while mask:
+                low = mask & -mask
+                landings[low.bit_length() - 1] |= 1 << i
+                mask ^= low
+        for coast_id in variant.named_coasts:
+            locations |= 1 << index_of[coast_id]
+
+        return cls(
+            ids=tuple(ids),
+            index_of=index_of,
+            parent=tuple(parent),
+            coasts=tuple(tuple(c) for c in coasts),
+            army_reach=tuple(army_reach),
+            fleet_reach=tuple(fleet_reach),
+            fleet_access=fleet_access,
+            sea=sea,
+            parent_by_location={
+                named.id: named.parent_province for named in variant.named_coasts.values()
+            },
+            coasts_by_parent={
+                ids[i]: tuple(ids[c] for c in cs) for i, cs in enumerate(coasts) if cs
+            },
+            locations=locations,
+            coastal=coastal,
+            multi_coast=multi_coast,
+            army_parent_reach=tuple(army_parent_reach),
+            fleet_parent_reach=tuple(fleet_parent_reach),
+            sea_reach=tuple(sea_reach),
+            sea_neighbours=tuple(sea_neighbours),
+            landings=tuple(landings),
+        )
+
+    def reach(self, unit_type: str) -> Tuple[int, ...]:
+        """The per-location reachability bitsets for `unit_type`."""
+        if unit_type == Unit.ARMY:
+            return self.army_reach
+        if unit_type == Unit.FLEET:
+            return self.fleet_reach
+        return (0,) * len(self.ids)
+
+    def parent_reach(self, unit_type: str) -> Tuple[int, ...]:
+        """The per-location bitsets of parent provinces reachable for
+        `unit_type` — the provinces a unit there can support into."""
+        if unit_type == Unit.ARMY:
+            return self.army_parent_reach
+        if unit_type == Unit.FLEET:
+            return self.fleet_parent_reach
+        return (0,) * len(self.ids)
+
+    def neighbours(self, location_id: str, unit_type: str) -> Tuple[str, ...]:
+        """The locations a `unit_type` at `location_id` can move to."""
+        i = self.index_of.get(location_id)
+        if i is None:
+            return ()
+        return self.ids_in(self.reach(unit_type)[i])
+
+    def mask_of(self, location_ids: Iterable[str]) -> int:
+        """The bitset of the given location ids; unknown ids are ignored."""
+        mask = 0
+        for location_id in location_ids:
+            i = self.index_of.get(location_id)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def ids_in(self, mask: int) -> Tuple[str, ...]:
+        """Decode a bitset back to location ids, in interning order."""
+        out: List[str] = []
+        while mask:
+            low = mask & -mask
+            out.append(self.ids[low.bit_length() - 1])
+            mask ^= low
+        return tuple(out)
+
+
 @dataclass(frozen=True)
 class Variant:
     id: str
@@ -145,43 +357,83 @@ class Variant:
             return self.named_coasts[location_id].adjacencies
         return ()
 
+    @property
+    def index(self) -> VariantIndex:
+        index = self.__dict__.get("_index")
+        if index is None:
+            index = VariantIndex.build(self)
+            object.__setattr__(self, "_index", index)
+        return index
+
+    def home_distances(self, nation: str) -> Dict[str, int]:
+        """
+        Unweighted distance from each location to the nearest home
+        supply center of `nation` (or a named coast of one), over the
+        raw adjacency graph with pass type ignored. Unreachable
+        locations are absent; a nation without home centers gets an
+        empty map.
+
+        Home centers are fixed per variant, so each nation's map is
+        computed once per Variant instance and cached alongside its
+        index. Callers must not mutate the returned dict.
+        """
+        cache = self.__dict__.get("_home_distances")
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_home_distances", cache)
+        distances = cache.get(nation)
+        if distances is None:
+            distances = cache[nation] = self._home_distances_bfs(nation)
+        return distances
+
+    def _home_distances_bfs(self, nation: str) -> Dict[str, int]:
+        frontier = [
+            location
+            for province in self.provinces.values()
+            if province.home_nation == nation
+            for location in (province.id, *self.coasts_of(province.id))
+        ]
+        distances: Dict[str, int] = {location: 0 for location in frontier}
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier: List[str] = []
+            for location in frontier:
+                for adjacency in self.adjacencies_of(location):
+                    if adjacency.to not in distances:
+                        distances[adjacency.to] = depth
+                        next_frontier.append(adjacency.to)
+            frontier = next_frontier
+        return distances
+
     def can_move(self, from_loc: str, to_loc: str, unit_type: str) -> bool:
-        for adjacency in self.adjacencies_of(from_loc):
-            if adjacency.to == to_loc:
-                return adjacency.allows(unit_type)
-        return False
+        index = self.index
+        i = index.index_of.get(from_loc)
+        j = index.index_of.get(to_loc)
+        if i is None or j is None:
+            return False
+        return bool(index.reach(unit_type)[i] >> j & 1)
 
     def parent_of(self, location_id: str) -> str:
-        named = self.named_coasts.get(location_id)
-        if named is not None:
-            return named.parent_province
-        return location_id
+        return self.index.parent_by_location.get(location_id, location_id)
 
     def coasts_of(self, province_id: str) -> Tuple[str, ...]:
-        return tuple(
-            nc.id for nc in self.named_coasts.values()
-            if nc.parent_province == province_id
-        )
+        return self.index.coasts_by_parent.get(province_id, ())
 
     def can_support_to(self, from_loc: str, to_loc: str, unit_type: str) -> bool:
         """
         Whether a unit at `from_loc` can support an order targeting
         `to_loc`. A supporter can support to a province by any path it
         could move to, including via any named coast of that province
-        (DATC 6.B.4).
+        (DATC 6.B.4) — that is, iff the parent of `to_loc` is in the
+        supporter's parent reach.
         """
-        if self.can_move(from_loc, to_loc, unit_type):
-            return True
-        parent = self.parent_of(to_loc)
-        if parent != to_loc and self.can_move(from_loc, parent, unit_type):
-            return True
-        target_parent = parent if parent != to_loc else to_loc
-        for coast in self.coasts_of(target_parent):
-            if coast == to_loc:
-                continue
-            if self.can_move(from_loc, coast, unit_type):
-                return True
-        return False
+        index = self.index
+        i = index.index_of.get(from_loc)
+        j = index.index_of.get(to_loc)
+        if i is None or j is None:
+            return False
+        return bool(index.parent_reach(unit_type)[i] >> index.parent[j] & 1)
 
     def has_fleet_access(self, prov_id: str) -> bool:
         """
@@ -189,18 +441,19 @@ class Variant:
         province (directly or via a named coast). Inland provinces with no
         coastal access return False.
         """
-        province = self.provinces.get(prov_id)
-        if province is None:
-            return False
-        if province.type == ProvinceType.SEA:
-            return True
-        for adjacency in province.adjacencies:
-            if adjacency.allows(Unit.FLEET):
-                return True
-        for named in self.named_coasts.values():
-            if named.parent_province == prov_id:
-                return True
-        return False
+        i = self.index.index_of.get(prov_id)
+        return i is not None and bool(self.index.fleet_access >> i & 1)
+
+    def is_sea(self, location_id: str) -> bool:
+        """Whether `location_id` is a sea province. Named coasts are not."""
+        i = self.index.index_of.get(location_id)
+        return i is not None and bool(self.index.sea >> i & 1)
+
+    def is_coastal(self, prov_id: str) -> bool:
+        """Whether `prov_id` is a land province with fleet access — the
+        provinces an army can be convoyed from or to."""
+        i = self.index.index_of.get(prov_id)
+        return i is not None and bool(self.index.coastal >> i & 1)
 
     def is_convoyable(self, source: str, target: str) -> bool:
         """
@@ -214,7 +467,7 @@ class Variant:
         return self.has_fleet_access(source) and self.has_fleet_access(target)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Phase:
     season: str
     year: int
@@ -225,7 +478,7 @@ class Phase:
     ADJUSTMENT: ClassVar[str] = "Adjustment"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Unit:
     nation: str
     type: str
@@ -237,13 +490,13 @@ class Unit:
     FLEET: ClassVar[str] = "Fleet"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SupplyCenter:
     nation: str
     province: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Resolution:
     province: str
     resolution: str
@@ -258,7 +511,7 @@ class Outcome:
     year: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Order:
     nation: str
     source: Optional[str]
@@ -282,7 +535,7 @@ class State:
     contested_provinces: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderOption:
     source: Optional[str]
     order_type: str
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 # === Imports ===
+import time
+from concurrent.futures import Executor
 from dataclasses import dataclass, replace
-from typing import ClassVar, Dict, List, Tuple, Type
+from typing import ClassVar, Dict, List, Optional, Sequence, Tuple, Type
 
-from .convoy import convoy_path_exists, is_convoy_redundant
+from .convoy import ConvoyOracle, convoy_path_exists, is_convoy_redundant
 from .domain import (
     Phase,
     Resolution,
@@ -12,6 +14,7 @@ from .domain import (
     SupplyCenter,
     Unit,
 )
+from .profiling import active_profile
 from .resolution import resolve_strengths_and_cuts
 from .types import (
     ALLOW_NON_HOME_BUILDS,
@@ -1441,6 +1444,42 @@ class Engine:
         MOVEMENT / RETREAT / ADJUSTMENT — or when the slice doesn't
         cover an order type present in state.orders (raised by the
         parse_* reducer of the relevant phase)."""
+        return self._adjudicate(state, ConvoyOracle(state.variant.index))
+
+    def adjudicate_many(
+        self,
+        states: Sequence[State],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 8,
+    ) -> List[List[State]]:
+        """Resolve independent states in one call; element i of the result
+        is what adjudicate(states[i]) returns.
+
+        States that share a Variant object also share its ConvoyOracle,
+        whose sea components depend only on the graph and the fleet set.
+        With an executor, states are grouped by variant into chunks of at
+        most `chunk_size`, one task each, so every task pickles its
+        variant once. The first exception raised propagates."""
+        if executor is None:
+            oracles: Dict[int, ConvoyOracle] = {}
+            results = []
+            for state in states:
+                convoys = oracles.get(id(state.variant))
+                if convoys is None:
+                    convoys = oracles[id(state.variant)] = ConvoyOracle(state.variant.index)
+                results.append(self._adjudicate(state, convoys))
+            return results
+        out: List[Optional[List[State]]] = [None] * len(states)
+        chunks = [
+            (positions, executor.submit(_adjudicate_chunk, [states[i] for i in positions]))
+            for positions in chunk_by_variant(states, chunk_size)
+        ]
+        for positions, future in chunks:
+            for i, resolved in zip(positions, future.result()):
+                out[i] = resolved
+        return out
+
+    def _adjudicate(self, state: State, convoys: ConvoyOracle) -> List[State]:
         resolver_cls = _PHASE_RESOLVER_REGISTRY.get(state.phase.type)
         if resolver_cls is None:
             raise NotImplementedError(
@@ -1448,20 +1487,37 @@ class Engine:
             )
         adj = self._to_adjudication_state(state)
         for action in resolver_cls.actions_for(adj):
-            adj = self.dispatch(adj, action)
+            adj = self.dispatch(adj, action, convoys)
         return self._to_external_states(state, adj)
 
-    def dispatch(self, state: AdjudicationState, action: Action) -> AdjudicationState:
+    def dispatch(
+        self,
+        state: AdjudicationState,
+        action: Action,
+        convoys: Optional[ConvoyOracle] = None,
+    ) -> AdjudicationState:
         """Look up the Reducer subclass registered for `type(action)` and
         apply its `reduce` classmethod. Wraps state into a StateView for
         the reducer and unwraps the returned view via .raw. Raises
         ValueError if no reducer is registered — that indicates a wiring
-        bug, not a user-input problem."""
+        bug, not a user-input problem.
+
+        `convoys` lets adjudicate() share one ConvoyOracle across every
+        reducer of a phase, so the solver, the convoy checks, and the
+        reachability pass reuse each other's sea components.
+
+        Under `profiling.profile_adjudication()` each call's wall time is
+        recorded against the reducer class."""
         reducer = _REDUCER_REGISTRY.get(type(action))
         if reducer is None:
             raise ValueError(f"No reducer registered for {type(action).__name__}")
-        view = StateView(state)
+        view = StateView(state, convoys)
+        profile = active_profile()
+        if profile is None:
+            return reducer.reduce(view, action).raw
+        started = time.perf_counter()
         result = reducer.reduce(view, action)
+        profile.record_reducer(reducer.__name__, time.perf_counter() - started)
         return result.raw
 
     def _to_adjudication_state(self, state: State) -> AdjudicationState:
@@ -1531,3 +1587,21 @@ class Engine:
             contested_provinces=tuple(adj.next_contested_provinces),
         )
         return [resolved, next_state]
+
+
+def chunk_by_variant(states: Sequence[State], chunk_size: int) -> List[List[int]]:
+    """Positions of `states` grouped by Variant object and split into runs
+    of at most `chunk_size`: the unit of work adjudicate_many and
+    pipeline.resolve_states hand an executor."""
+    groups: Dict[int, List[int]] = {}
+    for i, state in enumerate(states):
+        groups.setdefault(id(state.variant), []).append(i)
+    return [
+        positions[start:start + chunk_size]
+        for positions in groups.values()
+        for start in range(0, len(positions), chunk_size)
+    ]
+
+
+def _adjudicate_chunk(states: List[State]) -> List[List[State]]:
+    return Engine().adjudicate_many(states)
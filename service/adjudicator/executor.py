@@ -0,0 +1,203 @@
+"""Warm process pool for adjudication.
+
+`resolve` used to run the engine, option enumeration and the godip dict
+conversion on the calling thread. In the Procrastinate worker that is a
+thread sharing one interpreter with the event loop, so a long
+adjudication held the GIL and starved every other job the worker could
+have been running. `AdjudicationExecutor` ships that pure CPU work to a
+pool of worker processes instead: the caller still reads the phase and
+writes the next one, and only the canonical game state crosses the
+process boundary, in both directions as plain dicts.
+
+Each worker process keeps its own `adjudicator.compiled` cache. The pool
+preloads it with the variants passed at construction, so a worker never
+compiles a variant on the hot path. A variant that is missing or stale in
+a worker is reported back instead of resolved, and the caller resubmits
+with the canonical variant attached. The worker compiles it once and
+keeps it for later submissions.
+
+`queue_depth` bounds how many adjudications may be submitted and not yet
+finished, counting each chunk of a `resolve_states` batch as one;
+further callers wait for a slot, for at most `slot_timeout` seconds,
+then get `TimeoutError`. Pool size, in-flight depth and per-adjudication
+wall time are exported as OpenTelemetry metrics.
+
+Workers are started with the forkserver method. Nothing in this module
+imports Django, so they never run `django.setup()`, and none inherits the
+parent's database connections or threads.
+
+Public symbols: `AdjudicationExecutor`. Everything else is
+module-private.
+"""
+import logging
+import multiprocessing
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from .compiled import get_compiled_variant
+from .domain import State
+from .pipeline import resolve_state, resolve_states
+from .serializers import deserialize_game_state
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+_live_executors: "weakref.WeakSet[AdjudicationExecutor]" = weakref.WeakSet()
+
+
+def _observe_pool_size(options: CallbackOptions) -> Iterable[Observation]:
+    yield Observation(sum(executor.max_workers for executor in list(_live_executors)))
+
+
+meter.create_observable_gauge(
+    "adjudicator.executor.pool_size",
+    callbacks=[_observe_pool_size],
+    unit="{process}",
+    description="Worker processes in the adjudication pools of this process",
+)
+_queue_depth = meter.create_up_down_counter(
+    "adjudicator.executor.queue_depth",
+    unit="{adjudication}",
+    description="Adjudications submitted to the pool and not yet finished",
+)
+_duration = meter.create_histogram(
+    "adjudicator.executor.duration",
+    unit="ms",
+    description="Wall time of one pooled adjudication, including queueing",
+)
+
+
+class _VariantNotCached(Exception):
+    pass
+
+
+class AdjudicationExecutor:
+    """Resolve canonical game states on a pool of warm worker processes.
+
+    `variants` is an iterable of `(variant_id, updated_at,
+    canonical_variant)` triples compiled into every worker as it starts."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        queue_depth: int,
+        variants: Iterable[Tuple[str, Any, Dict[str, Any]]] = (),
+        slot_timeout: Optional[float] = None,
+    ):
+        self.max_workers = max_workers
+        self.queue_depth = max(queue_depth, 1)
+        self.slot_timeout = slot_timeout
+        self._slots = threading.BoundedSemaphore(self.queue_depth)
+        self._pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_warm_worker,
+            initargs=(list(variants),),
+        )
+        _live_executors.add(self)
+
+    def resolve(
+        self,
+        variant_id: str,
+        updated_at: Any,
+        load_canonical_variant: Callable[[], Dict[str, Any]],
+        game_state: Dict[str, Any],
+        skip_nations: Collection[str],
+    ) -> Dict[str, Any]:
+        """Resolve `game_state` in a worker and return the same dict
+        `pipeline.resolve_state` does. Blocks until a queue slot is free
+        and the worker has answered, so call it outside any transaction;
+        raises `TimeoutError` when no slot frees up within `slot_timeout`.
+        Exceptions raised by the engine are re-raised here.
+        `load_canonical_variant` is only called when the worker that
+        picked the job up does not hold the variant yet."""
+        started = time.perf_counter()
+        self._acquire_slot()
+        try:
+            args = (variant_id, updated_at, game_state, frozenset(skip_nations))
+            try:
+                return self._pool.submit(_resolve_in_worker, *args).result()
+            except _VariantNotCached:
+                logger.info(f"Shipping variant {variant_id} to an adjudication worker")
+                return self._pool.submit(_resolve_in_worker, *args, load_canonical_variant()).result()
+        finally:
+            self._release_slot(started, variant_id)
+
+    def resolve_states(
+        self, items: Sequence[Tuple[State, Collection[str]]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Batch form for states the caller has already built:
+        `pipeline.resolve_states` run across this pool, one task per
+        variant chunk. Used by `resolve_many`, outside any transaction.
+        Each chunk waits for a queue slot like `resolve` does; a chunk that
+        gets none within `slot_timeout` comes back as None per item."""
+        return resolve_states(items, _SlottedPool(self))
+
+    def _acquire_slot(self) -> None:
+        if not self._slots.acquire(timeout=self.slot_timeout):
+            raise TimeoutError(f"No adjudication slot free within {self.slot_timeout}s")
+        _queue_depth.add(1)
+
+    def _release_slot(self, started: float, variant_id: str) -> None:
+        _queue_depth.add(-1)
+        self._slots.release()
+        _duration.record((time.perf_counter() - started) * 1000, {"variant.id": variant_id})
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+        _live_executors.discard(self)
+
+
+class _SlottedPool:
+    """The `submit` side of an executor, handed to `pipeline.resolve_states`
+    so every chunk holds one of the executor's queue slots while it runs."""
+
+    def __init__(self, executor: AdjudicationExecutor):
+        self._executor = executor
+
+    def submit(self, fn: Callable[..., Any], items: List[Tuple[State, Collection[str]]]) -> Future:
+        started = time.perf_counter()
+        variant_id = items[0][0].variant.id
+        try:
+            self._executor._acquire_slot()
+        except TimeoutError as e:
+            future: Future = Future()
+            future.set_exception(e)
+            return future
+        try:
+            future = self._executor._pool.submit(fn, items)
+        except BaseException:
+            self._executor._release_slot(started, variant_id)
+            raise
+        future.add_done_callback(lambda _: self._executor._release_slot(started, variant_id))
+        return future
+
+
+def _warm_worker(variants: Iterable[Tuple[str, Any, Dict[str, Any]]]) -> None:
+    for variant_id, updated_at, canonical_variant in variants:
+        get_compiled_variant(variant_id, updated_at, lambda canonical=canonical_variant: canonical)
+
+
+def _variant_not_cached() -> Dict[str, Any]:
+    raise _VariantNotCached()
+
+
+def _resolve_in_worker(
+    variant_id: str,
+    updated_at: Any,
+    game_state: Dict[str, Any],
+    skip_nations: Collection[str],
+    canonical_variant: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    if canonical_variant is None:
+        compiled = get_compiled_variant(variant_id, updated_at, _variant_not_cached)
+    else:
+        compiled = get_compiled_variant(variant_id, updated_at, lambda: canonical_variant)
+    variant = compiled.variant
+    return resolve_state(deserialize_game_state(game_state, variant), skip_nations)
@@ -0,0 +1,264 @@
+"""Random legal Movement positions for stress-testing the engine.
+
+`random_position(variant, density, mix, seed)` places units on a
+`density` fraction of the variant's provinces, owned by random nations,
+and gives every unit an order drawn from `get_options`, so each order is
+one the engine would accept from a player. `OrderMix` weighs the shapes
+the orders are grouped into:
+
+  * hold -- the unit holds;
+  * move -- the unit moves; with probability `ring` the move continues
+    into the unit standing on the target, which is ordered next, so
+    moves chain and close into rings whenever a chain can reach its
+    start;
+  * support -- the unit backs a move already ordered to a province it
+    can reach, or, failing that, supports a unit with no order yet and
+    gives that unit the matching hold or move, so supports pile onto the
+    same attacks and form webs;
+  * convoy -- an army that can be convoyed picks a destination and every
+    unordered fleet offering that convoy joins it, giving multi-fleet
+    chains.
+
+`SUPPORT_WEB`, `MOVE_RINGS`, `CONVOY_CHAINS` and `MIXED` are the presets
+the scaling benchmark sweeps. Generation is deterministic per seed.
+
+Public symbols: `OrderMix`, `SUPPORT_WEB`, `MOVE_RINGS`, `CONVOY_CHAINS`,
+`MIXED`, and `random_position`. Everything else is module-private.
+"""
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from .domain import Order, OrderOption, Phase, ProvinceType, State, SupplyCenter, Unit, Variant
+from .options import get_options
+
+
+@dataclass(frozen=True)
+class OrderMix:
+    """Relative weights of the order shapes, and the chance a move
+    continues into the unit on its target."""
+
+    hold: float = 1.0
+    move: float = 1.0
+    support: float = 1.0
+    convoy: float = 0.0
+    ring: float = 0.0
+
+
+SUPPORT_WEB = OrderMix(hold=0.5, move=1.0, support=6.0)
+MOVE_RINGS = OrderMix(hold=0.2, move=4.0, support=0.5, ring=0.9)
+CONVOY_CHAINS = OrderMix(hold=0.2, move=1.0, support=1.0, convoy=4.0, ring=0.2)
+MIXED = OrderMix(hold=1.0, move=2.0, support=2.0, convoy=0.5, ring=0.3)
+
+
+def random_position(variant: Variant, density: float, mix: OrderMix = MIXED, seed: int = 0) -> State:
+    """A Movement-phase State with units on `density` (0 to 1) of the
+    variant's provinces and one legal order per unit."""
+    rng = random.Random(seed)
+    units = _place_units(variant, density, rng)
+    state = State(
+        variant=variant,
+        phase=Phase(season=variant.phase_progression.seasons[0], year=1901, type=Phase.MOVEMENT),
+        units=units,
+        supply_centers=[
+            SupplyCenter(nation=province.home_nation, province=province.id)
+            for province in variant.provinces.values()
+            if province.supply_center and province.home_nation
+        ],
+        orders=[],
+        resolutions=None,
+        skipped=False,
+        outcome=None,
+    )
+    state.orders = _OrderBuilder(state, mix, rng).build()
+    return state
+
+
+def _place_units(variant: Variant, density: float, rng: random.Random) -> List[Unit]:
+    nations = [nation.id for nation in variant.nations if not nation.non_playable] or [
+        nation.id for nation in variant.nations
+    ]
+    provinces = sorted(variant.provinces)
+    rng.shuffle(provinces)
+    count = round(max(0.0, min(density, 1.0)) * len(provinces))
+    units = []
+    for province_id in provinces[:count]:
+        province = variant.provinces[province_id]
+        fleet_locations = _fleet_locations(variant, province_id)
+        if province.type == ProvinceType.SEA or (fleet_locations and rng.random() < 0.5):
+            units.append(Unit(nation=rng.choice(nations), type=Unit.FLEET, location=rng.choice(fleet_locations)))
+        else:
+            units.append(Unit(nation=rng.choice(nations), type=Unit.ARMY, location=province_id))
+    return units
+
+
+def _fleet_locations(variant: Variant, province_id: str) -> List[str]:
+    province = variant.provinces[province_id]
+    if province.type == ProvinceType.SEA:
+        return [province_id]
+    coasts = variant.coasts_of(province_id)
+    if coasts:
+        return list(coasts)
+    if any(adjacency.pass_ in ("fleet", "both") for adjacency in province.adjacencies):
+        return [province_id]
+    return []
+
+
+def _option_sort_key(option: OrderOption):
+    return (
+        option.source or "",
+        option.order_type,
+        option.target or "",
+        option.aux or "",
+        option.unit_type or "",
+        option.named_coast or "",
+    )
+
+
+class _OrderBuilder:
+    def __init__(self, state: State, mix: OrderMix, rng: random.Random):
+        self.variant = state.variant
+        self.mix = mix
+        self.rng = rng
+        self.unit_by_parent = {self.variant.parent_of(unit.location): unit for unit in state.units}
+        self.options: Dict[str, List[OrderOption]] = {}
+        # get_options walks sets, so its order varies with the hash seed;
+        # sorting keeps a seed's position the same in every process.
+        for option in sorted(get_options(state), key=_option_sort_key):
+            self.options.setdefault(option.source, []).append(option)
+        self.orders: Dict[str, Order] = {}
+        self.moves_by_target: Dict[str, List[str]] = {}
+
+    def build(self) -> List[Order]:
+        units = list(self.unit_by_parent.values())
+        self.rng.shuffle(units)
+        for unit in units:
+            if unit.location in self.orders:
+                continue
+            shape = self._pick_shape(unit)
+            if shape == "convoy" and self._convoy(unit):
+                continue
+            if shape == "support" and self._support(unit):
+                continue
+            if shape in ("move", "convoy", "support") and self._move(unit):
+                continue
+            self._order(unit, "Hold")
+        return list(self.orders.values())
+
+    def _pick_shape(self, unit: Unit) -> str:
+        weights = {"hold": self.mix.hold, "move": self.mix.move, "support": self.mix.support}
+        if unit.type == Unit.ARMY:
+            weights["convoy"] = self.mix.convoy
+        shapes = [shape for shape, weight in weights.items() if weight > 0]
+        if not shapes:
+            return "hold"
+        return self.rng.choices(shapes, [weights[shape] for shape in shapes])[0]
+
+    def _unit_options(self, unit: Unit, order_type: str) -> List[OrderOption]:
+        return [option for option in self.options.get(unit.location, ()) if option.order_type == order_type]
+
+    def _direct_moves(self, unit: Unit) -> List[OrderOption]:
+        # "Move" options include destinations only a convoy reaches; those
+        # are left to the convoy shape, which orders the fleets as well.
+        return [
+            option
+            for option in self._unit_options(unit, "Move")
+            if self.variant.can_move(unit.location, option.target, unit.type)
+        ]
+
+    def _order(
+        self,
+        unit: Unit,
+        order_type: str,
+        target: Optional[str] = None,
+        aux: Optional[str] = None,
+        via_convoy: bool = False,
+    ) -> None:
+        self.orders[unit.location] = Order(
+            nation=unit.nation,
+            source=unit.location,
+            order_type=order_type,
+            target=target,
+            aux=aux,
+            via_convoy=via_convoy,
+        )
+        if order_type == "Move":
+            self.moves_by_target.setdefault(self.variant.parent_of(target), []).append(unit.location)
+
+    def _move(self, unit: Unit) -> bool:
+        chain: Set[str] = set()
+        start = self.variant.parent_of(unit.location)
+        current: Optional[Unit] = unit
+        ordered_any = False
+        while current is not None:
+            options = self._direct_moves(current)
+            if not options:
+                break
+            chain.add(self.variant.parent_of(current.location))
+            closing = [option for option in options if self.variant.parent_of(option.target) == start]
+            if len(chain) > 1 and closing:
+                option = self.rng.choice(closing)
+            else:
+                option = self.rng.choice(options)
+            self._order(current, "Move", target=option.target)
+            ordered_any = True
+            next_unit = self.unit_by_parent.get(self.variant.parent_of(option.target))
+            if (
+                next_unit is None
+                or next_unit.location in self.orders
+                or self.rng.random() >= self.mix.ring
+            ):
+                break
+            current = next_unit
+        return ordered_any
+
+    def _support(self, unit: Unit) -> bool:
+        candidates = []
+        backing = []
+        for option in self._unit_options(unit, "Support"):
+            supported = self.unit_by_parent.get(self.variant.parent_of(option.aux))
+            if supported is None:
+                continue
+            order = self.orders.get(supported.location)
+            if option.aux == option.target:
+                if order is None or order.order_type != "Move":
+                    candidates.append(option)
+            elif order is None:
+                if any(move.target == option.target for move in self._direct_moves(supported)):
+                    candidates.append(option)
+            elif order.order_type == "Move" and order.target == option.target:
+                backing.append(option)
+        if not backing and not candidates:
+            return False
+        option = self.rng.choice(backing or candidates)
+        supported = self.unit_by_parent[self.variant.parent_of(option.aux)]
+        if option.aux == option.target:
+            self._order(unit, "Support", aux=option.aux)
+            if supported.location not in self.orders:
+                self._order(supported, "Hold")
+            return True
+        self._order(unit, "Support", target=option.target, aux=option.aux)
+        if supported.location not in self.orders:
+            self._order(supported, "Move", target=option.target)
+        return True
+
+    def _convoy(self, unit: Unit) -> bool:
+        options = self._unit_options(unit, "MoveViaConvoy")
+        self.rng.shuffle(options)
+        for option in options:
+            fleets = [
+                fleet
+                for fleet in self.unit_by_parent.values()
+                if fleet.location not in self.orders
+                and any(
+                    convoy.aux == unit.location and convoy.target == option.target
+                    for convoy in self._unit_options(fleet, "Convoy")
+                )
+            ]
+            if not fleets:
+                continue
+            self._order(unit, "Move", target=option.target, via_convoy=True)
+            for fleet in fleets:
+                self._order(fleet, "Convoy", target=option.target, aux=unit.location)
+            return True
+        return False
@@ -4,13 +4,19 @@ For each phase, enumerates the complete set of legal orders a player could
 submit, returned as a flat list of `OrderOption` records. The design lives
 outside the `engine.py` rubric — see `docs/options-design.md`.
 
-The core pattern reuses the existing `LEGALITY_CHECKS` from `types.py` as
-the authoritative filter so options can't drift from what the engine
-accepts. For convoy-dependent enumeration the module falls back to
-`convoy_path_exists` over the physical fleet positions on the board,
-mirroring godip's options semantics (which don't depend on submitted
-convoys). This is documented as the only intentional divergence from the
-engine's legality semantics.
+The `LEGALITY_CHECKS` in `types.py` are the authoritative filter, but no
+phase runs candidates through them here: Movement options (the hot
+path) are derived from the variant's reachability bitsets check by
+check, and Retreat and Adjustment options are read directly off the
+resolved state. The scalar per-candidate enumeration survives in the
+tests as the parity reference for all three, so options can't drift
+from what the engine accepts. `option_nations` answers the cheaper
+question of who has any option at all, which is all the phase-skip
+loop needs. For convoy-dependent enumeration the module uses sea-province
+closures over the physical fleet positions on the board, mirroring
+godip's options semantics (which don't depend on submitted convoys).
+This is documented as the only intentional divergence from the engine's
+legality semantics.
 
 Named-coast convention matches godip: the coast id is placed directly in
 the location field (`target` for moves, `source` for builds). The
@@ -23,25 +29,11 @@ order for submission.
 """
 from __future__ import annotations
 
-from typing import List, Tuple
-
-from .convoy import convoy_path_exists, convoy_path_through_fleet
-from .domain import OrderOption, Phase, ProvinceType, State, Unit
-from .types import (
-    AdjudicationState,
-    AdjustmentDisbandOrder,
-    BuildOrder,
-    ConvoyFleetReachesEndpointsCheck,
-    ConvoyOrder,
-    MoveOrder,
-    MoveTargetIsReachableCheck,
-    OrderType,
-    RetreatOrder,
-    StateView,
-    SupportHoldOrder,
-    SupportMoveOrder,
-    SupportMoveSupportedCanReachCheck,
-)
+from typing import Dict, FrozenSet, List, Tuple
+
+from .convoy import ConvoyOracle
+from .domain import OrderOption, Phase, State, Unit, VariantIndex
+from .types import ALLOW_NON_HOME_BUILDS, AdjudicationState, OrderType, StateView
 
 
 def get_options(state: State) -> List[OrderOption]:
@@ -49,43 +41,78 @@ def get_options(state: State) -> List[OrderOption]:
     eligible units across every nation. Callers filter by nation if
     needed. Raises NotImplementedError for phase types other than
     Movement, Retreat, or Adjustment."""
-    adj = AdjudicationState(
-        variant=state.variant,
-        phase=state.phase,
-        units=tuple(state.units),
-        supply_centers=tuple(state.supply_centers),
-        raw_orders=(),
-        contested_provinces=tuple(state.contested_provinces),
-    )
-    view = StateView(adj)
     phase_type = state.phase.type
     if phase_type == Phase.MOVEMENT:
-        return _movement_options(view)
+        adj = AdjudicationState(
+            variant=state.variant,
+            phase=state.phase,
+            units=tuple(state.units),
+            supply_centers=tuple(state.supply_centers),
+            raw_orders=(),
+            contested_provinces=tuple(state.contested_provinces),
+        )
+        return _movement_options(StateView(adj))
+    if phase_type == Phase.RETREAT:
+        return _retreat_options(state)
+    if phase_type == Phase.ADJUSTMENT:
+        return _adjustment_options(state)
+    raise NotImplementedError(f"Phase type {phase_type!r} is not supported.")
+
+
+def option_nations(state: State) -> FrozenSet[str]:
+    """Ids of the nations that have at least one option in `state` --
+    the nations `get_options` would attribute options to -- without
+    enumerating move, support or retreat targets. Every standing unit can
+    hold in Movement and every playable dislodged unit can disband in
+    Retreat, so only Adjustment needs its (cheap) full pass."""
+    phase_type = state.phase.type
+    if phase_type == Phase.MOVEMENT:
+        return frozenset(u.nation for u in state.units if not u.dislodged)
     if phase_type == Phase.RETREAT:
-        return _retreat_options(view)
+        non_playable = {n.id for n in state.variant.nations if n.non_playable}
+        return frozenset(
+            u.nation
+            for u in {u.location: u for u in state.units if u.dislodged}.values()
+            if u.nation not in non_playable
+        )
     if phase_type == Phase.ADJUSTMENT:
-        return _adjustment_options(view)
+        return frozenset(nation for nation, _ in _adjustment_entries(state))
     raise NotImplementedError(f"Phase type {phase_type!r} is not supported.")
 
 
 # === Movement phase ===
+#
+# Movement candidates are derived from the variant's reachability bitsets
+# (`Variant.index`) rather than by running every (unit, location) pair
+# through LEGALITY_CHECKS. Each helper notes which checks its bit
+# operations stand in for; the parity test against the scalar
+# per-candidate enumeration keeps the two identical, ordering included.
 
 
 def _movement_options(view: StateView) -> List[OrderOption]:
     options: List[OrderOption] = []
     variant = view.variant()
+    index = variant.index
     units_view = view.units()
     standing_items = tuple(sorted(units_view.standing_by_loc().items()))
-    sea_fleet_locs = tuple(
+    # godip's options semantics treat every standing fleet in a sea
+    # province as available to convoy, whether or not it has been ordered
+    # to. The closures are answered by the state's ConvoyOracle, the same
+    # one the engine's convoy checks consult.
+    sea_fleet_locs = frozenset(
         u.location
         for u in units_view.all()
         if not u.dislodged
         and u.type == Unit.FLEET
         and view.province(variant.parent_of(u.location)).is_sea()
     )
-    all_locations = tuple(
-        list(variant.provinces.keys()) + list(variant.named_coasts.keys())
+    convoys = view.convoys()
+    fleets = convoys.sea_mask(sea_fleet_locs)
+    mover_targets: Dict[Tuple[str, int], int] = {}
+    army_source_parents = sorted(
+        {variant.parent_of(loc) for loc, u in standing_items if u.type == Unit.ARMY}
     )
+    coastal_parents = sorted(index.ids_in(index.coastal))
     for source_loc, unit in standing_items:
         options.append(
             OrderOption(
@@ -97,105 +124,74 @@ def _movement_options(view: StateView) -> List[OrderOption]:
                 named_coast=None,
             )
         )
-        for target in all_locations:
-            order = MoveOrder(
-                nation=unit.nation,
-                source=source_loc,
-                target=target,
-                unit_type=unit.type,
-            )
-            if _move_is_orderable(view, order, sea_fleet_locs):
-                options.append(
-                    OrderOption(
-                        source=source_loc,
-                        order_type=OrderType.MOVE,
-                        target=target,
-                        aux=None,
-                        unit_type=None,
-                        named_coast=None,
-                    )
-                )
-            # godip emits a parallel "MoveViaConvoy" option whenever the
-            # army could reach the target via a chain of fleets currently
-            # on the board. This is the wire-format channel for the
-            # explicit via-convoy intent (DATC 6.G.1/5 head-to-head
-            # exception).
-            if unit.type == Unit.ARMY and _move_has_convoy_path(
-                view, order, sea_fleet_locs
-            ):
-                options.append(
-                    OrderOption(
-                        source=source_loc,
-                        order_type="MoveViaConvoy",
-                        target=target,
-                        aux=None,
-                        unit_type=None,
-                        named_coast=None,
-                    )
-                )
+        options.extend(_move_options(index, source_loc, unit, convoys, fleets))
         options.extend(
             _support_options(
-                view, unit, source_loc, sea_fleet_locs, standing_items
+                variant, unit, source_loc, standing_items, convoys, fleets, mover_targets
             )
         )
-        if unit.type == Unit.FLEET and view.province(
-            variant.parent_of(source_loc)
-        ).is_sea():
+        if source_loc in sea_fleet_locs:
             options.extend(
                 _convoy_options(
-                    view, unit, source_loc, sea_fleet_locs, standing_items
+                    variant, source_loc, convoys, fleets, army_source_parents, coastal_parents
                 )
             )
     return options
 
 
-def _move_is_orderable(
-    view: StateView, order: MoveOrder, sea_fleet_locs: Tuple[str, ...]
-) -> bool:
-    if _fleet_target_is_bare_multi_coast(view, order):
-        return False
-    for check_cls in MoveOrder.LEGALITY_CHECKS:
-        if check_cls.check(view, order):
-            continue
-        if check_cls is MoveTargetIsReachableCheck and _move_has_convoy_path(
-            view, order, sea_fleet_locs
-        ):
-            continue
-        return False
-    return True
-
-
-def _move_has_convoy_path(
-    view: StateView, order: MoveOrder, sea_fleet_locs: Tuple[str, ...]
-) -> bool:
-    if order.unit_type != Unit.ARMY:
-        return False
-    variant = view.variant()
-    target_parent = variant.parent_of(order.target)
-    # Convoyed army moves are always to a bare parent — armies ignore coasts.
-    if order.target != target_parent:
-        return False
-    source_parent = variant.parent_of(order.source)
-    if not view.province(source_parent).is_coastal():
-        return False
-    if not view.province(target_parent).is_coastal():
-        return False
-    if not sea_fleet_locs:
-        return False
-    return convoy_path_exists(view, source_parent, target_parent, sea_fleet_locs)
-
-
-def _fleet_target_is_bare_multi_coast(view: StateView, order: MoveOrder) -> bool:
-    """A fleet enters a multi-coast province only via a specific named
-    coast, never the bare parent — godip models this in its fleet
-    adjacency graph. Armies are unaffected: they move to the bare parent
-    and ignore coasts."""
-    if order.unit_type != Unit.FLEET:
-        return False
-    variant = view.variant()
-    if order.target != variant.parent_of(order.target):
-        return False
-    return bool(variant.coasts_of(order.target))
+def _move_options(
+    index: VariantIndex, source_loc: str, unit: Unit, convoys: ConvoyOracle, fleets: int
+) -> List[OrderOption]:
+    """Move and MoveViaConvoy options for one unit, in the variant's
+    province-then-named-coast order.
+
+    A Move is offered for a directly reachable location
+    (MoveTargetIsReachableCheck) or a convoy destination, never for the
+    unit's own location (MoveTargetIsNotSourceCheck), and never for a
+    fleet into the bare parent of a multi-coast province. godip emits a
+    parallel "MoveViaConvoy" option whenever the army could reach the
+    target via a chain of fleets currently on the board; this is the
+    wire-format channel for the explicit via-convoy intent (DATC 6.G.1/5
+    head-to-head exception)."""
+    i = index.index_of.get(source_loc)
+    if i is None:
+        return []
+    direct = index.reach(unit.type)[i] & index.locations
+    if unit.type == Unit.FLEET:
+        # A fleet enters a multi-coast province only via a specific named
+        # coast, never the bare parent -- godip models this in its fleet
+        # adjacency graph. Armies move to the bare parent and ignore coasts.
+        direct &= ~index.multi_coast
+    via_convoy = 0
+    if unit.type == Unit.ARMY:
+        via_convoy = convoys.army_targets(index.parent[i], fleets)
+    moves = (direct | via_convoy) & ~(1 << i)
+    options: List[OrderOption] = []
+    for target in index.ids_in(moves | via_convoy):
+        bit = 1 << index.index_of[target]
+        if moves & bit:
+            options.append(
+                OrderOption(
+                    source=source_loc,
+                    order_type=OrderType.MOVE,
+                    target=target,
+                    aux=None,
+                    unit_type=None,
+                    named_coast=None,
+                )
+            )
+        if via_convoy & bit:
+            options.append(
+                OrderOption(
+                    source=source_loc,
+                    order_type="MoveViaConvoy",
+                    target=target,
+                    aux=None,
+                    unit_type=None,
+                    named_coast=None,
+                )
+            )
+    return options
 
 
 def _reachable_provinces(variant, source_loc: str, unit_type: str) -> set:
@@ -207,26 +203,34 @@ def _reachable_provinces(variant, source_loc: str, unit_type: str) -> set:
 
 
 def _support_options(
-    view: StateView,
+    variant,
     supporter: Unit,
     source_loc: str,
-    sea_fleet_locs: Tuple[str, ...],
     standing_items: Tuple[Tuple[str, Unit], ...],
+    convoys: ConvoyOracle,
+    fleets: int,
+    mover_targets: Dict[Tuple[str, int], int],
 ) -> List[OrderOption]:
+    """Support options for one supporter.
+
+    The supporter can support into exactly the parents of the locations
+    it can reach (SupportHold/SupportMoveSupporterCanReachCheck, via
+    `can_support_to`), so a SupportHold is offered to every other
+    standing unit whose parent is in that set. A SupportMove is offered
+    for each of the supporter's target provinces the mover can itself
+    reach, directly or by a convoy through the board's fleets other than
+    the supporter (godip's `noConvoy` argument)."""
     options: List[OrderOption] = []
-    variant = view.variant()
+    index = variant.index
     source_parent = variant.parent_of(source_loc)
+    i = index.index_of.get(source_loc)
+    supportable = index.parent_reach(supporter.type)[i] if i is not None else 0
     for supported_loc, _ in standing_items:
-        if variant.parent_of(supported_loc) == source_parent:
+        supported_parent = variant.parent_of(supported_loc)
+        if supported_parent == source_parent:
             continue
-        order = SupportHoldOrder(
-            nation=supporter.nation,
-            source=source_loc,
-            supported_source=supported_loc,
-            unit_type=supporter.type,
-        )
-        if all(c.check(view, order) for c in SupportHoldOrder.LEGALITY_CHECKS):
-            supported_parent = variant.parent_of(supported_loc)
+        p = index.index_of.get(supported_parent)
+        if p is not None and supportable >> p & 1:
             options.append(
                 OrderOption(
                     source=source_loc,
@@ -237,21 +241,34 @@ def _support_options(
                     named_coast=None,
                 )
             )
+    # Iterated in set order, as the scalar enumeration always has.
     supporter_targets = _reachable_provinces(variant, source_loc, supporter.type)
     supporter_targets.discard(source_parent)
+    if not supporter_targets:
+        return options
+    target_bits = [(target, 1 << index.index_of[target]) for target in supporter_targets]
+    target_mask = 0
+    for _, bit in target_bits:
+        target_mask |= bit
+    allowed = fleets
+    # A province holds one standing unit, so its sea province is in
+    # `fleets` only when the supporter is one of the convoying fleets.
+    if i is not None and fleets >> index.parent[i] & 1:
+        allowed &= ~(1 << index.parent[i])
     for mover_loc, mover in standing_items:
-        if variant.parent_of(mover_loc) == source_parent:
+        mover_parent = variant.parent_of(mover_loc)
+        if mover_parent == source_parent:
             continue
-        for target in supporter_targets:
-            order = SupportMoveOrder(
-                nation=supporter.nation,
-                source=source_loc,
-                supported_source=mover_loc,
-                target=target,
-                unit_type=supporter.type,
-            )
-            if _support_move_is_orderable(view, order, mover, sea_fleet_locs):
-                mover_parent = variant.parent_of(mover_loc)
+        key = (mover_loc, allowed)
+        reachable = mover_targets.get(key)
+        if reachable is None:
+            reachable = _mover_targets(index, mover, convoys, allowed)
+            mover_targets[key] = reachable
+        legal = reachable & target_mask
+        if not legal:
+            continue
+        for target, bit in target_bits:
+            if legal & bit:
                 options.append(
                     OrderOption(
                         source=source_loc,
@@ -265,79 +282,57 @@ def _support_options(
     return options
 
 
-def _support_move_is_orderable(
-    view: StateView,
-    order: SupportMoveOrder,
-    mover: Unit,
-    sea_fleet_locs: Tuple[str, ...],
-) -> bool:
-    for check_cls in SupportMoveOrder.LEGALITY_CHECKS:
-        if check_cls.check(view, order):
-            continue
-        if (
-            check_cls is SupportMoveSupportedCanReachCheck
-            and _supported_can_convoy(view, order, mover, sea_fleet_locs)
-        ):
-            continue
-        return False
-    return True
-
-
-def _supported_can_convoy(
-    view: StateView,
-    order: SupportMoveOrder,
-    mover: Unit,
-    sea_fleet_locs: Tuple[str, ...],
-) -> bool:
-    if mover.type != Unit.ARMY:
-        return False
-    variant = view.variant()
-    target_parent = variant.parent_of(order.target)
-    if order.target != target_parent:
-        return False
-    source_parent = variant.parent_of(mover.location)
-    if not view.province(source_parent).is_coastal():
-        return False
-    if not view.province(target_parent).is_coastal():
-        return False
-    # Exclude the supporter itself from the convoy chain (godip's
-    # `noConvoy` argument): if the supporter is also the only fleet,
-    # no third party can carry the army.
-    usable_fleets = tuple(loc for loc in sea_fleet_locs if loc != order.source)
-    if not usable_fleets:
-        return False
-    return convoy_path_exists(view, source_parent, target_parent, usable_fleets)
+def _mover_targets(
+    index: VariantIndex, mover: Unit, convoys: ConvoyOracle, allowed: int
+) -> int:
+    """Parent provinces `mover` could itself move into
+    (SupportMoveSupportedCanReachCheck): its direct support reach, plus
+    for an army every coastal province reachable by convoy through
+    `allowed`."""
+    i = index.index_of.get(mover.location)
+    if i is None:
+        return 0
+    reachable = index.parent_reach(mover.type)[i]
+    if mover.type == Unit.ARMY:
+        reachable |= convoys.army_targets(index.parent[i], allowed)
+    return reachable
 
 
 def _convoy_options(
-    view: StateView,
-    fleet: Unit,
+    variant,
     source_loc: str,
-    sea_fleet_locs: Tuple[str, ...],
-    standing_items: Tuple[Tuple[str, Unit], ...],
+    convoys: ConvoyOracle,
+    fleets: int,
+    army_source_parents: List[str],
+    coastal_parents: List[str],
 ) -> List[OrderOption]:
+    """Convoy options for one fleet in a sea province.
+
+    The ConvoyOrder checks reduce to: the army source is coastal, and a
+    chain through the board's fleets runs from the source to this fleet
+    and on to the target (`convoy_path_through_fleet`). The engine's
+    ConvoyFleetReachesEndpointsCheck is a purely topological test that
+    is intentionally lenient; the on-board chain requirement is strictly
+    stronger, so it replaces that check rather than supplementing it.
+    See the module docstring and docs/options-design.md."""
     options: List[OrderOption] = []
-    variant = view.variant()
-    army_source_parents = sorted(
-        {variant.parent_of(loc) for loc, u in standing_items if u.type == Unit.ARMY}
-    )
-    coastal_parents = sorted(
-        pid
-        for pid, p in variant.provinces.items()
-        if p.type != ProvinceType.SEA and variant.has_fleet_access(pid)
-    )
+    if source_loc in variant.named_coasts:
+        return options
+    index = variant.index
+    fleet_parent = index.parent[index.index_of[source_loc]]
+    landings = convoys.landings(convoys.closure(1 << fleet_parent, fleets))
+    if not landings:
+        return options
     for army_source in army_source_parents:
+        a = index.index_of.get(army_source)
+        if a is None or not index.coastal >> a & 1:
+            continue
+        if not convoys.closure(index.sea_neighbours[a], fleets) >> fleet_parent & 1:
+            continue
         for army_target in coastal_parents:
-            if army_source == army_target:
+            if army_target == army_source:
                 continue
-            order = ConvoyOrder(
-                nation=fleet.nation,
-                source=source_loc,
-                army_source=army_source,
-                army_target=army_target,
-                unit_type=fleet.type,
-            )
-            if _convoy_is_orderable(view, order, sea_fleet_locs):
+            if landings >> index.index_of[army_target] & 1:
                 options.append(
                     OrderOption(
                         source=source_loc,
@@ -351,51 +346,32 @@ def _convoy_options(
     return options
 
 
-def _convoy_is_orderable(
-    view: StateView, order: ConvoyOrder, sea_fleet_locs: Tuple[str, ...]
-) -> bool:
-    # ConvoyFleetReachesEndpointsCheck is the engine's order-legality
-    # check: a purely topological reachability test that is intentionally
-    # lenient. Options instead require a convoy chain through the fleets
-    # actually on the board, with this fleet on it — strictly stronger,
-    # so it fully replaces the topological check rather than supplementing
-    # it. See the module docstring and docs/options-design.md.
-    for check_cls in ConvoyOrder.LEGALITY_CHECKS:
-        if check_cls is ConvoyFleetReachesEndpointsCheck:
-            continue
-        if not check_cls.check(view, order):
-            return False
-    return _convoy_has_real_path(view, order, sea_fleet_locs)
-
-
-def _convoy_has_real_path(
-    view: StateView, order: ConvoyOrder, sea_fleet_locs: Tuple[str, ...]
-) -> bool:
-    if not sea_fleet_locs:
-        return False
-    variant = view.variant()
-    return convoy_path_through_fleet(
-        view,
-        variant.parent_of(order.army_source),
-        variant.parent_of(order.army_target),
-        order.source,
-        sea_fleet_locs,
-    )
-
-
 # === Retreat phase ===
-
-
-def _retreat_options(view: StateView) -> List[OrderOption]:
+#
+# Retreat and Adjustment options are read straight off the State the
+# engine produced, without a StateView pass. Everything they depend on is
+# what the movement resolution left behind: the dislodged units (with the
+# province each attacker came from) and the contested provinces that
+# `ApplyMovementOutcomesReducer` records, and the supply-center owners
+# `UpdateSupplyCenterOwnershipReducer` writes. Each helper notes which
+# LEGALITY_CHECKS its filters stand in for; the parity tests against the
+# per-candidate enumeration keep them identical, ordering included.
+
+
+def _retreat_options(state: State) -> List[OrderOption]:
+    variant = state.variant
+    index = variant.index
+    non_playable = {n.id for n in variant.nations if n.non_playable}
+    # RetreatTargetIsUnoccupiedCheck / RetreatTargetIsNotContestedCheck:
+    # every location whose parent holds a standing unit or saw a standoff.
+    blocked = _locations_under(
+        index,
+        [variant.parent_of(u.location) for u in state.units if not u.dislodged],
+    ) | _locations_under(index, state.contested_provinces)
+    dislodged = sorted({u.location: u for u in state.units if u.dislodged}.items())
     options: List[OrderOption] = []
-    variant = view.variant()
-    units_view = view.units()
-    dislodged = sorted(units_view.dislodged_by_loc().items())
-    all_locations = tuple(
-        list(variant.provinces.keys()) + list(variant.named_coasts.keys())
-    )
     for source_loc, unit in dislodged:
-        if view.nation(unit.nation).is_non_playable():
+        if unit.nation in non_playable:
             continue
         options.append(
             OrderOption(
@@ -407,54 +383,86 @@ def _retreat_options(view: StateView) -> List[OrderOption]:
                 named_coast=None,
             )
         )
-        for target in all_locations:
-            order = RetreatOrder(
-                nation=unit.nation,
-                source=source_loc,
-                target=target,
-                unit_type=unit.type,
-                dislodged_from=unit.dislodged_from,
-            )
-            if all(c.check(view, order) for c in RetreatOrder.LEGALITY_CHECKS):
-                options.append(
-                    OrderOption(
-                        source=source_loc,
-                        order_type=OrderType.RETREAT,
-                        target=target,
-                        aux=None,
-                        unit_type=None,
-                        named_coast=None,
-                    )
+        i = index.index_of.get(source_loc)
+        if i is None:
+            continue
+        # RetreatTargetIsReachableCheck, then the two checks above, then
+        # RetreatNotToAttackerOriginCheck.
+        targets = index.reach(unit.type)[i] & index.locations & ~blocked
+        if unit.dislodged_from is not None:
+            targets &= ~_locations_under(index, [variant.parent_of(unit.dislodged_from)])
+        for target in index.ids_in(targets):
+            options.append(
+                OrderOption(
+                    source=source_loc,
+                    order_type=OrderType.RETREAT,
+                    target=target,
+                    aux=None,
+                    unit_type=None,
+                    named_coast=None,
                 )
+            )
     return options
 
 
+def _locations_under(index: VariantIndex, parents) -> int:
+    """Bitset of the given parent provinces and all their named coasts.
+    Ids that are unknown or are themselves named coasts contribute
+    nothing, since no location has them as its parent."""
+    mask = 0
+    for parent_id in parents:
+        i = index.index_of.get(parent_id)
+        if i is None or index.parent[i] != i:
+            continue
+        mask |= 1 << i
+        for coast in index.coasts[i]:
+            mask |= 1 << coast
+    return mask
+
+
 # === Adjustment phase ===
 
 
-def _adjustment_options(view: StateView) -> List[OrderOption]:
-    options: List[OrderOption] = []
-    variant = view.variant()
-    units_view = view.units()
-    standing = sorted(units_view.standing_by_loc().items())
-    nations = [n.id for n in variant.nations]
-    for nation_id in nations:
-        nation_view = view.nation(nation_id)
-        if nation_view.allowed_builds() <= 0:
+def _adjustment_options(state: State) -> List[OrderOption]:
+    return [option for _, option in _adjustment_entries(state)]
+
+
+def _adjustment_entries(state: State) -> List[Tuple[str, OrderOption]]:
+    """Adjustment options paired with the id of the nation they belong
+    to, in `get_options` order."""
+    variant = state.variant
+    parent_of = variant.parent_of
+    non_home_builds = ALLOW_NON_HOME_BUILDS in variant.adjudication_modifiers
+    standing = {u.location: u for u in state.units if not u.dislodged}
+    standing_by_parent: Dict[str, Unit] = {}
+    unit_counts: Dict[str, int] = {}
+    for u in state.units:
+        if not u.dislodged:
+            standing_by_parent.setdefault(parent_of(u.location), u)
+            unit_counts[u.nation] = unit_counts.get(u.nation, 0) + 1
+    owned: Dict[str, set] = {}
+    for sc in state.supply_centers:
+        owned.setdefault(sc.nation, set()).add(sc.province)
+
+    entries: List[Tuple[str, OrderOption]] = []
+    playable = [n.id for n in variant.nations if not n.non_playable]
+    for nation_id in playable:
+        nation_owned = owned.get(nation_id, set())
+        if len(nation_owned) <= unit_counts.get(nation_id, 0):
             continue
-        for sc_parent in sorted(nation_view.owned_supply_centers()):
+        for sc_parent in sorted(nation_owned):
+            # BuildLocationIsSupplyCenterCheck, BuildLocationIsHomeCenterCheck
+            # and BuildLocationIsUnoccupiedCheck; ownership is given.
             province = variant.provinces.get(sc_parent)
             if province is None or not province.supply_center:
                 continue
-            if view.province(sc_parent).is_occupied():
+            if sc_parent in standing_by_parent:
                 continue
-            army_order = BuildOrder(
-                nation=nation_id,
-                location=sc_parent,
-                unit_type=Unit.ARMY,
-            )
-            if all(c.check(view, army_order) for c in BuildOrder.LEGALITY_CHECKS):
-                options.append(
+            if not non_home_builds and province.home_nation != nation_id:
+                continue
+            entries.append(
+                (
+                    nation_id,
                     OrderOption(
                         source=sc_parent,
                         order_type=OrderType.BUILD,
@@ -462,18 +470,22 @@ def _adjustment_options(view: StateView) -> List[OrderOption]:
                         aux=None,
                         unit_type=Unit.ARMY,
                         named_coast=None,
-                    )
+                    ),
                 )
+            )
+            # BuildFleetCoastIsSpecifiedCheck / BuildFleetLocationIsCoastalCheck:
+            # a named coast is always coastal, a bare parent needs fleet access.
             coasts = variant.coasts_of(sc_parent)
-            fleet_locations = list(coasts) if coasts else [sc_parent]
+            if coasts:
+                fleet_locations = list(coasts)
+            elif variant.has_fleet_access(sc_parent):
+                fleet_locations = [sc_parent]
+            else:
+                fleet_locations = []
             for fleet_loc in fleet_locations:
-                fleet_order = BuildOrder(
-                    nation=nation_id,
-                    location=fleet_loc,
-                    unit_type=Unit.FLEET,
-                )
-                if all(c.check(view, fleet_order) for c in BuildOrder.LEGALITY_CHECKS):
-                    options.append(
+                entries.append(
+                    (
+                        nation_id,
                         OrderOption(
                             source=fleet_loc,
                             order_type=OrderType.BUILD,
@@ -481,22 +493,23 @@ def _adjustment_options(view: StateView) -> List[OrderOption]:
                             aux=None,
                             unit_type=Unit.FLEET,
                             named_coast=None,
-                        )
+                        ),
                     )
-    for nation_id in nations:
-        nation_view = view.nation(nation_id)
-        if nation_view.required_disbands() <= 0:
+                )
+    for nation_id in playable:
+        if unit_counts.get(nation_id, 0) <= len(owned.get(nation_id, ())):
             continue
-        for loc, unit in standing:
+        for loc, unit in sorted(standing.items()):
+            # AdjustmentDisbandUnitExistsCheck: the standing unit found at
+            # the location's parent must be this nation's.
             if unit.nation != nation_id:
                 continue
-            order = AdjustmentDisbandOrder(
-                nation=nation_id,
-                location=loc,
-                unit_type=unit.type,
-            )
-            if all(c.check(view, order) for c in AdjustmentDisbandOrder.LEGALITY_CHECKS):
-                options.append(
+            found = standing_by_parent.get(parent_of(loc))
+            if found is None or found.nation != nation_id:
+                continue
+            entries.append(
+                (
+                    nation_id,
                     OrderOption(
                         source=loc,
                         order_type=OrderType.DISBAND,
@@ -504,6 +517,7 @@ def _adjustment_options(view: StateView) -> List[OrderOption]:
                         aux=None,
                         unit_type=None,
                         named_coast=None,
-                    )
+                    ),
                 )
-    return options
+            )
+    return entries
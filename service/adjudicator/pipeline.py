@@ -0,0 +1,304 @@
+"""Database-free half of `adjudicator.service`.
+
+`service.start` / `service.resolve` read a phase out of the database and
+hand the resulting domain `State` to the functions here, which run the
+engine, walk past phases nobody can act in, enumerate options, and build
+the legacy godip-style dict `Phase.objects.create_from_adjudication_data`
+consumes. Nothing in this module touches Django, so it can run in a
+worker process that has never called `django.setup()`.
+
+`resolve_states` is the batch form: it resolves many independent states
+in one call, sharing each variant's convoy oracle across the batch, and
+optionally fans the work out across a `concurrent.futures` executor.
+
+Public symbols: `start_state`, `resolve_state`, and `resolve_states`.
+Everything else is module-private.
+"""
+import logging
+from concurrent.futures import Executor
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
+
+from .domain import State, Variant
+from .engine import Engine, chunk_by_variant
+from .options import get_options, option_nations
+from .options_adapter import python_options_to_godip_dict
+
+logger = logging.getLogger(__name__)
+
+_MAX_SKIP = 10
+
+
+def start_state(state: State) -> Dict[str, Any]:
+    variant = state.variant
+    options = get_options(state)
+    godip_options = python_options_to_godip_dict(
+        options,
+        state.units,
+        state.supply_centers,
+        variant,
+        state.phase.type,
+    )
+
+    nation_name_by_id = {nation.id: nation.name for nation in variant.nations}
+    return {
+        "season": state.phase.season,
+        "year": state.phase.year,
+        "type": state.phase.type,
+        "options": godip_options,
+        "supply_centers": _build_supply_centers(state.supply_centers, nation_name_by_id),
+        "units": _build_units([], state.units, variant, nation_name_by_id),
+        "resolutions": [],
+    }
+
+
+def resolve_state(
+    state: State,
+    skip_nations: Collection[str],
+    engine: Optional[Engine] = None,
+    states: Optional[List[State]] = None,
+) -> Dict[str, Any]:
+    """Resolve `state` and return the adjudication dict for the next
+    phase that needs player input.
+
+    `skip_nations` are the nation names (civil disorder or non-playable)
+    whose options alone never hold a phase open. `states` is the result
+    of `engine.adjudicate(state)` when the caller already has it, as
+    `resolve_states` does after adjudicating a whole batch."""
+    engine = engine or Engine()
+    variant = state.variant
+    nation_name_by_id = {nation.id: nation.name for nation in variant.nations}
+    if states is None:
+        states = engine.adjudicate(state)
+    resolved = states[0]
+    next_state = states[1] if len(states) > 1 else resolved
+
+    # Advance through phases nobody can act in (empty retreat / empty
+    # adjustment, or retreat where every retreating nation is in Civil
+    # Disorder) so we land on the next phase that needs player input.
+    # Engine.adjudicate advances one phase per call and keeps phase
+    # skipping out of scope by contract, so skipping is orchestrated
+    # here. Skipped phases are never persisted -- only the final
+    # interactive phase is written by create_from_adjudication_data.
+    # The skip decision only needs to know which nations have options,
+    # so the full options are enumerated once, for the phase we land on.
+    _skip_count = 0
+    while len(states) > 1 and _should_skip(next_state, skip_nations, nation_name_by_id):
+        _skip_count += 1
+        if _skip_count >= _MAX_SKIP:
+            logger.warning(
+                f"Phase skip limit reached after {state.phase.season} {state.phase.year} "
+                f"{state.phase.type} — all nations likely in civil disorder"
+            )
+            break
+        states = engine.adjudicate(next_state)
+        next_state = states[1] if len(states) > 1 else states[0]
+
+    if len(states) > 1:
+        godip_options = python_options_to_godip_dict(
+            get_options(next_state),
+            next_state.units,
+            next_state.supply_centers,
+            variant,
+            next_state.phase.type,
+        )
+    else:
+        godip_options = {nation.name: {} for nation in variant.nations}
+
+    return {
+        "season": next_state.phase.season,
+        "year": next_state.phase.year,
+        "type": next_state.phase.type,
+        "options": godip_options,
+        "supply_centers": _build_supply_centers(
+            next_state.supply_centers, nation_name_by_id
+        ),
+        "units": _build_units(state.units, next_state.units, variant, nation_name_by_id),
+        "resolutions": _build_resolutions(state.orders, resolved.resolutions, variant),
+    }
+
+
+def resolve_states(
+    items: Sequence[Tuple[State, Collection[str]]],
+    executor: Optional[Executor] = None,
+    chunk_size: int = 8,
+) -> List[Optional[Dict[str, Any]]]:
+    """Batch form of `resolve_state` over independent `(state,
+    skip_nations)` pairs, returned in input order.
+
+    Without an executor the batch runs in-process through
+    `Engine.adjudicate_many`. With one, items are grouped by variant into
+    chunks of at most `chunk_size` and each chunk is one task, so a
+    worker receives each variant once per chunk rather than once per
+    state. An item whose adjudication raises is logged and comes back as
+    None, so one bad phase cannot sink the batch."""
+    if executor is None:
+        return _resolve_chunk(list(items))
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    futures = []
+    for positions in chunk_by_variant([state for state, _ in items], chunk_size):
+        chunk = [items[i] for i in positions]
+        futures.append((positions, executor.submit(_resolve_chunk, chunk)))
+    for positions, future in futures:
+        try:
+            chunk_results = future.result()
+        except Exception:
+            logger.exception(f"Adjudication batch chunk of {len(positions)} states failed")
+            continue
+        for i, result in zip(positions, chunk_results):
+            results[i] = result
+    return results
+
+
+def _resolve_chunk(items: List[Tuple[State, Collection[str]]]) -> List[Optional[Dict[str, Any]]]:
+    engine = Engine()
+    try:
+        adjudicated = engine.adjudicate_many([state for state, _ in items])
+    except Exception:
+        # Fall back to one state at a time so the failure is attributed
+        # to the item that caused it.
+        adjudicated = [None] * len(items)
+    results: List[Optional[Dict[str, Any]]] = []
+    for (state, skip_nations), states in zip(items, adjudicated):
+        try:
+            results.append(resolve_state(state, skip_nations, engine, states))
+        except Exception:
+            logger.exception(
+                f"Adjudication failed for {state.variant.id} {state.phase.season} "
+                f"{state.phase.year} {state.phase.type}"
+            )
+            results.append(None)
+    return results
+
+
+def _should_skip(state: State, skip_nations: Collection[str], nation_name_by_id: Dict[str, str]) -> bool:
+    nations = option_nations(state)
+    if not nations:
+        return True
+    if not skip_nations:
+        return False
+    return {nation_name_by_id.get(nation, nation) for nation in nations}.issubset(skip_nations)
+
+
+def _build_supply_centers(
+    supply_centers, nation_name_by_id: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    return sorted(
+        (
+            {
+                "province": sc.province,
+                "nation": nation_name_by_id.get(sc.nation, sc.nation),
+            }
+            for sc in supply_centers
+        ),
+        key=lambda entry: entry["province"],
+    )
+
+
+def _build_units(
+    pre_units,
+    next_units,
+    variant: Variant,
+    nation_name_by_id: Dict[str, str],
+) -> List[Dict[str, Any]]:
+    # The Python engine records `dislodged_from` as the parent province the
+    # attacker came from. godip's wire format uses the attacker unit's
+    # exact location (named coast included). Look up the dislodger from
+    # the pre-movement units so the location matches what downstream
+    # `previous_units_by_province` lookups expect.
+    pre_unit_location_by_parent: Dict[str, str] = {}
+    for unit in pre_units:
+        parent = variant.parent_of(unit.location)
+        pre_unit_location_by_parent.setdefault(parent, unit.location)
+
+    units_out: List[Dict[str, Any]] = []
+    for unit in next_units:
+        dislodged_by: Optional[str] = None
+        if unit.dislodged and unit.dislodged_from:
+            dislodged_by = pre_unit_location_by_parent.get(unit.dislodged_from)
+        units_out.append(
+            {
+                "province": unit.location,
+                "type": unit.type,
+                "nation": nation_name_by_id.get(unit.nation, unit.nation),
+                "dislodged": unit.dislodged,
+                "dislodged_by": dislodged_by,
+            }
+        )
+    return sorted(units_out, key=lambda entry: entry["province"])
+
+
+def _build_resolutions(orders, resolutions, variant: Variant) -> List[Dict[str, Any]]:
+    # Downstream `create_from_adjudication_data` matches resolution.province
+    # against order.source.province_id. Orders carry their source as the
+    # parent province (named coasts get collapsed at order creation), so
+    # the resolution province must be the parent too.
+    #
+    # The engine reports each order's outcome code directly, so "result"
+    # is a copy rather than a translation: ResolutionCode and
+    # OrderResolutionStatus are the same vocabulary.
+    #
+    # For BOUNCE/CUT statuses we also populate the "by" province — godip
+    # encoded it as `ErrBounce:par` / `ErrSupportBroken:mar`. The engine
+    # doesn't carry that on the Resolution, so we reconstruct it from the
+    # raw orders: a bounced Move is referenced by another Move targeting
+    # the same parent; a cut Support is referenced by the Move that
+    # attacked the supporter's parent.
+    orders_by_source_parent: Dict[str, Any] = {}
+    moves_by_target_parent: Dict[str, List[Any]] = {}
+    for order in orders:
+        if order.source is not None:
+            orders_by_source_parent.setdefault(variant.parent_of(order.source), order)
+        if order.order_type in ("Move", "MoveViaConvoy") and order.target is not None:
+            moves_by_target_parent.setdefault(variant.parent_of(order.target), []).append(order)
+
+    resolutions_out: List[Dict[str, Any]] = []
+    for resolution in resolutions or []:
+        province_parent = variant.parent_of(resolution.province)
+        by = _find_by_province(
+            resolution.resolution,
+            province_parent,
+            orders_by_source_parent,
+            moves_by_target_parent,
+            variant,
+        )
+        resolutions_out.append(
+            {
+                "province": province_parent,
+                "result": resolution.code,
+                "by": by,
+            }
+        )
+    return resolutions_out
+
+
+def _find_by_province(
+    status: str,
+    province_parent: str,
+    orders_by_source_parent: Dict[str, Any],
+    moves_by_target_parent: Dict[str, List[Any]],
+    variant: Variant,
+) -> Optional[str]:
+    if status not in ("BOUNCE", "CUT"):
+        return None
+
+    order = orders_by_source_parent.get(province_parent)
+    if order is None:
+        return None
+
+    if status == "BOUNCE":
+        # Only Moves bounce against other Moves at the same target.
+        if order.order_type not in ("Move", "MoveViaConvoy") or order.target is None:
+            return None
+        target_parent = variant.parent_of(order.target)
+        for other in moves_by_target_parent.get(target_parent, []):
+            if other is order or other.source is None:
+                continue
+            return variant.parent_of(other.source)
+        return None
+
+    # status == "CUT": find the Move that attacked the supporter's source.
+    for other in moves_by_target_parent.get(province_parent, []):
+        if other.source is None:
+            continue
+        return variant.parent_of(other.source)
+    return None
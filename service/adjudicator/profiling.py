@@ -0,0 +1,114 @@
+"""Opt-in profiling of the engine's inner stages.
+
+Nothing is recorded unless a profile is active. Inside
+`profile_adjudication()`, every adjudication run on the current thread
+(or asyncio task) records the following into the yielded
+`AdjudicationProfile`:
+
+  * wall time and call count per `Reducer` subclass, from
+    `Engine.dispatch`;
+  * how many `_Decision`s of each kind the strength solver enumerated,
+    and how many times it evaluated one (an evaluation that comes back
+    undecided is retried when its dependencies change, so evaluations
+    above the decision count point at churn in the graph);
+  * which cycle breaker fired, and how often.
+
+    with profile_adjudication() as profile:
+        Engine().adjudicate(state)
+    profile.as_dict()
+
+`service.resolve` opens a profile when the ADJUDICATION_PROFILING setting
+is on and attaches it to its `adjudicator.resolve` span as events.
+Offline benchmarks use `as_dict()` directly. The active profile lives in
+a context variable, so adjudications handed to another process (the
+adjudication executor, a batch pool) are not profiled.
+
+Public symbols: `AdjudicationProfile`, `profile_adjudication`, and
+`active_profile`. Everything else is module-private.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class AdjudicationProfile:
+    """Counters accumulated across every adjudication run while the
+    profile is active. Reducers are keyed by class name, decisions by
+    kind, and cycle breakers by the name the solver reports."""
+
+    def __init__(self) -> None:
+        self.reducer_calls: Dict[str, int] = {}
+        self.reducer_seconds: Dict[str, float] = {}
+        self.decisions: Dict[str, int] = {}
+        self.decision_evaluations: Dict[str, int] = {}
+        self.cycle_breakers: Dict[str, int] = {}
+
+    def record_reducer(self, name: str, seconds: float) -> None:
+        self.reducer_calls[name] = self.reducer_calls.get(name, 0) + 1
+        self.reducer_seconds[name] = self.reducer_seconds.get(name, 0.0) + seconds
+
+    def record_decisions(self, enumerated: Dict[str, int], evaluations: Dict[str, int]) -> None:
+        for kind, count in enumerated.items():
+            self.decisions[kind] = self.decisions.get(kind, 0) + count
+        for kind, count in evaluations.items():
+            self.decision_evaluations[kind] = self.decision_evaluations.get(kind, 0) + count
+
+    def record_cycle_breaker(self, name: str) -> None:
+        self.cycle_breakers[name] = self.cycle_breakers.get(name, 0) + 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "reducers": {
+                name: {"calls": calls, "seconds": self.reducer_seconds[name]}
+                for name, calls in self.reducer_calls.items()
+            },
+            "decisions": {
+                kind: {"count": count, "evaluations": self.decision_evaluations.get(kind, 0)}
+                for kind, count in self.decisions.items()
+            },
+            "cycle_breakers": dict(self.cycle_breakers),
+        }
+
+    def span_events(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """The profile as `(name, attributes)` pairs with OTel-compatible
+        attribute values, one event per reducer, decision kind and
+        cycle breaker."""
+        events: List[Tuple[str, Dict[str, Any]]] = []
+        for name, calls in self.reducer_calls.items():
+            events.append(
+                (
+                    "adjudicator.reducer",
+                    {"reducer": name, "calls": calls, "duration_ms": self.reducer_seconds[name] * 1000},
+                )
+            )
+        for kind, count in self.decisions.items():
+            events.append(
+                (
+                    "adjudicator.decisions",
+                    {"kind": kind, "count": count, "evaluations": self.decision_evaluations.get(kind, 0)},
+                )
+            )
+        for name, count in self.cycle_breakers.items():
+            events.append(("adjudicator.cycle_breaker", {"breaker": name, "count": count}))
+        return events
+
+    def add_span_events(self, span) -> None:
+        for name, attributes in self.span_events():
+            span.add_event(name, attributes)
+
+
+_ACTIVE: ContextVar[Optional[AdjudicationProfile]] = ContextVar("adjudication_profile", default=None)
+
+
+def active_profile() -> Optional[AdjudicationProfile]:
+    return _ACTIVE.get()
+
+
+@contextmanager
+def profile_adjudication() -> Iterator[AdjudicationProfile]:
+    profile = AdjudicationProfile()
+    token = _ACTIVE.set(profile)
+    try:
+        yield profile
+    finally:
+        _ACTIVE.reset(token)
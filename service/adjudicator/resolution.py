@@ -20,8 +20,13 @@ The internal representation is an explicit Decision graph:
   * A work queue holds decisions whose dependencies are all resolved.
     Popping one computes its value and re-checks every decision that
     depends on it; newly-ready ones are enqueued.
-  * When the queue empties but decisions remain, we look for closed
-    dependency cycles. Three kinds get resolved:
+  * The solver keeps the set of unresolved decisions up to date as
+    values are committed. Edges between unresolved decisions form the
+    residual graph; every stall is made of its strongly connected
+    components. When the queue empties but decisions remain, the
+    components are found once with Tarjan's algorithm and handed to
+    the cycle breakers, so a stall costs one pass over the residual
+    graph however many cycles it holds. Three kinds get resolved:
 
       - Clean N-move cycles (A→B→C→A): if every member's attack
         strictly exceeds every external competitor's prevent, all
@@ -35,10 +40,10 @@ The internal representation is an explicit Decision graph:
         through normal propagation. This covers contested rotations
         (DATC 6.C) and doomed attacks on convoying fleets.
 
-      - Convoy paradoxes (Szykman's rule): cycles in the dependency
-        graph that involve at least one `_CONVOY_PATH_INTACT`
+      - Convoy paradoxes (Szykman's rule): components of the residual
+        graph that contain at least one `_CONVOY_PATH_INTACT`
         decision are broken by forcing all such decisions in the
-        cycle to False, disrupting the relevant convoys (DATC
+        component to False, disrupting the relevant convoys (DATC
         Szykman's rule, 6.F.13ff). This matches the modern
         adjudication consensus. It is tried last, because a cycle
         that some other breaker can decide is not a paradox.
@@ -51,6 +56,11 @@ The internal representation is an explicit Decision graph:
     that cap raises `RuntimeError` — the disciplined replacement for
     the legacy `MAX_ITERATIONS` guard.
 
+Geometry — which supports back a move, which unit sits on its target,
+which moves compete for a province — is indexed once per solve, so
+enumeration, the compute functions and the breakers look it up instead
+of scanning `parsed_orders`.
+
 The boundary with `StateView` stays pure: a `StateView` goes in once,
 a `StateView` comes out once. The decision dict is mutated inside the
 solver — that is local state, not part of the engine's frozen
@@ -71,9 +81,12 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass, replace
 from typing import (
+    Callable,
     Deque,
     Dict,
     FrozenSet,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -81,6 +94,7 @@ from typing import (
 )
 
 from .convoy import convoy_path_exists
+from .profiling import active_profile
 from .types import (
     ConvoyOrder,
     HoldOrder,
@@ -108,11 +122,14 @@ _CONVOY_PATH_INTACT = "convoy_path_intact"
 
 _Key = Tuple[str, int]
 
+# Orders that stand for a unit on the board during Movement.
+_UNIT_ORDERS = (HoldOrder, MoveOrder, SupportHoldOrder, SupportMoveOrder, ConvoyOrder)
+
 
 # === Decision dataclass ===
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Decision:
     """One unresolved question in the strength resolution.
 
@@ -176,6 +193,14 @@ class _Solver:
         self._decisions: Dict[_Key, _Decision] = {}
         self._dependents: Dict[_Key, Set[_Key]] = {}
         self._ready: Deque[_Key] = deque()
+        # Unresolved decisions in enumeration order (a dict used as an
+        # ordered set), and the residual graph's cyclic components,
+        # cached until the next commit.
+        self._unresolved: Dict[_Key, None] = {}
+        self._components: Optional[List[List[_Key]]] = None
+        self._profile = active_profile()
+        self._evaluations: Dict[str, int] = {}
+        self._index_orders()
 
     def solve(self) -> StateView:
         self._enumerate_decisions()
@@ -186,29 +211,123 @@ class _Solver:
             if self._all_resolved():
                 break
             if self._try_speculative_move_status():
+                self._breaker_fired("speculative_move_status")
                 passes += 1
                 if passes > self._MAX_CYCLE_PASSES:
                     raise RuntimeError("Decision graph did not converge")
                 continue
             if self._try_resolve_clean_cycles():
+                self._breaker_fired("clean_cycles")
                 passes += 1
                 if passes > self._MAX_CYCLE_PASSES:
                     raise RuntimeError("Decision graph did not converge")
                 continue
             if self._try_resolve_guaranteed_bounces():
+                self._breaker_fired("guaranteed_bounces")
                 passes += 1
                 if passes > self._MAX_CYCLE_PASSES:
                     raise RuntimeError("Decision graph did not converge")
                 continue
             if self._try_resolve_szykman_paradoxes():
+                self._breaker_fired("szykman_paradoxes")
                 passes += 1
                 if passes > self._MAX_CYCLE_PASSES:
                     raise RuntimeError("Decision graph did not converge")
                 continue
             break
+        if self._profile is not None:
+            enumerated: Dict[str, int] = {}
+            for kind, _ in self._decisions:
+                enumerated[kind] = enumerated.get(kind, 0) + 1
+            self._profile.record_decisions(enumerated, self._evaluations)
         self._assert_decisions_complete()
         return self._project_back()
 
+    def _breaker_fired(self, name: str) -> None:
+        if self._profile is not None:
+            self._profile.record_cycle_breaker(name)
+
+    # --- Geometry index ---
+
+    def _index_orders(self) -> None:
+        """File every order under the provinces the geometry questions
+        ask about, in one pass over `parsed_orders`:
+
+          - `_moves_into[parent]`: non-ILLEGAL Moves targeting `parent`;
+          - `_attack_supports[i]`: matched SupportMoves for Move `i`;
+          - `_hold_supports[i]`: matched SupportHolds for the unit of
+            order `i`;
+          - `_head_to_head[i]`: the opposing Move of a head-to-head
+            pair (DATC 6.G: convoyed moves never form one);
+          - `_defenders[i]`: the order of the unit at Move `i`'s target
+            (convoy orders included, so attacks on convoying fleets
+            meet the fleet's hold strength);
+          - `_convoy_fleets[i]`: fleet locations of the matched,
+            non-ILLEGAL ConvoyOrders for Move `i`.
+
+        Lists keep `parsed_orders` order, so every consumer sees the
+        same sequence a scan would."""
+        parent_of = self._variant.parent_of
+        resolutions = self._initial_resolutions
+        self._moves_into: Dict[str, List[int]] = {}
+        attack_supports: Dict[Tuple[str, str], List[int]] = {}
+        hold_supports: Dict[str, List[int]] = {}
+        swaps: Dict[Tuple[str, str], List[int]] = {}
+        occupants: Dict[str, int] = {}
+        convoy_fleets: Dict[Tuple[str, str], List[str]] = {}
+        moves: List[int] = []
+        for i, order in enumerate(self._parsed):
+            if not isinstance(order, _UNIT_ORDERS):
+                continue
+            occupants.setdefault(parent_of(order.source), i)
+            if isinstance(order, MoveOrder):
+                moves.append(i)
+            r = resolutions[i]
+            if r.status == Status.ILLEGAL:
+                continue
+            if isinstance(order, MoveOrder):
+                source_parent = parent_of(order.source)
+                target_parent = parent_of(order.target)
+                self._moves_into.setdefault(target_parent, []).append(i)
+                if not r.via_convoy:
+                    swaps.setdefault((source_parent, target_parent), []).append(i)
+            elif isinstance(order, SupportMoveOrder):
+                if r.support_matched:
+                    attack_supports.setdefault(
+                        (parent_of(order.supported_source), parent_of(order.target)), []
+                    ).append(i)
+            elif isinstance(order, SupportHoldOrder):
+                if r.support_matched:
+                    hold_supports.setdefault(parent_of(order.supported_source), []).append(i)
+            elif isinstance(order, ConvoyOrder):
+                if r.convoy_matched:
+                    convoy_fleets.setdefault(
+                        (parent_of(order.army_source), parent_of(order.army_target)), []
+                    ).append(order.source)
+
+        self._attack_supports: Dict[int, Tuple[int, ...]] = {}
+        self._hold_supports: Dict[int, Tuple[int, ...]] = {}
+        self._head_to_head: Dict[int, Optional[int]] = {}
+        self._defenders: Dict[int, Optional[int]] = {}
+        self._convoy_fleets: Dict[int, Tuple[str, ...]] = {}
+        for i, order in enumerate(self._parsed):
+            if isinstance(order, _UNIT_ORDERS):
+                self._hold_supports[i] = tuple(hold_supports.get(parent_of(order.source), ()))
+        for i in moves:
+            move = self._parsed[i]
+            source_parent = parent_of(move.source)
+            target_parent = parent_of(move.target)
+            self._attack_supports[i] = tuple(attack_supports.get((source_parent, target_parent), ()))
+            self._defenders[i] = occupants.get(target_parent)
+            self._convoy_fleets[i] = tuple(convoy_fleets.get((source_parent, target_parent), ()))
+            opponent = None
+            if not resolutions[i].via_convoy:
+                for j in swaps.get((target_parent, source_parent), ()):
+                    if j != i:
+                        opponent = j
+                        break
+            self._head_to_head[i] = opponent
+
     # --- Decision enumeration ---
 
     def _enumerate_decisions(self) -> None:
@@ -229,7 +348,7 @@ class _Solver:
                     self._add_decision(
                         _ATTACK_STRENGTH, i, self._attack_strength_deps(i)
                     )
-                    if _head_to_head_opponent_index(self._state, i) is not None:
+                    if self._head_to_head[i] is not None:
                         self._add_decision(
                             _DEFENSE_STRENGTH, i, self._defense_strength_deps(i)
                         )
@@ -288,13 +407,8 @@ class _Solver:
         if isinstance(order, SupportMoveOrder):
             cut_exception_parent = variant.parent_of(order.target)
         deps: Set[_Key] = set()
-        for j, attacker in enumerate(self._parsed):
-            if not isinstance(attacker, MoveOrder):
-                continue
-            if resolutions[j].status == Status.ILLEGAL:
-                continue
-            if variant.parent_of(attacker.target) != supporter_parent:
-                continue
+        for j in self._moves_into.get(supporter_parent, ()):
+            attacker = self._parsed[j]
             if attacker.nation == order.nation:
                 continue
             if (
@@ -307,14 +421,14 @@ class _Solver:
         return frozenset(deps)
 
     def _attack_strength_deps(self, i: int) -> FrozenSet[_Key]:
-        supports = _matching_attack_supports(self._state, i)
+        supports = self._attack_supports[i]
         deps: Set[_Key] = set((_SUPPORT_CUT, k) for k in supports)
         # In h2h, the opponent is the defender — its nation is known up
         # front, no MOVE_STATUS dep needed (and adding one would cycle
         # via the symmetric ATTACK_STRENGTH).
-        if _head_to_head_opponent_index(self._state, i) is not None:
+        if self._head_to_head[i] is not None:
             return frozenset(deps)
-        defender_idx = _defender_order_index(self._state, i)
+        defender_idx = self._defenders[i]
         if defender_idx is None:
             return frozenset(deps)
         defender_order = self._parsed[defender_idx]
@@ -335,14 +449,14 @@ class _Solver:
 
     def _defense_strength_deps(self, i: int) -> FrozenSet[_Key]:
         return frozenset(
-            (_SUPPORT_CUT, k) for k in _matching_attack_supports(self._state, i)
+            (_SUPPORT_CUT, k) for k in self._attack_supports[i]
         )
 
     def _prevent_strength_deps(self, i: int) -> FrozenSet[_Key]:
         deps: Set[_Key] = set(
-            (_SUPPORT_CUT, k) for k in _matching_attack_supports(self._state, i)
+            (_SUPPORT_CUT, k) for k in self._attack_supports[i]
         )
-        h2h = _head_to_head_opponent_index(self._state, i)
+        h2h = self._head_to_head[i]
         if h2h is not None:
             deps.add((_MOVE_STATUS, h2h))
         # A convoyed move with a broken convoy never happens and so
@@ -361,22 +475,14 @@ class _Solver:
         deps: Set[_Key] = {(_ATTACK_STRENGTH, i)}
         if resolutions[i].via_convoy:
             deps.add((_CONVOY_PATH_INTACT, i))
-        target_parent = variant.parent_of(order.target)
-        for j, other in enumerate(parsed):
-            if j == i:
-                continue
-            if not isinstance(other, MoveOrder):
-                continue
-            if resolutions[j].status == Status.ILLEGAL:
-                continue
-            if variant.parent_of(other.target) != target_parent:
-                continue
-            deps.add((_PREVENT_STRENGTH, j))
-        h2h = _head_to_head_opponent_index(self._state, i)
+        for j in self._moves_into.get(variant.parent_of(order.target), ()):
+            if j != i:
+                deps.add((_PREVENT_STRENGTH, j))
+        h2h = self._head_to_head[i]
         if h2h is not None:
             deps.add((_DEFENSE_STRENGTH, h2h))
             return frozenset(deps)
-        defender_idx = _defender_order_index(self._state, i)
+        defender_idx = self._defenders[i]
         if defender_idx is not None:
             deps.add((_HOLD_STRENGTH, defender_idx))
             defender_order = parsed[defender_idx]
@@ -392,16 +498,9 @@ class _Solver:
         Move `j` that targets the parent province of some matched
         ConvoyOrder for Move `i`. Knowing those outcomes tells us which
         of the convoy fleets are dislodged."""
-        fleet_parents = self._matched_convoy_fleet_parents(i)
         deps: Set[_Key] = set()
-        variant = self._variant
-        resolutions = self._initial_resolutions
-        for j, other in enumerate(self._parsed):
-            if not isinstance(other, MoveOrder):
-                continue
-            if resolutions[j].status == Status.ILLEGAL:
-                continue
-            if variant.parent_of(other.target) in fleet_parents:
+        for fleet_parent in self._matched_convoy_fleet_parents(i):
+            for j in self._moves_into.get(fleet_parent, ()):
                 deps.add((_MOVE_STATUS, j))
         return frozenset(deps)
 
@@ -412,63 +511,15 @@ class _Solver:
         their parent is the same province (sea provinces have no
         separate named coasts). Returns parents for set-membership
         convenience."""
-        move = self._parsed[move_index]
-        assert isinstance(move, MoveOrder)
         variant = self._variant
-        resolutions = self._initial_resolutions
-        source_parent = variant.parent_of(move.source)
-        target_parent = variant.parent_of(move.target)
-        parents: Set[str] = set()
-        for k, order in enumerate(self._parsed):
-            if not isinstance(order, ConvoyOrder):
-                continue
-            r = resolutions[k]
-            if r.status == Status.ILLEGAL:
-                continue
-            if not r.convoy_matched:
-                continue
-            if variant.parent_of(order.army_source) != source_parent:
-                continue
-            if variant.parent_of(order.army_target) != target_parent:
-                continue
-            parents.add(variant.parent_of(order.source))
-        return parents
-
-    def _matched_convoy_fleet_locations(
-        self, move_index: int
-    ) -> Tuple[str, ...]:
-        """Fleet locations (not parents) of matched, non-ILLEGAL
-        ConvoyOrders corresponding to the given convoyed Move. The
-        locations are passed to convoy_path_exists, which normalises via
-        parent_of internally."""
-        move = self._parsed[move_index]
-        assert isinstance(move, MoveOrder)
-        variant = self._variant
-        resolutions = self._initial_resolutions
-        source_parent = variant.parent_of(move.source)
-        target_parent = variant.parent_of(move.target)
-        results: List[str] = []
-        for k, order in enumerate(self._parsed):
-            if not isinstance(order, ConvoyOrder):
-                continue
-            r = resolutions[k]
-            if r.status == Status.ILLEGAL:
-                continue
-            if not r.convoy_matched:
-                continue
-            if variant.parent_of(order.army_source) != source_parent:
-                continue
-            if variant.parent_of(order.army_target) != target_parent:
-                continue
-            results.append(order.source)
-        return tuple(results)
+        return {variant.parent_of(loc) for loc in self._convoy_fleets[move_index]}
 
     def _hold_strength_deps(self, i: int, illegal: bool) -> FrozenSet[_Key]:
         order = self._parsed[i]
         if isinstance(order, MoveOrder) and not illegal:
             return frozenset({(_MOVE_STATUS, i)})
         return frozenset(
-            (_SUPPORT_CUT, k) for k in _matching_hold_supports(self._state, i)
+            (_SUPPORT_CUT, k) for k in self._hold_supports[i]
         )
 
     # --- Work queue plumbing ---
@@ -477,6 +528,8 @@ class _Solver:
         for key, decision in self._decisions.items():
             for dep_key in decision.dependencies:
                 self._dependents.setdefault(dep_key, set()).add(key)
+            if decision.value is None:
+                self._unresolved[key] = None
             if not decision.dependencies:
                 self._ready.append(key)
 
@@ -491,8 +544,16 @@ class _Solver:
             value = self._compute(key)
             if value is None:
                 continue
-            self._decisions[key] = replace(decision, value=value)
-            self._enqueue_dependents(key)
+            self._commit(key, value)
+
+    def _commit(self, key: _Key, value: object) -> None:
+        """Record a decision's value. Every value — computed or forced
+        by a cycle breaker — goes through here, which keeps the
+        unresolved set current and drops the cached components."""
+        self._decisions[key] = replace(self._decisions[key], value=value)
+        self._unresolved.pop(key, None)
+        self._components = None
+        self._enqueue_dependents(key)
 
     def _enqueue_dependents(self, key: _Key) -> None:
         for dep_key in self._dependents.get(key, ()):
@@ -509,12 +570,36 @@ class _Solver:
         return True
 
     def _all_resolved(self) -> bool:
-        return all(d.value is not None for d in self._decisions.values())
+        return not self._unresolved
+
+    def _unresolved_deps(self, key: _Key) -> List[_Key]:
+        """Dependencies of `key` that are themselves still unresolved —
+        its out-edges in the residual graph. A resolved node cannot
+        complete a cycle of unresolved values, so it is not part of any
+        stall."""
+        unresolved = self._unresolved
+        return [d for d in self._decisions[key].dependencies if d in unresolved]
+
+    def _cyclic_components(self) -> List[List[_Key]]:
+        """The residual graph's cyclic strongly connected components,
+        each listed in enumeration order. Computed once per stall: the
+        result is cached until the next commit changes the graph."""
+        if self._components is None:
+            position = {key: n for n, key in enumerate(self._unresolved)}
+            self._components = [
+                sorted(component, key=position.__getitem__)
+                for component in _cyclic_components(
+                    list(self._unresolved), self._unresolved_deps
+                )
+            ]
+        return self._components
 
     # --- Compute dispatch ---
 
     def _compute(self, key: _Key) -> Optional[object]:
         kind, idx = key
+        if self._profile is not None:
+            self._evaluations[kind] = self._evaluations.get(kind, 0) + 1
         if kind == _SUPPORT_CUT:
             return self._compute_support_cut(idx)
         if kind == _ATTACK_STRENGTH:
@@ -549,13 +634,8 @@ class _Solver:
         cut_exception_parent: Optional[str] = None
         if isinstance(order, SupportMoveOrder):
             cut_exception_parent = variant.parent_of(order.target)
-        for j, attacker in enumerate(parsed):
-            if not isinstance(attacker, MoveOrder):
-                continue
-            if resolutions[j].status == Status.ILLEGAL:
-                continue
-            if variant.parent_of(attacker.target) != supporter_parent:
-                continue
+        for j in self._moves_into.get(supporter_parent, ()):
+            attacker = parsed[j]
             if attacker.nation == order.nation:
                 continue
             if resolutions[j].via_convoy:
@@ -583,7 +663,7 @@ class _Solver:
 
     def _compute_attack_strength(self, i: int) -> Optional[int]:
         defender_nation = self._effective_defender_nation_for(i)
-        supports = _matching_attack_supports(self._state, i)
+        supports = self._attack_supports[i]
         parsed = self._parsed
         resolutions = self._initial_resolutions
         active = 0
@@ -598,7 +678,7 @@ class _Solver:
         return 1 + active
 
     def _compute_defense_strength(self, i: int) -> int:
-        supports = _matching_attack_supports(self._state, i)
+        supports = self._attack_supports[i]
         resolutions = self._initial_resolutions
         active = 0
         for k in supports:
@@ -616,12 +696,12 @@ class _Solver:
                 return None
             if not intact:
                 return 0
-        h2h = _head_to_head_opponent_index(self._state, i)
+        h2h = self._head_to_head[i]
         if h2h is not None:
             opp_value = self._dec_value((_MOVE_STATUS, h2h))
             if opp_value is not None and opp_value[0] == Status.OK:
                 return 0
-        supports = _matching_attack_supports(self._state, i)
+        supports = self._attack_supports[i]
         resolutions = self._initial_resolutions
         active = 0
         for k in supports:
@@ -642,7 +722,7 @@ class _Solver:
             if move_value[0] == Status.OK:
                 return 0
             return 1
-        supports = _matching_hold_supports(self._state, i)
+        supports = self._hold_supports[i]
         resolutions = self._initial_resolutions
         active = 0
         for k in supports:
@@ -674,17 +754,10 @@ class _Solver:
                     ResolutionCode.MISSING_CONVOY_PATH,
                     "The convoy was disrupted.",
                 )
-        target_parent = variant.parent_of(order.target)
         max_prevent = 0
-        for j, other in enumerate(parsed):
+        for j in self._moves_into.get(variant.parent_of(order.target), ()):
             if j == i:
                 continue
-            if not isinstance(other, MoveOrder):
-                continue
-            if resolutions[j].status == Status.ILLEGAL:
-                continue
-            if variant.parent_of(other.target) != target_parent:
-                continue
             prev = self._dec_value((_PREVENT_STRENGTH, j))
             if prev is None:
                 return None
@@ -696,7 +769,7 @@ class _Solver:
                 ResolutionCode.BOUNCED,
                 "The attack was prevented by a competing move of equal or greater strength.",
             )
-        h2h_index = _head_to_head_opponent_index(self._state, i)
+        h2h_index = self._head_to_head[i]
         if h2h_index is not None:
             opp_defense = self._dec_value((_DEFENSE_STRENGTH, h2h_index))
             if opp_defense is None:
@@ -716,7 +789,7 @@ class _Solver:
                     "A unit cannot dislodge a unit of its own nation.",
                 )
             return (Status.OK, ResolutionCode.SUCCEEDED, None)
-        defender_idx = _defender_order_index(self._state, i)
+        defender_idx = self._defenders[i]
         if defender_idx is None:
             return (Status.OK, ResolutionCode.SUCCEEDED, None)
         defender_order = parsed[defender_idx]
@@ -762,23 +835,16 @@ class _Solver:
         move = self._parsed[i]
         assert isinstance(move, MoveOrder)
         variant = self._variant
-        parsed = self._parsed
         source_parent = variant.parent_of(move.source)
         target_parent = variant.parent_of(move.target)
-        matched_fleet_locs = self._matched_convoy_fleet_locations(i)
+        matched_fleet_locs = self._convoy_fleets[i]
         definitely_alive: List[str] = []
         candidates: List[str] = []
         for fleet_loc in matched_fleet_locs:
             fleet_parent = variant.parent_of(fleet_loc)
             any_ok_attacker = False
             any_unknown_attacker = False
-            for j, other in enumerate(parsed):
-                if not isinstance(other, MoveOrder):
-                    continue
-                if variant.parent_of(other.target) != fleet_parent:
-                    continue
-                if self._initial_resolutions[j].status == Status.ILLEGAL:
-                    continue
+            for j in self._moves_into.get(fleet_parent, ()):
                 status_value = self._dec_value((_MOVE_STATUS, j))
                 if status_value is None:
                     any_unknown_attacker = True
@@ -802,10 +868,10 @@ class _Solver:
         return None
 
     def _defender_nation_for(self, i: int) -> Optional[str]:
-        h2h = _head_to_head_opponent_index(self._state, i)
+        h2h = self._head_to_head[i]
         if h2h is not None:
             return self._parsed[h2h].nation
-        defender_idx = _defender_order_index(self._state, i)
+        defender_idx = self._defenders[i]
         if defender_idx is None:
             return None
         return self._parsed[defender_idx].nation
@@ -817,10 +883,10 @@ class _Solver:
         there is a Move that resolves OK and vacates. The own-nation
         support exclusion in attack-strength computation uses this
         effective view, not the static occupant (DATC 6.D.10/12)."""
-        h2h = _head_to_head_opponent_index(self._state, i)
+        h2h = self._head_to_head[i]
         if h2h is not None:
             return self._parsed[h2h].nation
-        defender_idx = _defender_order_index(self._state, i)
+        defender_idx = self._defenders[i]
         if defender_idx is None:
             return None
         defender_order = self._parsed[defender_idx]
@@ -849,58 +915,50 @@ class _Solver:
         route's known-intact status decides the support cut without
         needing to enter the paradox)."""
         changed = False
-        for key, decision in list(self._decisions.items()):
+        for key in list(self._unresolved):
             if key[0] not in (_MOVE_STATUS, _CONVOY_PATH_INTACT):
                 continue
-            if decision.value is not None:
+            if key not in self._unresolved:
                 continue
             value = self._compute(key)
             if value is None:
                 continue
-            self._decisions[key] = replace(decision, value=value)
-            self._enqueue_dependents(key)
+            self._commit(key, value)
             changed = True
         return changed
 
     # --- Cycle detection (DATC 6.F.4 clean N-cycles) ---
 
     def _try_resolve_clean_cycles(self) -> bool:
+        """Resolve every clean N-move cycle in the stall. A move cycle
+        makes each member's MOVE_STATUS depend on the next member's, so
+        its members all sit in one cyclic component of the residual
+        graph; only those moves are traced."""
         parsed = self._parsed
         variant = self._variant
         moves_by_source_parent: Dict[str, int] = {}
-        for i, order in enumerate(parsed):
-            if not isinstance(order, MoveOrder):
-                continue
-            if self._dec_value((_MOVE_STATUS, i)) is not None:
-                continue
-            if self._initial_resolutions[i].status == Status.ILLEGAL:
-                continue
-            moves_by_source_parent[variant.parent_of(order.source)] = i
+        for key in self._unresolved:
+            if key[0] == _MOVE_STATUS:
+                moves_by_source_parent[variant.parent_of(parsed[key[1]].source)] = key[1]
         changed = False
         seen_in_resolved_cycle: Set[int] = set()
-        for i, order in enumerate(parsed):
-            if not isinstance(order, MoveOrder):
-                continue
-            if self._initial_resolutions[i].status == Status.ILLEGAL:
-                continue
-            if self._dec_value((_MOVE_STATUS, i)) is not None:
-                continue
-            if i in seen_in_resolved_cycle:
-                continue
-            cycle = self._trace_cycle(i, moves_by_source_parent)
-            if cycle is None:
-                continue
-            if not self._cycle_is_clean(cycle):
-                continue
-            for j in cycle:
-                key = (_MOVE_STATUS, j)
-                self._decisions[key] = replace(
-                    self._decisions[key],
-                    value=(Status.OK, ResolutionCode.SUCCEEDED, None),
-                )
-                seen_in_resolved_cycle.add(j)
-                self._enqueue_dependents(key)
-            changed = True
+        for component in self._cyclic_components():
+            for kind, i in component:
+                if kind != _MOVE_STATUS:
+                    continue
+                if self._dec_value((_MOVE_STATUS, i)) is not None:
+                    continue
+                if i in seen_in_resolved_cycle:
+                    continue
+                cycle = self._trace_cycle(i, moves_by_source_parent)
+                if cycle is None:
+                    continue
+                if not self._cycle_is_clean(cycle):
+                    continue
+                for j in cycle:
+                    self._commit((_MOVE_STATUS, j), (Status.OK, ResolutionCode.SUCCEEDED, None))
+                    seen_in_resolved_cycle.add(j)
+                changed = True
         return changed
 
     def _trace_cycle(
@@ -929,7 +987,6 @@ class _Solver:
     def _cycle_is_clean(self, cycle: List[int]) -> bool:
         parsed = self._parsed
         variant = self._variant
-        resolutions = self._initial_resolutions
         cycle_set: Set[int] = set(cycle)
         for member_idx in cycle:
             member = parsed[member_idx]
@@ -945,16 +1002,9 @@ class _Solver:
                 attack = self._cycle_optimistic_attack(member_idx, cycle_set)
                 if attack is None:
                     return False
-            target_parent = variant.parent_of(member.target)
-            for j, other in enumerate(parsed):
+            for j in self._moves_into.get(variant.parent_of(member.target), ()):
                 if j == member_idx:
                     continue
-                if not isinstance(other, MoveOrder):
-                    continue
-                if resolutions[j].status == Status.ILLEGAL:
-                    continue
-                if variant.parent_of(other.target) != target_parent:
-                    continue
                 prev = self._dec_value((_PREVENT_STRENGTH, j))
                 if prev is None or attack <= prev:
                     return False
@@ -967,15 +1017,15 @@ class _Solver:
         defender that is itself a member of `cycle_set` succeeds and
         vacates. Returns None when a non-cycle dependency is still
         unresolved."""
-        supports = _matching_attack_supports(self._state, i)
+        supports = self._attack_supports[i]
         for k in supports:
             if self._dec_value((_SUPPORT_CUT, k)) is None:
                 return None
-        h2h = _head_to_head_opponent_index(self._state, i)
+        h2h = self._head_to_head[i]
         if h2h is not None:
             defender_nation: Optional[str] = self._parsed[h2h].nation
         else:
-            defender_idx = _defender_order_index(self._state, i)
+            defender_idx = self._defenders[i]
             defender_nation = None
             if defender_idx is not None and defender_idx not in cycle_set:
                 defender_order = self._parsed[defender_idx]
@@ -1006,106 +1056,28 @@ class _Solver:
     # --- Szykman's rule (DATC 6.F.13ff convoy paradoxes) ---
 
     def _try_resolve_szykman_paradoxes(self) -> bool:
-        """Detect dependency cycles among unresolved decisions and break
-        any cycle containing at least one `_CONVOY_PATH_INTACT` by
-        forcing those decisions to False (DATC Szykman's rule: convoyed
-        moves in a paradox are treated as disrupted).
+        """Break every cyclic component of the residual graph that
+        contains at least one `_CONVOY_PATH_INTACT` by forcing those
+        decisions to False (DATC Szykman's rule: convoyed moves in a
+        paradox are treated as disrupted).
 
         Returns True iff at least one decision value was forced. The
         solver's main loop relies on the True return to know the
         dependency graph state has changed and is worth re-processing.
 
-        Cycles without any `_CONVOY_PATH_INTACT` are not broken here.
-        They should not arise in practice; if one does, the main loop
-        will exhaust `_MAX_CYCLE_PASSES` and raise — the right
+        Components without any `_CONVOY_PATH_INTACT` are not broken
+        here. They should not arise in practice; if one does, the main
+        loop will exhaust `_MAX_CYCLE_PASSES` and raise — the right
         behavior, since a non-convoy paradox cycle indicates a solver
         bug rather than a recognised paradox shape.
         """
-        cycle = self._find_unresolved_cycle()
-        if cycle is None:
-            return False
-        convoy_decisions_in_cycle = [
-            key for key in cycle if key[0] == _CONVOY_PATH_INTACT
-        ]
-        if not convoy_decisions_in_cycle:
-            return False
-        for key in convoy_decisions_in_cycle:
-            decision = self._decisions[key]
-            self._decisions[key] = replace(decision, value=False)
-            self._enqueue_dependents(key)
-        return True
-
-    def _find_unresolved_cycle(self) -> Optional[List[_Key]]:
-        """Return any one cycle of unresolved decisions in the
-        dependency graph, or None if no cycle exists. Iterative DFS
-        with three colors:
-          - white: not yet visited
-          - gray: currently on the DFS stack
-          - black: fully explored, no cycle through this node
-
-        A back-edge from the current node to a gray node indicates a
-        cycle; the cycle members are extracted by walking the DFS
-        stack from the cycle's entry point onward."""
-        WHITE, GRAY, BLACK = 0, 1, 2
-        color: Dict[_Key, int] = {
-            key: WHITE
-            for key, d in self._decisions.items()
-            if d.value is None
-        }
-        for start in list(color):
-            if color[start] != WHITE:
-                continue
-            stack: List[Tuple[_Key, Deque[_Key]]] = [
-                (start, deque(self._unresolved_deps(start)))
-            ]
-            color[start] = GRAY
-            while stack:
-                node, remaining = stack[-1]
-                if not remaining:
-                    color[node] = BLACK
-                    stack.pop()
-                    continue
-                neighbour = remaining.popleft()
-                if neighbour not in color:
-                    continue
-                if color[neighbour] == BLACK:
-                    continue
-                if color[neighbour] == GRAY:
-                    return self._extract_cycle(neighbour, stack)
-                color[neighbour] = GRAY
-                stack.append(
-                    (neighbour, deque(self._unresolved_deps(neighbour)))
-                )
-        return None
-
-    def _unresolved_deps(self, key: _Key) -> List[_Key]:
-        """Dependencies of `key` that are themselves still unresolved.
-        Resolved deps are not part of any active cycle, so they are
-        filtered out before DFS — both for correctness (a resolved
-        node cannot complete a cycle of unresolved values) and to
-        keep the search tight."""
-        decision = self._decisions[key]
-        return [
-            d for d in decision.dependencies
-            if self._decisions[d].value is None
-        ]
-
-    def _extract_cycle(
-        self,
-        cycle_entry: _Key,
-        stack: List[Tuple[_Key, Deque[_Key]]],
-    ) -> List[_Key]:
-        """Reconstruct the cycle from the DFS stack: the slice from
-        `cycle_entry` (the gray node we found a back-edge to) through
-        the current top-of-stack node."""
-        cycle_members: List[_Key] = []
-        found_entry = False
-        for node, _ in stack:
-            if node == cycle_entry:
-                found_entry = True
-            if found_entry:
-                cycle_members.append(node)
-        return cycle_members
+        changed = False
+        for component in self._cyclic_components():
+            for key in component:
+                if key[0] == _CONVOY_PATH_INTACT:
+                    self._commit(key, False)
+                    changed = True
+        return changed
 
     # --- Guaranteed bounces (contested rotations) ---
 
@@ -1149,29 +1121,18 @@ class _Solver:
         variant = self._variant
         resolutions = self._initial_resolutions
         changed = False
-        for i, order in enumerate(parsed):
-            if not isinstance(order, MoveOrder):
-                continue
-            key = (_MOVE_STATUS, i)
-            decision = self._decisions.get(key)
-            if decision is None or decision.value is not None:
-                continue
+        for key in [key for key in self._unresolved if key[0] == _MOVE_STATUS]:
+            i = key[1]
+            order = parsed[i]
             if resolutions[i].via_convoy and (
                 self._dec_value((_CONVOY_PATH_INTACT, i)) is not True
             ):
                 continue
-            ceiling = 1 + len(_matching_attack_supports(self._state, i))
-            target_parent = variant.parent_of(order.target)
+            ceiling = 1 + len(self._attack_supports[i])
             forced_reason: Optional[str] = None
-            for j, other in enumerate(parsed):
+            for j in self._moves_into.get(variant.parent_of(order.target), ()):
                 if j == i:
                     continue
-                if not isinstance(other, MoveOrder):
-                    continue
-                if resolutions[j].status == Status.ILLEGAL:
-                    continue
-                if variant.parent_of(other.target) != target_parent:
-                    continue
                 prevent = self._dec_value((_PREVENT_STRENGTH, j))
                 if prevent is None:
                     continue
@@ -1182,7 +1143,7 @@ class _Solver:
                     )
                     break
             if forced_reason is None:
-                defender_idx = _defender_order_index(self._state, i)
+                defender_idx = self._defenders[i]
                 if defender_idx is not None:
                     hold = self._dec_value((_HOLD_STRENGTH, defender_idx))
                     if hold is not None and ceiling <= hold:
@@ -1192,25 +1153,17 @@ class _Solver:
                         )
             if forced_reason is None:
                 continue
-            self._decisions[key] = replace(
-                decision, value=(Status.BOUNCE, ResolutionCode.BOUNCED, forced_reason)
-            )
-            self._enqueue_dependents(key)
+            self._commit(key, (Status.BOUNCE, ResolutionCode.BOUNCED, forced_reason))
             changed = True
         return changed
 
     # --- Completeness check ---
 
     def _assert_decisions_complete(self) -> None:
-        unresolved = [
-            (key, decision)
-            for key, decision in self._decisions.items()
-            if decision.value is None
-        ]
-        if not unresolved:
+        if not self._unresolved:
             return
         formatted = ", ".join(
-            f"{kind}[{subject}]" for (kind, subject), _ in unresolved
+            f"{kind}[{subject}]" for kind, subject in self._unresolved
         )
         raise RuntimeError(
             "Strength-and-cut solver terminated with unresolved decisions: "
@@ -1246,128 +1199,56 @@ class _Solver:
         return self._state.replace(resolutions=tuple(resolutions))
 
 
-# === Geometry helpers (module-private) ===
-#
-# Read-only questions about parsed orders + the variant adjacency. These
-# are not methods on Views because they belong to the solver, not to the
-# engine's view layer — they encode strength-resolution geometry, not
-# general queries about state. P3 will revisit `source_province()` as a
-# narrow exception on Order; until then, these stay as functions.
-
-
-def _matching_attack_supports(
-    state: StateView, move_index: int
-) -> Tuple[int, ...]:
-    """Indices of SupportMoveOrders matched to the given Move."""
-    parsed = state.parsed_orders()
-    resolutions = state.resolutions()
-    variant = state.variant()
-    move = parsed[move_index]
-    assert isinstance(move, MoveOrder)
-    results: List[int] = []
-    for k, support in enumerate(parsed):
-        if not isinstance(support, SupportMoveOrder):
-            continue
-        if resolutions[k].status == Status.ILLEGAL:
-            continue
-        if not resolutions[k].support_matched:
-            continue
-        if variant.parent_of(support.supported_source) != variant.parent_of(
-            move.source
-        ):
-            continue
-        if support.target != move.target and variant.parent_of(
-            support.target
-        ) != variant.parent_of(move.target):
-            continue
-        results.append(k)
-    return tuple(results)
-
-
-def _matching_hold_supports(
-    state: StateView, supported_index: int
-) -> Tuple[int, ...]:
-    """Indices of SupportHoldOrders matched to the unit at
-    parsed_orders[supported_index]'s source province."""
-    parsed = state.parsed_orders()
-    resolutions = state.resolutions()
-    variant = state.variant()
-    supported = parsed[supported_index]
-    supported_parent = variant.parent_of(supported.source)
-    results: List[int] = []
-    for k, support in enumerate(parsed):
-        if not isinstance(support, SupportHoldOrder):
-            continue
-        if resolutions[k].status == Status.ILLEGAL:
-            continue
-        if not resolutions[k].support_matched:
-            continue
-        if variant.parent_of(support.supported_source) != supported_parent:
-            continue
-        results.append(k)
-    return tuple(results)
-
-
-def _head_to_head_opponent_index(
-    state: StateView, move_index: int
-) -> Optional[int]:
-    """Index of the opposing MoveOrder forming a head-to-head pair with
-    parsed_orders[move_index], or None. Two Moves are head-to-head when
-    each targets the other's source parent and neither is ILLEGAL — *and
-    neither moves by convoy* (DATC 6.G: convoyed moves do not form
-    head-to-head pairs)."""
-    parsed = state.parsed_orders()
-    resolutions = state.resolutions()
-    variant = state.variant()
-    move = parsed[move_index]
-    assert isinstance(move, MoveOrder)
-    if resolutions[move_index].via_convoy:
-        return None
-    target_parent = variant.parent_of(move.target)
-    source_parent = variant.parent_of(move.source)
-    for j, other in enumerate(parsed):
-        if j == move_index:
-            continue
-        if not isinstance(other, MoveOrder):
-            continue
-        if resolutions[j].status == Status.ILLEGAL:
-            continue
-        if resolutions[j].via_convoy:
-            continue
-        if variant.parent_of(other.source) != target_parent:
-            continue
-        if variant.parent_of(other.target) != source_parent:
-            continue
-        return j
-    return None
-
-
-def _defender_order_index(
-    state: StateView, attacker_index: int
-) -> Optional[int]:
-    """Index of the Movement-phase order at the attacker's target parent
-    (the unit being attacked), or None. Returned regardless of order
-    type — the caller checks whether that unit is moving away. Convoy
-    orders are included so attacks on convoying fleets resolve against
-    the fleet's hold strength rather than as if the province were
-    empty."""
-    parsed = state.parsed_orders()
-    variant = state.variant()
-    attacker = parsed[attacker_index]
-    assert isinstance(attacker, MoveOrder)
-    target_parent = variant.parent_of(attacker.target)
-    for i, order in enumerate(parsed):
-        if not isinstance(
-            order,
-            (
-                HoldOrder,
-                MoveOrder,
-                SupportHoldOrder,
-                SupportMoveOrder,
-                ConvoyOrder,
-            ),
-        ):
+# === Strongly connected components (module-private) ===
+
+
+def _cyclic_components(
+    nodes: Iterable[_Key], successors: Callable[[_Key], List[_Key]]
+) -> List[List[_Key]]:
+    """The strongly connected components of the graph that contain a
+    cycle — more than one member, or a single member depending on
+    itself — via an iterative Tarjan's algorithm. `successors` must
+    only return members of `nodes`. Each edge is followed once, so the
+    cost is linear in the size of the graph.
+
+    Components come out in reverse topological order: a component is
+    listed before any component that depends on it."""
+    index: Dict[_Key, int] = {}
+    low: Dict[_Key, int] = {}
+    stack: List[_Key] = []
+    on_stack: Set[_Key] = set()
+    components: List[List[_Key]] = []
+    for root in nodes:
+        if root in index:
             continue
-        if variant.parent_of(order.source) == target_parent:
-            return i
-    return None
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work: List[Tuple[_Key, Iterator[_Key]]] = [(root, iter(successors(root)))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors(child))))
+                    break
+                if child in on_stack and index[child] < low[node]:
+                    low[node] = index[child]
+            else:
+                work.pop()
+                if work and low[node] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[node]
+                if low[node] != index[node]:
+                    continue
+                component: List[_Key] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in successors(node):
+                    components.append(component)
+    return components
@@ -343,6 +343,31 @@ def deserialize_game_state(data: Dict[str, Any], variant: Variant) -> State:
     )
 
 
+def validate_game_state(state: State) -> None:
+    """Run the checks `deserialize_game_state` makes on its input over a
+    `State` built some other way, e.g. straight from database rows.
+    Raises `GameStateValidationError` on the first problem."""
+    variant = state.variant
+    _validate_phase(variant, {"season": state.phase.season, "type": state.phase.type, "year": state.phase.year})
+    for unit in state.units:
+        if unit.type not in SUPPORTED_UNIT_TYPES:
+            raise GameStateValidationError(f"Unsupported unit type: {unit.type!r}")
+        _validate_nation(variant, unit.nation)
+        _validate_location(variant, unit.location)
+        if unit.dislodged_from is not None:
+            _validate_location(variant, unit.dislodged_from)
+    for sc in state.supply_centers:
+        _validate_nation(variant, sc.nation)
+        if sc.province not in variant.provinces:
+            raise GameStateValidationError(f"Unknown supply-center province: {sc.province!r}")
+        if not variant.provinces[sc.province].supply_center:
+            raise GameStateValidationError(f"Province {sc.province} is not a supply center")
+    for order in state.orders:
+        if order.order_type not in SUPPORTED_ORDER_TYPES:
+            raise GameStateValidationError(f"Unsupported order type: {order.order_type!r}")
+        _validate_nation(variant, order.nation)
+
+
 def serialize_game_state(state: State) -> Dict[str, Any]:
     return {
         "phase": {
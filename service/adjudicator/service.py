@@ -10,27 +10,65 @@ consumes: next-phase descriptor + options, post-resolution units / supply
 centers, and per-order resolutions (with a "by" province pointing at the
 opponent that caused a bounce or cut where applicable).
 
-Both functions emit the legacy godip-style dict so downstream consumers
-(`Game.start`, `create_from_adjudication_data`, `transform_options`) keep
-working unchanged.
+`resolve_many(phases, executor=None)` adjudicates a batch of phases ahead
+of their resolve transactions; `resolve(phase, prepared=...)` then reuses
+a prepared result as long as the phase has not changed since.
+
+All of them build the domain `State` straight from the phase's rows
+(`phase.utils.phase_to_game_state`), reusing rows the caller prefetched
+with `with_adjudication_data()` rather than reading the phase again; the
+canonical dict is only produced for the adjudication executor.
+
+`get_adjudication_executor()` returns the process-wide pool of warm
+adjudication workers (see `adjudicator.executor`), or None when it is
+disabled; `prepare(phase, executor)` runs the engine work there ahead of
+the resolve transaction, so waiting on the pool holds no row locks.
+
+With the ADJUDICATION_PROFILING setting on, inline resolutions run under
+`adjudicator.profiling.profile_adjudication()` and the profile is attached
+to the `adjudicator.resolve` span as events.
+
+These functions only read the database; the engine work lives in
+`adjudicator.pipeline`. They emit the legacy godip-style dict so
+downstream consumers (`Game.start`, `create_from_adjudication_data`,
+`transform_options`) keep working unchanged.
 """
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
+from django.conf import settings
 from opentelemetry import trace
 
-from phase.utils import phase_to_canonical_game_state
+from phase.utils import phase_to_game_state
 from variant.utils import variant_to_canonical_dict
 
+from .compiled import get_compiled_variant
 from .domain import State, Variant
-from .engine import Engine
-from .options import get_options
-from .options_adapter import python_options_to_godip_dict
-from .serializers import deserialize_game_state, deserialize_variant
+from .executor import AdjudicationExecutor
+from .pipeline import resolve_state, resolve_states, start_state
+from .profiling import profile_adjudication
+from .serializers import serialize_game_state
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+_EXECUTOR: Optional[AdjudicationExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PreparedResolution:
+    """An adjudication computed ahead of the phase's resolve transaction
+    by `resolve_many` or `prepare`. `resolve` returns `data` only while the phase's
+    state and skip nations still equal the ones adjudicated; otherwise it
+    adjudicates afresh."""
+
+    game_state: State
+    skip_nations: FrozenSet[str]
+    data: Dict[str, Any]
+
 
 def start(phase) -> Dict[str, Any]:
     logger.info(f"Starting adjudication for phase {phase.id} of game {phase.game.id}")
@@ -39,256 +77,139 @@ def start(phase) -> Dict[str, Any]:
         span.set_attribute("game.id", str(phase.game.id))
         span.set_attribute("variant.id", phase.variant.id)
 
-        state, variant = _build_state(phase)
-        options = get_options(state)
-        godip_options = python_options_to_godip_dict(
-            options,
-            state.units,
-            state.supply_centers,
-            variant,
-            state.phase.type,
-        )
-
-        nation_name_by_id = {nation.id: nation.name for nation in variant.nations}
-        return {
-            "season": state.phase.season,
-            "year": state.phase.year,
-            "type": state.phase.type,
-            "options": godip_options,
-            "supply_centers": _build_supply_centers(state.supply_centers, nation_name_by_id),
-            "units": _build_units([], state.units, variant, nation_name_by_id),
-            "resolutions": [],
-        }
-
-
-def _should_skip(options, units, supply_centers, skip_nations, nation_name_by_id, variant):
-    if not options:
-        return True
-    if not skip_nations:
-        return False
-    standing_location_to_nation = {
-        u.location: nation_name_by_id.get(u.nation, u.nation)
-        for u in units
-        if not u.dislodged
-    }
-    dislodged_location_to_nation = {
-        u.location: nation_name_by_id.get(u.nation, u.nation)
-        for u in units
-        if u.dislodged
-    }
-    location_to_nation = {**standing_location_to_nation, **dislodged_location_to_nation}
-    province_to_nation = {
-        sc.province: nation_name_by_id.get(sc.nation, sc.nation)
-        for sc in supply_centers
-    }
-    option_nations = set()
-    for opt in options:
-        if opt.source is None:
-            continue
-        if opt.source in location_to_nation:
-            option_nations.add(location_to_nation[opt.source])
-        else:
-            province = variant.parent_of(opt.source)
-            if province in province_to_nation:
-                option_nations.add(province_to_nation[province])
-    return bool(option_nations) and option_nations.issubset(skip_nations)
-
-
-def resolve(phase) -> Dict[str, Any]:
+        state, _ = _build_state(phase)
+        return start_state(state)
+
+
+def resolve(phase, prepared: Optional[PreparedResolution] = None) -> Dict[str, Any]:
     logger.info(f"Resolving phase {phase.id} of game {phase.game.id}")
     with tracer.start_as_current_span("adjudicator.resolve") as span:
         span.set_attribute("phase.id", phase.id)
         span.set_attribute("game.id", str(phase.game.id))
         span.set_attribute("variant.id", phase.variant.id)
 
-        state, variant = _build_state(phase)
-        nation_name_by_id = {nation.id: nation.name for nation in variant.nations}
-        cd_nations = set(
-            phase.game.members
-            .filter(civil_disorder=True)
-            .values_list("nation__name", flat=True)
-        )
-        non_playable_nations = {n.name for n in variant.nations if n.non_playable}
-        skip_nations = cd_nations | non_playable_nations
-
-        states = Engine().adjudicate(state)
-        resolved = states[0]
-        next_state = states[1] if len(states) > 1 else resolved
-
-        # Advance through phases nobody can act in (empty retreat / empty
-        # adjustment, or retreat where every retreating nation is in Civil
-        # Disorder) so we land on the next phase that needs player input.
-        # Engine.adjudicate advances one phase per call and keeps phase
-        # skipping out of scope by contract, so skipping is orchestrated
-        # here. Skipped phases are never persisted -- only the final
-        # interactive phase is written by create_from_adjudication_data.
-        next_options = get_options(next_state) if len(states) > 1 else []
-        _skip_count = 0
-        _MAX_SKIP = 10
-        while len(states) > 1 and _should_skip(next_options, next_state.units, next_state.supply_centers, skip_nations, nation_name_by_id, next_state.variant):
-            _skip_count += 1
-            if _skip_count >= _MAX_SKIP:
-                logger.warning(
-                    f"Phase skip limit reached for phase {phase.id} "
-                    f"(game {phase.game.id}) — all nations likely in civil disorder"
-                )
-                break
-            states = Engine().adjudicate(next_state)
-            next_state = states[1] if len(states) > 1 else states[0]
-            next_options = get_options(next_state) if len(states) > 1 else []
-
-        if len(states) > 1:
-            godip_options = python_options_to_godip_dict(
-                next_options,
-                next_state.units,
-                next_state.supply_centers,
-                variant,
-                next_state.phase.type,
+        variant = _compiled_variant(phase)
+        # A prepared result was computed from rows read before this
+        # transaction; read the phase again so a change since is caught.
+        state = phase_to_game_state(phase, variant, refresh=prepared is not None)
+        skip_nations = _skip_nations(phase, variant)
+        if (
+            prepared is not None
+            and prepared.game_state == state
+            and prepared.skip_nations == skip_nations
+        ):
+            span.set_attribute("adjudication.prepared", True)
+            return prepared.data
+
+        if not getattr(settings, "ADJUDICATION_PROFILING", False):
+            return resolve_state(state, skip_nations)
+        with profile_adjudication() as profile:
+            data = resolve_state(state, skip_nations)
+        profile.add_span_events(span)
+        return data
+
+
+def prepare(phase, executor: AdjudicationExecutor) -> Optional[PreparedResolution]:
+    """Adjudicate `phase` on `executor` for `resolve(phase, prepared=...)`
+    to consume. Call it before opening the resolve transaction: it blocks
+    for a queue slot and the worker's answer. Returns None when the
+    executor fails, and the phase is then adjudicated inline."""
+    with tracer.start_as_current_span("adjudicator.prepare") as span:
+        span.set_attribute("phase.id", phase.id)
+        span.set_attribute("variant.id", phase.variant.id)
+        variant = _compiled_variant(phase)
+        state = phase_to_game_state(phase, variant)
+        skip_nations = _skip_nations(phase, variant)
+        variant_model = phase.variant
+        try:
+            data = executor.resolve(
+                variant_model.id,
+                variant_model.updated_at,
+                lambda: variant_to_canonical_dict(variant_model),
+                serialize_game_state(state),
+                skip_nations,
+            )
+        except Exception:
+            logger.exception(f"Executor adjudication of phase {phase.id} failed; resolving it inline")
+            return None
+        return PreparedResolution(game_state=state, skip_nations=skip_nations, data=data)
+
+
+def resolve_many(
+    phases: Sequence[Any], executor: Optional[AdjudicationExecutor] = None
+) -> List[Optional[PreparedResolution]]:
+    """Adjudicate several phases in one batch, ahead of their resolve
+    transactions. Reads each phase's state here, then runs the engine
+    work through `pipeline.resolve_states`, optionally across the
+    adjudication executor's pool. Returns one entry per phase, in order, for
+    `resolve(phase, prepared=...)` to consume; a phase whose
+    adjudication failed gets None and is simply adjudicated again
+    inline."""
+    with tracer.start_as_current_span("adjudicator.resolve_many") as span:
+        span.set_attribute("phases.count", len(phases))
+        inputs: List[Tuple[State, FrozenSet[str]]] = []
+        for phase in phases:
+            variant = _compiled_variant(phase)
+            inputs.append((phase_to_game_state(phase, variant), _skip_nations(phase, variant)))
+
+        results = resolve_states(inputs) if executor is None else executor.resolve_states(inputs)
+        span.set_attribute("phases.failed", sum(1 for data in results if data is None))
+        return [
+            PreparedResolution(game_state=state, skip_nations=skip, data=data)
+            if data is not None
+            else None
+            for (state, skip), data in zip(inputs, results)
+        ]
+
+
+def get_adjudication_executor() -> Optional[AdjudicationExecutor]:
+    """The process-wide adjudication pool, started on first use with every
+    official variant preloaded, or None when ADJUDICATION_EXECUTOR_WORKERS
+    is zero."""
+    global _EXECUTOR
+    max_workers = getattr(settings, "ADJUDICATION_EXECUTOR_WORKERS", 0)
+    if max_workers <= 0:
+        return None
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            from variant.models import Variant as VariantModel
+
+            variants = [
+                (variant_model.id, variant_model.updated_at, variant_to_canonical_dict(variant_model))
+                for variant_model in VariantModel.objects.filter(official=True)
+            ]
+            queue_depth = getattr(settings, "ADJUDICATION_EXECUTOR_QUEUE_DEPTH", 8)
+            slot_timeout = getattr(settings, "ADJUDICATION_EXECUTOR_SLOT_TIMEOUT_SECONDS", 30)
+            _EXECUTOR = AdjudicationExecutor(max_workers, queue_depth, variants, slot_timeout=slot_timeout)
+            logger.info(
+                f"Started adjudication executor: {max_workers} workers, queue depth {queue_depth}, "
+                f"{len(variants)} variants preloaded"
             )
-        else:
-            godip_options = {nation.name: {} for nation in variant.nations}
-
-        return {
-            "season": next_state.phase.season,
-            "year": next_state.phase.year,
-            "type": next_state.phase.type,
-            "options": godip_options,
-            "supply_centers": _build_supply_centers(
-                next_state.supply_centers, nation_name_by_id
-            ),
-            "units": _build_units(state.units, next_state.units, variant, nation_name_by_id),
-            "resolutions": _build_resolutions(state.orders, resolved.resolutions, variant),
-        }
+        return _EXECUTOR
 
 
-def _build_state(phase) -> Tuple[State, Variant]:
-    canonical_variant = variant_to_canonical_dict(phase.variant)
-    canonical_state = phase_to_canonical_game_state(phase)
-    variant = deserialize_variant(canonical_variant)
-    state = deserialize_game_state(canonical_state, variant)
-    return state, variant
-
-
-def _build_supply_centers(
-    supply_centers, nation_name_by_id: Dict[str, str]
-) -> List[Dict[str, Any]]:
-    return sorted(
-        (
-            {
-                "province": sc.province,
-                "nation": nation_name_by_id.get(sc.nation, sc.nation),
-            }
-            for sc in supply_centers
-        ),
-        key=lambda entry: entry["province"],
+def _skip_nations(phase, variant: Variant) -> FrozenSet[str]:
+    cd_nations = set(
+        phase.game.members
+        .filter(civil_disorder=True)
+        .values_list("nation__name", flat=True)
     )
+    non_playable_nations = {n.name for n in variant.nations if n.non_playable}
+    return frozenset(cd_nations | non_playable_nations)
+
+
+def _compiled_variant(phase) -> Variant:
+    # The variant graph is compiled once per process and reused until the
+    # Variant row changes; see adjudicator.compiled.
+    variant_model = phase.variant
+    compiled = get_compiled_variant(
+        variant_model.id,
+        variant_model.updated_at,
+        lambda: variant_to_canonical_dict(variant_model),
+    )
+    return compiled.variant
 
 
-def _build_units(
-    pre_units,
-    next_units,
-    variant: Variant,
-    nation_name_by_id: Dict[str, str],
-) -> List[Dict[str, Any]]:
-    # The Python engine records `dislodged_from` as the parent province the
-    # attacker came from. godip's wire format uses the attacker unit's
-    # exact location (named coast included). Look up the dislodger from
-    # the pre-movement units so the location matches what downstream
-    # `previous_units_by_province` lookups expect.
-    pre_unit_location_by_parent: Dict[str, str] = {}
-    for unit in pre_units:
-        parent = variant.parent_of(unit.location)
-        pre_unit_location_by_parent.setdefault(parent, unit.location)
-
-    units_out: List[Dict[str, Any]] = []
-    for unit in next_units:
-        dislodged_by: Optional[str] = None
-        if unit.dislodged and unit.dislodged_from:
-            dislodged_by = pre_unit_location_by_parent.get(unit.dislodged_from)
-        units_out.append(
-            {
-                "province": unit.location,
-                "type": unit.type,
-                "nation": nation_name_by_id.get(unit.nation, unit.nation),
-                "dislodged": unit.dislodged,
-                "dislodged_by": dislodged_by,
-            }
-        )
-    return sorted(units_out, key=lambda entry: entry["province"])
-
-
-def _build_resolutions(orders, resolutions, variant: Variant) -> List[Dict[str, Any]]:
-    # Downstream `create_from_adjudication_data` matches resolution.province
-    # against order.source.province_id. Orders carry their source as the
-    # parent province (named coasts get collapsed at order creation), so
-    # the resolution province must be the parent too.
-    #
-    # The engine reports each order's outcome code directly, so "result"
-    # is a copy rather than a translation: ResolutionCode and
-    # OrderResolutionStatus are the same vocabulary.
-    #
-    # For BOUNCE/CUT statuses we also populate the "by" province — godip
-    # encoded it as `ErrBounce:par` / `ErrSupportBroken:mar`. The engine
-    # doesn't carry that on the Resolution, so we reconstruct it from the
-    # raw orders: a bounced Move is referenced by another Move targeting
-    # the same parent; a cut Support is referenced by the Move that
-    # attacked the supporter's parent.
-    orders_by_source_parent: Dict[str, Any] = {}
-    moves_by_target_parent: Dict[str, List[Any]] = {}
-    for order in orders:
-        if order.source is not None:
-            orders_by_source_parent.setdefault(variant.parent_of(order.source), order)
-        if order.order_type in ("Move", "MoveViaConvoy") and order.target is not None:
-            moves_by_target_parent.setdefault(variant.parent_of(order.target), []).append(order)
-
-    resolutions_out: List[Dict[str, Any]] = []
-    for resolution in resolutions or []:
-        province_parent = variant.parent_of(resolution.province)
-        by = _find_by_province(
-            resolution.resolution,
-            province_parent,
-            orders_by_source_parent,
-            moves_by_target_parent,
-            variant,
-        )
-        resolutions_out.append(
-            {
-                "province": province_parent,
-                "result": resolution.code,
-                "by": by,
-            }
-        )
-    return resolutions_out
-
-
-def _find_by_province(
-    status: str,
-    province_parent: str,
-    orders_by_source_parent: Dict[str, Any],
-    moves_by_target_parent: Dict[str, List[Any]],
-    variant: Variant,
-) -> Optional[str]:
-    if status not in ("BOUNCE", "CUT"):
-        return None
-
-    order = orders_by_source_parent.get(province_parent)
-    if order is None:
-        return None
-
-    if status == "BOUNCE":
-        # Only Moves bounce against other Moves at the same target.
-        if order.order_type not in ("Move", "MoveViaConvoy") or order.target is None:
-            return None
-        target_parent = variant.parent_of(order.target)
-        for other in moves_by_target_parent.get(target_parent, []):
-            if other is order or other.source is None:
-                continue
-            return variant.parent_of(other.source)
-        return None
-
-    # status == "CUT": find the Move that attacked the supporter's source.
-    for other in moves_by_target_parent.get(province_parent, []):
-        if other.source is None:
-            continue
-        return variant.parent_of(other.source)
-    return None
+def _build_state(phase) -> Tuple[State, Variant]:
+    variant = _compiled_variant(phase)
+    return phase_to_game_state(phase, variant), variant
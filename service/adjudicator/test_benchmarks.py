@@ -0,0 +1,255 @@
+"""Adjudication latency benchmarks.
+
+These time real `adjudicator.service` calls, and replay the integration
+fixtures through the pure adjudicator, and print their numbers, so they
+are excluded from the default run (see pyproject.toml). Invoke
+explicitly when measuring:
+
+    pytest adjudicator/test_benchmarks.py -s
+"""
+import gc
+import json
+import math
+import statistics
+import time
+import tracemalloc
+
+import pytest
+
+import adjudicator.service as adjudication_service
+from adjudicator import adjudicate
+from adjudicator import generator
+from adjudicator.benchmark import (
+    DEFAULT_FIXTURES,
+    FIXTURES_DIR,
+    MEDIAN_ITERATIONS,
+    benchmark_fixture,
+    bundled_variant,
+    median_ms,
+    replay_fixture,
+)
+from adjudicator.compiled import clear_compiled_variants
+from adjudicator.convoy import ConvoyOracle
+from adjudicator.domain import ProvinceType
+from adjudicator.engine import Engine
+from adjudicator.options import get_options
+from adjudicator.profiling import profile_adjudication
+from adjudicator.serializers import deserialize_game_state, deserialize_variant
+from adjudicator.tests import _bfs_coast_seas, _bfs_sea_closure
+from integration.management.commands.benchmark_adjudicator import BASELINE_PATH
+
+
+@pytest.mark.django_db
+def test_resolve_latency_compiled_variant_cold_vs_warm(classical_opening_phase):
+    phase = classical_opening_phase
+
+    cold = median_ms(lambda: adjudication_service.resolve(phase), before_each=clear_compiled_variants)
+    adjudication_service.resolve(phase)
+    warm = median_ms(lambda: adjudication_service.resolve(phase))
+
+    print(f"\nresolve classical Spring 1901: cold {cold:.1f} ms, warm {warm:.1f} ms ({cold / warm:.1f}x)")
+    assert warm < cold
+
+
+# === Fixture replay without the database ===
+#
+# `adjudicator.benchmark` rebuilds each fixture's variant from the seed
+# data and replays its orders; `manage.py benchmark_adjudicator` is the
+# reporting front end with stored baselines.
+
+
+def test_fixture_replays_match_recorded_positions_and_baseline():
+    baseline = json.loads(BASELINE_PATH.read_text())
+    for fixture_name in DEFAULT_FIXTURES:
+        canonical_variant, states = replay_fixture(fixture_name)
+        fixture = json.loads((FIXTURES_DIR / fixture_name).read_text())
+        for state, phase in zip(states, fixture["phases"]):
+            expected = phase["expected_state_after"]
+            if not expected:
+                continue
+            resolved = adjudicate(canonical_variant, state)[0]
+            assert sorted(
+                (unit["nation"], unit["type"], unit["location"]) for unit in resolved["units"] if not unit["dislodged"]
+            ) == sorted(
+                (unit["nation"].lower(), unit["type"], unit["province"])
+                for unit in expected["units"]
+                if not unit["dislodged"]
+            ), f"{fixture_name} phase {phase['ordinal']}"
+
+        report = benchmark_fixture(fixture_name, repeat=3)
+        print(f"\n{fixture_name}: {json.dumps(report)}")
+        assert report["phases"] == baseline[fixture_name]["phases"]
+        assert report["options"] == baseline[fixture_name]["options"]
+
+
+def _bfs_convoy_query(variant, name, args):
+    """The pre-oracle answer to one ConvoyOracle query: a fresh BFS."""
+    sea = ProvinceType.SEA
+    if name == "fleet_reaches":
+        fleet_location, coast = args
+        fleet = variant.parent_of(fleet_location)
+        if variant.provinces[fleet].type != sea:
+            return False
+        seas = {pid for pid, p in variant.provinces.items() if p.type == sea}
+        return bool(_bfs_sea_closure(variant, {fleet}, seas) & _bfs_coast_seas(variant, coast))
+    source, target = args[0], args[1]
+    fleets = args[-1]
+    if source == target:
+        return False
+    allowed = {variant.parent_of(loc) for loc in fleets}
+    start = _bfs_coast_seas(variant, source)
+    end = _bfs_coast_seas(variant, target)
+    if name == "path_exists":
+        return bool(_bfs_sea_closure(variant, start, allowed) & end) if fleets else bool(start & end)
+    fleet = variant.parent_of(args[2])
+    if fleet not in allowed or variant.provinces[fleet].type != sea:
+        return False
+    return fleet in _bfs_sea_closure(variant, start, allowed) and bool(
+        _bfs_sea_closure(variant, {fleet}, allowed) & end
+    )
+
+
+def test_convoy_oracle_vs_bfs_convoyheavy_fixture(monkeypatch):
+    canonical_variant, states = replay_fixture("10_classical_solo_convoyheavy_65p.json")
+    variant = deserialize_variant(canonical_variant)
+    parsed = [deserialize_game_state(state, variant) for state in states]
+
+    queries = []
+    for name in ("path_exists", "path_through_fleet", "fleet_reaches"):
+        original = getattr(ConvoyOracle, name)
+
+        def recording(self, *args, _name=name, _original=original):
+            queries.append((_name, args))
+            return _original(self, *args)
+
+        monkeypatch.setattr(ConvoyOracle, name, recording)
+    for state, parsed_state in zip(states, parsed):
+        adjudicate(canonical_variant, state)
+        if parsed_state.phase.type == "Movement":
+            get_options(parsed_state)
+    monkeypatch.undo()
+
+    def replay_bfs():
+        return [_bfs_convoy_query(variant, name, args) for name, args in queries]
+
+    def replay_oracle():
+        oracle = ConvoyOracle(variant.index)
+        return [getattr(oracle, name)(*args) for name, args in queries]
+
+    assert replay_oracle() == replay_bfs()
+    bfs = median_ms(replay_bfs)
+    oracle = median_ms(replay_oracle)
+    print(
+        f"\nconvoy queries over {len(states)} phases of 10_classical_solo_convoyheavy_65p: "
+        f"{len(queries)} queries, "
+        f"bfs {bfs:.2f} ms, oracle {oracle:.2f} ms ({bfs / oracle:.1f}x)"
+    )
+    assert oracle < bfs
+
+
+def test_replay_allocations_classical_110p():
+    """Peak traced memory and GC time for replaying every phase of the
+    110-phase classical game: deserialize, adjudicate, and enumerate the
+    next phase's options, keeping every result alive the way a batch
+    does. Domain records, parsed orders and options are slotted, so the
+    retained peak is dominated by how many records exist, not by a
+    per-instance `__dict__`."""
+    canonical_variant, states = replay_fixture("09_classical_solo_110p.json")
+    variant = deserialize_variant(canonical_variant)
+    engine = Engine()
+
+    def replay():
+        kept = []
+        for state in states:
+            resolved = engine.adjudicate(deserialize_game_state(state, variant))
+            kept.append((resolved, get_options(resolved[-1]) if len(resolved) > 1 else None))
+        return kept
+
+    replay()
+    gc.collect()
+    tracemalloc.start()
+    kept = replay()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    gc_seconds = []
+    started = []
+
+    def on_gc(phase, info):
+        if phase == "start":
+            started.append(time.perf_counter())
+        else:
+            gc_seconds.append(time.perf_counter() - started.pop())
+
+    gc.collect()
+    gc.callbacks.append(on_gc)
+    try:
+        wall = median_ms(replay)
+    finally:
+        gc.callbacks.remove(on_gc)
+
+    gc_ms = sum(gc_seconds) * 1000 / MEDIAN_ITERATIONS
+    print(
+        f"\nreplay {len(states)} phases of 09_classical_solo_110p: peak {peak / 1024:.0f} KiB, "
+        f"wall {wall:.0f} ms, gc {gc_ms:.1f} ms over {len(gc_seconds) / MEDIAN_ITERATIONS:.0f} collections per replay"
+    )
+    assert len(states) == 110
+
+
+# === Solver scaling on generated positions ===
+
+
+def _ascii_plot(points, width=60, height=16):
+    """Scatter of (x, y) points as text, y growing upwards."""
+    max_x = max(x for x, _ in points) or 1
+    max_y = max(y for _, y in points) or 1
+    rows = [[" "] * (width + 1) for _ in range(height + 1)]
+    for x, y in points:
+        rows[height - round(y / max_y * height)][round(x / max_x * width)] = "*"
+    lines = [f"{max_y:8.2f} ms |" + "".join(rows[0])]
+    lines += ["            |" + "".join(row) for row in rows[1:]]
+    lines.append("            +" + "-" * (width + 1))
+    lines.append(f"             0 decisions{max_x:>{width - 10}}")
+    return "\n".join(lines)
+
+
+def _log_log_slope(points):
+    xs = [math.log(x) for x, _ in points]
+    ys = [math.log(y) for _, y in points]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum((x - mean_x) ** 2 for x in xs)
+
+
+@pytest.mark.parametrize("variant_id", ["classical", "youngstown-redux"])
+def test_solver_time_against_decision_count(variant_id):
+    """Strength solver wall time against the number of decisions it
+    enumerates, over generated positions of every preset shape and a
+    range of unit densities. The log-log slope is the growth exponent: 1
+    is linear in decisions, 2 quadratic. A slope creeping upwards, or one
+    preset bending away from the rest, is a pass that rescans the whole
+    graph."""
+    variant = deserialize_variant(bundled_variant(variant_id))
+    engine = Engine()
+    points, rows = [], []
+    for preset in ("SUPPORT_WEB", "MOVE_RINGS", "CONVOY_CHAINS", "MIXED"):
+        for density in (0.2, 0.4, 0.6, 0.8, 1.0):
+            for seed in range(3):
+                state = generator.random_position(variant, density, getattr(generator, preset), seed)
+                samples = []
+                for _ in range(5):
+                    with profile_adjudication() as profile:
+                        engine.adjudicate(state)
+                    samples.append(profile.reducer_seconds["ResolveStrengthsAndCutsReducer"] * 1000)
+                decisions = sum(profile.decisions.values())
+                solver_ms = statistics.median(samples)
+                points.append((decisions, solver_ms))
+                rows.append((preset, density, seed, len(state.orders), decisions, solver_ms, profile.cycle_breakers))
+
+    print(f"\nsolver scaling on {variant_id}")
+    print(f"{'preset':<14}{'density':>8}{'seed':>5}{'orders':>8}{'decisions':>10}{'solver ms':>10}  breakers")
+    for preset, density, seed, orders, decisions, solver_ms, breakers in sorted(rows, key=lambda row: row[4]):
+        print(f"{preset:<14}{density:>8.1f}{seed:>5}{orders:>8}{decisions:>10}{solver_ms:>10.2f}  {breakers or ''}")
+    print(_ascii_plot(points))
+    print(f"growth exponent (log-log slope): {_log_log_slope(points):.2f}")
+    assert all(decisions > 0 for decisions, _ in points)
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from phase.models import Phase
 from game.models import Game
 from member.models import Member
@@ -1152,3 +1153,233 @@ class TestUserUploadedVariant:
         assert set(current_phase.options.keys()) == {
             nation.name for nation in variant.nations.all()
         }
+
+
+class TestCompiledVariantCache:
+    @pytest.mark.django_db
+    def test_build_state_reuses_compiled_variant_until_variant_changes(
+        self, classical_variant, classical_england_nation, classical_edinburgh_province
+    ):
+        game = Game.objects.create(variant=classical_variant, name="Test Game", status=GameStatus.ACTIVE)
+        phase = Phase.objects.create(
+            variant=classical_variant, game=game, year=1901, season="Spring", type="Movement", ordinal=1
+        )
+
+        _, first = adjudication_service._build_state(phase)
+        _, second = adjudication_service._build_state(phase)
+        assert second is first
+
+        phase.variant.save()
+        _, third = adjudication_service._build_state(phase)
+        assert third is not first
+
+    @pytest.mark.django_db
+    def test_update_variant_from_dvar_invalidates_compiled_variant(self, primary_user, classical_variant):
+        import copy
+
+        from adjudicator.compiled import _CACHE
+        from variant.utils import create_variant_from_dvar, update_variant_from_dvar, variant_to_canonical_dict
+
+        dvar = copy.deepcopy(variant_to_canonical_dict(classical_variant))
+        dvar["id"] = "user-uploaded-variant"
+        variant = create_variant_from_dvar(dvar, owner=primary_user)
+        game = Game.objects.create_sandbox(user=primary_user, name="Sandbox", variant=variant)
+        adjudication_service._build_state(game.current_phase)
+        assert variant.id in _CACHE
+
+        update_variant_from_dvar(variant, dvar)
+
+        assert variant.id not in _CACHE
+
+
+
+class TestResolveMany:
+    @pytest.mark.django_db
+    def test_resolve_many_matches_resolve(self, phase_spring_1901_movement, member_italy, member_germany):
+        phase_state_italy = phase_spring_1901_movement.phase_states.create(member=member_italy)
+        phase_state_germany = phase_spring_1901_movement.phase_states.create(member=member_germany)
+        create_unit(phase_state_italy, "ber", "Army")
+        create_unit(phase_state_italy, "mun", "Army")
+        create_unit(phase_state_germany, "kie", "Fleet")
+        create_order(phase_state_italy, "ber", OrderType.MOVE, "kie")
+        create_order(phase_state_italy, "mun", OrderType.SUPPORT, "kie", "ber")
+
+        [prepared] = adjudication_service.resolve_many([phase_spring_1901_movement])
+
+        assert prepared.data == adjudication_service.resolve(phase_spring_1901_movement)
+        assert adjudication_service.resolve(phase_spring_1901_movement, prepared=prepared) is prepared.data
+
+    @pytest.mark.django_db
+    def test_resolve_recomputes_when_phase_changed_after_prepare(
+        self, phase_spring_1901_movement, member_italy, member_germany
+    ):
+        phase_state_italy = phase_spring_1901_movement.phase_states.create(member=member_italy)
+        phase_state_germany = phase_spring_1901_movement.phase_states.create(member=member_germany)
+        create_unit(phase_state_italy, "ber", "Army")
+        create_unit(phase_state_italy, "mun", "Army")
+        create_unit(phase_state_germany, "kie", "Fleet")
+        create_order(phase_state_italy, "ber", OrderType.MOVE, "kie")
+
+        [prepared] = adjudication_service.resolve_many([phase_spring_1901_movement])
+        create_order(phase_state_italy, "mun", OrderType.SUPPORT, "kie", "ber")
+
+        data = adjudication_service.resolve(phase_spring_1901_movement, prepared=prepared)
+
+        assert data is not prepared.data
+        results = {r["province"]: r["result"] for r in data["resolutions"]}
+        assert results["ber"] == OrderResolutionStatus.SUCCEEDED
+
+    @pytest.mark.django_db
+    def test_resolve_recomputes_when_civil_disorder_changed_after_prepare(
+        self, phase_spring_1901_movement, member_italy, member_germany
+    ):
+        phase_state_italy = phase_spring_1901_movement.phase_states.create(member=member_italy)
+        phase_state_germany = phase_spring_1901_movement.phase_states.create(member=member_germany)
+        create_unit(phase_state_italy, "ber", "Army")
+        create_unit(phase_state_italy, "mun", "Army")
+        create_unit(phase_state_germany, "kie", "Fleet")
+        create_order(phase_state_italy, "ber", OrderType.MOVE, "kie")
+        create_order(phase_state_italy, "mun", OrderType.SUPPORT, "kie", "ber")
+
+        [prepared] = adjudication_service.resolve_many([phase_spring_1901_movement])
+        assert prepared.data["type"] == "Retreat"
+        member_germany.civil_disorder = True
+        member_germany.save()
+
+        data = adjudication_service.resolve(phase_spring_1901_movement, prepared=prepared)
+
+        assert data["season"] == "Fall"
+        assert data["type"] == "Movement"
+
+
+
+class TestAdjudicationExecutor:
+    @pytest.fixture
+    def dislodgement_phase(self, phase_spring_1901_movement, member_italy, member_germany):
+        phase_state_italy = phase_spring_1901_movement.phase_states.create(member=member_italy)
+        phase_state_germany = phase_spring_1901_movement.phase_states.create(member=member_germany)
+        create_unit(phase_state_italy, "ber", "Army")
+        create_unit(phase_state_italy, "mun", "Army")
+        create_unit(phase_state_germany, "kie", "Fleet")
+        create_order(phase_state_italy, "ber", OrderType.MOVE, "kie")
+        create_order(phase_state_italy, "mun", OrderType.SUPPORT, "kie", "ber")
+        return phase_spring_1901_movement
+
+    @pytest.mark.django_db
+    def test_resolve_in_executor_matches_inline(self, dislodgement_phase):
+        from adjudicator.executor import AdjudicationExecutor
+
+        executor = AdjudicationExecutor(max_workers=1, queue_depth=2)
+        try:
+            prepared = adjudication_service.prepare(dislodgement_phase, executor)
+        finally:
+            executor.shutdown()
+
+        assert prepared.data == adjudication_service.resolve(dislodgement_phase)
+        assert adjudication_service.resolve(dislodgement_phase, prepared=prepared) is prepared.data
+
+    @pytest.mark.django_db
+    def test_preloaded_executor_does_not_load_the_variant(self, dislodgement_phase):
+        from adjudicator.executor import AdjudicationExecutor
+        from variant.utils import variant_to_canonical_dict
+
+        variant = dislodgement_phase.variant
+        adjudication_service._build_state(dislodgement_phase)
+        executor = AdjudicationExecutor(
+            max_workers=1,
+            queue_depth=1,
+            variants=[(variant.id, variant.updated_at, variant_to_canonical_dict(variant))],
+        )
+        try:
+            with patch("adjudicator.service.variant_to_canonical_dict") as mock_load:
+                prepared = adjudication_service.prepare(dislodgement_phase, executor)
+        finally:
+            executor.shutdown()
+
+        mock_load.assert_not_called()
+        assert prepared.data["type"] == "Retreat"
+
+    @pytest.mark.django_db
+    def test_resolve_many_on_the_executor_pool_matches_inline(self, dislodgement_phase):
+        from adjudicator.executor import AdjudicationExecutor
+
+        executor = AdjudicationExecutor(max_workers=1, queue_depth=1)
+        try:
+            [prepared] = adjudication_service.resolve_many([dislodgement_phase], executor)
+        finally:
+            executor.shutdown()
+
+        assert prepared.data == adjudication_service.resolve(dislodgement_phase)
+
+    @pytest.mark.django_db
+    def test_prepare_falls_back_to_inline_when_no_slot_frees_up(self, dislodgement_phase):
+        from adjudicator.executor import AdjudicationExecutor
+
+        executor = AdjudicationExecutor(max_workers=1, queue_depth=1, slot_timeout=0.01)
+        executor._slots.acquire()
+        try:
+            prepared = adjudication_service.prepare(dislodgement_phase, executor)
+        finally:
+            executor._slots.release()
+            executor.shutdown()
+
+        assert prepared is None
+
+    @pytest.mark.django_db
+    def test_resolve_many_waits_for_a_queue_slot(self, dislodgement_phase):
+        from adjudicator.executor import AdjudicationExecutor
+
+        executor = AdjudicationExecutor(max_workers=1, queue_depth=1, slot_timeout=0.01)
+        executor._slots.acquire()
+        try:
+            assert adjudication_service.resolve_many([dislodgement_phase], executor) == [None]
+        finally:
+            executor._slots.release()
+        try:
+            [prepared] = adjudication_service.resolve_many([dislodgement_phase], executor)
+        finally:
+            executor.shutdown()
+
+        assert prepared.data == adjudication_service.resolve(dislodgement_phase)
+        assert executor._slots.acquire(blocking=False)
+
+    def test_pool_size_gauge_counts_live_executors(self):
+        from adjudicator.executor import AdjudicationExecutor, _observe_pool_size
+
+        def observed():
+            return sum(observation.value for observation in _observe_pool_size(None))
+
+        before = observed()
+        executor = AdjudicationExecutor(max_workers=2, queue_depth=1)
+        try:
+            assert observed() == before + 2
+        finally:
+            executor.shutdown()
+        assert observed() == before
+
+    @pytest.mark.django_db
+    def test_executor_is_disabled_by_default(self, settings):
+        settings.ADJUDICATION_EXECUTOR_WORKERS = 0
+
+        assert adjudication_service.get_adjudication_executor() is None
+
+
+class TestMovementOptionsParity:
+    """The batched movement options must match the scalar per-candidate
+    enumeration on every bundled variant, not just the DATC map."""
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("seed", range(4))
+    def test_movement_options_match_scalar_enumeration_on_bundled_variants(self, seed):
+        from adjudicator.options import get_options
+        from adjudicator.serializers import deserialize_variant
+        from adjudicator.tests import _random_movement_state, _scalar_movement_options_for
+        from variant.models import Variant
+        from variant.utils import variant_to_canonical_dict
+
+        variants = list(Variant.objects.all())
+        assert variants
+        for variant_model in variants:
+            variant = deserialize_variant(variant_to_canonical_dict(variant_model))
+            state = _random_movement_state(variant, seed, density=0.3 + 0.15 * seed)
+            assert get_options(state) == _scalar_movement_options_for(state), variant_model.id
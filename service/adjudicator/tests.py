@@ -7,6 +7,8 @@ Organised into sections by what they cover:
   - Phase resolvers       (was tests_c2.py)
   - Strength resolver     (was tests_resolution.py)
   - Convoy path-finding   (was tests_convoy.py)
+  - Compiled variants     (integer-indexed variant graph and process-wide cache)
+  - Batch adjudication    (Engine.adjudicate_many, pipeline.resolve_states)
 """
 from __future__ import annotations
 
@@ -16,7 +18,7 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pytest
 
-from .convoy import convoy_path_exists
+from .convoy import convoy_path_exists, convoy_path_through_fleet
 from .domain import (
     Adjacency,
     NamedCoast,
@@ -8986,17 +8988,17 @@ def test_szykman_does_not_fire_on_simple_convoy_disruption():
     assert convoyed_res.failure_reason == "The convoy was disrupted."
 
 
-def test_find_unresolved_cycle_returns_none_when_acyclic():
+def test_cyclic_components_empty_when_acyclic():
     # Acyclic graph: solver runs to completion, all decisions resolved,
-    # `_find_unresolved_cycle` should return None when called on the
-    # resolved state.
+    # and the residual graph has no cyclic components left.
     move = MoveOrder(nation=RES_RED, source="a", target="b", unit_type=Unit.ARMY)
     view = _res_state_view([move])
     solver = _Solver(view)
     solver._enumerate_decisions()
     solver._build_dependents_and_initial_ready()
     solver._drain_ready_queue()
-    assert solver._find_unresolved_cycle() is None
+    assert solver._all_resolved()
+    assert solver._cyclic_components() == []
 
 
 def test_szykman_forces_convoy_paradox_decisions_to_false():
@@ -9033,7 +9035,7 @@ def test_szykman_forces_convoy_paradox_decisions_to_false():
             dependencies=frozenset({key_convoy}),
         ),
     }
-    solver._dependents = {key_convoy: {key_move}, key_move: {key_convoy}}
+    solver._build_dependents_and_initial_ready()
     fired = solver._try_resolve_szykman_paradoxes()
     assert fired is True
     assert solver._decisions[key_convoy].value is False
@@ -9063,7 +9065,7 @@ def test_szykman_does_not_fire_on_cycle_without_convoy():
             dependencies=frozenset({key_a}),
         ),
     }
-    solver._dependents = {key_a: {key_b}, key_b: {key_a}}
+    solver._build_dependents_and_initial_ready()
     fired = solver._try_resolve_szykman_paradoxes()
     assert fired is False
     assert solver._decisions[key_a].value is None
@@ -9115,12 +9117,7 @@ def test_szykman_handles_multi_convoy_paradox():
             dependencies=frozenset({k_c0}),
         ),
     }
-    solver._dependents = {
-        k_m2: {k_c0},
-        k_c1: {k_m2},
-        k_m3: {k_c1},
-        k_c0: {k_m3},
-    }
+    solver._build_dependents_and_initial_ready()
     fired = solver._try_resolve_szykman_paradoxes()
     assert fired is True
     assert solver._decisions[k_c0].value is False
@@ -9129,6 +9126,67 @@ def test_szykman_handles_multi_convoy_paradox():
     assert solver._decisions[k_m3].value is None
 
 
+def test_cyclic_components_finds_every_cycle_once():
+    # Two cycles joined by a one-way edge, a self-loop, and a tail that
+    # feeds into a cycle without being on one. Only the nontrivial
+    # components are returned, dependencies before their dependents.
+    from .resolution import _cyclic_components
+
+    graph = {
+        ("a", 0): [("a", 1)],
+        ("a", 1): [("a", 2)],
+        ("a", 2): [("a", 0), ("b", 0)],
+        ("b", 0): [("b", 1)],
+        ("b", 1): [("b", 0)],
+        ("c", 0): [("c", 0)],
+        ("d", 0): [("a", 0)],
+    }
+    components = _cyclic_components(list(graph), graph.__getitem__)
+    assert [sorted(c) for c in components] == [
+        [("b", 0), ("b", 1)],
+        [("a", 0), ("a", 1), ("a", 2)],
+        [("c", 0)],
+    ]
+
+
+def test_szykman_breaks_every_paradox_component_in_one_pass():
+    # White-box test: three independent convoy-paradox cycles. They are
+    # separate components of the residual graph, so a single Szykman
+    # pass forces all three convoys instead of one per pass (which,
+    # with more paradoxes than `_MAX_CYCLE_PASSES`, would not converge).
+    orders = []
+    initial = []
+    for n in range(3):
+        orders.append(
+            MoveOrder(nation=RES_RED, source=f"a{n}", target=f"b{n}", unit_type=Unit.ARMY)
+        )
+        initial.append(_res_via_convoy())
+        orders.append(
+            MoveOrder(nation=RES_BLUE, source=f"c{n}", target=f"s{n}", unit_type=Unit.FLEET)
+        )
+        initial.append(OrderResolution())
+    view = _res_convoy_state_view(orders, initial_resolutions=tuple(initial))
+    solver = _Solver(view)
+    solver._decisions = {}
+    for n in range(3):
+        k_convoy = (_CONVOY_PATH_INTACT, 2 * n)
+        k_move = (_MOVE_STATUS, 2 * n + 1)
+        solver._decisions[k_convoy] = _Decision(
+            kind=_CONVOY_PATH_INTACT, subject=2 * n, dependencies=frozenset({k_move}),
+        )
+        solver._decisions[k_move] = _Decision(
+            kind=_MOVE_STATUS, subject=2 * n + 1, dependencies=frozenset({k_convoy}),
+        )
+    solver._build_dependents_and_initial_ready()
+    assert len(solver._cyclic_components()) == 3
+    assert solver._try_resolve_szykman_paradoxes() is True
+    for n in range(3):
+        assert solver._decisions[(_CONVOY_PATH_INTACT, 2 * n)].value is False
+    # Forcing a value changes the residual graph, so the components are
+    # recomputed: only the three move decisions are left, acyclic.
+    assert solver._cyclic_components() == []
+
+
 def test_convoyed_move_into_rotational_cycle_resolves():
     # Regression from production game "The Fracas of the Garrulous Gun",
     # phase 51376 (Fall 1904, Movement) — Sentry DIPLICITY-API-9B. The
@@ -11284,6 +11342,734 @@ def test_options_movement_unit_type_is_none_for_existing_unit_orders():
     assert all(o.unit_type is None for o in non_build)
 
 
+# === Movement options parity with the scalar enumeration ===
+#
+# `options._movement_options` derives candidates from reachability
+# bitsets. The functions below are the scalar enumeration it replaced --
+# every (unit, location) pair run through the order's LEGALITY_CHECKS --
+# kept as the reference the batched path must match exactly, order
+# included.
+
+from .types import (  # noqa: E402
+    ConvoyFleetReachesEndpointsCheck,
+    SupportMoveSupportedCanReachCheck,
+)
+
+
+def _scalar_movement_options_for(state: State) -> List[OrderOption]:
+    view = StateView(
+        AdjudicationState(
+            variant=state.variant,
+            phase=state.phase,
+            units=tuple(state.units),
+            supply_centers=tuple(state.supply_centers),
+            raw_orders=(),
+            contested_provinces=tuple(state.contested_provinces),
+        )
+    )
+    return _scalar_movement_options(view)
+
+
+def _scalar_movement_options(view: StateView) -> List[OrderOption]:
+    options: List[OrderOption] = []
+    variant = view.variant()
+    units_view = view.units()
+    standing_items = tuple(sorted(units_view.standing_by_loc().items()))
+    sea_fleet_locs = tuple(
+        u.location
+        for u in units_view.all()
+        if not u.dislodged
+        and u.type == Unit.FLEET
+        and view.province(variant.parent_of(u.location)).is_sea()
+    )
+    all_locations = tuple(
+        list(variant.provinces.keys()) + list(variant.named_coasts.keys())
+    )
+    for source_loc, unit in standing_items:
+        options.append(
+            OrderOption(
+                source=source_loc,
+                order_type=OrderType.HOLD,
+                target=None,
+                aux=None,
+                unit_type=None,
+                named_coast=None,
+            )
+        )
+        for target in all_locations:
+            order = MoveOrder(
+                nation=unit.nation,
+                source=source_loc,
+                target=target,
+                unit_type=unit.type,
+            )
+            if _scalar_move_is_orderable(view, order, sea_fleet_locs):
+                options.append(
+                    OrderOption(
+                        source=source_loc,
+                        order_type=OrderType.MOVE,
+                        target=target,
+                        aux=None,
+                        unit_type=None,
+                        named_coast=None,
+                    )
+                )
+            # godip emits a parallel "MoveViaConvoy" option whenever the
+            # army could reach the target via a chain of fleets currently
+            # on the board. This is the wire-format channel for the
+            # explicit via-convoy intent (DATC 6.G.1/5 head-to-head
+            # exception).
+            if unit.type == Unit.ARMY and _scalar_move_has_convoy_path(
+                view, order, sea_fleet_locs
+            ):
+                options.append(
+                    OrderOption(
+                        source=source_loc,
+                        order_type="MoveViaConvoy",
+                        target=target,
+                        aux=None,
+                        unit_type=None,
+                        named_coast=None,
+                    )
+                )
+        options.extend(
+            _scalar_support_options(
+                view, unit, source_loc, sea_fleet_locs, standing_items
+            )
+        )
+        if unit.type == Unit.FLEET and view.province(
+            variant.parent_of(source_loc)
+        ).is_sea():
+            options.extend(
+                _scalar_convoy_options(
+                    view, unit, source_loc, sea_fleet_locs, standing_items
+                )
+            )
+    return options
+
+
+def _scalar_move_is_orderable(
+    view: StateView, order: MoveOrder, sea_fleet_locs: Tuple[str, ...]
+) -> bool:
+    if _scalar_fleet_target_is_bare_multi_coast(view, order):
+        return False
+    for check_cls in MoveOrder.LEGALITY_CHECKS:
+        if check_cls.check(view, order):
+            continue
+        if check_cls is MoveTargetIsReachableCheck and _scalar_move_has_convoy_path(
+            view, order, sea_fleet_locs
+        ):
+            continue
+        return False
+    return True
+
+
+def _scalar_move_has_convoy_path(
+    view: StateView, order: MoveOrder, sea_fleet_locs: Tuple[str, ...]
+) -> bool:
+    if order.unit_type != Unit.ARMY:
+        return False
+    variant = view.variant()
+    target_parent = variant.parent_of(order.target)
+    # Convoyed army moves are always to a bare parent — armies ignore coasts.
+    if order.target != target_parent:
+        return False
+    source_parent = variant.parent_of(order.source)
+    if not view.province(source_parent).is_coastal():
+        return False
+    if not view.province(target_parent).is_coastal():
+        return False
+    if not sea_fleet_locs:
+        return False
+    return convoy_path_exists(view, source_parent, target_parent, sea_fleet_locs)
+
+
+def _scalar_fleet_target_is_bare_multi_coast(view: StateView, order: MoveOrder) -> bool:
+    """A fleet enters a multi-coast province only via a specific named
+    coast, never the bare parent — godip models this in its fleet
+    adjacency graph. Armies are unaffected: they move to the bare parent
+    and ignore coasts."""
+    if order.unit_type != Unit.FLEET:
+        return False
+    variant = view.variant()
+    if order.target != variant.parent_of(order.target):
+        return False
+    return bool(variant.coasts_of(order.target))
+
+
+def _scalar_reachable_provinces(variant, source_loc: str, unit_type: str) -> set:
+    result = set()
+    for adj in variant.adjacencies_of(source_loc):
+        if adj.allows(unit_type):
+            result.add(variant.parent_of(adj.to))
+    return result
+
+
+def _scalar_support_options(
+    view: StateView,
+    supporter: Unit,
+    source_loc: str,
+    sea_fleet_locs: Tuple[str, ...],
+    standing_items: Tuple[Tuple[str, Unit], ...],
+) -> List[OrderOption]:
+    options: List[OrderOption] = []
+    variant = view.variant()
+    source_parent = variant.parent_of(source_loc)
+    for supported_loc, _ in standing_items:
+        if variant.parent_of(supported_loc) == source_parent:
+            continue
+        order = SupportHoldOrder(
+            nation=supporter.nation,
+            source=source_loc,
+            supported_source=supported_loc,
+            unit_type=supporter.type,
+        )
+        if all(c.check(view, order) for c in SupportHoldOrder.LEGALITY_CHECKS):
+            supported_parent = variant.parent_of(supported_loc)
+            options.append(
+                OrderOption(
+                    source=source_loc,
+                    order_type=OrderType.SUPPORT,
+                    target=supported_parent,
+                    aux=supported_parent,
+                    unit_type=None,
+                    named_coast=None,
+                )
+            )
+    supporter_targets = _scalar_reachable_provinces(variant, source_loc, supporter.type)
+    supporter_targets.discard(source_parent)
+    for mover_loc, mover in standing_items:
+        if variant.parent_of(mover_loc) == source_parent:
+            continue
+        for target in supporter_targets:
+            order = SupportMoveOrder(
+                nation=supporter.nation,
+                source=source_loc,
+                supported_source=mover_loc,
+                target=target,
+                unit_type=supporter.type,
+            )
+            if _scalar_support_move_is_orderable(view, order, mover, sea_fleet_locs):
+                mover_parent = variant.parent_of(mover_loc)
+                options.append(
+                    OrderOption(
+                        source=source_loc,
+                        order_type=OrderType.SUPPORT,
+                        target=target,
+                        aux=mover_parent,
+                        unit_type=None,
+                        named_coast=None,
+                    )
+                )
+    return options
+
+
+def _scalar_support_move_is_orderable(
+    view: StateView,
+    order: SupportMoveOrder,
+    mover: Unit,
+    sea_fleet_locs: Tuple[str, ...],
+) -> bool:
+    for check_cls in SupportMoveOrder.LEGALITY_CHECKS:
+        if check_cls.check(view, order):
+            continue
+        if (
+            check_cls is SupportMoveSupportedCanReachCheck
+            and _scalar_supported_can_convoy(view, order, mover, sea_fleet_locs)
+        ):
+            continue
+        return False
+    return True
+
+
+def _scalar_supported_can_convoy(
+    view: StateView,
+    order: SupportMoveOrder,
+    mover: Unit,
+    sea_fleet_locs: Tuple[str, ...],
+) -> bool:
+    if mover.type != Unit.ARMY:
+        return False
+    variant = view.variant()
+    target_parent = variant.parent_of(order.target)
+    if order.target != target_parent:
+        return False
+    source_parent = variant.parent_of(mover.location)
+    if not view.province(source_parent).is_coastal():
+        return False
+    if not view.province(target_parent).is_coastal():
+        return False
+    # Exclude the supporter itself from the convoy chain (godip's
+    # `noConvoy` argument): if the supporter is also the only fleet,
+    # no third party can carry the army.
+    usable_fleets = tuple(loc for loc in sea_fleet_locs if loc != order.source)
+    if not usable_fleets:
+        return False
+    return convoy_path_exists(view, source_parent, target_parent, usable_fleets)
+
+
+def _scalar_convoy_options(
+    view: StateView,
+    fleet: Unit,
+    source_loc: str,
+    sea_fleet_locs: Tuple[str, ...],
+    standing_items: Tuple[Tuple[str, Unit], ...],
+) -> List[OrderOption]:
+    options: List[OrderOption] = []
+    variant = view.variant()
+    army_source_parents = sorted(
+        {variant.parent_of(loc) for loc, u in standing_items if u.type == Unit.ARMY}
+    )
+    coastal_parents = sorted(
+        pid
+        for pid, p in variant.provinces.items()
+        if p.type != ProvinceType.SEA and variant.has_fleet_access(pid)
+    )
+    for army_source in army_source_parents:
+        for army_target in coastal_parents:
+            if army_source == army_target:
+                continue
+            order = ConvoyOrder(
+                nation=fleet.nation,
+                source=source_loc,
+                army_source=army_source,
+                army_target=army_target,
+                unit_type=fleet.type,
+            )
+            if _scalar_convoy_is_orderable(view, order, sea_fleet_locs):
+                options.append(
+                    OrderOption(
+                        source=source_loc,
+                        order_type=OrderType.CONVOY,
+                        target=army_target,
+                        aux=army_source,
+                        unit_type=None,
+                        named_coast=None,
+                    )
+                )
+    return options
+
+
+def _scalar_convoy_is_orderable(
+    view: StateView, order: ConvoyOrder, sea_fleet_locs: Tuple[str, ...]
+) -> bool:
+    # ConvoyFleetReachesEndpointsCheck is the engine's order-legality
+    # check: a purely topological reachability test that is intentionally
+    # lenient. Options instead require a convoy chain through the fleets
+    # actually on the board, with this fleet on it — strictly stronger,
+    # so it fully replaces the topological check rather than supplementing
+    # it. See the module docstring and docs/options-design.md.
+    for check_cls in ConvoyOrder.LEGALITY_CHECKS:
+        if check_cls is ConvoyFleetReachesEndpointsCheck:
+            continue
+        if not check_cls.check(view, order):
+            return False
+    return _scalar_convoy_has_real_path(view, order, sea_fleet_locs)
+
+
+def _scalar_convoy_has_real_path(
+    view: StateView, order: ConvoyOrder, sea_fleet_locs: Tuple[str, ...]
+) -> bool:
+    if not sea_fleet_locs:
+        return False
+    variant = view.variant()
+    return convoy_path_through_fleet(
+        view,
+        variant.parent_of(order.army_source),
+        variant.parent_of(order.army_target),
+        order.source,
+        sea_fleet_locs,
+    )
+
+
+def _random_movement_state(variant: Variant, seed: int, density: float) -> State:
+    """Scatter units over `variant` at roughly `density` of its provinces:
+    fleets in every occupied sea, armies inland, and a coin flip on the
+    coast (a fleet on a multi-coast province picks one of its coasts)."""
+    import random
+
+    rng = random.Random(seed)
+    nations = [n.id for n in variant.nations] or ["nation"]
+    units: List[Unit] = []
+    for province_id in sorted(variant.provinces):
+        if rng.random() >= density:
+            continue
+        province = variant.provinces[province_id]
+        if province.type == ProvinceType.SEA:
+            unit_type, location = Unit.FLEET, province_id
+        elif not variant.has_fleet_access(province_id) or rng.random() < 0.5:
+            unit_type, location = Unit.ARMY, province_id
+        else:
+            coasts = variant.coasts_of(province_id)
+            unit_type, location = Unit.FLEET, rng.choice(coasts) if coasts else province_id
+        units.append(Unit(nation=rng.choice(nations), type=unit_type, location=location))
+    return State(
+        variant=variant,
+        phase=Phase(season="Spring", year=1901, type=Phase.MOVEMENT),
+        units=units,
+        supply_centers=[],
+        orders=[],
+        resolutions=None,
+        skipped=False,
+        outcome=None,
+    )
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_movement_options_match_scalar_enumeration_classical(seed):
+    variant = deserialize_variant(_datc_classical_variant())
+    state = _random_movement_state(variant, seed, density=0.2 + 0.1 * seed)
+    assert get_options(state) == _scalar_movement_options_for(state)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_movement_options_match_scalar_enumeration_test_variant(seed):
+    state = _random_movement_state(make_variant(), seed, density=0.6)
+    assert get_options(state) == _scalar_movement_options_for(state)
+
+
+def test_movement_options_match_scalar_enumeration_property_fixture():
+    state = _property_state_movement()
+    assert get_options(state) == _scalar_movement_options_for(state)
+
+
+# === Retreat / Adjustment options parity with the scalar enumeration ===
+#
+# `options._retreat_options` and `options._adjustment_options` read the
+# resolved state directly. These are the LEGALITY_CHECKS enumerations they
+# replaced, kept as the reference. `_option_nations_from_options` is the
+# source-to-nation mapping the phase-skip loop used before
+# `option_nations` answered it from the state.
+
+from .types import (  # noqa: E402
+    ALLOW_NON_HOME_BUILDS,
+    AdjustmentDisbandOrder,
+    BuildOrder,
+    RetreatOrder,
+)
+from .options import option_nations  # noqa: E402
+
+
+def _options_view(state: State) -> StateView:
+    return StateView(
+        AdjudicationState(
+            variant=state.variant,
+            phase=state.phase,
+            units=tuple(state.units),
+            supply_centers=tuple(state.supply_centers),
+            raw_orders=(),
+            contested_provinces=tuple(state.contested_provinces),
+        )
+    )
+
+
+def _option(source, order_type, target=None, unit_type=None) -> OrderOption:
+    return OrderOption(
+        source=source, order_type=order_type, target=target, aux=None, unit_type=unit_type, named_coast=None
+    )
+
+
+def _scalar_retreat_options_for(state: State) -> List[OrderOption]:
+    view = _options_view(state)
+    variant = state.variant
+    all_locations = tuple(list(variant.provinces.keys()) + list(variant.named_coasts.keys()))
+    options: List[OrderOption] = []
+    for source_loc, unit in sorted(view.units().dislodged_by_loc().items()):
+        if view.nation(unit.nation).is_non_playable():
+            continue
+        options.append(_option(source_loc, "Disband"))
+        for target in all_locations:
+            order = RetreatOrder(
+                nation=unit.nation,
+                source=source_loc,
+                target=target,
+                unit_type=unit.type,
+                dislodged_from=unit.dislodged_from,
+            )
+            if all(c.check(view, order) for c in RetreatOrder.LEGALITY_CHECKS):
+                options.append(_option(source_loc, "Retreat", target))
+    return options
+
+
+def _scalar_adjustment_options_for(state: State) -> List[OrderOption]:
+    view = _options_view(state)
+    variant = state.variant
+    nations = [n.id for n in variant.nations]
+    options: List[OrderOption] = []
+    for nation_id in nations:
+        nation_view = view.nation(nation_id)
+        if nation_view.allowed_builds() <= 0:
+            continue
+        for sc_parent in sorted(nation_view.owned_supply_centers()):
+            province = variant.provinces.get(sc_parent)
+            if province is None or not province.supply_center or view.province(sc_parent).is_occupied():
+                continue
+            builds = [(sc_parent, Unit.ARMY)]
+            builds += [(loc, Unit.FLEET) for loc in (variant.coasts_of(sc_parent) or (sc_parent,))]
+            for location, unit_type in builds:
+                order = BuildOrder(nation=nation_id, location=location, unit_type=unit_type)
+                if all(c.check(view, order) for c in BuildOrder.LEGALITY_CHECKS):
+                    options.append(_option(location, "Build", location, unit_type))
+    for nation_id in nations:
+        if view.nation(nation_id).required_disbands() <= 0:
+            continue
+        for loc, unit in sorted(view.units().standing_by_loc().items()):
+            if unit.nation != nation_id:
+                continue
+            order = AdjustmentDisbandOrder(nation=nation_id, location=loc, unit_type=unit.type)
+            if all(c.check(view, order) for c in AdjustmentDisbandOrder.LEGALITY_CHECKS):
+                options.append(_option(loc, "Disband"))
+    return options
+
+
+def _option_nations_from_options(state: State, options: List[OrderOption]) -> set:
+    location_to_nation = {u.location: u.nation for u in state.units if not u.dislodged}
+    location_to_nation.update({u.location: u.nation for u in state.units if u.dislodged})
+    province_to_nation = {sc.province: sc.nation for sc in state.supply_centers}
+    nations = set()
+    for option in options:
+        if option.source in location_to_nation:
+            nations.add(location_to_nation[option.source])
+        elif state.variant.parent_of(option.source) in province_to_nation:
+            nations.add(province_to_nation[state.variant.parent_of(option.source)])
+    return nations
+
+
+def _random_retreat_state(variant: Variant, seed: int) -> State:
+    """A random position where about a third of the units were dislodged,
+    each by an attacker from a random neighbouring province (or by convoy),
+    with a few contested provinces."""
+    import random
+
+    rng = random.Random(seed)
+    state = _random_movement_state(variant, seed, density=0.5)
+    units = []
+    for unit in state.units:
+        neighbours = variant.index.neighbours(unit.location, unit.type)
+        if neighbours and rng.random() < 0.35:
+            attacker = rng.choice(list(neighbours) + [None])
+            unit = replace(unit, dislodged=True, dislodged_from=attacker and variant.parent_of(attacker))
+        units.append(unit)
+    contested = tuple(p for p in sorted(variant.provinces) if rng.random() < 0.1)
+    return replace(
+        state,
+        phase=Phase(season="Spring", year=1901, type=Phase.RETREAT),
+        units=units,
+        contested_provinces=contested,
+    )
+
+
+def _random_adjustment_state(variant: Variant, seed: int) -> State:
+    """A random position with every supply center handed to a random
+    nation, so some nations are owed builds and others must disband."""
+    import random
+
+    rng = random.Random(seed)
+    state = _random_movement_state(variant, seed, density=0.2 + 0.05 * seed)
+    nations = [n.id for n in variant.nations]
+    supply_centers = [
+        SupplyCenter(nation=rng.choice(nations), province=province_id)
+        for province_id, province in sorted(variant.provinces.items())
+        if province.supply_center and rng.random() < 0.8
+    ]
+    return replace(
+        state,
+        phase=Phase(season="Fall", year=1901, type=Phase.ADJUSTMENT),
+        supply_centers=supply_centers,
+    )
+
+
+def _non_home_builds(variant: Variant) -> Variant:
+    return replace(variant, adjudication_modifiers=tuple(variant.adjudication_modifiers) + (ALLOW_NON_HOME_BUILDS,))
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_retreat_options_match_scalar_enumeration(seed):
+    for variant in (deserialize_variant(_datc_classical_variant()), make_variant()):
+        state = _random_retreat_state(variant, seed)
+        options = get_options(state)
+        assert options == _scalar_retreat_options_for(state)
+        assert option_nations(state) == _option_nations_from_options(state, options)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_adjustment_options_match_scalar_enumeration(seed):
+    classical = deserialize_variant(_datc_classical_variant())
+    for variant in (classical, _non_home_builds(classical), make_variant()):
+        state = _random_adjustment_state(variant, seed)
+        options = get_options(state)
+        assert options == _scalar_adjustment_options_for(state)
+        assert option_nations(state) == _option_nations_from_options(state, options)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_option_nations_match_movement_options(seed):
+    state = _random_movement_state(deserialize_variant(_datc_classical_variant()), seed, density=0.3)
+    assert option_nations(state) == _option_nations_from_options(state, get_options(state))
+
+
+def test_skip_loop_does_not_enumerate_options_for_skipped_phases(monkeypatch):
+    import adjudicator.pipeline as pipeline
+
+    variant = deserialize_variant(_datc_classical_variant())
+    state = deserialize_game_state(
+        {
+            "phase": {"season": "Spring", "year": 1901, "type": "Movement"},
+            "units": [
+                {"nation": "germany", "type": "Army", "location": "ber"},
+                {"nation": "germany", "type": "Army", "location": "mun"},
+                {"nation": "russia", "type": "Fleet", "location": "kie"},
+            ],
+            "supplyCenters": [],
+            "orders": [
+                {"nation": "germany", "source": "ber", "orderType": "Move", "target": "kie"},
+                {"nation": "germany", "source": "mun", "orderType": "Support", "aux": "ber", "target": "kie"},
+            ],
+        },
+        variant,
+    )
+    enumerated = []
+    real_get_options = pipeline.get_options
+    monkeypatch.setattr(pipeline, "get_options", lambda s: enumerated.append(s.phase) or real_get_options(s))
+
+    data = pipeline.resolve_state(state, {"Russia"})
+
+    assert (data["season"], data["type"]) == ("Fall", "Movement")
+    assert enumerated == [Phase(season="Fall", year=1901, type=Phase.MOVEMENT)]
+
+
+# === StateView indexes ===
+
+
+def _indexed_view(units: Iterable[Unit]) -> StateView:
+    return StateView(
+        AdjudicationState(
+            variant=make_variant(),
+            phase=Phase(season="Spring", year=1901, type=Phase.MOVEMENT),
+            units=tuple(units),
+            supply_centers=(),
+            raw_orders=(),
+            contested_provinces=(),
+        )
+    )
+
+
+def test_state_view_indexes_are_shared_by_sub_views_and_dropped_on_replace():
+    view = _indexed_view(
+        [
+            Unit(nation=NORTH, type=Unit.FLEET, location="mlc/nc"),
+            Unit(nation=SOUTH, type=Unit.ARMY, location="mid", dislodged=True, dislodged_from="lhs"),
+        ]
+    )
+    by_parent = view.units().standing_by_parent()
+    assert view.units().standing_by_parent() is by_parent
+    assert view.units().at_parent("mlc/sc") is by_parent["mlc"]
+    assert view.province("mlc").is_occupied()
+    assert not view.province("mid").is_occupied()
+    assert view.units().dislodged_for_source("mid").nation == SOUTH
+
+    replaced = view.replace(units=())
+    assert replaced.units().standing_by_parent() == {}
+    assert not replaced.province("mlc").is_occupied()
+    assert view.units().standing_by_parent() is by_parent
+
+
+def test_state_view_parent_index_keeps_first_unit_on_shared_parent():
+    first = Unit(nation=NORTH, type=Unit.FLEET, location="mlc/nc")
+    second = Unit(nation=SOUTH, type=Unit.ARMY, location="mlc")
+    assert _indexed_view([first, second]).units().at_parent("mlc") is first
+
+
+# === Convoy oracle ===
+
+
+def _bfs_sea_closure(variant: Variant, start: set, allowed: set) -> set:
+    """The plain BFS the convoy module used before the oracle: sea
+    provinces reachable from `start ∩ allowed` through `allowed`."""
+    visited: set = set()
+    frontier = start & allowed
+    while frontier:
+        visited |= frontier
+        step = set()
+        for node in frontier:
+            for adjacency in variant.adjacencies_of(node):
+                if not adjacency.allows(Unit.FLEET):
+                    continue
+                neighbour = variant.parent_of(adjacency.to)
+                if variant.provinces[neighbour].type == ProvinceType.SEA:
+                    step.add(neighbour)
+        frontier = (step & allowed) - visited
+    return visited
+
+
+def _bfs_coast_seas(variant: Variant, location: str) -> set:
+    parent = variant.parent_of(location)
+    return {
+        variant.parent_of(adjacency.to)
+        for loc in (parent, *variant.coasts_of(parent))
+        for adjacency in variant.adjacencies_of(loc)
+        if adjacency.allows(Unit.FLEET)
+        and variant.provinces[variant.parent_of(adjacency.to)].type == ProvinceType.SEA
+    }
+
+
+def _oracle_view(state: State) -> StateView:
+    return StateView(
+        AdjudicationState(
+            variant=state.variant,
+            phase=state.phase,
+            units=tuple(state.units),
+            supply_centers=(),
+            raw_orders=(),
+            contested_provinces=(),
+        )
+    )
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_convoy_oracle_matches_bfs_on_random_fleet_sets(seed):
+    variant = deserialize_variant(_datc_classical_variant())
+    view = _oracle_view(_random_movement_state(variant, seed, density=0.3 + 0.1 * seed))
+    fleet_locs = [u.location for u in view.units().all() if u.type == Unit.FLEET]
+    allowed = {variant.parent_of(loc) for loc in fleet_locs}
+    coastal = sorted(pid for pid, p in variant.provinces.items() if p.type == ProvinceType.COASTAL)
+    for source in coastal:
+        reach = _bfs_sea_closure(variant, _bfs_coast_seas(variant, source), allowed)
+        for target in coastal:
+            expected = source != target and bool(reach & _bfs_coast_seas(variant, target))
+            assert convoy_path_exists(view, source, target, fleet_locs) == expected, (source, target)
+    for fleet_loc in fleet_locs:
+        fleet = variant.parent_of(fleet_loc)
+        if variant.provinces[fleet].type != ProvinceType.SEA:
+            continue
+        onward = _bfs_sea_closure(variant, {fleet}, allowed)
+        for source in coastal[::3]:
+            entered = fleet in _bfs_sea_closure(variant, _bfs_coast_seas(variant, source), allowed)
+            for target in coastal[1::3]:
+                expected = source != target and entered and bool(onward & _bfs_coast_seas(variant, target))
+                assert convoy_path_through_fleet(view, source, target, fleet_loc, fleet_locs) == expected
+
+
+def test_convoy_oracle_shares_one_component_per_fleet_set():
+    variant = deserialize_variant(_datc_classical_variant())
+    oracle = _oracle_view(_random_movement_state(variant, 0, density=0.0)).convoys()
+    index = variant.index
+    allowed = oracle.sea_mask(["nth", "eng", "mao", "wes"])
+    component = oracle.closure(1 << index.index_of["nth"], allowed)
+    assert set(index.ids_in(component)) == {"nth", "eng", "mao", "wes"}
+    assert oracle.closure(1 << index.index_of["wes"], allowed) == component
+    assert len(oracle._components[allowed]) == 4
+    assert oracle.path_exists("lon", "naf", ["nth", "eng", "mao", "wes"])
+    assert not oracle.path_exists("lon", "naf", ["nth", "mao", "wes"])
+
+
+def test_convoy_oracle_survives_replace_unless_variant_changes():
+    view = _indexed_view([Unit(nation=NORTH, type=Unit.FLEET, location="mlc/nc")])
+    oracle = view.convoys()
+    assert view.replace(units=()).convoys() is oracle
+    assert view.replace(variant=make_variant()).convoys() is not oracle
+
+
 # === Phase progression (next_phase) ===
 
 
@@ -11427,3 +12213,472 @@ def test_dislodged_convoying_fleet_disrupts_convoyed_move():
         == "The convoying fleet was dislodged."
     )
 
+
+
+# ======================================================================
+# Compiled variants
+# ======================================================================
+
+def _scan_can_move(variant: Variant, from_loc: str, to_loc: str, unit_type: str) -> bool:
+    """The pre-index `Variant.can_move`: first matching adjacency wins."""
+    for adjacency in variant.adjacencies_of(from_loc):
+        if adjacency.to == to_loc:
+            return adjacency.allows(unit_type)
+    return False
+
+
+def _scan_has_fleet_access(variant: Variant, prov_id: str) -> bool:
+    province = variant.provinces.get(prov_id)
+    if province is None:
+        return False
+    if province.type == ProvinceType.SEA:
+        return True
+    if any(a.allows(Unit.FLEET) for a in province.adjacencies):
+        return True
+    return any(nc.parent_province == prov_id for nc in variant.named_coasts.values())
+
+
+def test_variant_index_agrees_with_adjacency_scans():
+    variant = deserialize_variant(_datc_classical_variant())
+    locations = [*variant.provinces, *variant.named_coasts, "nowhere"]
+    for from_loc in locations:
+        for to_loc in locations:
+            for unit_type in (Unit.ARMY, Unit.FLEET):
+                assert variant.can_move(from_loc, to_loc, unit_type) == _scan_can_move(
+                    variant, from_loc, to_loc, unit_type
+                ), (from_loc, to_loc, unit_type)
+        assert variant.has_fleet_access(from_loc) == _scan_has_fleet_access(variant, from_loc)
+        named = variant.named_coasts.get(from_loc)
+        assert variant.parent_of(from_loc) == (named.parent_province if named else from_loc)
+        assert variant.coasts_of(from_loc) == tuple(
+            nc.id for nc in variant.named_coasts.values() if nc.parent_province == from_loc
+        )
+
+
+def test_variant_index_bitsets_decode_to_scanned_neighbours():
+    variant = deserialize_variant(_datc_classical_variant())
+    index = variant.index
+    assert [index.index_of[loc] for loc in index.ids] == list(range(len(index.ids)))
+    for loc in index.ids:
+        for unit_type, reach in ((Unit.ARMY, index.army_reach), (Unit.FLEET, index.fleet_reach)):
+            mask = reach[index.index_of[loc]]
+            assert index.mask_of(index.ids_in(mask)) == mask
+            assert set(index.neighbours(loc, unit_type)) == {
+                to for to in index.ids if _scan_can_move(variant, loc, to, unit_type)
+            }
+    assert set(index.ids_in(index.sea)) == {
+        p.id for p in variant.provinces.values() if p.type == ProvinceType.SEA
+    }
+    assert index.coasts[index.index_of["bul"]] == (index.index_of["bul/ec"], index.index_of["bul/sc"])
+    assert index.parent[index.index_of["bul/sc"]] == index.index_of["bul"]
+
+
+def test_variant_index_is_built_once_per_variant():
+    variant = deserialize_variant(_datc_classical_variant())
+    assert variant.index is variant.index
+    assert replace(variant, name="Copy").index is not variant.index
+
+
+def _scan_can_support_to(variant: Variant, from_loc: str, to_loc: str, unit_type: str) -> bool:
+    """The pre-index `Variant.can_support_to`: the target itself, its
+    parent, or any named coast of the parent."""
+    parent = variant.parent_of(to_loc)
+    candidates = [to_loc, parent, *variant.coasts_of(parent)]
+    return any(_scan_can_move(variant, from_loc, loc, unit_type) for loc in candidates)
+
+
+def _scan_is_coastal(variant: Variant, prov_id: str) -> bool:
+    province = variant.provinces.get(prov_id)
+    if province is None or province.type == ProvinceType.SEA:
+        return False
+    return _scan_has_fleet_access(variant, prov_id)
+
+
+from .benchmark import BUNDLED_VARIANTS, bundled_variant
+
+
+@pytest.mark.parametrize("variant_id", BUNDLED_VARIANTS)
+def test_static_legality_tables_agree_with_adjacency_scans(variant_id):
+    variant = deserialize_variant(bundled_variant(variant_id))
+    locations = [*variant.provinces, *variant.named_coasts, "nowhere"]
+    for from_loc in locations:
+        for unit_type in (Unit.ARMY, Unit.FLEET):
+            for to_loc in locations:
+                assert variant.can_support_to(from_loc, to_loc, unit_type) == _scan_can_support_to(
+                    variant, from_loc, to_loc, unit_type
+                ), (from_loc, to_loc, unit_type)
+        province = variant.provinces.get(from_loc)
+        assert variant.is_sea(from_loc) == (province is not None and province.type == ProvinceType.SEA)
+        assert variant.is_coastal(from_loc) == _scan_is_coastal(variant, from_loc)
+        assert variant.has_fleet_access(from_loc) == _scan_has_fleet_access(variant, from_loc)
+
+
+def _scan_home_distances(variant: Variant, nation: str) -> Dict[str, int]:
+    """The pre-cache `NationView._distance_from_home`: a level-by-level
+    BFS from the nation's home centers and their named coasts."""
+    sources = set()
+    for province in variant.provinces.values():
+        if province.home_nation == nation:
+            sources.add(province.id)
+            sources.update(variant.coasts_of(province.id))
+    distances = {node: 0 for node in sources}
+    frontier = set(sources)
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = set()
+        for node in frontier:
+            for adjacency in variant.adjacencies_of(node):
+                if adjacency.to not in distances:
+                    distances[adjacency.to] = depth
+                    next_frontier.add(adjacency.to)
+        frontier = next_frontier
+    return distances
+
+
+@pytest.mark.parametrize("variant_id", BUNDLED_VARIANTS)
+def test_cached_home_distances_match_a_fresh_bfs(variant_id):
+    from .compiled import compile_variant
+
+    compiled = compile_variant(bundled_variant(variant_id))
+    variant = compiled.variant
+    for nation in variant.nations:
+        cached = compiled.home_distances(nation.id)
+        assert cached == _scan_home_distances(variant, nation.id), nation.id
+        assert variant.home_distances(nation.id) is cached
+    assert variant.home_distances("nobody") == {}
+
+
+def test_get_compiled_variant_reuses_entry_until_updated_at_changes():
+    from .compiled import clear_compiled_variants, get_compiled_variant
+
+    canonical = _datc_classical_variant()
+    loads: List[int] = []
+
+    def load() -> Dict[str, Any]:
+        loads.append(1)
+        return canonical
+
+    clear_compiled_variants()
+    try:
+        first = get_compiled_variant("datc", "t1", load)
+        second = get_compiled_variant("datc", "t1", load)
+        assert second is first
+        assert len(loads) == 1
+        assert first.coasts_by_parent["spa"] == ("spa/nc", "spa/sc")
+        assert "nwy" in first.index.neighbours("nth", Unit.FLEET)
+
+        third = get_compiled_variant("datc", "t2", load)
+        assert third is not first
+        assert len(loads) == 2
+    finally:
+        clear_compiled_variants()
+
+
+def test_invalidate_compiled_variant_forces_recompile():
+    from .compiled import clear_compiled_variants, get_compiled_variant, invalidate_compiled_variant
+
+    canonical = _datc_classical_variant()
+    clear_compiled_variants()
+    try:
+        first = get_compiled_variant("datc", "t1", lambda: canonical)
+        invalidate_compiled_variant("datc")
+        invalidate_compiled_variant("unknown")
+        assert get_compiled_variant("datc", "t1", lambda: canonical) is not first
+    finally:
+        clear_compiled_variants()
+
+
+# ======================================================================
+# Batch adjudication
+# ======================================================================
+
+
+def _batch_states() -> List[State]:
+    canonical = _datc_classical_variant()
+    variant = deserialize_variant(canonical)
+    opening = _datc_initial_game_state(canonical)
+    bounce = copy.deepcopy(opening)
+    bounce["orders"] = [
+        {"nation": "germany", "source": "mun", "orderType": "Move", "target": "bur"},
+        {"nation": "france", "source": "par", "orderType": "Move", "target": "bur"},
+        {"nation": "england", "source": "lvp", "orderType": "Move", "target": "yor"},
+    ]
+    convoy = copy.deepcopy(opening)
+    convoy["units"] = [
+        {"nation": "england", "type": "Army", "location": "lon", "dislodged": False, "dislodgedFrom": None},
+        {"nation": "england", "type": "Fleet", "location": "nth", "dislodged": False, "dislodgedFrom": None},
+    ]
+    convoy["orders"] = [
+        {"nation": "england", "source": "lon", "orderType": "Move", "target": "nwy"},
+        {"nation": "england", "source": "nth", "orderType": "Convoy", "target": "nwy", "aux": "lon"},
+    ]
+    return [deserialize_game_state(s, variant) for s in (opening, bounce, convoy, bounce)]
+
+
+def test_adjudicate_many_matches_one_at_a_time():
+    states = _batch_states()
+    expected = [Engine().adjudicate(state) for state in states]
+    assert Engine().adjudicate_many(states) == expected
+
+
+def test_adjudicate_many_fans_out_over_an_executor_in_input_order():
+    from concurrent.futures import ThreadPoolExecutor
+
+    states = _batch_states()
+    expected = [Engine().adjudicate(state) for state in states]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert Engine().adjudicate_many(states, executor, chunk_size=1) == expected
+
+
+def test_validate_game_state_accepts_a_deserialized_state():
+    from .serializers import validate_game_state
+
+    for state in _batch_states():
+        validate_game_state(state)
+
+
+def test_validate_game_state_rejects_unknown_nations_and_locations():
+    from .serializers import GameStateValidationError, validate_game_state
+
+    state = _batch_states()[1]
+    bad_order = replace(state, orders=[replace(state.orders[0], nation="atlantis")])
+    bad_unit = replace(state, units=[replace(state.units[0], location="xyz")])
+    for bad in (bad_order, bad_unit):
+        with pytest.raises(GameStateValidationError):
+            validate_game_state(bad)
+
+
+def test_chunk_by_variant_groups_states_sharing_a_variant():
+    from .engine import chunk_by_variant
+
+    states = _batch_states()
+    other = replace(states[0], variant=deserialize_variant(_datc_classical_variant()))
+    mixed = [states[0], other, states[1], states[2], other]
+    assert chunk_by_variant(mixed, 2) == [[0, 2], [3], [1, 4]]
+
+
+def test_public_adjudicate_many_matches_adjudicate():
+    from . import adjudicate_many
+
+    canonical = _datc_classical_variant()
+    states = [serialize_game_state(state) for state in _batch_states()]
+    assert adjudicate_many(canonical, states) == [adjudicate(canonical, state) for state in states]
+
+
+def test_resolve_states_isolates_a_failing_item():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .pipeline import resolve_state, resolve_states
+
+    states = _batch_states()
+    broken = replace(states[1], phase=Phase(season="Spring", year=1901, type="Bogus"))
+    items = [(states[0], frozenset()), (broken, frozenset()), (states[2], frozenset())]
+    expected = [resolve_state(states[0], ()), None, resolve_state(states[2], ())]
+    assert resolve_states(items) == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert resolve_states(items, executor, chunk_size=2) == expected
+
+
+# === Record layout ===
+
+
+def test_engine_records_carry_no_instance_dict():
+    """Units, orders, resolutions and options are allocated per unit per
+    phase; they stay slotted so none of them grows a `__dict__`."""
+    from .domain import Order as DomainOrder
+    from .resolution import _Decision
+    from .types import RetreatOrder, SupportMoveOrder
+
+    records = [
+        Unit(nation="england", type=Unit.ARMY, location="lon"),
+        SupplyCenter(nation="england", province="lon"),
+        Resolution(province="lon", resolution="SUCCEEDED"),
+        DomainOrder(nation="england", source="lon", order_type="Hold"),
+        OrderOption(source="lon", order_type="Hold", target=None, aux=None, unit_type=None, named_coast=None),
+        HoldOrder(nation="england", source="lon", unit_type=Unit.ARMY),
+        SupportMoveOrder(
+            nation="england", source="lon", supported_source="wal", target="yor", unit_type=Unit.ARMY
+        ),
+        RetreatOrder(nation="england", source="lon", target="wal", unit_type=Unit.ARMY, dislodged_from=None),
+        OrderResolution(),
+        Phase(season="Spring", year=1901, type=Phase.MOVEMENT),
+    ]
+    for record in records:
+        assert not hasattr(record, "__dict__"), type(record).__name__
+    assert not hasattr(_Decision(kind="move", subject=0), "__dict__")
+
+
+# === Profiling ===
+
+
+def _circular_movement_state(variant: Dict[str, Any]) -> Dict[str, Any]:
+    return (
+        _DatcStateBuilder(variant)
+        .at_phase("Spring", 1901, "Movement")
+        .with_unit("turkey", "Fleet", "ank")
+        .with_unit("turkey", "Army", "con")
+        .with_unit("turkey", "Army", "smy")
+        .with_order("turkey", "ank", "Move", target="con")
+        .with_order("turkey", "con", "Move", target="smy")
+        .with_order("turkey", "smy", "Move", target="ank")
+        .build()
+    )
+
+
+def test_profile_records_reducers_decisions_and_cycle_breaker():
+    from .profiling import profile_adjudication
+
+    variant = _datc_classical_variant()
+    state = _circular_movement_state(variant)
+    with profile_adjudication() as profile:
+        adjudicate(variant, state)
+
+    report = profile.as_dict()
+    assert report["reducers"]["ResolveStrengthsAndCutsReducer"]["calls"] == 1
+    assert report["reducers"]["ApplyMovementOutcomesReducer"]["seconds"] >= 0
+    assert report["decisions"]["move_status"] == {"count": 3, "evaluations": 3}
+    assert report["cycle_breakers"] == {"clean_cycles": 1}
+
+
+def test_profile_accumulates_across_adjudications_and_stops_on_exit():
+    from .profiling import active_profile, profile_adjudication
+
+    variant = _datc_classical_variant()
+    state = _circular_movement_state(variant)
+    with profile_adjudication() as profile:
+        adjudicate(variant, state)
+        adjudicate(variant, state)
+    adjudicate(variant, state)
+
+    assert active_profile() is None
+    assert profile.reducer_calls["ResolveStrengthsAndCutsReducer"] == 2
+    assert profile.cycle_breakers == {"clean_cycles": 2}
+
+
+def test_profile_span_events_carry_otel_attribute_values():
+    from .profiling import profile_adjudication
+
+    variant = _datc_classical_variant()
+    with profile_adjudication() as profile:
+        adjudicate(variant, _circular_movement_state(variant))
+
+    events = profile.span_events()
+    names = {name for name, _ in events}
+    assert names == {"adjudicator.reducer", "adjudicator.decisions", "adjudicator.cycle_breaker"}
+    assert ("adjudicator.cycle_breaker", {"breaker": "clean_cycles", "count": 1}) in events
+    for _, attributes in events:
+        assert all(isinstance(value, (str, int, float)) for value in attributes.values())
+
+
+# === Benchmark baselines ===
+
+
+def _benchmark_report(**overrides: Any) -> Dict[str, Any]:
+    report = {
+        "fixture": "02_classical_solo_35p.json",
+        "variant": "classical",
+        "phases": 35,
+        "repeat": 5,
+        "adjudicate_ms": {"p50": 0.3, "p90": 4.0, "p99": 6.0},
+        "options_ms": {"p50": 0.1, "p90": 2.5, "p99": 4.0},
+        "game_ms": {"p50": 80.0, "p90": 110.0, "p99": 110.0},
+        "peak_kib": 180,
+        "options": {"total": 10330, "max_per_phase": 1334},
+    }
+    report.update(overrides)
+    return report
+
+
+def test_benchmark_compare_ignores_noise_within_tolerance():
+    from .benchmark import compare_to_baseline
+
+    report = _benchmark_report(
+        adjudicate_ms={"p50": 0.3, "p90": 40.0, "p99": 60.0},
+        game_ms={"p50": 95.0, "p90": 200.0, "p99": 200.0},
+        peak_kib=200,
+    )
+    assert compare_to_baseline(report, _benchmark_report(), tolerance=0.25) == []
+
+
+def test_benchmark_compare_flags_slowdowns_memory_and_option_changes():
+    from .benchmark import compare_to_baseline
+
+    report = _benchmark_report(
+        game_ms={"p50": 150.0, "p90": 200.0, "p99": 200.0},
+        peak_kib=400,
+        options={"total": 10331, "max_per_phase": 1334},
+    )
+    problems = compare_to_baseline(report, _benchmark_report(), tolerance=0.25)
+    assert len(problems) == 3
+    assert any("game_ms.p50" in problem for problem in problems)
+    assert any("peak_kib" in problem for problem in problems)
+    assert any("options changed" in problem for problem in problems)
+
+
+def test_benchmark_percentiles_use_nearest_rank():
+    from .benchmark import _percentiles
+
+    assert _percentiles([float(n) for n in range(1, 101)]) == {"p50": 50.0, "p90": 90.0, "p99": 99.0}
+    assert _percentiles([7.0]) == {"p50": 7.0, "p90": 7.0, "p99": 7.0}
+
+
+# === Random position generator ===
+
+
+@pytest.mark.parametrize("preset", ["SUPPORT_WEB", "MOVE_RINGS", "CONVOY_CHAINS", "MIXED"])
+@pytest.mark.parametrize("density", [0.3, 1.0])
+def test_random_position_orders_every_unit_with_an_emitted_option(preset, density):
+    from . import generator
+
+    variant = deserialize_variant(_datc_classical_variant())
+    state = generator.random_position(variant, density, getattr(generator, preset), seed=7)
+
+    assert len(state.units) == round(density * len(variant.provinces))
+    parents = [variant.parent_of(unit.location) for unit in state.units]
+    assert len(set(parents)) == len(parents)
+    assert sorted(order.source for order in state.orders) == sorted(unit.location for unit in state.units)
+
+    emitted = {
+        (option.source, option.order_type, option.target, option.aux) for option in get_options(state)
+    }
+    for order in state.orders:
+        if order.order_type == "Move" and order.via_convoy:
+            key = (order.source, "MoveViaConvoy", order.target, None)
+        elif order.order_type == "Support" and order.target is None:
+            key = (order.source, "Support", order.aux, order.aux)
+        else:
+            key = (order.source, order.order_type, order.target, order.aux)
+        assert key in emitted, order
+
+    resolved = Engine().adjudicate(state)[0]
+    assert len(resolved.resolutions) == len(state.orders)
+
+
+def test_random_position_is_deterministic_per_seed():
+    from .generator import MIXED, random_position
+
+    variant = deserialize_variant(_datc_classical_variant())
+    first = random_position(variant, 0.8, MIXED, seed=3)
+    again = random_position(variant, 0.8, MIXED, seed=3)
+    other = random_position(variant, 0.8, MIXED, seed=4)
+
+    assert first.units == again.units and first.orders == again.orders
+    assert (first.units, first.orders) != (other.units, other.orders)
+
+
+def test_random_position_presets_build_their_shapes():
+    from .generator import CONVOY_CHAINS, MOVE_RINGS, SUPPORT_WEB, random_position
+
+    variant = deserialize_variant(_datc_classical_variant())
+
+    def counts(mix):
+        state = random_position(variant, 1.0, mix, seed=1)
+        return {
+            kind: sum(1 for order in state.orders if order.order_type == kind)
+            for kind in ("Move", "Support", "Convoy")
+        }
+
+    assert counts(SUPPORT_WEB)["Support"] > counts(SUPPORT_WEB)["Move"]
+    assert counts(MOVE_RINGS)["Move"] > len(variant.provinces) // 2
+    assert counts(CONVOY_CHAINS)["Convoy"] > 0
@@ -14,7 +14,7 @@ from __future__ import annotations
 
 # === Imports ===
 from dataclasses import dataclass, replace
-from typing import ClassVar, Dict, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple, Type
 
 from .domain import (
     Order as RawOrder,
@@ -22,12 +22,14 @@ from .domain import (
 from .domain import (
     Phase,
     PhaseTransition,
-    ProvinceType,
     SupplyCenter,
     Unit,
     Variant,
 )
 
+if TYPE_CHECKING:
+    from .convoy import ConvoyOracle
+
 # === Status constants ===
 
 
@@ -105,7 +107,10 @@ class Order:
     """Empty marker base for concrete Order dataclasses. Exists so the
     type system can express `Tuple[Order, ...]` and so reducers / selectors
     can isinstance-check across all order types. No behavior beyond the
-    trivial identity accessor `source_province`."""
+    trivial identity accessor `source_province`. Declares no slots of its
+    own so the slotted subclasses carry no per-instance `__dict__`."""
+
+    __slots__ = ()
 
     def source_province(self) -> str:
         """Return the parent province (or named coast) this order pertains
@@ -293,9 +298,9 @@ class SupportMoveSupportedCanReachCheck(Check):
             return False
         source_parent = variant.parent_of(supported.location)
         target_parent = variant.parent_of(order.target)
-        if not state.province(source_parent).is_coastal():
+        if not variant.is_coastal(source_parent):
             return False
-        if not state.province(target_parent).is_coastal():
+        if not variant.is_coastal(target_parent):
             return False
         # Only fleets that have actually submitted a matching Convoy
         # order count — physical possibility alone is not enough
@@ -343,9 +348,7 @@ class ConvoyerIsInSeaCheck(Check):
     @classmethod
     def check(cls, state: "StateView", order: Order) -> bool:
         assert isinstance(order, ConvoyOrder)
-        if order.source in state.variant().named_coasts:
-            return False
-        return state.province(state.variant().parent_of(order.source)).is_sea()
+        return state.variant().is_sea(order.source)
 
 
 class ConvoyArmyExistsCheck(Check):
@@ -389,9 +392,8 @@ class ConvoyEndpointsAreCoastalCheck(Check):
     def check(cls, state: "StateView", order: Order) -> bool:
         assert isinstance(order, ConvoyOrder)
         variant = state.variant()
-        return (
-            state.province(variant.parent_of(order.army_source)).is_coastal()
-            and state.province(variant.parent_of(order.army_target)).is_coastal()
+        return variant.is_coastal(variant.parent_of(order.army_source)) and variant.is_coastal(
+            variant.parent_of(order.army_target)
         )
 
 
@@ -456,10 +458,7 @@ class RetreatTargetIsUnoccupiedCheck(Check):
     def check(cls, state: "StateView", order: Order) -> bool:
         assert isinstance(order, RetreatOrder)
         target_parent = state.variant().parent_of(order.target)
-        for loc in state.units().standing_by_loc():
-            if state.variant().parent_of(loc) == target_parent:
-                return False
-        return True
+        return target_parent not in state.units().standing_by_parent()
 
 
 class RetreatNotToAttackerOriginCheck(Check):
@@ -641,7 +640,7 @@ class AdjustmentDisbandUnitExistsCheck(Check):
 # === Order classes ===
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HoldOrder(Order):
     """A non-dislodged unit's instruction to stay put during the Movement
     phase. Hold has no legality requirements — staying in place is
@@ -657,7 +656,7 @@ class HoldOrder(Order):
         return self.source
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveOrder(Order):
     """A standing unit's instruction to relocate to an adjacent province
     during the Movement phase (DATC 6.A). Convoyed moves are out of scope
@@ -680,7 +679,7 @@ class MoveOrder(Order):
         return self.source
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupportHoldOrder(Order):
     """A standing unit's instruction to lend defensive strength to another
     unit holding at `supported_source` (DATC 6.A.13, 6.D.7). Whether the
@@ -703,7 +702,7 @@ class SupportHoldOrder(Order):
         return self.source
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupportMoveOrder(Order):
     """A standing unit's instruction to lend attack strength to another
     unit moving from `supported_source` to `target` (DATC 6.A.13, 6.D.5,
@@ -728,7 +727,7 @@ class SupportMoveOrder(Order):
         return self.source
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConvoyOrder(Order):
     """A fleet's instruction to convoy an army from one coastal province
     to another during the Movement phase (DATC 6.F, 6.G). The convoyed
@@ -771,7 +770,7 @@ class ConvoyOrder(Order):
         return self.source
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetreatOrder(Order):
     """A dislodged unit's instruction to relocate to an adjacent
     unoccupied non-contested province (DATC 6.H.1–6.H.6). Bounce
@@ -795,7 +794,7 @@ class RetreatOrder(Order):
         return self.source
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DisbandOrder(Order):
     """A dislodged unit's instruction to disband instead of retreating.
     Always legal. The Adjustment-phase form of disband is out of scope
@@ -811,7 +810,7 @@ class DisbandOrder(Order):
         return self.source
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuildOrder(Order):
     """An Adjustment-phase instruction to add a new unit at one of the
     nation's vacant home supply centers (or any owned supply center if
@@ -838,7 +837,7 @@ class BuildOrder(Order):
         return self.location
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdjustmentDisbandOrder(Order):
     """An Adjustment-phase instruction to remove an existing standing unit
     of the ordering nation. Distinct from the Retreat-phase DisbandOrder:
@@ -863,7 +862,7 @@ class AdjustmentDisbandOrder(Order):
 # === State ===
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderResolution:
     """Per-order resolution record. Indexed parallel to parsed_orders.
 
@@ -951,7 +950,7 @@ class OrderResolution:
     ResolveStrengthsAndCutsReducer."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdjudicationState:
     """The complete working state for one phase resolution.
 
@@ -1041,25 +1040,25 @@ class ProvinceView:
     """Read-only wrapper over (AdjudicationState, parent province id) for
     questions about one specific parent province."""
 
-    def __init__(self, state: AdjudicationState, parent: str):
+    def __init__(
+        self,
+        state: AdjudicationState,
+        parent: str,
+        indexes: Optional[Dict[str, Any]] = None,
+    ):
         self._state = state
         self._parent = parent
+        self._indexes = {} if indexes is None else indexes
 
     def is_occupied(self) -> bool:
-        for unit in self._state.units:
-            if unit.dislodged:
-                continue
-            if self._state.variant.parent_of(unit.location) == self._parent:
-                return True
-        return False
+        return self._parent in UnitsView(self._state, self._indexes).standing_by_parent()
 
     def is_sea(self) -> bool:
         """True iff this province is a sea province. Named coasts and
         inland provinces are not sea provinces; coastal land provinces
         are not sea provinces. A fleet can occupy a sea province
         directly."""
-        province = self._state.variant.provinces.get(self._parent)
-        return province is not None and province.type == ProvinceType.SEA
+        return self._state.variant.is_sea(self._parent)
 
     def is_coastal(self) -> bool:
         """True iff this province is a coastal land province — a land
@@ -1067,10 +1066,7 @@ class ProvinceView:
         provinces are not coastal; inland land provinces are not
         coastal. Convoy endpoints (army_source / army_target on a
         ConvoyOrder) must be coastal."""
-        province = self._state.variant.provinces.get(self._parent)
-        if province is None or province.type == ProvinceType.SEA:
-            return False
-        return self._state.variant.has_fleet_access(self._parent)
+        return self._state.variant.is_coastal(self._parent)
 
 
 class NationView:
@@ -1159,118 +1155,125 @@ class NationView:
             )
         )
 
-    def _bfs_source_nodes(self) -> set:
-        """Build the BFS source set for civil-disorder distance
-        computation: every home supply center of this nation, plus
-        every named coast belonging to one of those provinces. Named
-        coasts are included because a fleet can occupy a coast and
-        we want its distance measured from that coast, not from the
-        parent."""
-        variant = self._state.variant
-        home = self.home_supply_centers()
-        sources: set = set(home)
-        for province_id in home:
-            for coast in variant.coasts_of(province_id):
-                sources.add(coast)
-        return sources
-
     def _distance_from_home(self) -> Dict[str, int]:
-        """Unweighted BFS distance from each reachable node to the
-        nearest home supply center of this nation (or named coast
-        thereof). Pass type is ignored — distances are over the raw
-        adjacency graph, matching the effective behaviour of godip's
-        shortestDistance (whose unfiltered path is always at least
-        as short as the type-filtered one). Returns a map from node
-        id to distance; unreachable nodes are absent."""
-        variant = self._state.variant
-        sources = self._bfs_source_nodes()
-        if not sources:
-            return {}
-        distances: Dict[str, int] = {node: 0 for node in sources}
-        frontier: set = set(sources)
-        depth = 0
-        while frontier:
-            depth += 1
-            next_frontier: set = set()
-            for node in frontier:
-                for adjacency in variant.adjacencies_of(node):
-                    neighbour = adjacency.to
-                    if neighbour in distances:
-                        continue
-                    distances[neighbour] = depth
-                    next_frontier.add(neighbour)
-            frontier = next_frontier
-        return distances
+        """Unweighted distance from each reachable node to the nearest
+        home supply center of this nation (or named coast thereof).
+        Pass type is ignored — distances are over the raw adjacency
+        graph, matching the effective behaviour of godip's
+        shortestDistance (whose unfiltered path is always at least as
+        short as the type-filtered one). Home centers are static, so
+        the map comes from the variant's per-nation cache rather than
+        a fresh BFS per adjustment phase."""
+        return self._state.variant.home_distances(self._nation)
 
 
 class UnitsView:
     """Read-only wrapper over AdjudicationState providing queries grouped
-    over the units list as a whole."""
+    over the units list as a whole.
 
-    def __init__(self, state: AdjudicationState):
+    Lookups by location or parent are answered from indexes built on
+    first use and kept in `indexes`, which StateView shares across every
+    sub-view it hands out for the same state. The returned dicts are
+    those indexes — callers must not mutate them."""
+
+    def __init__(self, state: AdjudicationState, indexes: Optional[Dict[str, Any]] = None):
         self._state = state
+        self._indexes = {} if indexes is None else indexes
 
     def all(self) -> Tuple[Unit, ...]:
         return self._state.units
 
     def standing_by_loc(self) -> Dict[str, Unit]:
-        return {u.location: u for u in self._state.units if not u.dislodged}
+        index = self._indexes.get("standing_by_loc")
+        if index is None:
+            index = {u.location: u for u in self._state.units if not u.dislodged}
+            self._indexes["standing_by_loc"] = index
+        return index
+
+    def standing_by_parent(self) -> Dict[str, Unit]:
+        """Standing units keyed by parent province. Where two standing
+        units share a parent (never in a legal position) the first in
+        `state.units` wins, as a linear scan would find it."""
+        index = self._indexes.get("standing_by_parent")
+        if index is None:
+            index = {}
+            parent_of = self._state.variant.parent_of
+            for u in self._state.units:
+                if not u.dislodged:
+                    index.setdefault(parent_of(u.location), u)
+            self._indexes["standing_by_parent"] = index
+        return index
 
     def at_parent(self, location: str) -> Optional[Unit]:
         """Look up a standing unit by parent province. Accepts either a
         bare parent province id or a named coast; in both cases a match
         is by parent. Returns the unit or None."""
-        parent = self._state.variant.parent_of(location)
-        for u in self._state.units:
-            if u.dislodged:
-                continue
-            if self._state.variant.parent_of(u.location) == parent:
-                return u
-        return None
+        return self.standing_by_parent().get(self._state.variant.parent_of(location))
 
     def dislodged_by_loc(self) -> Dict[str, Unit]:
-        return {u.location: u for u in self._state.units if u.dislodged}
+        index = self._indexes.get("dislodged_by_loc")
+        if index is None:
+            index = {u.location: u for u in self._state.units if u.dislodged}
+            self._indexes["dislodged_by_loc"] = index
+        return index
+
+    def dislodged_by_parent(self) -> Dict[str, Unit]:
+        """Dislodged units keyed by parent province; first in
+        `dislodged_by_loc` order wins on a shared parent."""
+        index = self._indexes.get("dislodged_by_parent")
+        if index is None:
+            index = {}
+            parent_of = self._state.variant.parent_of
+            for loc, unit in self.dislodged_by_loc().items():
+                index.setdefault(parent_of(loc), unit)
+            self._indexes["dislodged_by_parent"] = index
+        return index
 
     def dislodged_for_source(self, source: str) -> Optional[Unit]:
         dislodged = self.dislodged_by_loc()
         if source in dislodged:
             return dislodged[source]
-        parent = self._state.variant.parent_of(source)
-        for loc, unit in dislodged.items():
-            if self._state.variant.parent_of(loc) == parent:
-                return unit
-        return None
+        return self.dislodged_by_parent().get(self._state.variant.parent_of(source))
 
 
 class OrdersView:
     """Read-only wrapper over AdjudicationState providing queries grouped
-    over parsed_orders."""
+    over parsed_orders. Groupings are memoized in `indexes` like
+    UnitsView's; callers must not mutate them."""
 
-    def __init__(self, state: AdjudicationState):
+    def __init__(self, state: AdjudicationState, indexes: Optional[Dict[str, Any]] = None):
         self._state = state
+        self._indexes = {} if indexes is None else indexes
 
     def by_source(self) -> Dict[str, Tuple[int, Order]]:
-        by_source: Dict[str, Tuple[int, Order]] = {}
+        by_source = self._indexes.get("orders_by_source")
+        if by_source is not None:
+            return by_source
+        by_source = {}
         for i, order in enumerate(self._state.parsed_orders):
             if isinstance(order, (HoldOrder, MoveOrder, RetreatOrder, DisbandOrder)):
                 by_source[order.source] = (i, order)
+        self._indexes["orders_by_source"] = by_source
         return by_source
 
     def retreats_by_target_parent(self) -> Dict[str, List[int]]:
-        grouped: Dict[str, List[int]] = {}
-        for i, order in enumerate(self._state.parsed_orders):
-            if not isinstance(order, RetreatOrder):
-                continue
-            if self._state.resolutions[i].status is not None:
-                continue
-            parent = self._state.variant.parent_of(order.target)
-            grouped.setdefault(parent, []).append(i)
+        grouped = self._indexes.get("retreats_by_target_parent")
+        if grouped is None:
+            grouped = self._undecided_by_target_parent(RetreatOrder)
+            self._indexes["retreats_by_target_parent"] = grouped
         return grouped
 
     def moves_by_target_parent(self) -> Dict[str, List[int]]:
+        grouped = self._indexes.get("moves_by_target_parent")
+        if grouped is None:
+            grouped = self._undecided_by_target_parent(MoveOrder)
+            self._indexes["moves_by_target_parent"] = grouped
+        return grouped
+
+    def _undecided_by_target_parent(self, order_cls: type) -> Dict[str, List[int]]:
         grouped: Dict[str, List[int]] = {}
         for i, order in enumerate(self._state.parsed_orders):
-            if not isinstance(order, MoveOrder):
+            if not isinstance(order, order_cls):
                 continue
             if self._state.resolutions[i].status is not None:
                 continue
@@ -1285,10 +1288,19 @@ class StateView:
     derived data through its methods. Sub-Views are constructed on
     demand via province(), nation(), units(), and orders(). The only
     way reducers update state is through replace(), which returns a new
-    StateView wrapping a freshly-constructed AdjudicationState."""
+    StateView wrapping a freshly-constructed AdjudicationState.
 
-    def __init__(self, state: AdjudicationState):
+    Because AdjudicationState is frozen, the per-state indexes the
+    sub-views build (units by parent, orders by source, ...) are safe to
+    memoize on the view; they live in `_indexes`, are shared by every
+    sub-view this view hands out, and are dropped with the view on
+    replace(). The convoy oracle depends on the variant alone, so it
+    survives replace() unless the variant itself is replaced."""
+
+    def __init__(self, state: AdjudicationState, convoys: Optional["ConvoyOracle"] = None):
         self._state = state
+        self._indexes: Dict[str, Any] = {}
+        self._convoys = convoys
 
     def variant(self) -> Variant:
         return self._state.variant
@@ -1324,16 +1336,23 @@ class StateView:
         return self._state.resolutions
 
     def province(self, parent: str) -> ProvinceView:
-        return ProvinceView(self._state, parent)
+        return ProvinceView(self._state, parent, self._indexes)
 
     def nation(self, nation: str) -> NationView:
         return NationView(self._state, nation)
 
     def units(self) -> UnitsView:
-        return UnitsView(self._state)
+        return UnitsView(self._state, self._indexes)
 
     def orders(self) -> OrdersView:
-        return OrdersView(self._state)
+        return OrdersView(self._state, self._indexes)
+
+    def convoys(self) -> "ConvoyOracle":
+        if self._convoys is None:
+            from .convoy import ConvoyOracle
+
+            self._convoys = ConvoyOracle(self._state.variant.index)
+        return self._convoys
 
     def next_phase(self) -> Optional[Phase]:
         phase = self._state.phase
@@ -1362,7 +1381,8 @@ class StateView:
         return None
 
     def replace(self, **kwargs) -> "StateView":
-        return StateView(replace(self._state, **kwargs))
+        convoys = None if "variant" in kwargs else self._convoys
+        return StateView(replace(self._state, **kwargs), convoys)
 
     @property
     def raw(self) -> AdjudicationState:
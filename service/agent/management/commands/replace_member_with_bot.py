@@ -1,9 +1,11 @@
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.utils import timezone
 
 from agent.constants import AgentTaskKind
 from agent.models import AgentTask
 from channel.models import ChannelMember
+from emit import emit
 from game.models import Game
 from order.models import Order
 from phase.models import Phase, PhaseState
@@ -50,13 +52,13 @@ class Command(BaseCommand):
 
             member.kicked = True
             member.replaced_by = replacement
-            member.save(update_fields=["kicked", "replaced_by"])
+            member.save(update_fields=["kicked", "replaced_by", "updated_at"])
 
             phase = game.current_phase
             if phase is not None and Phase.objects.lock_if_active(phase.id) is not None:
                 replaced_states = phase.phase_states.filter(member=member)
                 Order.objects.filter(phase_state__in=replaced_states).delete()
-                replaced_states.update(has_possible_orders=False)
+                replaced_states.update(has_possible_orders=False, updated_at=timezone.now())
                 PhaseState.objects.create(
                     member=replacement,
                     phase=phase,
@@ -64,6 +66,8 @@ class Command(BaseCommand):
                 )
                 AgentTask.objects.enqueue(kind=AgentTaskKind.PLAN, member=replacement, phase=phase)
 
+            emit("member_replaced", game=game)
+
         self.stdout.write(
             self.style.SUCCESS(f"{bot_profile.name} now plays {member.nation.name} in '{game.id}'.")
         )
@@ -2,6 +2,7 @@ from django.db import transaction
 
 from agent.constants import AgentTaskKind
 from agent.models import AgentTask
+from game.models import GameSummary
 from order.models import Order
 from phase.models import Phase
 
@@ -22,4 +23,5 @@ def replan(member):
         if phase is None or Phase.objects.lock_if_active(phase.id) is None:
             raise ReplanError(f"game '{member.game_id}' has no active phase")
         Order.objects.filter(phase_state__member=member, phase_state__phase=phase).delete()
+        GameSummary.objects.refresh_on_commit(member.game, user_ids=[member.user_id])
         return AgentTask.objects.requeue(kind=AgentTaskKind.PLAN, member=member, phase=phase)
@@ -20,6 +20,7 @@ from channel.models import ChannelMessage
 from common.constants import OrderType, PhaseStatus, PhaseType, UserKind
 from emit.context import build_context
 from emit.dispatch import emit
+from game.models import GameSummary
 from inference.clients.base import InferenceResult
 from inference.constants import InferenceStatus
 from inference.models import Inference
@@ -1256,6 +1257,27 @@ class TestReplanMemberCommand:
 
         assert not Order.objects.filter(phase_state__member=member).exists()
 
+    @pytest.mark.django_db
+    def test_refreshes_the_bots_game_summary(
+        self,
+        active_game_factory,
+        primary_user,
+        in_memory_procrastinate,
+        classical_london_province,
+        mock_immediate_on_commit,
+    ):
+        game = active_game_factory()
+        member = self._seat_bot(game, primary_user)
+        phase_state = game.current_phase.phase_states.get(member=member)
+        phase_state.has_possible_orders = True
+        phase_state.save(update_fields=["has_possible_orders"])
+        Order.objects.create(phase_state=phase_state, source=classical_london_province, order_type=OrderType.HOLD)
+        GameSummary.objects.refresh_for_game(game)
+
+        self._replan(game, member)
+
+        assert GameSummary.objects.get(game=game, user=member.user).order_status == "orders_required"
+
     @pytest.mark.django_db
     def test_rejects_a_member_not_played_by_a_bot(self, active_game_factory, in_memory_procrastinate):
         game = active_game_factory()
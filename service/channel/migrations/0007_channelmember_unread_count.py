@@ -0,0 +1,37 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_unread_counts(apps, schema_editor):
+    ChannelMember = apps.get_model("channel", "ChannelMember")
+    ChannelMessage = apps.get_model("channel", "ChannelMessage")
+    Member = apps.get_model("member", "Member")
+    reader_user = Member.objects.filter(pk=OuterRef(OuterRef("member"))).values("user")[:1]
+    unread = (
+        ChannelMessage.objects.filter(channel=OuterRef("channel"), created_at__gt=OuterRef("last_read_at"))
+        .exclude(sender=OuterRef("member"))
+        .exclude(sender__user=Subquery(reader_user))
+        .order_by()
+        .values("channel")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    ChannelMember.objects.update(unread_count=Coalesce(Subquery(unread), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("channel", "0006_widen_channel_name"),
+        ("member", "0007_member_seeking_replacement_replaced_by"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="channelmember",
+            name="unread_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_unread_counts, migrations.RunPython.noop),
+    ]
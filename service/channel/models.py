@@ -1,5 +1,6 @@
 from django.db import models
-from django.db.models import Q, Count, Subquery, OuterRef, IntegerField, Value, Max, F
+from django.db.models import Q, Subquery, OuterRef, IntegerField, Value, Max, F
+from django.db.models.functions import Coalesce
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from channel import registry as channel_registry
@@ -35,19 +36,12 @@ class ChannelQuerySet(models.QuerySet):
     def with_unread_counts(self, user):
         if not user.is_authenticated:
             return self.annotate(unread_message_count=Value(0, output_field=IntegerField()))
-        last_read_subquery = Subquery(
-            ChannelMember.objects.filter(
-                channel=OuterRef("pk"),
-                member__user=user,
-            ).values("last_read_at")[:1]
-        )
+        unread_subquery = ChannelMember.objects.filter(
+            channel=OuterRef("pk"),
+            member__user=user,
+        ).values("unread_count")[:1]
         return self.annotate(
-            unread_message_count=Count(
-                "messages",
-                filter=Q(messages__created_at__gt=last_read_subquery)
-                & ~Q(messages__sender__user=user),
-                distinct=True,
-            )
+            unread_message_count=Coalesce(Subquery(unread_subquery, output_field=IntegerField()), Value(0))
         )
 
 
@@ -107,6 +101,7 @@ class ChannelMember(BaseModel):
     member = models.ForeignKey("member.Member", on_delete=models.CASCADE, related_name="member_channels")
     channel = models.ForeignKey("channel.Channel", on_delete=models.CASCADE, related_name="member_channels")
     last_read_at = models.DateTimeField(default=timezone.now)
+    unread_count = models.PositiveIntegerField(default=0)
 
     objects = ChannelMemberQuerySet.as_manager()
 
@@ -135,6 +130,17 @@ class ChannelMessage(BaseModel):
     class Meta:
         ordering = ["created_at"]
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            # Bump every other reader's counter in one UPDATE so unread
+            # totals are a lookup rather than a count over messages.
+            readers = ChannelMember.objects.filter(channel_id=self.channel_id).exclude(member_id=self.sender_id)
+            if self.sender.user_id is not None:
+                readers = readers.exclude(member__user_id=self.sender.user_id)
+            readers.update(unread_count=F("unread_count") + 1)
+
 
 class ChannelEventManager(models.Manager):
     def create_from_event(self, event_type, context):
@@ -82,5 +82,6 @@ class ChannelMarkReadSerializer(serializers.Serializer):
         member = self.context["current_game_member"]
         channel_member = ChannelMember.objects.get(member=member, channel=channel)
         channel_member.last_read_at = timezone.now()
-        channel_member.save(update_fields=["last_read_at"])
+        channel_member.unread_count = 0
+        channel_member.save(update_fields=["last_read_at", "unread_count"])
         return channel_member
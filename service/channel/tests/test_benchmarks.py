@@ -0,0 +1,88 @@
+"""Unread counter latency benchmarks.
+
+These build 200k messages, time real queries and print their numbers,
+so they are excluded from the default run (see pyproject.toml). Invoke
+explicitly when measuring:
+
+    pytest channel/tests/test_benchmarks.py -s
+"""
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from adjudicator.benchmark import median_ms
+from channel.models import Channel, ChannelMember, ChannelMessage
+from game.models import Game
+
+
+@pytest.mark.django_db
+def test_unread_total_latency_counter_sum_vs_message_count(
+    classical_variant, primary_user, secondary_user, game_factory, member_factory
+):
+    """Total unread counts for a page of 20 games with 10k messages each.
+    The legacy column times the correlated count over ChannelMessage past
+    each ChannelMember.last_read_at; the counter column sums the
+    maintained ChannelMember.unread_count. Also reports what the counter
+    UPDATE adds to posting a message."""
+    game_count, messages_per_game = 20, 10_000
+    england, france = classical_variant.nations.all()[:2]
+    channels = []
+    for _ in range(game_count):
+        game = game_factory(variant=classical_variant)
+        reader = member_factory(game=game, user=primary_user, nation=england)
+        sender = member_factory(game=game, user=secondary_user, nation=france)
+        channel = Channel.objects.create(game=game, name="Public Press", private=False)
+        channel.members.add(reader, sender)
+        ChannelMessage.objects.bulk_create(
+            ChannelMessage(channel=channel, sender=sender, body=f"Message {index}")
+            for index in range(messages_per_game)
+        )
+        ChannelMember.objects.filter(channel=channel, member=reader).update(
+            last_read_at=timezone.now() - timedelta(days=1), unread_count=messages_per_game
+        )
+        channels.append((channel, sender))
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    games = Game.objects.filter(id__in=[channel.game_id for channel, _ in channels])
+
+    def legacy_totals():
+        last_read = Subquery(
+            ChannelMember.objects.filter(channel=OuterRef("channel"), member__user=primary_user).values("last_read_at")[:1]
+        )
+        unread = (
+            ChannelMessage.objects.filter(
+                channel__game=OuterRef("pk"),
+                channel__member_channels__member__user=primary_user,
+                created_at__gt=last_read,
+            )
+            .exclude(sender__user=primary_user)
+            .order_by()
+            .values("channel__game")
+            .annotate(count=Count("id", distinct=True))
+            .values("count")
+        )
+        return list(games.annotate(total=Coalesce(Subquery(unread, output_field=IntegerField()), Value(0))))
+
+    def counter_totals():
+        return list(games.with_total_unread_counts(primary_user))
+
+    assert {g.total for g in legacy_totals()} == {g.total_unread_message_count for g in counter_totals()}
+    legacy = median_ms(legacy_totals)
+    counter = median_ms(counter_totals)
+
+    channel, sender = channels[0]
+    post = median_ms(lambda: ChannelMessage.objects.create(channel=channel, sender=sender, body="Another"))
+    insert = median_ms(
+        lambda: ChannelMessage.objects.bulk_create([ChannelMessage(channel=channel, sender=sender, body="Another")])
+    )
+
+    print(
+        f"\n{game_count} games x {messages_per_game} messages: unread totals by message count {legacy:.1f} ms, "
+        f"by counter sum {counter:.1f} ms ({legacy / counter:.0f}x); "
+        f"post with counter update {post:.2f} ms vs bare insert {insert:.2f} ms"
+    )
+    assert counter < legacy
@@ -6,7 +6,7 @@ from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
-from channel.models import Channel, ChannelMessage
+from channel.models import Channel, ChannelMember, ChannelMessage
 from nation.models import Nation
 from game.models import Game
 from game.serializers import GameRetrieveSerializer
@@ -715,6 +715,29 @@ class TestChannelUnreadCount:
         assert public_data["unread_message_count"] == 0
         assert private_data["unread_message_count"] == 1
 
+    @pytest.mark.django_db
+    def test_posting_increments_other_members_counters_only(
+        self, authenticated_client, game_with_public_channel_and_messages, primary_user, secondary_user
+    ):
+        game = game_with_public_channel_and_messages
+        channel = Channel.objects.get(game=game, name="Public Press")
+
+        url = reverse("channel-message-create", args=[game.id, channel.id])
+        response = authenticated_client.post(url, {"body": "Hello"}, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        counters = dict(ChannelMember.objects.filter(channel=channel).values_list("member__user", "unread_count"))
+        assert counters == {primary_user.id: 2, secondary_user.id: 3}
+
+    @pytest.mark.django_db
+    def test_mark_read_resets_the_counter(self, authenticated_client, game_with_public_channel_and_messages, primary_user):
+        game = game_with_public_channel_and_messages
+        channel = Channel.objects.get(game=game, name="Public Press")
+
+        authenticated_client.post(reverse("channel-mark-read", args=[game.id, channel.id]))
+
+        assert ChannelMember.objects.get(channel=channel, member__user=primary_user).unread_count == 0
+
 
 class TestGameRetrieveUnreadCount:
 
@@ -1,7 +1,132 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+
+from django.db.models import F, Q
+from django.db.models.expressions import OrderBy
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class StandardPageNumberPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pages by seeking past the last row of the previous page rather than
+    counting and offsetting, so a page costs the same however deep it is
+    and however large the table grows. The sort key is the queryset's own
+    ordering with the primary key appended as a tiebreaker; each ordering
+    term must be a field or annotation readable off the returned rows.
+    There is no total count and no previous link.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        self.keys = self.get_keys(ordering)
+        if len(self.keys) > len(ordering):
+            name, descending, _ = self.keys[-1]
+            queryset = queryset.order_by(*ordering, f"-{name}" if descending else name)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.seek(position))
+
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        self.last_position = [getattr(rows[-1], name) for name, _, _ in self.keys] if rows else None
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_keys(self, ordering):
+        """(name, descending, nulls_last) for each ordering term, pk last."""
+        keys = []
+        for term in ordering:
+            if isinstance(term, str):
+                descending = term.startswith("-")
+                keys.append((term.lstrip("-"), descending, not descending))
+            elif isinstance(term, OrderBy) and isinstance(term.expression, F):
+                nulls_last = term.nulls_last if (term.nulls_last or term.nulls_first) else not term.descending
+                keys.append((term.expression.name, term.descending, bool(nulls_last)))
+            else:
+                raise ValueError(f"Unsupported keyset ordering term: {term!r}")
+        if not any(name in ("pk", "id") for name, _, _ in keys):
+            descending = keys[-1][1] if keys else False
+            keys.append(("pk", descending, not descending))
+        return keys
+
+    def seek(self, position):
+        """Rows strictly after ``position`` in key order."""
+        condition = None
+        tied = Q()
+        for (name, descending, nulls_last), value in zip(self.keys, position):
+            if value is None:
+                # Nothing sorts after a trailing null; everything non-null
+                # sorts after a leading one.
+                after = None if nulls_last else Q(**{f"{name}__isnull": False})
+                equal = Q(**{f"{name}__isnull": True})
+            else:
+                after = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+                if nulls_last:
+                    after |= Q(**{f"{name}__isnull": True})
+                equal = Q(**{name: value})
+            if after is not None:
+                condition = tied & after if condition is None else condition | (tied & after)
+            tied &= equal
+        return condition
+
+    def encode_cursor(self, position):
+        data = json.dumps(position, default=lambda value: value.isoformat(), separators=(",", ":"))
+        token = base64.urlsafe_b64encode(data.encode()).decode()
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(token.encode()))
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.keys):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.last_position)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
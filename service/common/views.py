@@ -36,7 +36,7 @@ def resolve_phase(request, game_id, phase_id):
         request._phase_cache = cache
     key = (game_id, phase_id)
     if key not in cache:
-        cache[key] = get_object_or_404(Phase.objects.defer("options"), id=phase_id, game_id=game_id)
+        cache[key] = get_object_or_404(Phase, id=phase_id, game_id=game_id)
     return cache[key]
 
 
@@ -92,7 +92,8 @@ class CurrentPhaseMixin:
     def get_phase(self):
         game_id = self.kwargs.get("game_id")
         game = resolve_game(self.request, game_id)
-        return game.current_phase
+        # The order views read the phase's options; load them in the same query.
+        return game.phases.with_options().order_by("ordinal", "id").last()
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -10,6 +10,7 @@ from django.utils import timezone
 from rest_framework.test import APIClient
 
 from adjudicator import service as adjudication_service
+from adjudicator.compiled import clear_compiled_variants
 from channel.models import Channel, ChannelMember, ChannelMessage
 from common.constants import (
     DeadlineMode,
@@ -66,6 +67,16 @@ def override_test_settings():
         yield
 
 
+@pytest.fixture(autouse=True)
+def clear_compiled_variant_cache():
+    # Tests edit provinces inside rolled-back transactions without touching
+    # the Variant row, so the process-wide compiled-variant cache must not
+    # leak between them.
+    clear_compiled_variants()
+    yield
+    clear_compiled_variants()
+
+
 # ---------------------------------------------------------------------------
 # Users and API clients
 # ---------------------------------------------------------------------------
@@ -648,6 +659,24 @@ def phase_factory(db, classical_variant, primary_user):
     return _create
 
 
+@pytest.fixture
+def classical_opening_phase(classical_variant, primary_user):
+    """A Spring 1901 Movement phase of a new classical game with every
+    nation's starting units and supply centers, for the benchmarks."""
+    from adjudicator.test_service import setup_classical_opening
+
+    game = Game.objects.create(variant=classical_variant, name="Benchmark Game", status=GameStatus.ACTIVE)
+    members_by_nation = {
+        nation.name: Member.objects.create(nation=nation, user=primary_user, game=game)
+        for nation in classical_variant.nations.all()
+    }
+    phase = Phase.objects.create(
+        game=game, variant=classical_variant, season="Spring", year=1901, type="Movement", ordinal=1
+    )
+    setup_classical_opening(phase, members_by_nation)
+    return phase
+
+
 @pytest.fixture
 def member_factory(db):
     def _create(game=None, user=None, nation=None, eliminated=False, kicked=False, **kwargs):
@@ -1,9 +1,8 @@
 import django_filters
-from django.db.models import Count, Exists, F, OuterRef, Q, Subquery
+from django.db.models import Case, Count, Exists, F, OuterRef, Q, When
 
 from common.constants import Commitment, CommitmentRequirement, GameStatus, MovementPhaseDuration, PhaseStatus
 from member.models import Member
-from phase.models import Phase
 
 from .models import Game
 
@@ -72,12 +71,11 @@ class GameFilter(django_filters.FilterSet):
                 slots_remaining=F("nation_count") - F("member_count"),
             ).order_by("slots_remaining", "-created_at")
         if value == "deadline":
-            next_deadline = (
-                Phase.objects.filter(game=OuterRef("pk"), status=PhaseStatus.ACTIVE)
-                .order_by("-ordinal")
-                .values("scheduled_resolution")[:1]
+            # Only the head phase is ever live, so its deadline is the game's.
+            next_deadline = Case(
+                When(head_phase__status=PhaseStatus.ACTIVE, then=F("head_phase__scheduled_resolution")),
             )
-            qs = queryset.annotate(next_deadline=Subquery(next_deadline))
+            qs = queryset.annotate(next_deadline=next_deadline)
             if self.request.user.is_authenticated:
                 user_eliminated = Exists(
                     Member.objects.filter(
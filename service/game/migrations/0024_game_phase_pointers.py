@@ -0,0 +1,54 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_phase_pointers(apps, schema_editor):
+    Game = apps.get_model("game", "Game")
+    Phase = apps.get_model("phase", "Phase")
+    head_phase = Phase.objects.filter(game=OuterRef("pk")).order_by("-ordinal", "-id").values("id")[:1]
+    latest_completed_phase = (
+        Phase.objects.filter(game=OuterRef("pk"), status="completed")
+        .order_by("-ordinal", "-id")
+        .values("id")[:1]
+    )
+    Game.objects.update(
+        head_phase=Subquery(head_phase),
+        latest_completed_phase=Subquery(latest_completed_phase),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0023_backfill_commitment_requirement"),
+        ("phase", "0020_phase_options_side_table"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="head_phase",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="phase.phase",
+            ),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="latest_completed_phase",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="phase.phase",
+            ),
+        ),
+        migrations.RunPython(backfill_phase_pointers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,123 @@
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def _order_status(confirmed, possible, order_count, deadline_mode):
+    if confirmed:
+        return "orders_submitted"
+    if not possible:
+        return "no_orders_required"
+    if order_count == 0:
+        return "orders_required"
+    if deadline_mode == "fixed_time":
+        return "orders_submitted"
+    return "orders_not_confirmed"
+
+
+def _commitment_eligibility(commitment, private, commitment_requirement):
+    if commitment == "low" and not private:
+        return "low_locked"
+    if commitment_requirement == "committed" and commitment != "high":
+        return "committed_locked"
+    return "eligible"
+
+
+def backfill_game_summaries(apps, schema_editor):
+    Game = apps.get_model("game", "Game")
+    GameSummary = apps.get_model("game", "GameSummary")
+    Member = apps.get_model("member", "Member")
+    PhaseState = apps.get_model("phase", "PhaseState")
+
+    for game in Game.objects.filter(sandbox=False).iterator():
+        civil_disorder = {}
+        commitment = {}
+        members = Member.objects.filter(game=game, replaced_by__isnull=True, user__isnull=False).order_by("id")
+        for user_id, in_civil_disorder, user_commitment in members.values_list(
+            "user_id", "civil_disorder", "user__profile__commitment"
+        ):
+            civil_disorder.setdefault(user_id, in_civil_disorder)
+            commitment.setdefault(user_id, user_commitment)
+        if not civil_disorder:
+            continue
+
+        phase_confirmed = set()
+        order_status = {}
+        nmr = {}
+        states = (
+            PhaseState.objects.filter(phase_id__in=[game.head_phase_id, game.latest_completed_phase_id])
+            .annotate(order_count=Count("orders"))
+            .order_by("id")
+            .values_list(
+                "member__user_id",
+                "phase_id",
+                "orders_confirmed",
+                "has_possible_orders",
+                "orders_outcome",
+                "order_count",
+            )
+        )
+        for user_id, phase_id, confirmed, possible, outcome, order_count in states:
+            if phase_id == game.head_phase_id:
+                if confirmed:
+                    phase_confirmed.add(user_id)
+                order_status.setdefault(user_id, _order_status(confirmed, possible, order_count, game.deadline_mode))
+            if phase_id == game.latest_completed_phase_id:
+                nmr.setdefault(user_id, outcome == "nmr")
+
+        GameSummary.objects.bulk_create(
+            [
+                GameSummary(
+                    user_id=user_id,
+                    game=game,
+                    phase_confirmed=user_id in phase_confirmed,
+                    order_status=order_status.get(user_id),
+                    member_status=(["civil_disorder"] if civil_disorder[user_id] else [])
+                    + (["nmr"] if nmr.get(user_id) else []),
+                    can_join=False,
+                    can_leave=game.status == "pending",
+                    commitment_eligibility=_commitment_eligibility(
+                        commitment[user_id], game.private, game.commitment_requirement
+                    ),
+                )
+                for user_id in civil_disorder
+            ],
+            update_conflicts=True,
+            unique_fields=["user", "game"],
+            update_fields=[
+                "phase_confirmed",
+                "order_status",
+                "member_status",
+                "can_join",
+                "can_leave",
+                "commitment_eligibility",
+            ],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0026_game_created_at_id_index"),
+        ("member", "0007_member_seeking_replacement_replaced_by"),
+        ("phase", "0020_phase_options_side_table"),
+        ("user_profile", "0009_seed_bot_roster"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gamesummary",
+            name="can_join",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="gamesummary",
+            name="can_leave",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="gamesummary",
+            name="commitment_eligibility",
+            field=models.CharField(blank=True, max_length=20, null=True),
+        ),
+        migrations.RunPython(backfill_game_summaries, migrations.RunPython.noop),
+    ]
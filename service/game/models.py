@@ -1,4 +1,5 @@
 from datetime import timedelta
+import logging
 import random
 import re
 import uuid
@@ -8,11 +9,14 @@ from django.db import IntegrityError, models, transaction
 from django.utils import timezone
 from django.db.models import (
     Count,
+    Exists,
+    F,
     IntegerField,
     OuterRef,
     Prefetch,
     Q,
     Subquery,
+    Sum,
     Value,
 )
 from django.db.models.functions import Coalesce
@@ -38,14 +42,53 @@ from emit import emit
 from phase.models import Phase, PhaseState
 from phase.utils import calculate_next_fixed_deadline, FREQUENCY_INTERVALS
 from member.models import Member
+from order.models import Order
 from unit.models import Unit
 from supply_center.models import SupplyCenter
 from victory.models import Victory
-from channel.models import ChannelMember, ChannelMessage
+from channel.models import ChannelMember
+from user_profile.models import UserProfile
 from adjudicator import service as adjudication_service
 
+logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# Events after which a game's GameSummary rows are recomputed. Those sent
+# with an actor only touch the actor's row. Writers that change a summary
+# without one of these events, seating and unseating members among them,
+# call refresh_on_commit themselves; see GameSummary.
+GAME_SUMMARY_EVENTS = frozenset(
+    {
+        "phase_started",
+        "phase_state_confirmed",
+        "phase_state_unconfirmed",
+        "order_created",
+        "order_deleted",
+        "civil_disorder_recovery",
+        "member_replaced",
+    }
+)
+
+
+def order_status_for(orders_confirmed, has_possible_orders, order_count, deadline_mode):
+    if orders_confirmed:
+        return "orders_submitted"
+    if not has_possible_orders:
+        return "no_orders_required"
+    if order_count == 0:
+        return "orders_required"
+    if deadline_mode == DeadlineMode.FIXED_TIME:
+        return "orders_submitted"
+    return "orders_not_confirmed"
+
+
+def commitment_eligibility_for(commitment, private, commitment_requirement):
+    if commitment == Commitment.LOW and not private:
+        return CommitmentEligibility.LOW_LOCKED
+    if commitment_requirement == CommitmentRequirement.COMMITTED and commitment != Commitment.HIGH:
+        return CommitmentEligibility.COMMITTED_LOCKED
+    return CommitmentEligibility.ELIGIBLE
+
 
 class GameQuerySet(models.QuerySet):
 
@@ -54,32 +97,84 @@ class GameQuerySet(models.QuerySet):
             return self.annotate(
                 total_unread_message_count=Value(0, output_field=IntegerField())
             )
-        last_read_subquery = Subquery(
-            ChannelMember.objects.filter(
-                channel=OuterRef("channel"),
-                member__user=user,
-            ).values("last_read_at")[:1]
-        )
-        unread_count_subquery = (
-            ChannelMessage.objects.filter(
-                channel__game=OuterRef("pk"),
-                channel__member_channels__member__user=user,
-                created_at__gt=last_read_subquery,
-            )
-            .exclude(sender__user=user)
+        unread_total_subquery = (
+            ChannelMember.objects.filter(member__game=OuterRef("pk"), member__user=user)
             .order_by()
-            .values("channel__game")
-            .annotate(count=Count("id", distinct=True))
-            .values("count")
+            .values("member__game")
+            .annotate(total=Sum("unread_count"))
+            .values("total")
         )
         return self.annotate(
             total_unread_message_count=Coalesce(
-                Subquery(unread_count_subquery, output_field=IntegerField()),
+                Subquery(unread_total_subquery, output_field=IntegerField()),
                 Value(0),
             )
         )
 
-    def with_list_data(self):
+    def retrieve_version(self, user):
+        """The stamps, counts and unread total the retrieve payload of the
+        game in this queryset is rendered from, in one query, or None if
+        there is no such game. Writers that change those rows through
+        update() bump updated_at so the version moves with them."""
+
+        def latest(queryset, field="updated_at"):
+            return Subquery(queryset.order_by(f"-{field}").values(field)[:1])
+
+        def count(queryset, group):
+            return Coalesce(
+                Subquery(
+                    queryset.order_by().values(group).annotate(total=Count("id")).values("total"),
+                    output_field=IntegerField(),
+                ),
+                Value(0),
+            )
+
+        members = Member.objects.filter(game=OuterRef("pk"))
+        pointer_states = PhaseState.objects.filter(
+            Q(phase=OuterRef("head_phase")) | Q(phase=OuterRef("latest_completed_phase"))
+        )
+        head_orders = Order.objects.filter(phase_state__phase=OuterRef("head_phase"))
+        annotations = {
+            "head_phase_updated_at": F("head_phase__updated_at"),
+            "latest_completed_phase_updated_at": F("latest_completed_phase__updated_at"),
+            "phase_states_updated_at": latest(pointer_states),
+            "orders_updated_at": latest(head_orders),
+            "order_count": count(head_orders, "phase_state__phase"),
+            "members_updated_at": latest(members),
+            "member_count": count(members, "game"),
+            "profiles_updated_at": latest(members.filter(user__isnull=False), "user__profile__updated_at"),
+        }
+        if user.is_authenticated:
+            annotations["user_profile_updated_at"] = latest(UserProfile.objects.filter(user=user))
+        return (
+            self.with_total_unread_counts(user)
+            .annotate(**annotations)
+            .values_list(
+                "updated_at", "head_phase_id", "latest_completed_phase_id", "total_unread_message_count", *annotations
+            )
+            .first()
+        )
+
+    def refresh_phase_pointers(self):
+        """Point head_phase and latest_completed_phase at each game's
+        highest-ordinal phase and highest-ordinal completed phase, in one
+        UPDATE."""
+        head_phase = Phase.objects.filter(game=OuterRef("pk")).order_by("-ordinal", "-id").values("id")[:1]
+        latest_completed_phase = (
+            Phase.objects.filter(game=OuterRef("pk"), status=PhaseStatus.COMPLETED)
+            .order_by("-ordinal", "-id")
+            .values("id")[:1]
+        )
+        return self.update(
+            head_phase=Subquery(head_phase),
+            latest_completed_phase=Subquery(latest_completed_phase),
+            updated_at=timezone.now(),
+        )
+
+    def with_list_data(self, summaries_for=None):
+        """Pass summaries_for=user to attach the user's GameSummary rows as
+        user_summaries; the phase states the per-user fields are otherwise
+        computed from are then only loaded for games without one."""
         members_prefetch = Prefetch(
             "members",
             queryset=Member.objects.not_replaced().select_related("nation", "user__profile"),
@@ -90,33 +185,33 @@ class GameQuerySet(models.QuerySet):
             queryset=Member.objects.select_related("user__profile", "nation"),
         )
 
-        current_phase_ids = (
-            Phase.objects.order_by("game_id", "-ordinal", "-id")
-            .distinct("game_id")
-            .values("id")
-        )
-        latest_completed_phase_ids = (
-            Phase.objects.filter(status=PhaseStatus.COMPLETED)
-            .order_by("game_id", "-ordinal", "-id")
-            .distinct("game_id")
-            .values("id")
+        phase_states = PhaseState.objects.filter(
+            Q(phase__game__head_phase=F("phase")) | Q(phase__game__latest_completed_phase=F("phase"))
         )
+        summary_prefetches = []
+        if summaries_for is not None:
+            phase_states = phase_states.filter(
+                ~Exists(GameSummary.objects.filter(game=OuterRef("phase__game"), user=summaries_for))
+            )
+            summary_prefetches.append(
+                Prefetch(
+                    "summaries",
+                    queryset=GameSummary.objects.filter(user=summaries_for),
+                    to_attr="user_summaries",
+                )
+            )
         phase_states_prefetch = Prefetch(
             "phase_states",
-            queryset=PhaseState.objects.filter(
-                Q(phase__in=current_phase_ids) | Q(phase__in=latest_completed_phase_ids)
-            )
-            .select_related("member")
-            .annotate(order_count=Count("orders")),
+            queryset=phase_states.select_related("member").annotate(order_count=Count("orders")),
         )
         current_units_prefetch = Prefetch(
             "units",
-            queryset=Unit.objects.filter(phase__in=current_phase_ids)
+            queryset=Unit.objects.filter(phase__game__head_phase=F("phase"))
             .select_related("nation", "province"),
         )
         current_supply_centers_prefetch = Prefetch(
             "supply_centers",
-            queryset=SupplyCenter.objects.filter(phase__in=current_phase_ids)
+            queryset=SupplyCenter.objects.filter(phase__game__head_phase=F("phase"))
             .select_related("nation", "province"),
         )
         phases_prefetch = Prefetch(
@@ -142,9 +237,12 @@ class GameQuerySet(models.QuerySet):
             members_prefetch,
             victory_members_prefetch,
             phases_prefetch,
+            *summary_prefetches,
         )
 
     def with_retrieve_data(self):
+        """Loads only the current and latest completed phases, as
+        pointer_phases, with their states; Game.phase_ids() lists the rest."""
         members_prefetch = Prefetch(
             "members",
             queryset=Member.objects.not_replaced().select_related("nation__flag", "user__profile"),
@@ -155,35 +253,25 @@ class GameQuerySet(models.QuerySet):
             queryset=Member.objects.select_related("user__profile", "nation__flag")
         )
 
-        current_phase_ids = (
-            Phase.objects.order_by("game_id", "-ordinal", "-id")
-            .distinct("game_id")
-            .values("id")
-        )
-        latest_completed_phase_ids = (
-            Phase.objects.filter(status=PhaseStatus.COMPLETED)
-            .order_by("game_id", "-ordinal", "-id")
-            .distinct("game_id")
-            .values("id")
-        )
         phase_states_prefetch = Prefetch(
             "phase_states",
-            queryset=PhaseState.objects.filter(
-                Q(phase__in=current_phase_ids) | Q(phase__in=latest_completed_phase_ids)
-            ).select_related("member__user").annotate(
+            queryset=PhaseState.objects.select_related("member__user").annotate(
                 order_count=Count("orders")
             )
         )
 
-        phases_prefetch = Prefetch(
+        pointer_phases_prefetch = Prefetch(
             "phases",
-            queryset=Phase.objects.defer("options").prefetch_related(phase_states_prefetch)
+            queryset=Phase.objects.filter(
+                Q(game__head_phase=F("pk")) | Q(game__latest_completed_phase=F("pk"))
+            ).prefetch_related(phase_states_prefetch),
+            to_attr="pointer_phases",
         )
 
         return self.select_related("variant", "victory", "game_master__profile").prefetch_related(
             members_prefetch,
             victory_members_prefetch,
-            phases_prefetch,
+            pointer_phases_prefetch,
         )
 
     def with_related_data(self):
@@ -264,8 +352,8 @@ class GameManager(models.Manager):
     def with_total_unread_counts(self, user):
         return self.get_queryset().with_total_unread_counts(user)
 
-    def with_list_data(self):
-        return self.get_queryset().with_list_data()
+    def with_list_data(self, summaries_for=None):
+        return self.get_queryset().with_list_data(summaries_for=summaries_for)
 
     def with_retrieve_data(self):
         return self.get_queryset().with_retrieve_data()
@@ -273,6 +361,9 @@ class GameManager(models.Manager):
     def with_related_data(self):
         return self.get_queryset().with_related_data()
 
+    def refresh_phase_pointers(self):
+        return self.get_queryset().refresh_phase_pointers()
+
     def create_from_template(self, variant, **kwargs):
         template_phase = variant.template_phase
         game = self.create(variant=variant, **kwargs)
@@ -475,6 +566,25 @@ class Game(BaseModel):
         null=True,
         blank=True,
     )
+    # Denormalised so listings join straight to the phases they show
+    # instead of scanning every game's phases. Written only by
+    # refresh_phase_pointers(); current_phase still reads the phases.
+    head_phase = models.ForeignKey(
+        "phase.Phase",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
+    latest_completed_phase = models.ForeignKey(
+        "phase.Phase",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
 
     def save(self, *args, **kwargs):
         if self.id:
@@ -492,6 +602,9 @@ class Game(BaseModel):
             self.id = self._suffixed_id(base_id)
             super().save(*args, **kwargs)
 
+    def refresh_phase_pointers(self):
+        Game.objects.filter(pk=self.pk).refresh_phase_pointers()
+
     def _generate_base_id(self):
         base_id = re.sub(r"[^a-z0-9]+", "-", self.name.lower())
         return re.sub(r"^-+|-+$", "", base_id)
@@ -512,12 +625,21 @@ class Game(BaseModel):
             if hasattr(self, "active_phases_list"):
                 return self.active_phases_list[-1] if self.active_phases_list else None
 
+            # The head phase sorts last of the two with_retrieve_data loads.
+            if hasattr(self, "pointer_phases"):
+                return self.pointer_phases[-1] if self.pointer_phases else None
+
             if "phases" in getattr(self, "_prefetched_objects_cache", {}):
                 phases = list(self.phases.all())
                 return phases[-1] if phases else None
 
             return self.phases.order_by("ordinal", "id").last()
 
+    def phase_ids(self):
+        if "phases" in getattr(self, "_prefetched_objects_cache", {}):
+            return [phase.id for phase in self.phases.all()]
+        return list(self.phases.values_list("id", flat=True))
+
     @property
     def movement_phase_duration_seconds(self):
         return duration_to_seconds(self.movement_phase_duration)
@@ -598,15 +720,7 @@ class Game(BaseModel):
     def commitment_eligibility(self, user):
         if not user.is_authenticated:
             return None
-        commitment = user.profile.commitment
-        if commitment == Commitment.LOW and not self.private:
-            return CommitmentEligibility.LOW_LOCKED
-        if (
-            self.commitment_requirement == CommitmentRequirement.COMMITTED
-            and commitment != Commitment.HIGH
-        ):
-            return CommitmentEligibility.COMMITTED_LOCKED
-        return CommitmentEligibility.ELIGIBLE
+        return commitment_eligibility_for(user.profile.commitment, self.private, self.commitment_requirement)
 
     def can_leave(self, user):
         with tracer.start_as_current_span("game.models.can_leave"):
@@ -642,6 +756,7 @@ class Game(BaseModel):
     def seat(self, user):
         member = self.members.create(user=user)
         self.get_public_press().member_channels.create(member=member)
+        GameSummary.objects.refresh_on_commit(self, user_ids=[user.id])
         return member
 
     def reassign_admin(self):
@@ -655,7 +770,7 @@ class Game(BaseModel):
 
             new_admin = random.choice(candidates).user
             self.admin = new_admin
-            self.save(update_fields=["admin"])
+            self.save(update_fields=["admin", "updated_at"])
 
             emit("game_admin_reassigned", game=self)
 
@@ -753,21 +868,26 @@ class Game(BaseModel):
 
             self.status = GameStatus.ACTIVE
             self.started_at = timezone.now()
-            self.save()
+            self.save(update_fields=["status", "started_at", "updated_at"])
 
             emit("game_start", game=self)
             emit("phase_started", phase=current_phase)
 
     def finish(self, status):
         with transaction.atomic():
+            # Resolution finishes the game through an instance loaded
+            # before the new phase; its pointers are stale.
             self.status = status
             self.finished_at = timezone.now()
-            self.save()
+            self.save(update_fields=["status", "finished_at", "updated_at"])
 
             for phase in self.phases.exclude(status=PhaseStatus.COMPLETED):
                 phase.status = PhaseStatus.COMPLETED
                 phase.scheduled_resolution = None
+                phase.options = {}
                 phase.save()
+            self.refresh_phase_pointers()
+            GameSummary.objects.refresh_on_commit(self)
 
     def emit_game_ended(self):
         try:
@@ -796,7 +916,7 @@ class Game(BaseModel):
         if self.is_paused:
             raise ValueError("Game is already paused")
         self.paused_at = timezone.now()
-        self.save()
+        self.save(update_fields=["paused_at", "updated_at"])
 
     @transaction.atomic
     def unpause(self):
@@ -813,7 +933,7 @@ class Game(BaseModel):
             current_phase.save()
 
         self.paused_at = None
-        self.save()
+        self.save(update_fields=["paused_at", "updated_at"])
 
     def delete_if_empty_pending(self):
         human_members = self.members.exclude(user__profile__kind__in=UserKind.BOT_KINDS)
@@ -843,4 +963,166 @@ class Game(BaseModel):
         indexes = [
             models.Index(fields=["status"]),
             models.Index(fields=["variant"]),
+            models.Index(fields=["created_at", "id"]),
+        ]
+
+
+class GameSummaryManager(models.Manager):
+
+    def refresh_from_event(self, event_type, context):
+        if event_type not in GAME_SUMMARY_EVENTS or context.game is None:
+            return
+        user_ids = [context.actor.id] if context.actor is not None else None
+        self.refresh_on_commit(context.game, user_ids=user_ids)
+
+    def refresh_on_commit(self, game, user_ids=None):
+        """refresh_for_game once the current transaction commits, so the
+        writer's transaction does not carry the refresh and the refresh
+        sees everything it wrote. Sandbox games get no summaries."""
+        if game.sandbox:
+            return
+
+        def _refresh():
+            try:
+                self.refresh_for_game(game, user_ids=user_ids)
+            except Exception:
+                # The writer has committed; rebuild the rows in a job that
+                # retries rather than leave them stale.
+                logger.error("Failed to refresh game summaries for game %s", game.id, exc_info=True)
+                from game.tasks import refresh_game_summaries
+
+                refresh_game_summaries.defer(game_id=game.id, user_ids=user_ids)
+
+        transaction.on_commit(_refresh)
+
+    def refresh_commitment_eligibility(self, user):
+        """Rewrite commitment_eligibility on the user's rows after their
+        commitment changes."""
+        commitment = user.profile.commitment
+        summaries = list(self.filter(user=user).select_related("game"))
+        for summary in summaries:
+            summary.commitment_eligibility = commitment_eligibility_for(
+                commitment, summary.game.private, summary.game.commitment_requirement
+            )
+        self.bulk_update(summaries, ["commitment_eligibility"])
+
+    def refresh_for_game(self, game, user_ids=None):
+        """Recompute the summaries of the game's members, or of user_ids
+        only, from the head and latest completed phases, and drop those of
+        users no longer playing."""
+        with tracer.start_as_current_span("game.models.refresh_summaries") as span:
+            span.set_attribute("game.id", game.id)
+            members = Member.objects.not_replaced().filter(game=game, user__isnull=False)
+            phase_states = PhaseState.objects.filter(phase__game=game).filter(
+                Q(phase__game__head_phase=F("phase")) | Q(phase__game__latest_completed_phase=F("phase"))
+            )
+            if user_ids is not None:
+                members = members.filter(user_id__in=user_ids)
+                phase_states = phase_states.filter(member__user_id__in=user_ids)
+
+            civil_disorder = {}
+            commitment = {}
+            for user_id, in_civil_disorder, user_commitment in members.order_by("id").values_list(
+                "user_id", "civil_disorder", "user__profile__commitment"
+            ):
+                civil_disorder.setdefault(user_id, in_civil_disorder)
+                commitment.setdefault(user_id, user_commitment)
+
+            phase_confirmed = set()
+            order_status = {}
+            nmr = {}
+            rows = (
+                phase_states.annotate(order_count=Count("orders"))
+                .order_by("id")
+                .values_list(
+                    "member__user_id",
+                    "phase_id",
+                    "phase__game__head_phase",
+                    "phase__game__latest_completed_phase",
+                    "orders_confirmed",
+                    "has_possible_orders",
+                    "orders_outcome",
+                    "order_count",
+                )
+            )
+            for user_id, phase_id, head_id, completed_id, confirmed, possible, outcome, order_count in rows:
+                if phase_id == head_id:
+                    if confirmed:
+                        phase_confirmed.add(user_id)
+                    order_status.setdefault(
+                        user_id, order_status_for(confirmed, possible, order_count, game.deadline_mode)
+                    )
+                if phase_id == completed_id:
+                    nmr.setdefault(user_id, outcome == PhaseState.OrdersOutcome.NMR)
+
+            summaries = [
+                self.model(
+                    user_id=user_id,
+                    game=game,
+                    phase_confirmed=user_id in phase_confirmed,
+                    order_status=order_status.get(user_id),
+                    member_status=(["civil_disorder"] if civil_disorder[user_id] else [])
+                    + (["nmr"] if nmr.get(user_id) else []),
+                    # Rows are only written for members, who cannot join.
+                    can_join=False,
+                    can_leave=game.status == GameStatus.PENDING,
+                    commitment_eligibility=commitment_eligibility_for(
+                        commitment[user_id], game.private, game.commitment_requirement
+                    ),
+                )
+                for user_id in civil_disorder
+            ]
+            if summaries:
+                self.bulk_create(
+                    summaries,
+                    update_conflicts=True,
+                    unique_fields=["user", "game"],
+                    update_fields=[
+                        "phase_confirmed",
+                        "order_status",
+                        "member_status",
+                        "can_join",
+                        "can_leave",
+                        "commitment_eligibility",
+                        "updated_at",
+                    ],
+                )
+
+            stale = self.filter(game=game).exclude(user_id__in=list(civil_disorder))
+            if user_ids is not None:
+                departed = set(user_ids) - set(civil_disorder)
+                if not departed:
+                    return
+                stale = stale.filter(user_id__in=departed)
+            stale.delete()
+
+
+class GameSummary(BaseModel):
+    """One member's view of one game in the game list: the fields that
+    depend on the user's own phase states, membership and commitment, kept
+    current by the events in GAME_SUMMARY_EVENTS so the "mine" list need
+    not walk them. Games with no row, sandbox games among them, fall back
+    to computing them. Migration 0027 wrote the rows of existing games.
+
+    Writers outside those events refresh explicitly: Game.seat, leaving and
+    kicking, Game.finish, agent.replan and recompute_commitment. Bots
+    submit and confirm orders through the API, so they send the same
+    events players do. The civil disorder flags set while a phase resolves
+    are read by the refresh of the phase_started (or Game.finish) that ends
+    the same resolution."""
+
+    objects = GameSummaryManager()
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="game_summaries")
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="summaries")
+    phase_confirmed = models.BooleanField(default=False)
+    order_status = models.CharField(max_length=30, null=True, blank=True)
+    member_status = models.JSONField(default=list)
+    can_join = models.BooleanField(default=False)
+    can_leave = models.BooleanField(default=False)
+    commitment_eligibility = models.CharField(max_length=20, null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "game"], name="unique_game_summary_per_user"),
         ]
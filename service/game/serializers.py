@@ -2,7 +2,7 @@ from zoneinfo import ZoneInfo
 
 from rest_framework import serializers
 from django.db import transaction
-from django.db.models import Subquery, OuterRef
+from django.db.models import Sum
 from django.apps import apps
 from drf_spectacular.utils import extend_schema_field
 from opentelemetry import trace
@@ -15,14 +15,19 @@ from emit import emit
 from victory.serializers import VictorySerializer
 from variant.models import Variant
 from member.models import Member
-from .models import Game
+from .models import Game, order_status_for
 
 ChannelMember = apps.get_model("channel", "ChannelMember")
-ChannelMessage = apps.get_model("channel", "ChannelMessage")
 
 tracer = trace.get_tracer(__name__)
 
 
+def _user_summary(obj):
+    # GameSummary rows are attached by with_list_data(summaries_for=user).
+    summaries = getattr(obj, "user_summaries", None)
+    return summaries[0] if summaries else None
+
+
 def _phase_state_order_count(phase_state):
     count = getattr(phase_state, "order_count", None)
     if count is None:
@@ -115,6 +120,9 @@ class GameListSerializer(serializers.Serializer):
             user = self.context["request"].user
             if not user.is_authenticated:
                 return False
+            summary = _user_summary(obj)
+            if summary is not None:
+                return summary.can_join
             return obj.can_join(user)
 
     @extend_schema_field(serializers.BooleanField)
@@ -123,6 +131,9 @@ class GameListSerializer(serializers.Serializer):
             user = self.context["request"].user
             if not user.is_authenticated:
                 return False
+            summary = _user_summary(obj)
+            if summary is not None:
+                return summary.can_leave
             return obj.can_leave(user)
 
     @extend_schema_field(serializers.BooleanField)
@@ -148,6 +159,9 @@ class GameListSerializer(serializers.Serializer):
         allow_null=True,
     ))
     def get_commitment_eligibility(self, obj):
+        summary = _user_summary(obj)
+        if summary is not None:
+            return summary.commitment_eligibility
         return obj.commitment_eligibility(self.context["request"].user)
 
     @extend_schema_field(serializers.ListField(child=serializers.IntegerField()))
@@ -170,6 +184,9 @@ class GameListSerializer(serializers.Serializer):
             user = self.context["request"].user
             if not user.is_authenticated:
                 return False
+            summary = _user_summary(obj)
+            if summary is not None:
+                return summary.phase_confirmed
             return obj.phase_confirmed(user)
 
     @extend_schema_field(serializers.ChoiceField(
@@ -182,20 +199,20 @@ class GameListSerializer(serializers.Serializer):
         user = self.context["request"].user
         if not user.is_authenticated or obj.status != "active":
             return None
+        summary = _user_summary(obj)
+        if summary is not None:
+            return summary.order_status
         current_phase = obj.current_phase
         if current_phase is None:
             return None
         for phase_state in current_phase.phase_states.all():
             if phase_state.member.user_id == user.id:
-                if phase_state.orders_confirmed:
-                    return "orders_submitted"
-                if not phase_state.has_possible_orders:
-                    return "no_orders_required"
-                if _phase_state_order_count(phase_state) == 0:
-                    return "orders_required"
-                if obj.deadline_mode == DeadlineMode.FIXED_TIME:
-                    return "orders_submitted"
-                return "orders_not_confirmed"
+                return order_status_for(
+                    phase_state.orders_confirmed,
+                    phase_state.has_possible_orders,
+                    _phase_state_order_count(phase_state),
+                    obj.deadline_mode,
+                )
         return None
 
     @extend_schema_field(serializers.ListField(
@@ -208,6 +225,9 @@ class GameListSerializer(serializers.Serializer):
         user = self.context["request"].user
         if not user.is_authenticated:
             return []
+        summary = _user_summary(obj)
+        if summary is not None:
+            return summary.member_status
         current_member = next(
             (m for m in obj.members.all() if m.user_id == user.id), None
         )
@@ -289,21 +309,10 @@ class GameRetrieveSerializer(serializers.Serializer):
         user = self.context["request"].user
         if not user.is_authenticated:
             return 0
-        return (
-            ChannelMessage.objects.filter(
-                channel__game=obj,
-                channel__member_channels__member__user=user,
-                created_at__gt=Subquery(
-                    ChannelMember.objects.filter(
-                        channel=OuterRef("channel"),
-                        member__user=user,
-                    ).values("last_read_at")[:1]
-                ),
-            )
-            .exclude(sender__user=user)
-            .distinct()
-            .count()
-        )
+        total = ChannelMember.objects.filter(member__game=obj, member__user=user).aggregate(
+            total=Sum("unread_count")
+        )["total"]
+        return total or 0
 
     @extend_schema_field(serializers.BooleanField)
     def get_can_join(self, obj):
@@ -337,7 +346,7 @@ class GameRetrieveSerializer(serializers.Serializer):
 
     @extend_schema_field(serializers.ListField(child=serializers.IntegerField()))
     def get_phases(self, obj):
-        return [phase.id for phase in obj.phases.all()]
+        return obj.phase_ids()
 
     @extend_schema_field(serializers.IntegerField(allow_null=True))
     def get_current_phase_id(self, obj):
@@ -367,15 +376,12 @@ class GameRetrieveSerializer(serializers.Serializer):
             return None
         for phase_state in current_phase.phase_states.all():
             if phase_state.member.user_id == user.id:
-                if phase_state.orders_confirmed:
-                    return "orders_submitted"
-                if not phase_state.has_possible_orders:
-                    return "no_orders_required"
-                if _phase_state_order_count(phase_state) == 0:
-                    return "orders_required"
-                if obj.deadline_mode == DeadlineMode.FIXED_TIME:
-                    return "orders_submitted"
-                return "orders_not_confirmed"
+                return order_status_for(
+                    phase_state.orders_confirmed,
+                    phase_state.has_possible_orders,
+                    _phase_state_order_count(phase_state),
+                    obj.deadline_mode,
+                )
         return None
 
     @extend_schema_field(serializers.ListField(
@@ -396,7 +402,9 @@ class GameRetrieveSerializer(serializers.Serializer):
         statuses = []
         if current_member.civil_disorder:
             statuses.append("civil_disorder")
-        phases = list(obj.phases.all())
+        phases = getattr(obj, "pointer_phases", None)
+        if phases is None:
+            phases = list(obj.phases.all())
         completed_phases = [p for p in phases if p.status == "completed"]
         if completed_phases:
             prev_phase = max(completed_phases, key=lambda p: p.ordinal)
@@ -4,7 +4,7 @@ from datetime import timedelta
 from django.utils import timezone
 from procrastinate.contrib.django import app
 
-from game.models import Game
+from game.models import Game, GameSummary
 
 logger = logging.getLogger(__name__)
 
@@ -20,3 +20,11 @@ def purge_stale_sandbox_games(timestamp: int):
     if count:
         stale.delete()
         logger.info(f"Purged {count} sandbox games idle for more than {SANDBOX_RETENTION_DAYS}d")
+
+
+@app.task(name="game.refresh_game_summaries", retry=3)
+def refresh_game_summaries(game_id, user_ids=None):
+    game = Game.objects.filter(id=game_id).first()
+    if game is None:
+        return
+    GameSummary.objects.refresh_for_game(game, user_ids=user_ids)
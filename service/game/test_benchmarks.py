@@ -0,0 +1,82 @@
+"""Game list latency benchmarks.
+
+These build tens of thousands of games, time real queries and print
+their numbers, so they are excluded from the default run (see
+pyproject.toml). Invoke explicitly when measuring:
+
+    pytest game/test_benchmarks.py -s
+"""
+import time
+
+import pytest
+from django.db import connection
+from django.db.models import F, Q
+from django.urls import reverse
+
+from adjudicator.benchmark import median_ms
+from common.constants import GameStatus, PhaseStatus
+from game.models import Game
+from phase.models import Phase, PhaseState
+
+
+@pytest.mark.django_db
+def test_game_list_latency_phase_pointers_vs_distinct_on(classical_variant, unauthenticated_client):
+    """GET /games/ over 50k games of 100 phases each. The legacy column
+    times the phase-state prefetch the list used to run, picking each
+    game's current and latest completed phase with DISTINCT ON over every
+    phase; the pointer column joins to Game.head_phase and
+    Game.latest_completed_phase instead."""
+    game_count, phases_per_game, batch = 50_000, 100, 500
+    for start in range(0, game_count, batch):
+        games = Game.objects.bulk_create(
+            Game(id=f"list-benchmark-{number}", variant=classical_variant, name=f"List Benchmark {number}",
+                 status=GameStatus.ACTIVE)
+            for number in range(start, start + batch)
+        )
+        Phase.objects.bulk_create(
+            Phase(
+                game=game, variant=classical_variant, season="Spring", year=1900 + ordinal, type="Movement",
+                status=PhaseStatus.ACTIVE if ordinal == phases_per_game else PhaseStatus.COMPLETED,
+                ordinal=ordinal,
+            )
+            for game in games
+            for ordinal in range(1, phases_per_game + 1)
+        )
+    started = time.perf_counter()
+    Game.objects.refresh_phase_pointers()
+    backfill_s = time.perf_counter() - started
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    page_ids = list(Game.objects.order_by("-created_at").values_list("id", flat=True)[:20])
+
+    def legacy_prefetch():
+        latest = Phase.objects.order_by("game_id", "-ordinal", "-id").distinct("game_id").values("id")
+        latest_completed = (
+            Phase.objects.filter(status=PhaseStatus.COMPLETED)
+            .order_by("game_id", "-ordinal", "-id")
+            .distinct("game_id")
+            .values("id")
+        )
+        return list(
+            PhaseState.objects.filter(phase__game__in=page_ids)
+            .filter(Q(phase__in=latest) | Q(phase__in=latest_completed))
+        )
+
+    def pointer_prefetch():
+        return list(
+            PhaseState.objects.filter(phase__game__in=page_ids).filter(
+                Q(phase__game__head_phase=F("phase")) | Q(phase__game__latest_completed_phase=F("phase"))
+            )
+        )
+
+    legacy = median_ms(legacy_prefetch)
+    pointers = median_ms(pointer_prefetch)
+    request = median_ms(lambda: unauthenticated_client.get(reverse("game-list")))
+
+    print(
+        f"\n{game_count} games x {phases_per_game} phases: pointer backfill {backfill_s:.1f} s; "
+        f"phase-state prefetch DISTINCT ON {legacy:.1f} ms, pointers {pointers:.1f} ms "
+        f"({legacy / pointers:.0f}x); GET /games/ {request:.1f} ms"
+    )
+    assert pointers < legacy
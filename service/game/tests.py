@@ -1,5 +1,6 @@
 import pytest
 from adjudicator import service as adjudication_service
+from agent.api_client import ApiClient
 from unittest.mock import patch
 from django.urls import reverse
 from django.test.utils import override_settings
@@ -15,7 +16,9 @@ from nation.models import Nation
 from province.models import Province
 from notification.models import Notification, NotificationDelivery
 from user_profile.models import UserProfile
-from .models import Game
+from emit import emit
+from emit.context import build_context
+from .models import Game, GameSummary
 
 retrieve_viewname = "game-retrieve"
 list_viewname = "game-list"
@@ -269,6 +272,92 @@ class TestGameRetrieveView:
 
         assert len(response.data["phases"]) == 2
 
+    @pytest.mark.django_db
+    def test_retrieve_loads_only_the_pointer_phases(self, authenticated_client, active_game_with_phase_state):
+        game = active_game_with_phase_state
+        first = game.current_phase
+        Phase.objects.filter(pk=first.pk).update(status=PhaseStatus.COMPLETED)
+        phases = [first] + [
+            game.phases.create(
+                variant=game.variant, season="Fall", year=1901 + ordinal, type="Movement",
+                status=PhaseStatus.ACTIVE if ordinal == 5 else PhaseStatus.COMPLETED, ordinal=ordinal,
+            )
+            for ordinal in range(2, 6)
+        ]
+
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            response = authenticated_client.get(reverse(retrieve_viewname, args=[game.id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["phases"] == [phase.id for phase in phases]
+        assert response.data["current_phase_id"] == phases[-1].id
+        phase_queries = [q["sql"] for q in connection.queries if 'FROM "phase_phase"' in q["sql"]]
+        assert any('"head_phase_id"' in sql for sql in phase_queries)
+        assert all('"unit_unit"' not in q["sql"] for q in connection.queries)
+
+    @pytest.mark.django_db
+    def test_retrieve_returns_304_until_the_game_changes(self, authenticated_client, active_game_with_phase_state):
+        game = active_game_with_phase_state
+        url = reverse(retrieve_viewname, args=[game.id])
+
+        first = authenticated_client.get(url)
+        etag = first["ETag"]
+        unchanged = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        authenticated_client.put(reverse("game-confirm-phase", args=[game.id]))
+        changed = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert first["Cache-Control"] == "private, no-cache"
+        assert unchanged.status_code == status.HTTP_304_NOT_MODIFIED
+        assert unchanged["ETag"] == etag
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.data["phase_confirmed"] is True
+        assert changed["ETag"] != etag
+
+    @pytest.mark.django_db
+    def test_304_is_answered_from_the_version_query_alone(self, authenticated_client, active_game_with_phase_state):
+        url = reverse(retrieve_viewname, args=[active_game_with_phase_state.id])
+        etag = authenticated_client.get(url)["ETag"]
+
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert len(connection.queries) == 1
+
+    @pytest.mark.django_db
+    def test_etag_changes_with_queryset_writers(self, authenticated_client, active_game_with_phase_state):
+        game = active_game_with_phase_state
+        url = reverse(retrieve_viewname, args=[game.id])
+        etag = authenticated_client.get(url)["ETag"]
+
+        game.refresh_phase_pointers()
+        after_pointers = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        Phase.objects._set_orders_outcome(game.current_phase)
+        after_outcome = authenticated_client.get(url, HTTP_IF_NONE_MATCH=after_pointers["ETag"])
+
+        assert after_pointers.status_code == status.HTTP_200_OK
+        assert after_outcome.status_code == status.HTTP_200_OK
+
+    @pytest.mark.django_db
+    def test_etag_changes_with_the_users_unread_count(
+        self, authenticated_client, active_game_with_phase_state, primary_user, secondary_user, classical_france_nation
+    ):
+        game = active_game_with_phase_state
+        sender = game.members.create(user=secondary_user, nation=classical_france_nation)
+        channel = game.channels.create(name="Private", private=True)
+        channel.member_channels.create(member=sender)
+        channel.member_channels.create(member=game.members.get(user=primary_user))
+        url = reverse(retrieve_viewname, args=[game.id])
+        etag = authenticated_client.get(url)["ETag"]
+
+        channel.messages.create(sender=sender, body="hello")
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["total_unread_message_count"] == 1
+
 
 class TestGameRetrieveViewQueryPerformance:
 
@@ -282,7 +371,7 @@ class TestGameRetrieveViewQueryPerformance:
 
         assert response.status_code == status.HTTP_200_OK
         query_count = len(connection.queries)
-        assert query_count == 4
+        assert query_count == 6
 
     @pytest.mark.django_db
     def test_retrieve_game_query_count_multiple_phases_with_units(
@@ -323,7 +412,7 @@ class TestGameRetrieveViewQueryPerformance:
 
         assert response.status_code == status.HTTP_200_OK
         query_count = len(connection.queries)
-        assert query_count == 4
+        assert query_count == 6
 
     @pytest.mark.django_db
     def test_retrieve_game_query_count_with_multiple_members(
@@ -392,7 +481,7 @@ class TestGameRetrieveViewQueryPerformance:
 
         assert response.status_code == status.HTTP_200_OK
         query_count = len(connection.queries)
-        assert query_count == 4
+        assert query_count == 6
 
 
 class TestGameCurrentPhase:
@@ -442,6 +531,300 @@ class TestGameCurrentPhase:
         assert base_active_game_for_primary_user.current_phase is None
 
 
+class TestGamePhasePointers:
+
+    def _pointers(self, game):
+        return Game.objects.values_list("head_phase_id", "latest_completed_phase_id").get(pk=game.pk)
+
+    def _create_phase(self, game, ordinal, status):
+        return game.phases.create(
+            variant=game.variant,
+            season="Fall",
+            year=1900 + ordinal,
+            type="Movement",
+            status=status,
+            ordinal=ordinal,
+        )
+
+    @pytest.mark.django_db
+    def test_creating_a_phase_moves_the_head(self, active_game_with_phase_state):
+        game = active_game_with_phase_state
+        first = game.current_phase
+        assert self._pointers(game) == (first.id, None)
+
+        completed = self._create_phase(game, 2, PhaseStatus.COMPLETED)
+        latest = self._create_phase(game, 3, PhaseStatus.ACTIVE)
+
+        assert self._pointers(game) == (latest.id, completed.id)
+
+    @pytest.mark.django_db
+    def test_pausing_a_stale_game_keeps_the_pointers(self, base_active_game_for_primary_user):
+        game = base_active_game_for_primary_user
+        stale = Game.objects.get(pk=game.pk)
+        phase = self._create_phase(game, 1, PhaseStatus.ACTIVE)
+
+        stale.pause()
+
+        assert self._pointers(game) == (phase.id, None)
+        assert Game.objects.get(pk=game.pk).paused_at is not None
+
+    @pytest.mark.django_db
+    def test_finish_points_latest_completed_at_the_head(self, active_game_with_phase_state):
+        game = active_game_with_phase_state
+        phase = game.current_phase
+
+        game.finish(GameStatus.COMPLETED)
+
+        assert self._pointers(game) == (phase.id, phase.id)
+
+    @pytest.mark.django_db
+    def test_revert_points_back_at_the_reverted_phase(self, active_game_with_phase_state):
+        game = active_game_with_phase_state
+        first = game.current_phase
+        first.status = PhaseStatus.COMPLETED
+        first.save()
+        second = self._create_phase(game, 2, PhaseStatus.COMPLETED)
+        self._create_phase(game, 3, PhaseStatus.ACTIVE)
+
+        second.revert_to_this_phase()
+
+        assert self._pointers(game) == (second.id, first.id)
+
+    @pytest.mark.django_db
+    def test_refresh_phase_pointers_backfills_every_game(self, active_game_with_phase_state):
+        game = active_game_with_phase_state
+        Game.objects.filter(pk=game.pk).update(head_phase=None, latest_completed_phase=None)
+
+        Game.objects.refresh_phase_pointers()
+
+        assert self._pointers(game) == (game.current_phase.id, None)
+
+    @pytest.mark.django_db
+    def test_list_joins_to_the_pointers_instead_of_scanning_phases(self, authenticated_client, active_game_with_phase_state):
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            response = authenticated_client.get(reverse(list_viewname), {"ordering": "deadline"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not any("DISTINCT ON" in query["sql"] for query in connection.queries)
+
+
+class TestGameSummary:
+
+    @pytest.fixture
+    def two_player_game(self, active_game_with_phase_state, secondary_user, classical_france_nation):
+        game = active_game_with_phase_state
+        member = game.members.create(user=secondary_user, nation=classical_france_nation)
+        game.current_phase.phase_states.create(member=member, has_possible_orders=True)
+        return game
+
+    def _summary(self, game, user):
+        return GameSummary.objects.get(game=game, user=user)
+
+    @pytest.mark.django_db
+    def test_phase_started_writes_a_summary_per_member(
+        self, two_player_game, primary_user, secondary_user, mock_immediate_on_commit
+    ):
+        game = two_player_game
+
+        emit("phase_started", phase=game.current_phase)
+
+        for user in (primary_user, secondary_user):
+            summary = self._summary(game, user)
+            assert summary.phase_confirmed is False
+            assert summary.order_status == "orders_required"
+            assert summary.member_status == []
+
+    @pytest.mark.django_db
+    def test_event_with_actor_refreshes_only_the_actors_summary(
+        self, two_player_game, primary_user, secondary_user, mock_immediate_on_commit
+    ):
+        game = two_player_game
+        GameSummary.objects.refresh_for_game(game)
+        game.current_phase.phase_states.update(orders_confirmed=True)
+
+        GameSummary.objects.refresh_from_event(
+            "phase_state_confirmed", build_context("phase_state_confirmed", phase=game.current_phase, actor=primary_user)
+        )
+
+        assert self._summary(game, primary_user).order_status == "orders_submitted"
+        assert self._summary(game, primary_user).phase_confirmed is True
+        assert self._summary(game, secondary_user).order_status == "orders_required"
+
+    @pytest.mark.django_db
+    def test_member_status_reads_latest_completed_phase_and_civil_disorder(
+        self, two_player_game, primary_user, secondary_user
+    ):
+        game = two_player_game
+        previous = game.current_phase
+        previous.phase_states.filter(member__user=primary_user).update(orders_outcome="nmr")
+        previous.status = PhaseStatus.COMPLETED
+        previous.save()
+        game.members.filter(user=secondary_user).update(civil_disorder=True)
+        game.phases.create(
+            variant=game.variant, season="Fall", year=1901, type="Movement", status=PhaseStatus.ACTIVE, ordinal=2
+        )
+
+        GameSummary.objects.refresh_for_game(game)
+
+        assert self._summary(game, primary_user).member_status == ["nmr"]
+        assert self._summary(game, secondary_user).member_status == ["civil_disorder"]
+        assert self._summary(game, primary_user).order_status is None
+
+    @pytest.mark.django_db
+    def test_refresh_drops_summaries_of_departed_users(self, two_player_game, secondary_user):
+        game = two_player_game
+        GameSummary.objects.refresh_for_game(game)
+        game.members.filter(user=secondary_user).delete()
+
+        GameSummary.objects.refresh_for_game(game, user_ids=[secondary_user.id])
+
+        assert not GameSummary.objects.filter(game=game, user=secondary_user).exists()
+
+    @pytest.mark.django_db
+    def test_confirming_orders_updates_the_summary(
+        self, authenticated_client, two_player_game, primary_user, mock_immediate_on_commit
+    ):
+        game = two_player_game
+        GameSummary.objects.refresh_for_game(game)
+
+        response = authenticated_client.put(reverse("game-confirm-phase", args=[game.id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self._summary(game, primary_user).phase_confirmed is True
+        assert self._summary(game, primary_user).order_status == "orders_submitted"
+
+    @pytest.mark.django_db
+    def test_refresh_waits_for_the_transaction_to_commit(self, two_player_game, primary_user):
+        game = two_player_game
+
+        emit("phase_started", phase=game.current_phase)
+
+        assert not GameSummary.objects.filter(game=game, user=primary_user).exists()
+
+    @pytest.mark.django_db
+    def test_bot_order_updates_the_summary(self, game_with_options, primary_user, bot_user, mock_immediate_on_commit):
+        game = game_with_options
+        game.members.filter(user=primary_user).update(user=bot_user)
+        game.current_phase.phase_states.filter(member__user=bot_user).update(has_possible_orders=True)
+        GameSummary.objects.refresh_for_game(game)
+        assert self._summary(game, bot_user).order_status == "orders_required"
+
+        ApiClient(bot_user).submit_orders(game.id, [["bud", "Move", "gal"]])
+
+        assert self._summary(game, bot_user).order_status == "orders_submitted"
+
+    @pytest.mark.django_db
+    def test_civil_disorder_transition_updates_the_summary(
+        self,
+        italy_vs_germany_phase_with_orders,
+        mock_adjudication_data_basic,
+        primary_user,
+        mock_immediate_on_commit,
+    ):
+        phase = italy_vs_germany_phase_with_orders
+        game = phase.game
+        phase.phase_states.update(has_possible_orders=True)
+        phase.phase_states.get(member__user=primary_user).orders.all().delete()
+        previous = game.phases.create(
+            variant=game.variant,
+            season="Fall",
+            year=1900,
+            type=PhaseType.MOVEMENT,
+            status=PhaseStatus.COMPLETED,
+            ordinal=0,
+        )
+        for member in game.members.all():
+            previous.phase_states.create(member=member, has_possible_orders=True)
+        Phase.objects._set_orders_outcome(previous)
+
+        with patch("phase.models.resolve", return_value=mock_adjudication_data_basic):
+            Phase.objects.resolve(phase)
+
+        assert "civil_disorder" in self._summary(game, primary_user).member_status
+
+    @pytest.mark.django_db
+    def test_seating_and_leaving_a_pending_game_maintain_the_summary(
+        self, mock_immediate_on_commit, authenticated_client_for_secondary_user, pending_game_created_by_primary_user,
+        primary_user, secondary_user,
+    ):
+        game = pending_game_created_by_primary_user
+        game.seat(secondary_user)
+
+        assert self._summary(game, primary_user).can_leave is True
+        assert self._summary(game, primary_user).can_join is False
+        assert self._summary(game, secondary_user).commitment_eligibility == "eligible"
+
+        response = authenticated_client_for_secondary_user.delete(reverse("game-leave", args=[game.id]))
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not GameSummary.objects.filter(game=game, user=secondary_user).exists()
+
+    @pytest.mark.django_db
+    def test_commitment_change_updates_the_eligibility(self, two_player_game, primary_user):
+        game = two_player_game
+        GameSummary.objects.refresh_for_game(game)
+        UserProfile.objects.filter(user=primary_user).update(commitment="low")
+        primary_user.profile.refresh_from_db()
+
+        GameSummary.objects.refresh_commitment_eligibility(primary_user)
+
+        assert self._summary(game, primary_user).commitment_eligibility == "low_locked"
+
+    @pytest.mark.django_db
+    def test_failed_refresh_queues_a_rebuild(self, two_player_game, in_memory_procrastinate, mock_immediate_on_commit):
+        game = two_player_game
+
+        with patch.object(GameSummary.objects, "refresh_for_game", side_effect=RuntimeError("boom")):
+            emit("phase_started", phase=game.current_phase)
+
+        jobs = [j for j in in_memory_procrastinate.jobs.values() if j["task_name"] == "game.refresh_game_summaries"]
+        assert [job["args"] for job in jobs] == [{"game_id": game.id, "user_ids": None}]
+
+    @pytest.mark.django_db
+    def test_sandbox_games_get_no_summary(self, sandbox_game_factory, mock_immediate_on_commit):
+        game = sandbox_game_factory()
+
+        emit("phase_started", phase=game.current_phase)
+
+        assert not GameSummary.objects.filter(game=game).exists()
+
+    @pytest.mark.django_db
+    def test_mine_list_serves_the_summary(
+        self, authenticated_client, two_player_game, primary_user
+    ):
+        game = two_player_game
+        GameSummary.objects.refresh_for_game(game)
+        GameSummary.objects.filter(game=game, user=primary_user).update(
+            phase_confirmed=True,
+            order_status="orders_submitted",
+            member_status=["nmr"],
+            can_leave=True,
+            commitment_eligibility="low_locked",
+        )
+
+        response = authenticated_client.get(reverse(list_viewname), {"mine": "true"})
+
+        assert response.status_code == status.HTTP_200_OK
+        data = next(item for item in response.data["results"] if item["id"] == game.id)
+        assert data["phase_confirmed"] is True
+        assert data["order_status"] == "orders_submitted"
+        assert data["member_status"] == ["nmr"]
+        assert data["can_leave"] is True
+        assert data["commitment_eligibility"] == "low_locked"
+
+    @pytest.mark.django_db
+    def test_list_without_mine_computes_the_fields(self, authenticated_client, two_player_game, primary_user):
+        game = two_player_game
+        GameSummary.objects.refresh_for_game(game)
+        GameSummary.objects.filter(game=game, user=primary_user).update(order_status="orders_submitted")
+
+        response = authenticated_client.get(reverse(list_viewname))
+
+        data = next(item for item in response.data["results"] if item["id"] == game.id)
+        assert data["order_status"] == "orders_required"
+
+
 class TestGameListView:
 
     @pytest.mark.django_db
@@ -735,6 +1118,62 @@ class TestGameListViewPagination:
         # max_page_size is 100, but only 5 games exist, so all are returned
         assert len(response.data["results"]) == 5
 
+    def _walk_cursor_pages(self, client, params):
+        response = client.get(reverse(list_viewname), {**params, "cursor": ""})
+        pages = []
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            assert "count" not in response.data
+            pages.append([g["id"] for g in response.data["results"]])
+            if response.data["next"] is None:
+                return pages
+            response = client.get(response.data["next"])
+
+    @pytest.mark.django_db
+    def test_list_games_cursor_pages_follow_created_order(self, authenticated_client, classical_variant, base_pending_phase):
+        for i in range(25):
+            game = Game.objects.create(name=f"Game {i}", variant=classical_variant, status=GameStatus.PENDING)
+            base_pending_phase(game)
+
+        pages = self._walk_cursor_pages(authenticated_client, {"page_size": 10})
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        expected = list(Game.objects.filter(sandbox=False).order_by("-created_at", "-id").values_list("id", flat=True))
+        assert sum(pages, []) == expected
+
+    @pytest.mark.django_db
+    def test_list_games_cursor_pages_follow_deadline_order(self, authenticated_client, classical_variant, base_pending_phase):
+        now = timezone.now()
+        for i in range(12):
+            game = Game.objects.create(name=f"Game {i}", variant=classical_variant, status=GameStatus.ACTIVE)
+            phase = base_pending_phase(game)
+            if i % 4:
+                # Shared deadlines and missing ones both have to page cleanly.
+                Phase.objects.filter(pk=phase.pk).update(
+                    status=PhaseStatus.ACTIVE, scheduled_resolution=now + timedelta(hours=i % 3)
+                )
+
+        pages = self._walk_cursor_pages(authenticated_client, {"ordering": "deadline", "page_size": 5})
+        full = authenticated_client.get(reverse(list_viewname), {"ordering": "deadline", "page_size": 100})
+
+        assert [len(page) for page in pages] == [5, 5, 2]
+        assert sum(pages, []) == [g["id"] for g in full.data["results"]]
+
+    @pytest.mark.django_db
+    def test_list_games_cursor_mode_skips_the_count_query(self, authenticated_client, pending_game_created_by_primary_user):
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            response = authenticated_client.get(reverse(list_viewname), {"cursor": ""})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [g["id"] for g in response.data["results"]] == [pending_game_created_by_primary_user.id]
+        assert not any("COUNT(*)" in query["sql"] for query in connection.queries)
+
+    @pytest.mark.django_db
+    def test_list_games_invalid_cursor_returns_404(self, authenticated_client):
+        response = authenticated_client.get(reverse(list_viewname), {"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
     @pytest.mark.django_db
     def test_list_games_filter_status_single(self, authenticated_client, classical_variant, base_pending_phase):
@@ -1295,8 +1734,8 @@ class TestGameListViewQueryPerformance:
 
         assert len(unit_queries) == 1
         assert len(supply_center_queries) == 1
-        assert "DISTINCT ON" in unit_queries[0]
-        assert "DISTINCT ON" in supply_center_queries[0]
+        assert "head_phase_id" in unit_queries[0]
+        assert "head_phase_id" in supply_center_queries[0]
 
     @pytest.mark.django_db
     def test_list_games_board_is_lean(
@@ -1982,7 +2421,7 @@ class TestGameCreateViewPerformance:
 
         assert response.status_code == status.HTTP_201_CREATED
         query_count = len(connection.queries)
-        assert query_count == 47
+        assert query_count == 48
 
     @pytest.mark.django_db
     def test_create_game_query_count_large_variant(self, authenticated_client, classical_variant):
@@ -2002,7 +2441,7 @@ class TestGameCreateViewPerformance:
 
         assert response.status_code == status.HTTP_201_CREATED
         query_count = len(connection.queries)
-        assert query_count == 47
+        assert query_count == 48
 
 
 class TestGamePrivateFiltering:
@@ -2438,7 +2877,7 @@ class TestSandboxGameCreateViewPerformance:
 
         assert response.status_code == status.HTTP_201_CREATED
         query_count = len(connection.queries)
-        assert query_count == 52
+        assert query_count == 54
 
     @pytest.mark.django_db
     def test_create_sandbox_game_query_count_large_variant(
@@ -2459,7 +2898,7 @@ class TestSandboxGameCreateViewPerformance:
 
         assert response.status_code == status.HTTP_201_CREATED
         query_count = len(connection.queries)
-        assert query_count == 52
+        assert query_count == 54
 
 
 class TestSandboxGameFiltering:
@@ -1,3 +1,7 @@
+import hashlib
+import json
+
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
@@ -6,6 +10,7 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter
 from opentelemetry import trace
 
 from common.constants import GameStatus
+from common.etag import if_none_match
 from .models import Game
 from .serializers import (
     GameCreateSerializer,
@@ -21,13 +26,19 @@ from .serializers import (
 from common.views import SelectedGameMixin
 from common.serializers import EmptySerializer
 from common.permissions import IsActiveGame, IsGameMember, IsGameManager, CanDeleteGame
-from common.pagination import StandardPageNumberPagination
+from common.pagination import KeysetPagination, StandardPageNumberPagination
 from emit import emit
 from .filters import GameFilter
 
 tracer = trace.get_tracer(__name__)
 
 
+def _game_retrieve_etag(version, user):
+    body = json.dumps([user.id, *version], default=str)
+    digest = hashlib.sha256(body.encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
 class GameRetrieveView(generics.RetrieveAPIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = GameRetrieveSerializer
@@ -40,6 +51,21 @@ class GameRetrieveView(generics.RetrieveAPIView):
         )
         return get_object_or_404(queryset, id=self.kwargs.get("game_id"))
 
+    def retrieve(self, request, *args, **kwargs):
+        # The version is read before the payload, so a write in between
+        # only costs the client one more full response.
+        version = Game.objects.filter(id=self.kwargs.get("game_id")).retrieve_version(request.user)
+        if version is None:
+            raise Http404
+        etag = _game_retrieve_etag(version, request.user)
+        if if_none_match(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(self.get_serializer(self.get_object()).data)
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
 
 class GameListView(generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
@@ -48,10 +74,20 @@ class GameListView(generics.ListAPIView):
     filter_backends = [DjangoFilterBackend]
     pagination_class = StandardPageNumberPagination
 
+    @property
+    def paginator(self):
+        # Passing ``cursor`` (empty for the first page) opts into keyset
+        # paging, which skips the COUNT and OFFSET of page-number paging.
+        if "_paginator" not in self.__dict__ and "cursor" in self.request.query_params:
+            self._paginator = KeysetPagination()
+        return super().paginator
+
     def get_queryset(self):
+        user = self.request.user
+        mine = user.is_authenticated and self.request.query_params.get("mine") in ("true", "True", "1")
         queryset = (
             Game.objects.all()
-            .with_list_data()
+            .with_list_data(summaries_for=user if mine else None)
             .with_total_unread_counts(self.request.user)
             .order_by("-created_at")
         )
@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from adjudicator.benchmark import DEFAULT_FIXTURES, benchmark_fixture, compare_to_baseline
+
+BASELINE_PATH = Path(__file__).resolve().parents[2] / "benchmarks" / "adjudicator.json"
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay integration fixtures through the adjudicator without the database and report "
+        "per-phase and per-game latency percentiles, peak memory and option counts. Compares "
+        "against a baseline recorded on this machine with --save-baseline and fails on a regression."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("fixtures", nargs="*", help="fixture file names (default: the standard replay set)")
+        parser.add_argument("--repeat", type=int, default=5, help="timed replays per fixture")
+        parser.add_argument("--baseline", default=str(BASELINE_PATH))
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.5,
+            help="fractional slowdown or memory growth allowed over the baseline",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="write this run's reports as the new baseline instead of comparing",
+        )
+        parser.add_argument("--json", action="store_true", help="print the reports as JSON")
+
+    def handle(self, *args, **options):
+        fixtures = options["fixtures"] or list(DEFAULT_FIXTURES)
+        reports = []
+        for fixture in fixtures:
+            try:
+                report = benchmark_fixture(fixture, options["repeat"])
+            except (FileNotFoundError, KeyError, ValueError) as e:
+                raise CommandError(f"Cannot replay {fixture}: {e}")
+            reports.append(report)
+            if not options["json"]:
+                self.stdout.write(self._summary(report))
+        if options["json"]:
+            self.stdout.write(json.dumps(reports, indent=2))
+
+        baseline_path = Path(options["baseline"])
+        if options["save_baseline"]:
+            existing = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+            existing.update({report["fixture"]: report for report in reports})
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(json.dumps(existing, indent=2, sort_keys=True) + "\n")
+            self.stdout.write(f"wrote {baseline_path}")
+            return
+
+        if not baseline_path.exists():
+            self.stdout.write(f"no baseline at {baseline_path}; run with --save-baseline to record one")
+            return
+        baseline = json.loads(baseline_path.read_text())
+        problems = []
+        for report in reports:
+            if report["fixture"] not in baseline:
+                self.stdout.write(f"{report['fixture']}: no baseline entry")
+                continue
+            problems += compare_to_baseline(report, baseline[report["fixture"]], options["tolerance"])
+        if problems:
+            raise CommandError("Adjudicator benchmark regressed:\n  " + "\n  ".join(problems))
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline"))
+
+    def _summary(self, report):
+        def percentiles(values):
+            return " ".join(f"{name} {value:.2f}" for name, value in values.items())
+
+        return (
+            f"{report['fixture']} ({report['variant']}, {report['phases']} phases, x{report['repeat']})\n"
+            f"  adjudicate ms/phase: {percentiles(report['adjudicate_ms'])}\n"
+            f"  options ms/phase:    {percentiles(report['options_ms'])}\n"
+            f"  game ms:             {percentiles(report['game_ms'])}\n"
+            f"  peak {report['peak_kib']} KiB, "
+            f"options {report['options']['total']} total, {report['options']['max_per_phase']} max/phase"
+        )
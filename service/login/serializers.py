@@ -58,7 +58,7 @@ class GoogleAuthSerializer(serializers.Serializer):
         )
         if not created:
             profile.picture = id_info.get("picture")
-            profile.save(update_fields=["picture"])
+            profile.save(update_fields=["picture", "updated_at"])
         refresh = RefreshToken.for_user(user)
         user.access_token = str(refresh.access_token)
         user.refresh_token = str(refresh)
@@ -89,7 +89,7 @@ class AppleAuthSerializer(serializers.Serializer):
         profile, profile_created = UserProfile.objects.get_or_create(user=user, defaults={"name": name})
         if not profile_created and (validated_data.get("first_name") or validated_data.get("last_name")):
             profile.name = name
-            profile.save(update_fields=["name"])
+            profile.save(update_fields=["name", "updated_at"])
         refresh = RefreshToken.for_user(user)
         user.access_token = str(refresh.access_token)
         user.refresh_token = str(refresh)
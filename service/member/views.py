@@ -2,8 +2,10 @@ from rest_framework import permissions, generics, status
 from rest_framework.response import Response
 from django.db import transaction
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema
 
+from game.models import GameSummary
 from .models import Member
 from .serializers import MemberCreateSerializer, MemberJoinSerializer, MemberSerializer
 from common.serializers import EmptySerializer
@@ -55,6 +57,7 @@ class MemberDeleteView(SelectedGameMixin, generics.DestroyAPIView):
             if user_id == game.admin_id:
                 game.reassign_admin()
             game.delete_if_empty_pending()
+            GameSummary.objects.refresh_on_commit(game, user_ids=[user_id])
 
 
 class MemberKickView(SelectedGameMixin, generics.DestroyAPIView):
@@ -74,6 +77,8 @@ class MemberKickView(SelectedGameMixin, generics.DestroyAPIView):
         is_bot = instance.user is not None and instance.user.profile.is_bot
         with transaction.atomic():
             instance.delete()
+            if user_id:
+                GameSummary.objects.refresh_on_commit(game, user_ids=[user_id])
             if user_id and not is_bot:
                 emit("kicked_from_staging", game=game, recipients=[user_id])
 
@@ -94,12 +99,12 @@ class CivilDisorderRecoveryView(SelectedGameMixin, generics.GenericAPIView):
 
         with transaction.atomic():
             member.civil_disorder = False
-            member.save(update_fields=["civil_disorder"])
+            member.save(update_fields=["civil_disorder", "updated_at"])
 
             current_phase = game.current_phase
             if current_phase:
                 current_phase.phase_states.filter(member=member).update(
-                    orders_confirmed=False
+                    orders_confirmed=False, updated_at=timezone.now()
                 )
 
             emit("civil_disorder_recovery", game=game, actor=request.user)
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from django.core import exceptions
 from django.db import transaction
 from common.permissions import IsCurrentPhaseActive
+from emit import emit
 from order.utils import get_options_for_order
 from phase.models import Phase
 from province.serializers import ProvinceSerializer
@@ -102,6 +103,7 @@ class OrderSerializer(serializers.Serializer):
                     except exceptions.ValidationError as e:
                         raise serializers.ValidationError(e.messages)
                 order.save()
+                emit("order_created", phase=self.context["phase"], actor=self.context["request"].user)
             return Order.objects.with_related_data().get(id=order.id)
 
         return order
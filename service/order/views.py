@@ -12,7 +12,8 @@ from .utils import flatten_options, build_move_coast_lookup, FIELD_ORDER
 from common.constants import PhaseStatus
 from common.etag import if_none_match
 from common.permissions import IsActiveGame, IsActiveGameMember, IsCurrentPhaseActive
-from common.views import SelectedPhaseMixin, CurrentPhaseMixin
+from common.views import SelectedPhaseMixin, CurrentPhaseMixin, resolve_game
+from emit import emit
 from common.serializers import EmptySerializer
 
 
@@ -112,3 +113,4 @@ class OrderDeleteView(CurrentPhaseMixin, generics.DestroyAPIView):
             if Phase.objects.lock_if_active(instance.phase_state.phase_id) is None:
                 raise serializers.ValidationError(IsCurrentPhaseActive.message)
             instance.delete()
+            emit("order_deleted", game=resolve_game(self.request, self.kwargs["game_id"]), actor=self.request.user)
@@ -0,0 +1,58 @@
+import json
+import zlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def move_options_to_side_table(apps, schema_editor):
+    Phase = apps.get_model("phase", "Phase")
+    PhaseOptions = apps.get_model("phase", "PhaseOptions")
+    batch = []
+    for phase_id, options in Phase.objects.exclude(options={}).values_list("id", "options").iterator(BATCH_SIZE):
+        data = zlib.compress(json.dumps(options, separators=(",", ":")).encode())
+        batch.append(PhaseOptions(phase_id=phase_id, data=data))
+        if len(batch) >= BATCH_SIZE:
+            PhaseOptions.objects.bulk_create(batch)
+            batch = []
+    PhaseOptions.objects.bulk_create(batch)
+
+
+def move_options_back_to_phase(apps, schema_editor):
+    Phase = apps.get_model("phase", "Phase")
+    PhaseOptions = apps.get_model("phase", "PhaseOptions")
+    for phase_id, data in PhaseOptions.objects.values_list("phase_id", "data").iterator(BATCH_SIZE):
+        Phase.objects.filter(pk=phase_id).update(options=json.loads(zlib.decompress(data)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phase", "0019_unique_live_phase_ordinal_per_game"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PhaseOptions",
+            fields=[
+                (
+                    "phase",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="options_row",
+                        serialize=False,
+                        to="phase.phase",
+                    ),
+                ),
+                ("data", models.BinaryField()),
+            ],
+        ),
+        migrations.RunPython(move_options_to_side_table, move_options_back_to_phase),
+        migrations.RemoveField(
+            model_name="phase",
+            name="options",
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+def clear_completed_phase_options(apps, schema_editor):
+    PhaseOptions = apps.get_model("phase", "PhaseOptions")
+    PhaseOptions.objects.filter(phase__status="completed").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phase", "0020_phase_options_side_table"),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_completed_phase_options, migrations.RunPython.noop),
+    ]
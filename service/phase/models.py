@@ -1,17 +1,19 @@
 import json
 import logging
+import zlib
 from functools import cached_property
 
 import sentry_sdk
 from django.conf import settings
 from django.db import models, transaction
-from django.db.models import F, Q, Exists, OuterRef, Count, Prefetch
+from django.db.models import Case, F, Q, Exists, OuterRef, Count, Prefetch, Value, When
 from django.utils import timezone
-from opentelemetry import trace
+from opentelemetry import metrics, trace
+from procrastinate.exceptions import AlreadyEnqueued
 from common.models import BaseModel
 from datetime import timedelta
 from common.constants import PhaseStatus, PhaseType, GameStatus, DeadlineMode, OrderType, UserKind
-from adjudicator.service import resolve
+from adjudicator.service import get_adjudication_executor, prepare, resolve, resolve_many, start
 from member.models import Member
 from order.models import OrderResolution, Order
 from phase.utils import transform_options, format_time_remaining, build_notification_body, compress_deadline, format_deadline
@@ -24,6 +26,13 @@ from emit import emit
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+
+_sweep_queue_depth = meter.create_histogram(
+    "phase.sweep.queue_depth",
+    unit="{phase}",
+    description="Due phases found by one resolution sweep",
+)
 
 
 class PhaseQuerySet(models.QuerySet):
@@ -68,6 +77,9 @@ class PhaseQuerySet(models.QuerySet):
             "phase_states__orders__named_coast",
         )
 
+    def with_options(self):
+        return self.select_related("options_row")
+
     def filter_due_phases(self):
         deadline_passed = (
             Q(scheduled_resolution__isnull=False)
@@ -99,6 +111,9 @@ class PhaseManager(models.Manager):
     def with_canonical_state_data(self):
         return self.get_queryset().with_canonical_state_data()
 
+    def with_options(self):
+        return self.get_queryset().with_options()
+
     def filter_due_phases(self):
         return self.get_queryset().filter_due_phases()
 
@@ -127,8 +142,7 @@ class PhaseManager(models.Manager):
 
     def lock_if_active(self, phase_id):
         return (
-            self.defer("options")
-            .select_for_update()
+            self.select_for_update()
             .filter(pk=phase_id, status=PhaseStatus.ACTIVE)
             .first()
         )
@@ -148,6 +162,30 @@ class PhaseManager(models.Manager):
         phase.status = PhaseStatus.PROCESSING
         return True
 
+    def lock_due_phases(self):
+        # Due phases locked FOR UPDATE SKIP LOCKED and loaded with their
+        # adjudication data, by one query. Rows another transaction holds are
+        # left out rather than waited on, and the due check runs under the lock.
+        return self.filter_due_phases().select_for_update(skip_locked=True, of=("self",)).with_adjudication_data()
+
+    def claim_due_phases(self, limit):
+        """Claim up to `limit` due phases for processing and return them,
+        loaded with `with_adjudication_data()` and already PROCESSING.
+
+        Due rows another transaction has locked are skipped rather than
+        waited on (FOR UPDATE SKIP LOCKED), so concurrent callers pull
+        disjoint batches. Each phase then goes through
+        `claim_for_processing`, so a phase an NMR extension postpones
+        stays active and is left out of the result."""
+        with tracer.start_as_current_span("phase.manager.claim_due_phases") as span:
+            span.set_attribute("phases.limit", limit)
+            with transaction.atomic():
+                phases = list(self.lock_due_phases().order_by("scheduled_resolution", "id")[:limit])
+                claimed = [phase for phase in phases if self.claim_for_processing(phase)]
+            span.set_attribute("phases.claimed", len(claimed))
+            logger.info(f"Claimed {len(claimed)} of {len(phases)} due phases for processing")
+            return claimed
+
     def release_from_processing(self, phase_id):
         return self.filter(pk=phase_id, status=PhaseStatus.PROCESSING).update(
             status=PhaseStatus.ACTIVE, processing_started_at=None
@@ -177,24 +215,31 @@ class PhaseManager(models.Manager):
             status=PhaseStatus.ACTIVE, processing_started_at=None
         )
 
-    def resolve_if_due(self, phase_id):
+    def resolve_if_due(self, phase_id, executor=None):
         with tracer.start_as_current_span("phase.manager.resolve_if_due") as span:
             span.set_attribute("phase.id", phase_id)
-            with transaction.atomic():
-                locked = self.select_for_update().filter(pk=phase_id).first()
-                if locked is None:
-                    logger.info(f"Phase {phase_id} no longer exists; skipping resolve")
-                    return None
-                if not self.filter_due_phases().filter(pk=phase_id).exists():
-                    logger.info(f"Phase {phase_id} not due on re-check; skipping resolve")
-                    return None
-                phase = self.with_adjudication_data().get(pk=phase_id)
-                if not self.claim_for_processing(phase):
-                    return phase
-                logger.info(f"Resolving due phase {phase.id} ({phase.name}) for game {phase.game_id}")
-            return self._resolve_claimed(phase)
-
-    def resolve_due_phases(self, canary=False):
+            phase, claimed = self._claim_if_due(phase_id)
+            if not claimed:
+                return phase
+            if executor is None:
+                return self._resolve_claimed(phase)
+            return self._resolve_claimed(phase, executor=executor)
+
+    def _claim_if_due(self, phase_id):
+        # Returns (phase, claimed); phase is None when the phase is gone, no
+        # longer due or locked by another worker, and unclaimed when an NMR
+        # extension postponed it.
+        with transaction.atomic():
+            phase = self.lock_due_phases().filter(pk=phase_id).first()
+            if phase is None:
+                logger.info(f"Phase {phase_id} is gone, not due or locked elsewhere; skipping resolve")
+                return None, False
+            if not self.claim_for_processing(phase):
+                return phase, False
+            logger.info(f"Resolving due phase {phase.id} ({phase.name}) for game {phase.game_id}")
+        return phase, True
+
+    def resolve_due_phases(self):
         with tracer.start_as_current_span("phase.manager.resolve_due_phases") as span:
             logger.info("Starting resolution of due phases")
 
@@ -204,34 +249,40 @@ class PhaseManager(models.Manager):
             resolved_count = 0
             failed_count = 0
 
-            now = timezone.now()
-            grace = timedelta(seconds=getattr(settings, "RESOLUTION_CANARY_GRACE_SECONDS", 300))
-
-            for phase in phases_to_resolve:
-                if (
-                    canary
-                    and phase.scheduled_resolution
-                    and phase.scheduled_resolution < now - grace
-                ):
-                    overdue_seconds = (now - phase.scheduled_resolution).total_seconds()
-                    logger.error(
-                        f"Phase {phase.id} (game {phase.game_id}) overdue by {overdue_seconds:.0f}s; "
-                        f"a primary trigger should have resolved it. Capturing canary."
-                    )
-                    sentry_sdk.capture_message(
-                        f"Phase resolution overdue: phase {phase.id} game {phase.game_id} "
-                        f"overdue by {overdue_seconds:.0f}s",
-                        level="error",
-                    )
-
-                logger.info(f"Resolving phase {phase.id} ({phase.name}) for game {phase.game_id}")
-                try:
-                    if self.resolve_if_due(phase.id) is not None:
+            executor = get_adjudication_executor()
+            batched = executor is not None and total_phases_to_resolve > 1
+            claimed = []
+
+            if batched:
+                claimed = self.claim_due_phases(total_phases_to_resolve)
+            else:
+                for phase in phases_to_resolve:
+                    logger.info(f"Resolving phase {phase.id} ({phase.name}) for game {phase.game_id}")
+                    try:
+                        if self.resolve_if_due(phase.id, executor=executor) is not None:
+                            resolved_count += 1
+                            logger.info(f"Successfully resolved phase {phase.id}")
+                    except Exception as e:
+                        failed_count += 1
+                        logger.error(f"Failed to resolve phase {phase.id} ({phase.name}): {e}", exc_info=True)
+
+            # Batched runs claim the due phases first (skipping any another
+            # worker holds), adjudicate the claimed ones together across the
+            # adjudication executor's pool, then persist them one
+            # transaction at a time.
+            # resolve() discards a prepared result if the phase changed in
+            # between.
+            if claimed:
+                span.set_attribute("phases.batched", len(claimed))
+                prepared = self._prepare_adjudications(claimed, executor)
+                for phase, prepared_resolution in zip(claimed, prepared):
+                    try:
+                        self._resolve_claimed(phase, prepared=prepared_resolution)
                         resolved_count += 1
                         logger.info(f"Successfully resolved phase {phase.id}")
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"Failed to resolve phase {phase.id} ({phase.name}): {e}", exc_info=True)
+                    except Exception as e:
+                        failed_count += 1
+                        logger.error(f"Failed to resolve phase {phase.id} ({phase.name}): {e}", exc_info=True)
 
             result = {
                 "resolved": resolved_count,
@@ -247,9 +298,53 @@ class PhaseManager(models.Manager):
             )
             return result
 
+    def _prepare_adjudications(self, phases, executor):
+        try:
+            return resolve_many(phases, executor)
+        except Exception as e:
+            logger.error(f"Batch adjudication of {len(phases)} phases failed; resolving them one at a time: {e}", exc_info=True)
+            return [None] * len(phases)
+
     def sweep_due_phases(self):
-        self.recover_stalled_processing()
-        return self.resolve_due_phases(canary=True)
+        # The sweep only finds due phases; each is resolved by its own
+        # resolve_phase job under the game's resolve lock, so workers drain
+        # a backlog concurrently. Returns the number of jobs deferred.
+        from phase.tasks import resolve_phase
+
+        with tracer.start_as_current_span("phase.manager.sweep_due_phases") as span:
+            self.recover_stalled_processing()
+            due = list(self.filter_due_phases().values_list("id", "game_id", "scheduled_resolution"))
+            span.set_attribute("phases.due", len(due))
+            _sweep_queue_depth.record(len(due))
+
+            now = timezone.now()
+            grace = timedelta(seconds=getattr(settings, "RESOLUTION_CANARY_GRACE_SECONDS", 300))
+            deferred = 0
+            for phase_id, game_id, scheduled_resolution in due:
+                if scheduled_resolution and scheduled_resolution < now - grace:
+                    overdue_seconds = (now - scheduled_resolution).total_seconds()
+                    logger.error(
+                        f"Phase {phase_id} (game {game_id}) overdue by {overdue_seconds:.0f}s; "
+                        f"a primary trigger should have resolved it. Capturing canary."
+                    )
+                    sentry_sdk.capture_message(
+                        f"Phase resolution overdue: phase {phase_id} game {game_id} "
+                        f"overdue by {overdue_seconds:.0f}s",
+                        level="error",
+                    )
+                try:
+                    resolve_phase.configure(
+                        lock=f"resolve-game-{game_id}",
+                        queueing_lock=f"sweep-phase-{phase_id}",
+                    ).defer(phase_id=phase_id, swept_at=now.timestamp())
+                except AlreadyEnqueued:
+                    logger.info(f"Phase {phase_id} already has a sweep job waiting; not deferring another")
+                    continue
+                deferred += 1
+
+            span.set_attribute("phases.deferred", deferred)
+            logger.info(f"Sweep deferred {deferred} resolve jobs for {len(due)} due phases")
+            return deferred
 
     def _check_and_apply_nmr_extensions(self, phase):
         not_submitted = phase.phase_states.filter(
@@ -401,21 +496,18 @@ class PhaseManager(models.Manager):
             return {"notifications_sent": notifications_sent}
 
     def _set_orders_outcome(self, phase):
-        base_qs = phase.phase_states.filter(
-            has_possible_orders=True
-        ).annotate(order_count=Count("orders"))
-
-        received_ids = list(base_qs.filter(order_count__gt=0).values_list("id", flat=True))
-        nmr_ids = list(base_qs.filter(order_count=0).values_list("id", flat=True))
-
-        if received_ids:
-            PhaseState.objects.filter(id__in=received_ids).update(
-                orders_outcome=PhaseState.OrdersOutcome.RECEIVED
-            )
-        if nmr_ids:
-            PhaseState.objects.filter(id__in=nmr_ids).update(
-                orders_outcome=PhaseState.OrdersOutcome.NMR
-            )
+        # One UPDATE for every state that could order: received when it has
+        # any order, NMR otherwise.
+        phase.phase_states.filter(has_possible_orders=True).update(
+            orders_outcome=Case(
+                When(
+                    Exists(Order.objects.filter(phase_state=OuterRef("pk"))),
+                    then=Value(PhaseState.OrdersOutcome.RECEIVED),
+                ),
+                default=Value(PhaseState.OrdersOutcome.NMR),
+            ),
+            updated_at=timezone.now(),
+        )
 
     def _check_civil_disorder(self, phase):
         if phase.game.sandbox:
@@ -604,17 +696,21 @@ class PhaseManager(models.Manager):
             return phase
         return self._resolve_claimed(phase)
 
-    def _resolve_claimed(self, phase):
+    def _resolve_claimed(self, phase, prepared=None, executor=None):
         with tracer.start_as_current_span("phase.manager.resolve") as span:
             span.set_attribute("phase.id", phase.id)
             span.set_attribute("game.id", str(phase.game.id))
 
             try:
+                if prepared is None and executor is not None:
+                    # Wait on the pool before taking any locks; resolve()
+                    # re-checks the result against the locked rows.
+                    prepared = prepare(phase, executor)
                 with tracer.start_as_current_span("phase.transaction_atomic"):
                     with transaction.atomic():
                         self._set_orders_outcome(phase)
                         newly_cd_members = self._check_civil_disorder(phase)
-                        adjudication_data = resolve(phase)
+                        adjudication_data = resolve(phase, prepared=prepared)
 
                         surviving_cd_members = self._reconcile_civil_disorder_eliminations(
                             newly_cd_members, adjudication_data
@@ -676,8 +772,21 @@ class PhaseManager(models.Manager):
                     existing_orders = list(previous_phase.all_orders)
                     order_count = len(existing_orders)
 
-                    order_ids = [order.id for order in existing_orders]
-                    OrderResolution.objects.filter(order_id__in=order_ids).delete()
+                    # A phase is normally resolved once, so there is nothing to
+                    # clear; only a retried resolution has stale rows to drop.
+                    # When with_adjudication_data() prefetched the resolutions
+                    # they say which orders have one without a query; otherwise
+                    # a single DELETE covers the whole phase.
+                    if all(Order.resolution.is_cached(order) for order in existing_orders):
+                        stale_order_ids = [order.id for order in existing_orders if hasattr(order, "resolution")]
+                        if stale_order_ids:
+                            OrderResolution.objects.filter(order_id__in=stale_order_ids).delete()
+                    else:
+                        OrderResolution.objects.filter(order__phase_state__phase=previous_phase).delete()
+
+                    resolution_by_province = {}
+                    for resolution_data in adjudication_data["resolutions"]:
+                        resolution_by_province.setdefault(resolution_data["province"], resolution_data)
 
                     unit_nation_by_province = {
                         unit.province.province_id: unit.nation
@@ -724,10 +833,7 @@ class PhaseManager(models.Manager):
                             )
 
                     for order in existing_orders:
-                        resolution_data = next(
-                            (r for r in adjudication_data["resolutions"] if r["province"] == order.source.province_id),
-                            None,
-                        )
+                        resolution_data = resolution_by_province.get(order.source.province_id)
                         if resolution_data:
                             by_province = province_lookup.get(resolution_data["by"]) if resolution_data["by"] else None
                             resolutions_to_create.append(
@@ -737,7 +843,6 @@ class PhaseManager(models.Manager):
                                     by=by_province,
                                 )
                             )
-                            logger.debug(f"Prepared resolution for order {order.id}: {resolution_data['result']}")
                         else:
                             logger.warning(
                                 f"No resolution found for order {order.id} in province {order.source.province_id}"
@@ -819,17 +924,11 @@ class PhaseManager(models.Manager):
 
                 # Create units
                 with tracer.start_as_current_span("phase.create_units") as units_span:
-                    # Build a lookup for previous phase units by province_id to avoid N+1 queries
-                    previous_units_by_province = {
-                        u.province.province_id: u for u in previous_phase.units.select_related("province").all()
-                    }
+                    # Units and their provinces come prefetched by with_adjudication_data().
+                    previous_units_by_province = {u.province.province_id: u for u in previous_phase.units.all()}
 
                     units_to_create = []
                     for unit in adjudication_data["units"]:
-                        logger.info(
-                            f"Preparing unit {unit['type']} for nation {unit['nation']} in province {unit['province']}"
-                        )
-
                         is_dislodged = unit.get("dislodged", False)
 
                         dislodged_by_id = unit.get("dislodged_by", None)
@@ -842,7 +941,7 @@ class PhaseManager(models.Manager):
                                     f"Unit {unit['province']} is dislodged but dislodger {dislodged_by_id} not found in previous phase"
                                 )
                         elif is_dislodged:
-                            logger.info(
+                            logger.debug(
                                 f"Unit {unit['province']} is dislodged but no dislodger information available (convoy case)"
                             )
 
@@ -898,7 +997,9 @@ class PhaseManager(models.Manager):
                 with tracer.start_as_current_span("phase.mark_previous_complete") as complete_span:
                     complete_span.set_attribute("previous_phase.id", previous_phase.id)
                     previous_phase.status = PhaseStatus.COMPLETED
+                    previous_phase.options = {}
                     previous_phase.save()
+                    previous_phase.game.refresh_phase_pointers()
                     logger.info(f"Marked previous phase {previous_phase.id} as completed")
 
                 self._emit_phase_resolved(previous_phase)
@@ -931,7 +1032,6 @@ class Phase(BaseModel):
     type = models.CharField(max_length=10)
     scheduled_resolution = models.DateTimeField(null=True, blank=True)
     resolution_job_id = models.BigIntegerField(null=True, blank=True, editable=False)
-    options = models.JSONField(default=dict)
 
     class Meta:
         ordering = ["ordinal", "id"]
@@ -946,6 +1046,62 @@ class Phase(BaseModel):
     def __str__(self):
         return f"{self.name} ({self.game.name if self.game else '-'})"
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding and self.game_id is not None:
+            from game.models import Game
+
+            Game.objects.filter(pk=self.game_id).refresh_phase_pointers()
+        if not self.__dict__.pop("_options_dirty", False):
+            return
+        # Empty options are stored as no row at all. Nothing is written when
+        # the loaded blob already holds the value.
+        data = PhaseOptions.encode(self.options) if self.options else None
+        if "_options_data" in self.__dict__ and self.__dict__["_options_data"] == data:
+            return
+        if data is not None:
+            PhaseOptions.objects.bulk_create(
+                [PhaseOptions(phase=self, data=data)],
+                update_conflicts=True,
+                unique_fields=["phase"],
+                update_fields=["data"],
+            )
+        elif not adding:
+            PhaseOptions.objects.filter(phase=self).delete()
+        self.__dict__["_options_data"] = data
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        if fields is None:
+            for key in ("_options", "_options_data", "_options_dirty", "transformed_options"):
+                self.__dict__.pop(key, None)
+
+    @property
+    def options(self):
+        # The godip-shaped options live compressed in PhaseOptions, off the
+        # row every phase query reads. They come with the phase when it was
+        # loaded with_options(), and are otherwise queried on first access.
+        if "_options" not in self.__dict__:
+            data = None
+            if Phase.options_row.is_cached(self):
+                try:
+                    data = self.options_row.data
+                except PhaseOptions.DoesNotExist:
+                    pass
+            elif self.pk is not None:
+                data = PhaseOptions.objects.filter(phase_id=self.pk).values_list("data", flat=True).first()
+            self.__dict__["_options_data"] = bytes(data) if data is not None else None
+            self.__dict__["_options"] = PhaseOptions.decode(data) if data is not None else {}
+        return self.__dict__["_options"]
+
+    @options.setter
+    def options(self, value):
+        # Written to PhaseOptions on the next save().
+        self.__dict__["_options"] = value
+        self.__dict__["_options_dirty"] = True
+        self.__dict__.pop("transformed_options", None)
+
     @property
     def name(self):
         return f"{self.season} {self.year}, {self.type}"
@@ -1044,18 +1200,39 @@ class Phase(BaseModel):
 
         logger.info(f"Reactivating phase {self.id} with new scheduled resolution")
         self.status = PhaseStatus.ACTIVE
+        # Options are dropped when a phase completes; compute them again.
+        self.options = start(self)["options"]
         self.scheduled_resolution = self.game.get_scheduled_resolution(self.type)
         self.save()
 
         phase_states_count = self.phase_states.count()
         logger.info(f"Resetting orders_confirmed to False for {phase_states_count} phase states")
-        self.phase_states.update(orders_confirmed=False)
+        self.phase_states.update(orders_confirmed=False, updated_at=timezone.now())
+        self.game.refresh_phase_pointers()
 
         emit("phase_started", phase=self)
 
         logger.info(f"Successfully reverted game {self.game.id} to phase {self.id}")
 
 
+class PhaseOptions(models.Model):
+    """A phase's godip-shaped order options as zlib-compressed JSON, kept
+    out of phase_phase so listing and locking phases never reads them.
+    Accessed through `Phase.options`. A phase's row is deleted when it
+    completes."""
+
+    phase = models.OneToOneField(Phase, on_delete=models.CASCADE, primary_key=True, related_name="options_row")
+    data = models.BinaryField()
+
+    @staticmethod
+    def encode(options):
+        return zlib.compress(json.dumps(options, separators=(",", ":")).encode())
+
+    @staticmethod
+    def decode(data):
+        return json.loads(zlib.decompress(data))
+
+
 class PhaseState(BaseModel):
     class OrdersOutcome(models.TextChoices):
         RECEIVED = "received"
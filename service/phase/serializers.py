@@ -35,11 +35,14 @@ class PhaseStateSerializer(serializers.Serializer):
             instance.orders_confirmed = not instance.orders_confirmed
             instance.save()
 
+            actor = self.context["request"].user
             if instance.orders_confirmed:
-                emit("phase_state_confirmed", phase=instance.phase)
+                emit("phase_state_confirmed", phase=instance.phase, actor=actor)
                 resolve_phase.configure(
                     lock=f"resolve-game-{instance.phase.game_id}",
                 ).defer(phase_id=instance.phase_id)
+            else:
+                emit("phase_state_unconfirmed", phase=instance.phase, actor=actor)
 
         return instance
 
@@ -1,16 +1,30 @@
 import logging
+import time
+from typing import Optional
 
+from opentelemetry import metrics
 from procrastinate.contrib.django import app
 
+from adjudicator.service import get_adjudication_executor
 from phase.models import Phase
 
 logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+_sweep_drain_time = meter.create_histogram(
+    "phase.sweep.drain_time",
+    unit="s",
+    description="Time from the sweep deferring a resolve_phase job to the job finishing",
+)
 
 
 @app.task(name="phase.resolve_phase", retry=3)
-def resolve_phase(phase_id: int):
+def resolve_phase(phase_id: int, swept_at: Optional[float] = None):
     logger.info(f"Running resolve_phase task for phase {phase_id}")
-    Phase.objects.resolve_if_due(phase_id)
+    Phase.objects.resolve_if_due(phase_id, executor=get_adjudication_executor())
+    # swept_at is set only on jobs the minute sweep fanned out.
+    if swept_at is not None:
+        _sweep_drain_time.record(time.time() - swept_at)
 
 
 @app.periodic(cron="* * * * *")
@@ -120,6 +120,25 @@ class TestResolveIfDue:
         assert result is None
         mock_resolve.assert_not_called()
 
+    @pytest.mark.django_db
+    def test_claim_locks_and_checks_the_phase_in_one_query(self, phase_factory, classical_england_nation):
+        phase = phase_factory(
+            scheduled_resolution=timezone.now() - timedelta(hours=1),
+            phase_states_config=[
+                {"nation": classical_england_nation, "has_possible_orders": True, "orders_confirmed": False},
+            ],
+        )
+
+        with patch.object(Phase.objects, "_resolve_claimed", return_value="resolved"):
+            with CaptureQueriesContext(connection) as queries:
+                Phase.objects.resolve_if_due(phase.id)
+
+        phase_reads = [
+            query["sql"] for query in queries if query["sql"].startswith('SELECT "phase_phase"."id"')
+        ]
+        assert len(phase_reads) == 1
+        assert "FOR UPDATE OF" in phase_reads[0] and "SKIP LOCKED" in phase_reads[0]
+
     @pytest.mark.django_db
     def test_missing_phase_is_noop(self):
         with patch.object(Phase.objects, "_resolve_claimed") as mock_resolve:
@@ -295,6 +314,34 @@ class TestProcessingStatus:
         assert observed["status"] == PhaseStatus.PROCESSING
         assert observed["savepoints"] == baseline
 
+    @pytest.mark.django_db
+    def test_executor_round_trip_happens_before_the_resolve_transaction(self, due_phase):
+        observed = {}
+        executor = object()
+
+        def record_prepare(phase, pool):
+            observed["pool"] = pool
+            observed["prepare_savepoints"] = len(transaction.get_connection().savepoint_ids)
+            return "prepared"
+
+        def record_resolve(phase, prepared):
+            observed["prepared"] = prepared
+            observed["resolve_savepoints"] = len(transaction.get_connection().savepoint_ids)
+            raise RuntimeError("stop")
+
+        baseline = len(transaction.get_connection().savepoint_ids)
+
+        with patch("phase.models.prepare", side_effect=record_prepare), patch(
+            "phase.models.resolve", side_effect=record_resolve
+        ):
+            with pytest.raises(RuntimeError):
+                Phase.objects.resolve_if_due(due_phase.id, executor=executor)
+
+        assert observed["pool"] is executor
+        assert observed["prepared"] == "prepared"
+        assert observed["prepare_savepoints"] == baseline
+        assert observed["resolve_savepoints"] > baseline
+
     @pytest.mark.django_db
     def test_claim_records_when_processing_started(self, due_phase):
         before = timezone.now()
@@ -348,31 +395,65 @@ class TestProcessingStatus:
         assert str(due_phase.id) in mock_capture.call_args[0][0]
 
     @pytest.mark.django_db
-    def test_sweep_retries_a_phase_it_recovered(self, due_phase):
+    def test_sweep_retries_a_phase_it_recovered(self, due_phase, in_memory_procrastinate):
         Phase.objects.filter(pk=due_phase.pk).update(
             status=PhaseStatus.PROCESSING,
             processing_started_at=timezone.now() - timedelta(seconds=400),
         )
 
         with patch("phase.models.sentry_sdk.capture_message"):
-            with patch.object(Phase.objects, "_resolve_claimed", return_value="resolved") as mock_resolve:
-                Phase.objects.sweep_due_phases()
+            Phase.objects.sweep_due_phases()
 
-        mock_resolve.assert_called_once()
+        jobs = _immediate_resolve_jobs(in_memory_procrastinate)
+        assert [job["args"]["phase_id"] for job in jobs] == [due_phase.id]
 
     @pytest.mark.django_db
-    def test_sweep_leaves_a_phase_processing_within_the_timeout(self, due_phase):
+    def test_sweep_leaves_a_phase_processing_within_the_timeout(self, due_phase, in_memory_procrastinate):
         started = timezone.now() - timedelta(seconds=60)
         Phase.objects.filter(pk=due_phase.pk).update(
             status=PhaseStatus.PROCESSING, processing_started_at=started
         )
 
-        with patch.object(Phase.objects, "_resolve_claimed") as mock_resolve:
-            Phase.objects.sweep_due_phases()
+        Phase.objects.sweep_due_phases()
 
         due_phase.refresh_from_db()
         assert due_phase.status == PhaseStatus.PROCESSING
-        mock_resolve.assert_not_called()
+        assert _immediate_resolve_jobs(in_memory_procrastinate) == []
+
+
+    @pytest.mark.django_db
+    def test_batched_sweep_adjudicates_claimed_phases_together(self, phase_factory, classical_england_nation):
+        executor = object()
+        phases = [
+            phase_factory(
+                scheduled_resolution=timezone.now() - timedelta(hours=1),
+                phase_states_config=[
+                    {"nation": classical_england_nation, "has_possible_orders": True, "orders_confirmed": False},
+                ],
+            )
+            for _ in range(2)
+        ]
+        prepared = {phase.id: object() for phase in phases}
+
+        def prepare(claimed, pool=None):
+            assert pool is executor
+            assert all(
+                Phase.objects.get(pk=phase.pk).status == PhaseStatus.PROCESSING for phase in claimed
+            )
+            return [prepared[phase.id] for phase in claimed]
+
+        with patch("phase.models.get_adjudication_executor", return_value=executor), patch(
+            "phase.models.resolve_many", side_effect=prepare
+        ) as mock_resolve_many, patch.object(
+            Phase.objects, "_resolve_claimed", return_value="resolved"
+        ) as mock_resolve:
+            result = Phase.objects.resolve_due_phases()
+
+        assert result == {"resolved": 2, "failed": 0}
+        mock_resolve_many.assert_called_once()
+        assert {
+            call.args[0].id: call.kwargs["prepared"] for call in mock_resolve.call_args_list
+        } == prepared
 
 
 class TestLockIfActive:
@@ -397,10 +478,56 @@ class TestLockIfActive:
             assert Phase.objects.lock_if_active(phase.id) is None
 
 
+class TestClaimDuePhases:
+
+    def _due_phase(self, phase_factory, nation, overdue):
+        return phase_factory(
+            scheduled_resolution=timezone.now() - overdue,
+            phase_states_config=[
+                {"nation": nation, "has_possible_orders": True, "orders_confirmed": False},
+            ],
+        )
+
+    @pytest.mark.django_db
+    def test_claims_up_to_the_limit_oldest_deadline_first(self, phase_factory, classical_england_nation):
+        newest = self._due_phase(phase_factory, classical_england_nation, timedelta(minutes=1))
+        oldest = self._due_phase(phase_factory, classical_england_nation, timedelta(minutes=30))
+        middle = self._due_phase(phase_factory, classical_england_nation, timedelta(minutes=10))
+
+        claimed = Phase.objects.claim_due_phases(2)
+
+        assert [phase.id for phase in claimed] == [oldest.id, middle.id]
+        assert all(phase.status == PhaseStatus.PROCESSING for phase in claimed)
+        for phase in (oldest, middle):
+            phase.refresh_from_db()
+            assert phase.status == PhaseStatus.PROCESSING
+            assert phase.processing_started_at is not None
+        newest.refresh_from_db()
+        assert newest.status == PhaseStatus.ACTIVE
+
+    @pytest.mark.django_db
+    def test_claimed_phases_are_not_claimed_again(self, phase_factory, classical_england_nation):
+        phase = self._due_phase(phase_factory, classical_england_nation, timedelta(minutes=5))
+
+        assert [claimed.id for claimed in Phase.objects.claim_due_phases(5)] == [phase.id]
+        assert Phase.objects.claim_due_phases(5) == []
+
+    @pytest.mark.django_db
+    def test_claim_skips_rows_locked_elsewhere(self, phase_factory, classical_england_nation):
+        self._due_phase(phase_factory, classical_england_nation, timedelta(minutes=5))
+
+        with CaptureQueriesContext(connection) as queries:
+            Phase.objects.claim_due_phases(5)
+
+        assert any("FOR UPDATE OF" in query["sql"] and "SKIP LOCKED" in query["sql"] for query in queries)
+
+
 class TestSweepCanary:
 
     @pytest.mark.django_db
-    def test_canary_fires_when_overdue_beyond_grace(self, phase_factory, classical_england_nation):
+    def test_canary_fires_when_overdue_beyond_grace(
+        self, phase_factory, classical_england_nation, in_memory_procrastinate
+    ):
         phase = phase_factory(
             scheduled_resolution=timezone.now() - timedelta(seconds=400),
             phase_states_config=[
@@ -408,17 +535,15 @@ class TestSweepCanary:
             ],
         )
 
-        with patch("phase.models.sentry_sdk.capture_message") as mock_capture, patch.object(
-            Phase.objects, "_resolve_claimed", return_value="resolved"
-        ) as mock_resolve:
+        with patch("phase.models.sentry_sdk.capture_message") as mock_capture:
             Phase.objects.sweep_due_phases()
 
         mock_capture.assert_called_once()
         assert str(phase.id) in mock_capture.call_args[0][0]
-        mock_resolve.assert_called_once()
+        assert len(_immediate_resolve_jobs(in_memory_procrastinate)) == 1
 
     @pytest.mark.django_db
-    def test_no_canary_within_grace(self, phase_factory, classical_england_nation):
+    def test_no_canary_within_grace(self, phase_factory, classical_england_nation, in_memory_procrastinate):
         phase_factory(
             scheduled_resolution=timezone.now() - timedelta(seconds=60),
             phase_states_config=[
@@ -426,13 +551,75 @@ class TestSweepCanary:
             ],
         )
 
-        with patch("phase.models.sentry_sdk.capture_message") as mock_capture, patch.object(
-            Phase.objects, "_resolve_claimed", return_value="resolved"
-        ) as mock_resolve:
+        with patch("phase.models.sentry_sdk.capture_message") as mock_capture:
             Phase.objects.sweep_due_phases()
 
         mock_capture.assert_not_called()
-        mock_resolve.assert_called_once()
+        assert len(_immediate_resolve_jobs(in_memory_procrastinate)) == 1
+
+
+class TestSweepFanOut:
+
+    def _due_phase(self, phase_factory, nation):
+        return phase_factory(
+            scheduled_resolution=timezone.now() - timedelta(minutes=5),
+            phase_states_config=[
+                {"nation": nation, "has_possible_orders": True, "orders_confirmed": False},
+            ],
+        )
+
+    @pytest.mark.django_db
+    def test_sweep_defers_one_locked_job_per_due_phase(
+        self, phase_factory, classical_england_nation, in_memory_procrastinate
+    ):
+        phases = [self._due_phase(phase_factory, classical_england_nation) for _ in range(3)]
+
+        with patch.object(Phase.objects, "_resolve_claimed") as mock_resolve:
+            deferred = Phase.objects.sweep_due_phases()
+
+        assert deferred == 3
+        mock_resolve.assert_not_called()
+        jobs = _immediate_resolve_jobs(in_memory_procrastinate)
+        assert {job["args"]["phase_id"]: job["lock"] for job in jobs} == {
+            phase.id: f"resolve-game-{phase.game_id}" for phase in phases
+        }
+        assert all(job["args"]["swept_at"] is not None for job in jobs)
+
+    @pytest.mark.django_db
+    def test_sweep_does_not_queue_a_second_job_for_a_waiting_phase(
+        self, phase_factory, classical_england_nation, in_memory_procrastinate
+    ):
+        phase = self._due_phase(phase_factory, classical_england_nation)
+
+        assert Phase.objects.sweep_due_phases() == 1
+        assert Phase.objects.sweep_due_phases() == 0
+
+        jobs = _immediate_resolve_jobs(in_memory_procrastinate)
+        assert [job["args"]["phase_id"] for job in jobs] == [phase.id]
+
+    @pytest.mark.django_db
+    def test_sweep_reads_ids_only(self, phase_factory, classical_england_nation, in_memory_procrastinate):
+        self._due_phase(phase_factory, classical_england_nation)
+
+        with CaptureQueriesContext(connection) as queries:
+            Phase.objects.sweep_due_phases()
+
+        # No phase rows, units or orders are loaded; resolve_phase does that.
+        sql = [query["sql"] for query in queries]
+        assert not any('"phase_phaseoptions"' in statement for statement in sql)
+        assert not any('"unit_unit"' in statement for statement in sql)
+        assert not any('"order_order"' in statement for statement in sql)
+
+    @pytest.mark.django_db
+    def test_swept_job_resolves_the_phase(self, phase_factory, classical_england_nation):
+        from phase.tasks import resolve_phase
+
+        phase = self._due_phase(phase_factory, classical_england_nation)
+
+        with patch.object(Phase.objects, "resolve_if_due") as mock_resolve_if_due:
+            resolve_phase(phase_id=phase.id, swept_at=timezone.now().timestamp())
+
+        assert mock_resolve_if_due.call_args.args == (phase.id,)
 
 
 class TestFixedTimeEarlyResolution:
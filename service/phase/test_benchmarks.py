@@ -0,0 +1,83 @@
+"""Phase read and write latency benchmarks.
+
+These time real database round trips and print their numbers, so they
+are excluded from the default run (see pyproject.toml). Invoke
+explicitly when measuring:
+
+    pytest phase/test_benchmarks.py -s
+"""
+import json
+
+import pytest
+from django.db import transaction
+
+import adjudicator.service as adjudication_service
+from adjudicator.benchmark import median_ms
+from adjudicator.serializers import deserialize_game_state
+from phase.models import Phase, PhaseOptions
+from phase.tests import create_board_phase
+from phase.utils import phase_to_canonical_game_state, phase_to_game_state
+
+
+@pytest.mark.django_db
+def test_state_read_canonical_dict_vs_prefetched_rows(classical_opening_phase):
+    phase = Phase.objects.with_adjudication_data().get(pk=classical_opening_phase.pk)
+    variant = adjudication_service._compiled_variant(phase)
+
+    via_dict = median_ms(lambda: deserialize_game_state(phase_to_canonical_game_state(phase), variant))
+    direct = median_ms(lambda: phase_to_game_state(phase, variant))
+
+    print(
+        f"\nstate read classical Spring 1901: canonical dict {via_dict:.2f} ms, "
+        f"prefetched rows {direct:.2f} ms ({via_dict / direct:.1f}x)"
+    )
+    assert direct < via_dict
+
+
+@pytest.mark.django_db
+def test_writeback_latency_full_board_vs_small(classical_variant, primary_user):
+    def median_writeback_ms(unit_count):
+        phase, adjudication_data = create_board_phase(classical_variant, primary_user, unit_count)
+        loaded = []
+
+        def load():
+            loaded[:] = [Phase.objects.with_adjudication_data().get(pk=phase.pk)]
+
+        def write():
+            with transaction.atomic():
+                Phase.objects.create_from_adjudication_data(loaded[0], adjudication_data)
+                transaction.set_rollback(True)
+
+        return median_ms(write, before_each=load)
+
+    small = median_writeback_ms(7)
+    full = median_writeback_ms(34)
+
+    print(f"\ncreate_from_adjudication_data: 7 units {small:.1f} ms, 34 units {full:.1f} ms ({full / small:.1f}x)")
+    # The writeback is a fixed number of multi-row statements, so five
+    # times the units must cost well under five times the time.
+    assert full < small * 2.5
+
+
+@pytest.mark.django_db
+def test_phase_options_storage_and_phase_read_time(classical_opening_phase):
+    phase = classical_opening_phase
+    phase.options = adjudication_service.start(phase)["options"]
+    phase.save()
+    for ordinal in range(2, 51):
+        Phase.objects.create(
+            game=phase.game, variant=phase.variant, season="Spring", year=1900 + ordinal,
+            type="Movement", status="completed", ordinal=ordinal, options=phase.options,
+        )
+
+    json_bytes = len(json.dumps(phase.options))
+    stored_bytes = len(bytes(PhaseOptions.objects.get(phase=phase).data))
+    rows = median_ms(lambda: list(Phase.objects.filter(game=phase.game)))
+    with_options = median_ms(lambda: [p.options for p in Phase.objects.filter(game=phase.game)])
+
+    print(
+        f"\nclassical Spring 1901 options: {json_bytes} B as JSON, {stored_bytes} B stored "
+        f"({json_bytes / stored_bytes:.1f}x); 50 phase rows {rows:.2f} ms, "
+        f"{with_options:.2f} ms when every row's options are read"
+    )
+    assert stored_bytes < json_bytes
@@ -11,9 +11,9 @@ from unittest.mock import patch, Mock
 from rest_framework import status
 from common.constants import PhaseStatus, PhaseType, OrderType, UnitType, GameStatus, DeadlineMode, ProvinceType, PhaseFrequency
 from game.models import Game
-from .models import Phase, PhaseState
+from .models import Phase, PhaseOptions, PhaseState
 from .serializers import PhaseStateSerializer
-from .utils import transform_options, phase_to_canonical_game_state
+from .utils import transform_options, phase_to_canonical_game_state, phase_to_game_state
 from order.models import Order, OrderResolution
 from supply_center.models import SupplyCenter
 from unit.models import Unit
@@ -1123,6 +1123,26 @@ class TestCreateFromAdjudicationData:
         resolved_orders = [order for order in phase.all_orders if hasattr(order, "resolution")]
         assert len(resolved_orders) == orders_count
 
+    @pytest.mark.django_db
+    def test_create_from_adjudication_data_replaces_stale_resolutions_with_one_delete(
+        self,
+        italy_vs_germany_phase_with_orders,
+        mock_adjudication_data_basic,
+    ):
+        phase = italy_vs_germany_phase_with_orders
+        orders = phase.all_orders
+        OrderResolution.objects.bulk_create(OrderResolution(order=order, status="ErrBounce") for order in orders)
+        unprefetched = Phase.objects.get(pk=phase.pk)
+
+        with override_settings(DEBUG=True):
+            connection.queries_log.clear()
+            Phase.objects.create_from_adjudication_data(unprefetched, mock_adjudication_data_basic)
+            resolution_queries = [q["sql"] for q in connection.queries if '"order_orderresolution"' in q["sql"]]
+
+        assert [sql.split()[0] for sql in resolution_queries] == ["DELETE", "INSERT"]
+        statuses = OrderResolution.objects.filter(order__in=orders).values_list("status", flat=True)
+        assert sorted(statuses) == ["OK"] * len(orders)
+
     @pytest.mark.django_db
     def test_create_from_adjudication_data_creates_implicit_hold_for_failed_resolution_without_explicit_order(
         self,
@@ -1177,6 +1197,48 @@ class TestCreateFromAdjudicationData:
         assert implicit_order.resolution.status == "ErrForcedDisband"
 
 
+def create_board_phase(variant, user, unit_count):
+    """An active Movement phase of a new game with one member per nation
+    and `unit_count` units dealt round-robin across the nations, each
+    holding on its own supply-center province, plus the adjudication
+    data that resolves every hold and carries the position forward."""
+    nations = list(variant.nations.order_by("name"))
+    game = Game.objects.create(name=f"Board Game {unit_count}", variant=variant, status=GameStatus.ACTIVE)
+    members = [game.members.create(user=user, nation=nation) for nation in nations]
+    phase = game.phases.create(
+        variant=variant,
+        season="Spring",
+        year=1901,
+        type=PhaseType.MOVEMENT,
+        status=PhaseStatus.ACTIVE,
+        ordinal=1,
+        scheduled_resolution=timezone.now() - timedelta(hours=1),
+        options={},
+    )
+    phase_states = [phase.phase_states.create(member=member, has_possible_orders=True) for member in members]
+    provinces = list(variant.provinces.filter(supply_center=True).order_by("province_id")[:unit_count])
+    placements = []
+    for i, province in enumerate(provinces):
+        nation, phase_state = nations[i % len(nations)], phase_states[i % len(nations)]
+        phase.units.create(province=province, nation=nation, type=UnitType.ARMY)
+        phase.supply_centers.create(province=province, nation=nation)
+        phase_state.orders.create(source=province, order_type=OrderType.HOLD)
+        placements.append((province.province_id, nation.name))
+    adjudication_data = {
+        "season": "Spring",
+        "year": 1901,
+        "type": "Retreat",
+        "options": {},
+        "supply_centers": [{"province": province_id, "nation": nation} for province_id, nation in placements],
+        "units": [
+            {"province": province_id, "nation": nation, "type": UnitType.ARMY, "dislodged_by": None}
+            for province_id, nation in placements
+        ],
+        "resolutions": [{"province": province_id, "result": "OK", "by": None} for province_id, _ in placements],
+    }
+    return phase, adjudication_data
+
+
 class TestCreateFromAdjudicationDataPerformance:
 
     @pytest.mark.django_db
@@ -1194,7 +1256,7 @@ class TestCreateFromAdjudicationDataPerformance:
 
         query_count = len(connection.queries)
 
-        assert query_count == 20
+        assert query_count == 22
 
     @pytest.mark.django_db
     def test_create_from_adjudication_data_query_count_with_full_game(
@@ -1309,7 +1371,40 @@ class TestCreateFromAdjudicationDataPerformance:
 
         query_count = len(connection.queries)
 
-        assert query_count == 18
+        assert query_count == 20
+
+    def _writeback_queries(self, variant, user, unit_count):
+        phase, adjudication_data = create_board_phase(variant, user, unit_count)
+        phase = Phase.objects.with_adjudication_data().get(pk=phase.pk)
+
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            Phase.objects.create_from_adjudication_data(phase, adjudication_data)
+        return connection.queries
+
+    @pytest.mark.django_db
+    def test_create_from_adjudication_data_full_board_writes_each_table_once(self, classical_variant, primary_user):
+        queries = self._writeback_queries(classical_variant, primary_user, 34)
+
+        inserts = [q["sql"] for q in queries if q["sql"].startswith("INSERT")]
+        for table in (
+            "order_orderresolution",
+            "supply_center_supplycenter",
+            "unit_unit",
+            "phase_phasestate",
+            "phase_phaseoptions",
+        ):
+            assert sum(f'INSERT INTO "{table}"' in sql for sql in inserts) == 1, table
+        assert not any(q["sql"].startswith('DELETE FROM "order_orderresolution"') for q in queries)
+
+    @pytest.mark.django_db
+    def test_create_from_adjudication_data_query_count_does_not_scale_with_units(
+        self, classical_variant, primary_user
+    ):
+        small = self._writeback_queries(classical_variant, primary_user, 7)
+        full = self._writeback_queries(classical_variant, primary_user, 34)
+
+        assert len(full) == len(small)
 
 
 class TestPhaseReversion:
@@ -4101,6 +4196,37 @@ class TestSetOrdersOutcome:
         ps.refresh_from_db()
         assert ps.orders_outcome == PhaseState.OrdersOutcome.NMR
 
+    @pytest.mark.django_db
+    def test_outcomes_are_written_by_one_update(
+        self,
+        italy_vs_germany_variant,
+        italy_vs_germany_italy_nation,
+        italy_vs_germany_germany_nation,
+        italy_vs_germany_venice_province,
+        primary_user,
+        secondary_user,
+    ):
+        phase, italy, germany = self._setup_phase(
+            italy_vs_germany_variant,
+            italy_vs_germany_italy_nation,
+            italy_vs_germany_germany_nation,
+            primary_user,
+            secondary_user,
+        )
+        received = phase.phase_states.create(member=italy, has_possible_orders=True)
+        received.orders.create(source=italy_vs_germany_venice_province, order_type=OrderType.HOLD)
+        nmr = phase.phase_states.create(member=germany, has_possible_orders=True)
+
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            Phase.objects._set_orders_outcome(phase)
+
+        assert len(connection.queries) == 1
+        received.refresh_from_db()
+        nmr.refresh_from_db()
+        assert received.orders_outcome == PhaseState.OrdersOutcome.RECEIVED
+        assert nmr.orders_outcome == PhaseState.OrdersOutcome.NMR
+
 
 class TestCivilDisorderAutoConfirm:
 
@@ -4383,6 +4509,116 @@ class TestPhaseDurationByPhaseType:
         assert abs(actual_seconds - expected_seconds) < 5
 
 
+class TestPhaseOptions:
+
+    @pytest.mark.django_db
+    def test_options_round_trip_through_the_compressed_side_table(self, game_with_options, sample_options):
+        phase = game_with_options.current_phase
+
+        row = PhaseOptions.objects.get(phase=phase)
+        assert len(bytes(row.data)) < len(json.dumps(sample_options))
+        assert PhaseOptions.decode(row.data) == sample_options
+        assert Phase.objects.get(pk=phase.pk).options == sample_options
+
+    @pytest.mark.django_db
+    def test_options_load_lazily_on_first_access(self, game_with_options, sample_options):
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            phase = game_with_options.current_phase
+            loaded_row = list(connection.queries)
+            phase.transformed_options
+            phase.options
+
+        assert not any('"phase_phaseoptions"' in query["sql"] for query in loaded_row)
+        assert len(connection.queries) == len(loaded_row) + 1
+        assert phase.options == sample_options
+
+    @pytest.mark.django_db
+    def test_phase_without_options_reads_as_empty(self, phase_factory):
+        phase = phase_factory()
+
+        assert Phase.objects.get(pk=phase.pk).options == {}
+        assert not PhaseOptions.objects.filter(phase=phase).exists()
+
+    @pytest.mark.django_db
+    def test_setting_options_replaces_the_stored_blob_and_transformed_options(
+        self, game_with_options, sample_options
+    ):
+        phase = game_with_options.current_phase
+        assert phase.transformed_options
+
+        phase.options = {}
+        assert phase.transformed_options == {}
+        phase.save()
+
+        assert not PhaseOptions.objects.filter(phase=phase).exists()
+        assert Phase.objects.get(pk=phase.pk).options == {}
+
+    @pytest.mark.django_db
+    def test_refresh_from_db_reloads_options(self, game_with_options, sample_options):
+        phase = game_with_options.current_phase
+        stale = Phase.objects.get(pk=phase.pk)
+        assert stale.options == sample_options
+
+        phase.options = {}
+        phase.save()
+        stale.refresh_from_db()
+
+        assert stale.options == {}
+
+    @pytest.mark.django_db
+    def test_with_options_loads_them_with_the_phase(self, game_with_options, sample_options, phase_factory):
+        bare = phase_factory()
+
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            phase = Phase.objects.with_options().get(pk=game_with_options.current_phase.pk)
+            without_row = Phase.objects.with_options().get(pk=bare.pk)
+            assert phase.options == sample_options
+            assert without_row.options == {}
+
+        assert len(connection.queries) == 2
+
+    @pytest.mark.django_db
+    def test_setting_unchanged_options_writes_nothing(self, game_with_options, sample_options):
+        phase = Phase.objects.with_options().get(pk=game_with_options.current_phase.pk)
+
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            phase.options = json.loads(json.dumps(sample_options))
+            phase.save()
+
+        assert not any('"phase_phaseoptions"' in query["sql"] for query in connection.queries)
+
+    @pytest.mark.django_db
+    def test_resolution_clears_the_completed_phases_options(
+        self, italy_vs_germany_phase_with_orders, mock_adjudication_data_basic, sample_options
+    ):
+        phase = italy_vs_germany_phase_with_orders
+        phase.options = sample_options
+        phase.save()
+
+        phase = Phase.objects.with_adjudication_data().get(pk=phase.pk)
+        Phase.objects.create_from_adjudication_data(phase, mock_adjudication_data_basic)
+
+        assert not PhaseOptions.objects.filter(phase=phase).exists()
+
+    @pytest.mark.django_db
+    def test_finishing_a_game_clears_its_phases_options(self, game_with_options):
+        game_with_options.finish(GameStatus.COMPLETED)
+
+        assert not PhaseOptions.objects.filter(phase__game=game_with_options).exists()
+
+    @pytest.mark.django_db
+    def test_reverting_recomputes_the_options(self, game_with_three_phases):
+        phase1 = game_with_three_phases.phases.get(ordinal=1)
+        assert not PhaseOptions.objects.filter(phase=phase1).exists()
+
+        phase1.revert_to_this_phase()
+
+        assert Phase.objects.get(pk=phase1.pk).options
+
+
 class TestPhaseToCanonicalGameState:
 
     def _game_with_members(self, variant, primary_user, secondary_user):
@@ -4458,7 +4694,8 @@ class TestPhaseToCanonicalGameState:
 
         data = phase_to_canonical_game_state(phase)
         domain_variant = deserialize_variant(variant_to_canonical_dict(classical_variant))
-        deserialize_game_state(data, domain_variant)
+        state = deserialize_game_state(data, domain_variant)
+        assert phase_to_game_state(phase, domain_variant) == state
 
         assert data["phase"] == {"season": "Spring", "year": 1901, "type": "Movement"}
         assert len(data["units"]) == 6
@@ -4515,7 +4752,8 @@ class TestPhaseToCanonicalGameState:
 
         data = phase_to_canonical_game_state(phase)
         domain_variant = deserialize_variant(variant_to_canonical_dict(classical_variant))
-        deserialize_game_state(data, domain_variant)
+        state = deserialize_game_state(data, domain_variant)
+        assert phase_to_game_state(phase, domain_variant) == state
 
         units_by_location = {u["location"]: u for u in data["units"]}
         assert units_by_location["lon"]["dislodged"] is True
@@ -4565,7 +4803,8 @@ class TestPhaseToCanonicalGameState:
 
         data = phase_to_canonical_game_state(phase)
         domain_variant = deserialize_variant(variant_to_canonical_dict(classical_variant))
-        deserialize_game_state(data, domain_variant)
+        state = deserialize_game_state(data, domain_variant)
+        assert phase_to_game_state(phase, domain_variant) == state
 
         assert data["phase"] == {"season": "Fall", "year": 1901, "type": "Adjustment"}
         orders_by_unit_type = {o["unitType"]: o for o in data["orders"] if o["orderType"] == "Build"}
@@ -4573,6 +4812,60 @@ class TestPhaseToCanonicalGameState:
         assert orders_by_unit_type["Fleet"]["source"] == "stp/nc"
         assert orders_by_unit_type["Army"]["source"] == "edi"
 
+    @pytest.mark.django_db
+    def test_prefetched_rows_match_the_canonical_dict_with_replaced_members(
+        self, classical_variant, primary_user, secondary_user, tertiary_user
+    ):
+        game, england, france = self._game_with_members(
+            classical_variant, primary_user, secondary_user
+        )
+        replacement = Member.objects.create(game=game, user=tertiary_user, nation=england.nation)
+        england.kicked = True
+        england.replaced_by = replacement
+        england.save(update_fields=["kicked", "replaced_by"])
+        provinces = {p.province_id: p for p in classical_variant.provinces.all()}
+        phase = Phase.objects.create(
+            game=game,
+            variant=classical_variant,
+            season="Spring",
+            year=1901,
+            type=PhaseType.MOVEMENT,
+            status=PhaseStatus.ACTIVE,
+            ordinal=1,
+        )
+        phase.units.create(type=UnitType.FLEET, nation=england.nation, province=provinces["lon"])
+        phase.units.create(type=UnitType.ARMY, nation=england.nation, province=provinces["lvp"])
+        phase.units.create(type=UnitType.ARMY, nation=france.nation, province=provinces["par"])
+        phase.supply_centers.create(nation=england.nation, province=provinces["lon"])
+        phase.supply_centers.create(nation=france.nation, province=provinces["par"])
+
+        replaced_state = phase.phase_states.create(member=england, has_possible_orders=False)
+        replacement_state = phase.phase_states.create(member=replacement)
+        france_state = phase.phase_states.create(member=france)
+        replaced_state.orders.create(source=provinces["lvp"], order_type=OrderType.HOLD)
+        replacement_state.orders.create(
+            source=provinces["lon"], order_type=OrderType.MOVE, target=provinces["eng"]
+        )
+        france_state.orders.create(
+            source=provinces["par"], order_type=OrderType.MOVE, target=provinces["bur"]
+        )
+
+        domain_variant = deserialize_variant(variant_to_canonical_dict(classical_variant))
+        expected = deserialize_game_state(phase_to_canonical_game_state(phase), domain_variant)
+        prefetched = Phase.objects.with_adjudication_data().get(pk=phase.pk)
+
+        with override_settings(DEBUG=True):
+            connection.queries_log.clear()
+            state = phase_to_game_state(prefetched, domain_variant)
+            assert len(connection.queries) == 0
+
+        assert state == expected
+        assert {(o.source, o.nation) for o in state.orders} == {
+            ("lvp", england.nation.nation_id),
+            ("lon", england.nation.nation_id),
+            ("par", france.nation.nation_id),
+        }
+
 
 class TestPhaseToCanonicalGameStatePerformance:
 
@@ -4665,6 +4958,44 @@ class TestPhaseToCanonicalGameStatePerformance:
 
         assert small_count == large_count
 
+    @pytest.mark.django_db
+    def test_game_state_from_prefetched_rows_makes_no_queries(
+        self, classical_variant, primary_user, secondary_user
+    ):
+        game, england, france = self._game_with_members(
+            classical_variant, primary_user, secondary_user
+        )
+        phase = self._build_phase(classical_variant, game, england, france, 15)
+        domain_variant = deserialize_variant(variant_to_canonical_dict(classical_variant))
+        prefetched = Phase.objects.with_adjudication_data().get(pk=phase.pk)
+
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            state = phase_to_game_state(prefetched, domain_variant)
+
+        assert len(connection.queries) == 0
+        assert len(state.units) == 30
+        assert len(state.orders) == 30
+        assert state == deserialize_game_state(phase_to_canonical_game_state(phase), domain_variant)
+
+    @pytest.mark.django_db
+    def test_game_state_without_prefetched_rows_reads_the_phase_once(
+        self, classical_variant, primary_user, secondary_user
+    ):
+        game, england, france = self._game_with_members(
+            classical_variant, primary_user, secondary_user
+        )
+        phase = self._build_phase(classical_variant, game, england, france, 3)
+        domain_variant = deserialize_variant(variant_to_canonical_dict(classical_variant))
+        canonical_count = self._count_queries(phase)
+        unprefetched = Phase.objects.get(pk=phase.pk)
+
+        connection.queries_log.clear()
+        with override_settings(DEBUG=True):
+            phase_to_game_state(unprefetched, domain_variant)
+
+        assert len(connection.queries) == canonical_count
+
 
 class TestSendDeadlineWarnings:
 
@@ -3,6 +3,8 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from django.utils import timezone
 
+from adjudicator import domain
+from adjudicator.serializers import validate_game_state
 from common.constants import OrderType, PhaseFrequency, PhaseType, ProvinceType
 
 
@@ -487,10 +489,11 @@ def _parent_province_id(province):
     return province.province_id
 
 
-def _canonical_order(order, phase_type):
+def _translate_order(order, phase_type):
     # Django/godip use a Move order in a retreat phase to mean a retreat;
     # the canonical adjudicator has a distinct Retreat order type. Django's
     # MoveViaConvoy collapses to a Move with viaConvoy set.
+    # Returns (order_type, source, target, aux, via_convoy).
     via_convoy = False
     if phase_type == PhaseType.RETREAT:
         order_type = "Retreat" if order.order_type == OrderType.MOVE else order.order_type
@@ -512,6 +515,11 @@ def _canonical_order(order, phase_type):
         else:
             target = order.named_coast.province_id
 
+    return order_type, source, target, aux, via_convoy
+
+
+def _canonical_order(order, phase_type):
+    order_type, source, target, aux, via_convoy = _translate_order(order, phase_type)
     return {
         "nation": order.nation.nation_id,
         "source": source,
@@ -633,3 +641,65 @@ def phase_to_canonical_game_state(phase):
             for order in phase_state.orders.all()
         ],
     }
+
+
+def phase_to_game_state(phase, variant, refresh=False):
+    """The phase's position as an adjudicator `State` over `variant`,
+    built straight from the phase's rows.
+
+    Equivalent to `deserialize_game_state(phase_to_canonical_game_state(
+    phase), variant)` without the intermediate dict; the built state goes
+    through the same checks (`validate_game_state`). When `phase` came
+    from `with_adjudication_data()` or `with_canonical_state_data()` its
+    prefetched rows are used as they are and no query is made; otherwise,
+    or with `refresh`, the phase is read afresh."""
+    if refresh or "units" not in getattr(phase, "_prefetched_objects_cache", {}):
+        phase = type(phase).objects.with_canonical_state_data().get(pk=phase.pk)
+    units = [
+        domain.Unit(
+            nation=unit.nation.nation_id,
+            type=unit.type,
+            location=unit.province.province_id,
+            dislodged=unit.dislodged,
+            dislodged_from=(
+                variant.parent_of(unit.dislodged_by.province.province_id)
+                if unit.dislodged_by_id is not None
+                else None
+            ),
+        )
+        for unit in phase.units.all()
+    ]
+    supply_centers = [
+        domain.SupplyCenter(
+            nation=supply_center.nation.nation_id,
+            province=supply_center.province.province_id,
+        )
+        for supply_center in phase.supply_centers.all()
+    ]
+    orders = []
+    for phase_state in phase.phase_states.all():
+        for order in phase_state.orders.all():
+            order_type, source, target, aux, via_convoy = _translate_order(order, phase.type)
+            orders.append(
+                domain.Order(
+                    nation=order.nation.nation_id,
+                    source=source,
+                    order_type=order_type,
+                    target=target,
+                    aux=aux,
+                    unit_type=order.unit_type,
+                    via_convoy=via_convoy,
+                )
+            )
+    state = domain.State(
+        variant=variant,
+        phase=domain.Phase(season=phase.season, year=phase.year, type=phase.type),
+        units=units,
+        supply_centers=supply_centers,
+        orders=orders,
+        resolutions=None,
+        skipped=False,
+        outcome=None,
+    )
+    validate_game_state(state)
+    return state
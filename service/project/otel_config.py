@@ -1,8 +1,11 @@
 import os
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource, SERVICE_NAME, DEPLOYMENT_ENVIRONMENT
 from opentelemetry.instrumentation.django import DjangoInstrumentor
 from opentelemetry.instrumentation.psycopg import PsycopgInstrumentor
@@ -41,6 +44,21 @@ def configure_opentelemetry():
 
     trace.set_tracer_provider(tracer_provider)
 
+    metric_exporter = OTLPMetricExporter(
+        endpoint="https://api.honeycomb.io:443",
+        headers={
+            "x-honeycomb-team": honeycomb_api_key,
+            "x-honeycomb-dataset": service_name,
+        },
+    )
+
+    meter_provider = MeterProvider(
+        resource=resource,
+        metric_readers=[PeriodicExportingMetricReader(metric_exporter)],
+    )
+
+    metrics.set_meter_provider(meter_provider)
+
     DjangoInstrumentor().instrument()
 
     PsycopgInstrumentor().instrument(enable_commenter=True)
@@ -51,6 +51,24 @@ RESOLUTION_CANARY_GRACE_SECONDS = int(os.getenv("RESOLUTION_CANARY_GRACE_SECONDS
 # resolution as lost and returns the phase to active so it can be retried (seconds).
 PHASE_PROCESSING_TIMEOUT_SECONDS = int(os.getenv("PHASE_PROCESSING_TIMEOUT_SECONDS", "300"))
 
+# Worker processes the resolve_phase task ships adjudication to, so the engine
+# runs off the Procrastinate worker's own interpreter. resolve_due_phases (the
+# resolve-all endpoint) also adjudicates its due phases as one batch on this
+# pool. Zero adjudicates inline, one phase at a time.
+ADJUDICATION_EXECUTOR_WORKERS = int(os.getenv("ADJUDICATION_EXECUTOR_WORKERS", "0"))
+
+# Adjudications that may be waiting on or running in the executor at once;
+# further resolve_phase jobs wait for a slot, outside their transaction.
+ADJUDICATION_EXECUTOR_QUEUE_DEPTH = int(os.getenv("ADJUDICATION_EXECUTOR_QUEUE_DEPTH", "8"))
+
+# How long a phase waits for an executor slot before it is adjudicated inline
+# instead (seconds). The wait happens before the resolve transaction opens.
+ADJUDICATION_EXECUTOR_SLOT_TIMEOUT_SECONDS = float(os.getenv("ADJUDICATION_EXECUTOR_SLOT_TIMEOUT_SECONDS", "30"))
+
+# Record per-reducer timings, decision counts and cycle breakers for every inline
+# adjudication and attach them to the adjudicator.resolve span as events.
+ADJUDICATION_PROFILING = os.getenv("ADJUDICATION_PROFILING", "False") == "True"
+
 ALLOWED_HOSTS = os.getenv("DJANGO_ALLOWED_HOSTS", "localhost,127.0.0.1,service,192.168.68.50").split(",")
 
 # CSRF Settings
@@ -1,4 +1,5 @@
 from common.constants import Commitment, CommitmentRequirement, PhaseStatus, PhaseType
+from game.models import GameSummary
 from phase.models import PhaseState
 
 COMMITMENT_PHASE_WINDOW = 10
@@ -73,8 +74,11 @@ def get_rated_outcomes(user):
 
 def recompute_commitment(user):
     profile = user.profile
+    previous = profile.commitment
     profile.commitment = score_commitment(get_rated_outcomes(user))
     profile.save(update_fields=["commitment", "updated_at"])
+    if profile.commitment != previous:
+        GameSummary.objects.refresh_commitment_eligibility(user)
     return profile.commitment
 
 
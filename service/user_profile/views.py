@@ -1,6 +1,7 @@
 from rest_framework import permissions, generics
 from django.db import transaction
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema
 
 from game.models import Game
@@ -71,10 +72,10 @@ class UserAccountDeleteView(generics.DestroyAPIView):
             ongoing_members = user_members.filter(
                 game__status__in=[GameStatus.ACTIVE, GameStatus.COMPLETED]
             )
-            ongoing_members.update(kicked=True)
+            ongoing_members.update(kicked=True, updated_at=timezone.now())
             PhaseState.objects.filter(
                 member__in=ongoing_members, phase__status=PhaseStatus.ACTIVE
-            ).update(has_possible_orders=False)
+            ).update(has_possible_orders=False, updated_at=timezone.now())
             for game in Game.objects.filter(id__in=pending_game_ids):
                 game.delete_if_empty_pending()
             instance.delete()
@@ -8,6 +8,7 @@ import yaml
 from jsonschema import Draft202012Validator
 from lxml import etree
 
+from adjudicator.compiled import invalidate_compiled_variant
 from common.constants import ProvinceType
 
 
@@ -874,6 +875,8 @@ def update_variant_from_dvar(variant, dvar):
             if nation is not None:
                 NationFlag.objects.create(nation=nation, svg=svg)
 
+    invalidate_compiled_variant(variant.id)
+
     return variant
 
 
@@ -1082,6 +1085,7 @@ def apply_safe_replacement(variant, dvar, dsvg_text):
 
     if hasattr(variant, "_prefetched_objects_cache"):
         variant._prefetched_objects_cache.clear()
+    invalidate_compiled_variant(variant.id)
 
     return variant
 